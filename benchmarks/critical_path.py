@@ -0,0 +1,124 @@
+"""Benchmark: disjunctive graph, incremental swaps vs rebuilding the graph.
+
+For every instance the greedy schedule is turned into a DisjunctiveGraph
+and random adjacent swaps are applied (half of them N5 moves on the
+critical path). Each swap is timed three ways: ``swap_estimate`` (O(1)
+prediction), ``swap`` (incremental update) and a full rebuild from the
+resulting solution. Every ``--check`` swaps the incremental heads, tails
+and makespan are compared with the rebuilt graph::
+
+    python benchmarks/critical_path.py --sizes 20x10 50x20 100x20 --swaps 2000
+    python benchmarks/critical_path.py --files data/instances/large.txt
+
+``exact`` is the share of swaps whose estimate equals the new makespan.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from jobshop import load_bindings  # noqa: E402
+
+jb = load_bindings()
+
+
+def write_instance(path, jobs, machines, seed):
+    rng = random.Random(seed)
+    lines = [f"{jobs} {machines}", "", "# Machine sequences"]
+    for _ in range(jobs):
+        route = list(range(machines))
+        rng.shuffle(route)
+        lines.append(" ".join(map(str, route)))
+    lines += ["", "# Processing times"]
+    lines += [" ".join(str(rng.randint(1, 99)) for _ in range(machines)) for _ in range(jobs)]
+    lines += ["", "# Transport times"]
+    lines += [" ".join("0" if a == b else str(rng.randint(1, 10)) for b in range(machines))
+              for a in range(machines)]
+    Path(path).write_text("\n".join(lines) + "\n")
+
+
+def pick_swap(graph, rng):
+    moves = graph.critical_moves()
+    if moves and rng.random() < 0.5:
+        return rng.choice(moves)
+    while True:
+        order = graph.machine_order(rng.randrange(graph.num_machines))
+        if len(order) > 1:
+            k = rng.randrange(len(order) - 1)
+            return order[k], order[k + 1]
+
+
+def rebuild(instance, graph):
+    solution = graph.to_solution()
+    solution.start_times = []      # machine order from the sequence, as for a fresh solution
+    return jb.DisjunctiveGraph(instance, solution)
+
+
+def run(label, instance, args):
+    solution = jb.greedy_schedule(instance)
+    start = time.perf_counter()
+    graph = jb.DisjunctiveGraph(instance, solution)
+    build_s = time.perf_counter() - start
+
+    rng = random.Random(args.seed)
+    estimate_s = swap_s = rebuild_s = 0.0
+    applied = exact = 0
+    for n in range(args.swaps):
+        u, v = pick_swap(graph, rng)
+        t0 = time.perf_counter()
+        estimate = graph.swap_estimate(u, v)
+        t1 = time.perf_counter()
+        ok = graph.swap(u, v)
+        t2 = time.perf_counter()
+        estimate_s += t1 - t0
+        swap_s += t2 - t1
+        if not ok:
+            continue
+        applied += 1
+        exact += estimate == graph.makespan
+        t3 = time.perf_counter()
+        reference = rebuild(instance, graph)
+        rebuild_s += time.perf_counter() - t3
+        if n % args.check == 0:
+            if (reference.makespan != graph.makespan or not np.array_equal(reference.heads, graph.heads)
+                    or not np.array_equal(reference.tails, graph.tails)):
+                sys.exit(f"{label}: incremental update differs from the rebuilt graph after {n + 1} swaps")
+
+    report = jb.bottleneck_report(graph)
+    us = 1e6 / max(args.swaps, 1)
+    print(f"{label:<12}{instance.num_operations:>6}{build_s * 1e3:>10.2f}{estimate_s * us:>12.2f}"
+          f"{swap_s * us:>10.2f}{rebuild_s * 1e6 / max(applied, 1):>12.1f}"
+          f"{100.0 * exact / max(applied, 1):>8.1f}%{report.path_operations:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="*", default=["20x10", "50x20", "100x20"], help="JOBSxMACHINES")
+    parser.add_argument("--files", nargs="*", default=[], help="instance files")
+    parser.add_argument("--swaps", type=int, default=1000)
+    parser.add_argument("--check", type=int, default=10, help="compare with a rebuild every N swaps")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'instance':<12}{'ops':>6}{'build ms':>10}{'estimate us':>12}{'swap us':>10}"
+          f"{'rebuild us':>12}{'exact':>9}{'path':>7}")
+    for path in args.files:
+        run(Path(path).stem, jb.load_instance_from_file(path), args)
+    with tempfile.TemporaryDirectory(prefix="jobshop-graph-") as directory:
+        for size in args.sizes:
+            jobs, machines = map(int, size.lower().split("x"))
+            path = os.path.join(directory, f"{size}.txt")
+            write_instance(path, jobs, machines, args.seed)
+            run(size, jb.load_instance_from_file(path), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: early-abort evaluation against a cutoff.
+
+Two workloads where only "better than X?" matters:
+
+* tournament - random contenders against the best of a tournament
+* neighbourhood - every adjacent swap of a GA solution against its makespan
+
+For each the share of operations ``makespan_with_cutoff`` did not have to
+decode (per-call binding overhead would swamp timings taken from Python)::
+
+    python benchmarks/cutoff.py data/instances/large.txt
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jobshop import load_bindings  # noqa: E402
+
+
+def tournament_pairs(jb, instance, population, tournament_size, rounds, rng):
+    pairs = []
+    for _ in range(rounds):
+        best = jb.calculate_makespan(instance, rng.choice(population))
+        for _ in range(tournament_size - 1):
+            contender = rng.choice(population)
+            pairs.append((contender, best))
+            best = min(best, jb.calculate_makespan(instance, contender))
+    return pairs
+
+
+def neighbourhood_pairs(jb, instance, solution):
+    sequence = list(solution.operation_sequence)
+    genes = [job for job, _ in sequence]
+    pairs = []
+    for i in range(len(genes) - 1):
+        if genes[i] == genes[i + 1]:
+            continue
+        swapped = genes[:]
+        swapped[i], swapped[i + 1] = swapped[i + 1], swapped[i]
+        counts, ops = {}, []
+        for job in swapped:
+            ops.append((job, counts.get(job, 0)))
+            counts[job] = counts.get(job, 0) + 1
+        neighbour = jb.Solution()
+        neighbour.operation_sequence = ops
+        neighbour.machine_choice = solution.machine_choice
+        pairs.append((neighbour, solution.makespan))
+    return pairs
+
+
+def skipped_share(jb, instance, pairs):
+    total = instance.num_operations * len(pairs)
+    decoded = sum(jb.makespan_with_cutoff(instance, s, cutoff)[1] for s, cutoff in pairs)
+    aborted = sum(1 for s, cutoff in pairs if jb.makespan_with_cutoff(instance, s, cutoff)[0] >= cutoff)
+    return 1.0 - decoded / total, aborted / len(pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance")
+    parser.add_argument("--population", type=int, default=100)
+    parser.add_argument("--tournament", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--generations", type=int, default=300, help="GA run that gives the neighbourhood centre")
+    args = parser.parse_args()
+
+    jb = load_bindings()
+    instance = jb.load_instance_from_file(args.instance)
+    rng = random.Random(1)
+
+    population = [jb.generate_random_solution(instance, seed) for seed in range(1, args.population + 1)]
+    params = jb.GeneticParams()
+    params.generations = args.generations
+    params.seed = 1
+    centre = jb.run_genetic(instance, params)
+
+    workloads = (
+        ("tournament", tournament_pairs(jb, instance, population, args.tournament, args.rounds, rng)),
+        ("neighbourhood", neighbourhood_pairs(jb, instance, centre)),
+    )
+    print(f"{'workload':<15}{'comparisons':>12}{'not better':>12}{'ops skipped':>13}")
+    for name, pairs in workloads:
+        skipped, rejected = skipped_share(jb, instance, pairs)
+        print(f"{name:<15}{len(pairs):>12}{rejected:>12.1%}{skipped:>13.1%}")
+
+
+if __name__ == "__main__":
+    main()
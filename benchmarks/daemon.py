@@ -0,0 +1,149 @@
+"""Benchmark: solver daemon vs one CLI process per request.
+
+Starts ``jobshop_optimizer --daemon`` and compares, for the same solve
+request, the latency and throughput of
+
+- ``process``: ``jobshop_optimizer FILE ALGORITHM`` per request (startup,
+  parse, solve, exit),
+- ``client``: ``jobshop_optimizer --client FILE ALGORITHM`` per request
+  (process startup + one round trip to the resident instance),
+- ``socket``: requests over one persistent connection,
+- ``socket xN``: N connections in parallel (throughput of the worker pool)::
+
+    python benchmarks/daemon.py data/instances/large.txt --algorithm greedy --requests 200
+
+Requests ask for the makespan only (``"schedule": false``), the CLI
+output goes to /dev/null.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BINARY = ROOT / "build" / "bin" / "jobshop_optimizer"
+
+
+class Connection:
+    """One persistent protocol connection (JSON lines)."""
+
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.reader = self.sock.makefile("rb")
+
+    def request(self, payload):
+        self.sock.sendall(json.dumps(payload).encode() + b"\n")
+        response = json.loads(self.reader.readline())
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error"))
+        return response
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+def timed(fn, count):
+    """Per-call latencies (seconds) and the wall time of all calls."""
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(count):
+        t = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t)
+    return latencies, time.perf_counter() - start
+
+
+def report(label, latencies, wall):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    print(f"{label:<14}{statistics.median(latencies) * 1e3:>10.3f}{p95 * 1e3:>10.3f}"
+          f"{len(latencies) / wall:>12,.0f}")
+
+
+def wait_for_socket(path, daemon, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if daemon.poll() is not None:
+            sys.exit(f"daemon exited with code {daemon.returncode}")
+        try:
+            Connection(path).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    sys.exit("daemon did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance")
+    parser.add_argument("--algorithm", default="greedy", choices=("greedy", "exact", "genetic"))
+    parser.add_argument("--requests", type=int, default=200, help="requests per mode")
+    parser.add_argument("--connections", type=int, default=4, help="parallel connections of the last mode")
+    parser.add_argument("--threads", type=int, default=0, help="daemon workers (0 = all cores)")
+    parser.add_argument("--binary", default=str(DEFAULT_BINARY))
+    args = parser.parse_args()
+
+    instance = str(Path(args.instance).resolve())
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="jobshop-bench-"), "daemon.sock")
+    daemon = subprocess.Popen([args.binary, "--daemon", "-socket", socket_path, "-quiet",
+                               "-threads", str(args.threads)], stdout=subprocess.DEVNULL)
+    try:
+        wait_for_socket(socket_path, daemon)
+        request = {"cmd": "solve", "path": instance, "algorithm": args.algorithm, "schedule": False,
+                   "params": {"seed": 42} if args.algorithm == "genetic" else {}}
+
+        # The first request loads the instance into the daemon's memory
+        warm = Connection(socket_path)
+        first = warm.request(request)
+        print(f"{Path(instance).name}, {args.algorithm}: makespan {first['makespan']}, "
+              f"solve {first['solve_ms']:.3f} ms inside the daemon, {args.requests} requests per mode\n")
+        print(f"{'mode':<14}{'p50 [ms]':>10}{'p95 [ms]':>10}{'req/s':>12}")
+
+        cli = [args.binary, instance, args.algorithm]
+        report("process", *timed(lambda: subprocess.run(cli, stdout=subprocess.DEVNULL, check=True),
+                                 args.requests))
+
+        client = [args.binary, "--client", instance, args.algorithm, "-socket", socket_path]
+        report("client", *timed(lambda: subprocess.run(client, stdout=subprocess.DEVNULL, check=True),
+                                args.requests))
+
+        report("socket", *timed(lambda: warm.request(request), args.requests))
+        warm.close()
+
+        latencies = []
+        lock = threading.Lock()
+
+        def worker(count):
+            connection = Connection(socket_path)
+            own, _ = timed(lambda: connection.request(request), count)
+            connection.close()
+            with lock:
+                latencies.extend(own)
+
+        per_connection = max(1, args.requests // args.connections)
+        threads = [threading.Thread(target=worker, args=(per_connection,)) for _ in range(args.connections)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        report(f"socket x{args.connections}", latencies, time.perf_counter() - start)
+
+        Connection(socket_path).request({"cmd": "shutdown"})
+        daemon.wait(timeout=10)
+    finally:
+        if daemon.poll() is None:
+            daemon.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Regression check: CLI options forwarded by --client reach the daemon.
+
+Starts ``jobshop_optimizer --daemon`` and runs ``jobshop_optimizer
+--client FILE ALGORITHM OPTIONS`` for every case below. A case passes when
+the client exits with the expected code, and, for solves that should
+succeed, prints the makespan the plain CLI prints for the same command.
+The exact solver runs too, so the instance must be small::
+
+    python benchmarks/daemon_check.py data/instances/test.txt
+
+Exit code 0 = OK, 1 = a case failed.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BINARY = ROOT / "build" / "bin" / "jobshop_optimizer"
+
+# (algorithm, options, expected to succeed)
+CASES = (
+    ("greedy", [], True),
+    ("exact", [], True),
+    ("exact", ["-search", "ida"], True),
+    ("exact", ["-search", "astar"], True),
+    ("exact", ["-search", "ida", "-table-mb", "4"], True),
+    ("exact", ["-table-mb", "4", "-node-mb", "64"], True),
+    ("genetic", ["-pop", "20", "-gen", "30", "-seed", "7"], True),
+    ("genetic", ["-decoder", "active", "-seed", "7"], True),
+    ("portfolio", ["-time", "0.5", "-threads", "1", "-ga", "1"], True),
+    # Options of another algorithm are rejected, not ignored
+    ("genetic", ["-search", "ida"], False),
+    ("greedy", ["-pop", "20"], False),
+)
+
+MAKESPAN = re.compile(r"^Makespan: (\d+)", re.MULTILINE)
+
+
+def run(command):
+    proc = subprocess.run(command, capture_output=True, text=True, timeout=120)
+    match = MAKESPAN.search(proc.stdout)
+    return proc.returncode, int(match.group(1)) if match else None, (proc.stdout + proc.stderr).strip()
+
+
+def wait_for_daemon(binary, socket_path, daemon, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if daemon.poll() is not None:
+            sys.exit(f"daemon exited with code {daemon.returncode}")
+        if run([binary, "--client", "-stats", "-socket", socket_path])[0] == 0:
+            return
+        time.sleep(0.05)
+    sys.exit("daemon did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance", nargs="?", default=str(ROOT / "data/instances/test.txt"))
+    parser.add_argument("--binary", default=str(DEFAULT_BINARY))
+    args = parser.parse_args()
+
+    instance = str(Path(args.instance).resolve())
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="jobshop-check-"), "daemon.sock")
+    daemon = subprocess.Popen([args.binary, "--daemon", "-socket", socket_path, "-quiet", "-threads", "1"],
+                              stdout=subprocess.DEVNULL)
+    failures = 0
+    try:
+        wait_for_daemon(args.binary, socket_path, daemon)
+        print(f"{'case':<44}{'client':>8}{'cli':>8}  result")
+        for algorithm, options, succeeds in CASES:
+            code, makespan, output = run([args.binary, "--client", instance, algorithm, *options,
+                                          "-socket", socket_path])
+            expected = None
+            if succeeds and (algorithm in ("greedy", "exact") or "-seed" in options):
+                # Deterministic runs: the plain CLI must agree (portfolio depends on timing)
+                expected = run([args.binary, instance, algorithm, *options])[1]
+            ok = (code == 0) == succeeds and (expected is None or makespan == expected)
+            label = " ".join([algorithm, *options])
+            print(f"{label:<44}{makespan if makespan is not None else '-':>8}"
+                  f"{expected if expected is not None else '-':>8}  {'ok' if ok else 'FAIL'}")
+            if not ok:
+                print("    " + output.replace("\n", "\n    "))
+                failures += 1
+        run([args.binary, "--client", "-shutdown", "-socket", socket_path])
+        daemon.wait(timeout=10)
+    finally:
+        if daemon.poll() is None:
+            daemon.kill()
+
+    print("\nOK" if not failures else f"\nFAIL: {failures} case(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
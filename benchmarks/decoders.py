@@ -0,0 +1,74 @@
+"""Benchmark: schedule decoders (semi-active, active, non-delay, hybrid).
+
+For every decoder reports the mean makespan a random genome decodes to
+(quality per evaluation), evaluations per second inside a GA run and the
+makespan the GA reaches with the same budget::
+
+    python benchmarks/decoders.py data/instances/large.txt --generations 500
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jobshop import load_bindings  # noqa: E402
+
+DECODERS = (
+    ("semi-active", 0.5),
+    ("active", 0.5),
+    ("non-delay", 0.5),
+    ("hybrid", 0.25),
+    ("hybrid", 0.5),
+    ("hybrid", 0.75),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance")
+    parser.add_argument("--samples", type=int, default=500, help="random genomes per decoder")
+    parser.add_argument("--population", type=int, default=50)
+    parser.add_argument("--generations", type=int, default=500)
+    parser.add_argument("--seeds", type=int, default=3, help="GA runs per decoder")
+    args = parser.parse_args()
+
+    jb = load_bindings()
+    instance = jb.load_instance_from_file(args.instance)
+    genomes = [jb.generate_random_solution(instance, seed).operation_sequence
+               for seed in range(1, args.samples + 1)]
+
+    print(f"{'decoder':<14}{'mean random':>12}{'evals/s':>12}{'GA best':>9}{'GA mean':>9}")
+    for name, delta in DECODERS:
+        kind = jb.parse_decoder(name)
+
+        makespans = []
+        for sequence in genomes:
+            solution = jb.Solution()
+            solution.operation_sequence = sequence
+            makespans.append(jb.decode_schedule(instance, solution, kind, delta))
+
+        results, elapsed = [], 0.0
+        for seed in range(1, args.seeds + 1):
+            params = jb.GeneticParams()
+            params.population_size = args.population
+            params.generations = args.generations
+            params.seed = seed
+            params.decoder = kind
+            params.decoder_delta = delta
+            # Fixed budget: evals/s assumes population x (generations + 1) evaluations
+            params.stop_at_lower_bound = False
+            start = time.perf_counter()
+            results.append(jb.run_genetic(instance, params).makespan)
+            elapsed += time.perf_counter() - start
+
+        evaluations = args.seeds * args.population * (args.generations + 1)
+        label = f"{name} {delta}" if name == "hybrid" else name
+        print(f"{label:<14}{statistics.mean(makespans):>12.1f}{evaluations / elapsed:>12.0f}"
+              f"{min(results):>9}{statistics.mean(results):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
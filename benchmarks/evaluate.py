@@ -0,0 +1,62 @@
+"""Benchmark: whole-population evaluation, scalar vs lockstep batches.
+
+Decodes the same random population with ``evaluate_population`` one
+genome at a time (``calculate_makespan``) and in lockstep batches, checks
+both give the same makespans and reports evaluations per second::
+
+    python benchmarks/evaluate.py data/instances/large.txt --population 200
+
+The times include copying the solutions between Python and C++, which
+both paths pay equally.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jobshop import load_bindings  # noqa: E402
+
+
+def best_time(fn, repeats, rounds):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance")
+    parser.add_argument("--population", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20, help="evaluations of the population per timing")
+    parser.add_argument("--repeats", type=int, default=7, help="timings, the fastest one counts")
+    args = parser.parse_args()
+
+    jb = load_bindings()
+    instance = jb.load_instance_from_file(args.instance)
+    population = [jb.generate_random_solution(instance, seed) for seed in range(1, args.population + 1)]
+
+    scalar = list(jb.evaluate_population(instance, population, batched=False))
+    batched = list(jb.evaluate_population(instance, population, batched=True))
+    if scalar != batched:
+        sys.exit("batched makespans differ from calculate_makespan")
+
+    print(f"{instance.num_jobs}x{instance.num_machines}, {instance.num_operations} operations, "
+          f"population {args.population}, {jb.EVAL_LANES} lanes")
+    evaluations = args.population * args.rounds
+    rates = {}
+    for label, batched in (("scalar", False), ("batched", True)):
+        elapsed = best_time(lambda: jb.evaluate_population(instance, population, batched=batched),
+                            args.repeats, args.rounds)
+        rates[label] = evaluations / elapsed
+        print(f"{label:<8}{rates[label]:>14,.0f} evals/s")
+    print(f"speedup {rates['batched'] / rates['scalar']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark: exact solver, A* vs IDA* (expansion rate and peak memory).
+
+Random square instances (every job visits every machine once, processing
+times 1-20, transport 1-5) from 4x4 to 6x6; both searches start from the
+greedy makespan as upper bound, like the CLI. Each solve runs in its own
+process so its peak RSS can be read from ``wait4``; the RSS of a process
+that only imports the bindings is subtracted::
+
+    python benchmarks/exact_search.py --sizes 4 5 6 --seeds 3 --timeout 60
+    python benchmarks/exact_search.py --sizes 5 --node-mb 4   # A* hits its budget
+
+``nodes/s`` counts expanded states. IDA* expands states again in every
+iteration, so compare the time as well as the rate. An A* run marked
+``*`` ran out of ``--node-mb`` and finished as IDA*.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from jobshop import load_bindings
+jb = load_bindings()
+if {path!r}:
+    instance = jb.load_instance_from_file({path!r})
+    bound = jb.greedy_schedule(instance).makespan + 1
+    start = time.perf_counter()
+    solution, complete, stats = jb.solve_exact_stats(instance, upper_bound=bound, search={search!r},
+                                                     table_mb={table_mb}, node_mb={node_mb})
+    seconds = time.perf_counter() - start
+    makespan = solution.makespan if solution.operation_sequence else bound - 1
+    print(json.dumps({{"makespan": makespan, "complete": complete, "seconds": seconds,
+                      "expanded": stats.expanded, "iterations": stats.iterations,
+                      "switched": stats.switched_to_ida}}))
+"""
+
+
+def write_instance(path, size, seed):
+    rng = random.Random(seed)
+    lines = [f"{size} {size}", "", "# Machine sequences"]
+    for _ in range(size):
+        route = list(range(size))
+        rng.shuffle(route)
+        lines.append(" ".join(map(str, route)))
+    lines += ["", "# Processing times"]
+    lines += [" ".join(str(rng.randint(1, 20)) for _ in range(size)) for _ in range(size)]
+    lines += ["", "# Transport times"]
+    lines += [" ".join("0" if a == b else str(rng.randint(1, 5)) for b in range(size)) for a in range(size)]
+    Path(path).write_text("\n".join(lines) + "\n")
+
+
+def run_child(path, search, args):
+    """(result dict or None on timeout, peak RSS in MB)"""
+    code = CHILD.format(root=str(ROOT), path=path, search=search, table_mb=args.table_mb, node_mb=args.node_mb)
+    proc = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + args.timeout
+    while True:
+        pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+        if pid:
+            break
+        if time.monotonic() > deadline:
+            proc.kill()
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = -1
+            return None, usage.ru_maxrss / 1024
+        time.sleep(0.01)
+    output = proc.stdout.read()
+    proc.stdout.close()
+    if os.waitstatus_to_exitcode(status) != 0:
+        sys.exit(f"solver process failed on {path} ({search})")
+    return (json.loads(output) if output.strip() else None), usage.ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 5, 6], help="jobs = machines")
+    parser.add_argument("--seeds", type=int, default=3, help="instances per size")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per solve")
+    parser.add_argument("--table-mb", type=int, default=16, help="transposition table size")
+    parser.add_argument("--node-mb", type=int, default=1024, help="A* node budget")
+    args = parser.parse_args()
+
+    _, baseline = run_child("", "astar", args)
+    print(f"baseline RSS {baseline:.1f} MB (interpreter + bindings), table {args.table_mb} MB, "
+          f"A* nodes {args.node_mb} MB\n")
+    print(f"{'instance':<10}{'search':<7}{'makespan':>9}{'time [s]':>10}{'expanded':>12}"
+          f"{'nodes/s':>12}{'peak MB':>9}")
+
+    with tempfile.TemporaryDirectory(prefix="jobshop-exact-") as directory:
+        for size in args.sizes:
+            for seed in range(args.seeds):
+                path = os.path.join(directory, f"{size}x{size}_{seed}.txt")
+                write_instance(path, size, seed)
+                for search in ("astar", "ida"):
+                    result, peak = run_child(path, search, args)
+                    label = f"{size}x{size}/{seed}"
+                    if result is None:
+                        print(f"{label:<10}{search:<7}{'timeout':>9}{'>' + format(args.timeout, 'g'):>10}"
+                              f"{'':>12}{'':>12}{peak - baseline:>9.1f}")
+                        continue
+                    rate = result["expanded"] / result["seconds"] if result["seconds"] > 0 else 0.0
+                    if result["switched"]:
+                        search += "*"
+                    print(f"{label:<10}{search:<7}{result['makespan']:>9}{result['seconds']:>10.2f}"
+                          f"{result['expanded']:>12,}{rate:>12,.0f}{peak - baseline:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark: 1000 greedy solves fanned out over a process pool.
+
+Compares shipping the instance with every task (pickle) against passing
+a shared-memory reference (``jobshop.SharedInstance``)::
+
+    python benchmarks/fanout.py data/instances/large.txt --tasks 1000
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jobshop import SharedInstance, load_bindings  # noqa: E402
+from jobshop.shared import attach_instance, start_tracker  # noqa: E402
+
+
+def _solve_pickled(instance):
+    return load_bindings().greedy_schedule(instance).makespan
+
+
+def _solve_shared(ref):
+    return load_bindings().greedy_schedule(attach_instance(*ref)).makespan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instance")
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    jb = load_bindings()
+    instance = jb.load_instance_from_file(args.instance)
+    print(f"pickled instance: {len(instance.__getstate__())} bytes")
+
+    start_tracker()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(_solve_pickled, [instance] * 8))  # warm up workers
+
+        start = time.perf_counter()
+        list(pool.map(_solve_pickled, [instance] * args.tasks))
+        pickled = time.perf_counter() - start
+
+        with SharedInstance(instance) as shared:
+            start = time.perf_counter()
+            list(pool.map(_solve_shared, [shared.ref] * args.tasks))
+            shared_time = time.perf_counter() - start
+
+    print(f"pickle per task: {pickled:.3f}s ({args.tasks / pickled:.0f} solves/s)")
+    print(f"shared memory:   {shared_time:.3f}s ({args.tasks / shared_time:.0f} solves/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark: Gantt redraw time, per-artist figure rebuild vs collection renderer.
+
+Renders off-screen (Agg), so no display or Tk is needed::
+
+    python benchmarks/gantt_redraw.py --ops 5000 --machines 20 --jobs 250
+    python benchmarks/gantt_redraw.py --instance data/instances/large.txt
+
+``legacy`` reproduces the previous ``GanttFrame.draw_gantt`` (new Figure per
+draw, ``barh`` + one ``ax.text`` per operation); ``renderer`` reuses one
+figure with ``GanttRenderer``; ``zoom`` is a redraw after a 4x zoom-in.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "gui"))
+
+from utils.gantt_render import GanttRenderer, job_palette  # noqa: E402
+from utils.schedule import schedule_columns  # noqa: E402
+
+
+def synthetic_schedule(ops, machines, jobs, seed):
+    """Dense schedule without overlaps on a machine (enough for rendering)."""
+    rng = np.random.default_rng(seed)
+    machine = rng.integers(0, machines, ops)
+    duration = rng.integers(1, 100, ops)
+    start = np.zeros(ops, dtype=np.int64)
+    for m in range(machines):
+        mask = machine == m
+        start[mask] = np.concatenate(([0], np.cumsum(duration[mask])[:-1]))
+    return {"job": rng.integers(0, jobs, ops), "machine": machine,
+            "start": start, "duration": duration}
+
+
+def draw_legacy(columns, machines, jobs):
+    colors, text_colors = job_palette(jobs)
+    fig = Figure(figsize=(10, 6), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    for i in range(0, machines, 2):
+        ax.axhspan(i - 0.5, i + 0.5, zorder=0)
+    count = len(columns["job"])
+    fontsize, min_w = (6, 3) if count > 100 else (8, 2) if count > 50 else (9, 1)
+    ax.barh(columns["machine"], columns["duration"], left=columns["start"], height=0.7,
+            color=colors[columns["job"]], edgecolor="#ffffff", linewidth=0.5, zorder=3)
+    for job, machine, start, duration in zip(columns["job"], columns["machine"],
+                                             columns["start"], columns["duration"]):
+        if duration >= min_w:
+            ax.text(start + duration / 2, machine, f"J{job}", ha="center", va="center",
+                    fontsize=fontsize, color=text_colors[job], fontweight="bold", zorder=4)
+    fig.canvas.draw()
+
+
+def timed(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instance", help="solve this instance greedily instead of a synthetic schedule")
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--machines", type=int, default=20)
+    parser.add_argument("--jobs", type=int, default=250)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.instance:
+        sys.path.insert(0, str(ROOT))
+        from jobshop import load_bindings
+
+        jb = load_bindings()
+        instance = jb.load_instance_from_file(args.instance)
+        solution = jb.greedy_schedule(instance)
+        start = time.perf_counter()
+        columns = schedule_columns(instance, solution)
+        print(f"schedule_columns: {1000 * (time.perf_counter() - start):.1f} ms")
+        machines, jobs = instance.num_machines, instance.num_jobs
+    else:
+        columns = synthetic_schedule(args.ops, args.machines, args.jobs, args.seed)
+        machines, jobs = args.machines, args.jobs
+    print(f"{len(columns['job'])} operations, {machines} machines, {jobs} jobs")
+
+    legacy = timed(lambda: draw_legacy(columns, machines, jobs), args.repeats)
+
+    fig = Figure(figsize=(10, 6), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    renderer = GanttRenderer(fig, fig.add_subplot(111))
+
+    def redraw():
+        renderer.set_schedule(columns, machines, jobs)
+        canvas.draw()
+
+    def zoom():
+        renderer.reset_view()
+        x0, x1 = renderer.ax.get_xlim()
+        renderer.zoom((x0 + x1) / 2, 0.25)
+        canvas.draw()
+
+    fresh = timed(redraw, args.repeats)
+    zoomed = timed(zoom, args.repeats)
+
+    print(f"legacy   : {1000 * legacy:8.1f} ms")
+    print(f"renderer : {1000 * fresh:8.1f} ms  ({legacy / fresh:.1f}x)")
+    print(f"zoom     : {1000 * zoomed:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
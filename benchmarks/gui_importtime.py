@@ -0,0 +1,81 @@
+"""Regression check: import-time profile of the GUI startup path.
+
+Runs ``python -X importtime`` on ``import main`` (gui/main.py, the module
+the window is built from) in a fresh interpreter and fails when
+
+- a module that the GUI loads in the background (matplotlib, NumPy, the
+  C++ bindings, the Gantt renderer) is imported on the startup path, or
+- the cumulative startup import time exceeds ``--budget-ms``::
+
+    python benchmarks/gui_importtime.py --budget-ms 400 --top 15
+
+Exit code 0 = OK, 1 = regression, 2 = the GUI could not be imported at all
+(e.g. customtkinter missing).
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Top-level packages that must stay off the startup path (gui/main.py: BACKGROUND_IMPORTS)
+DEFERRED = ("matplotlib", "numpy", "bindings", "utils.gantt_render", "utils.export", "PIL")
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def profile(python):
+    """(module, self us, cumulative us, depth) per import, in import order."""
+    code = "import sys; sys.path[:0] = ['gui', '.']; import main"
+    proc = subprocess.run([python, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    if proc.returncode != 0:
+        tail = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        sys.stderr.write("\n".join(tail[-5:]) + "\n")
+        sys.exit(2)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=400.0,
+                        help="maximum cumulative import time of the startup path")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports (main and its direct imports) to list")
+    parser.add_argument("--python", default=sys.executable)
+    args = parser.parse_args()
+
+    rows = profile(args.python)
+    top_level = [row for row in rows if row[3] == 0]
+    total_ms = sum(row[2] for row in top_level) / 1e3
+    # "main" itself is one line; what it pulls in directly is more telling
+    listed = [row for row in rows if row[3] <= 1 and row[0] != "main"]
+
+    print(f"startup imports: {len(rows)} modules, {total_ms:.1f} ms cumulative (budget {args.budget_ms:.0f} ms)\n")
+    print(f"{'module':<44}{'cumulative [ms]':>16}")
+    for name, _, cumulative_us, _ in sorted(listed, key=lambda row: -row[2])[:args.top]:
+        print(f"{name:<44}{cumulative_us / 1e3:>16.1f}")
+
+    eager = [d for d in DEFERRED
+             if any(name == d or name.startswith(d + ".") for name, *_ in rows)]
+    failed = False
+    if eager:
+        print(f"\nFAIL: imported at startup, should load in the background: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"\nFAIL: startup imports take {total_ms:.1f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("\nOK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark: non-dominated sorting and NSGA-II runs.
+
+First part: ``non_dominated_sort`` (ENS-BS) on random 3-objective points
+against a naive pairwise sort in NumPy, checking that both give the same
+fronts. Second part: ``run_nsga2`` on instance files, reporting the front
+size, the makespan range of the front and the run time::
+
+    python benchmarks/nsga2.py --points 200 1000 4000
+    python benchmarks/nsga2.py --files data/instances/flexible.txt --generations 300
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from jobshop import load_bindings  # noqa: E402
+
+jb = load_bindings()
+
+
+def naive_sort(points):
+    """Front index of every point, O(M N^2) (NSGA-II's original sort)"""
+    no_worse = (points[:, None, :] <= points[None, :, :]).all(axis=2)
+    better = (points[:, None, :] < points[None, :, :]).any(axis=2)
+    dominates = no_worse & better          # [a, b]: a dominates b
+    counts = dominates.sum(axis=0)
+    rank = np.full(len(points), -1)
+    front = 0
+    current = np.flatnonzero(counts == 0)
+    while current.size:
+        rank[current] = front
+        counts = counts - dominates[current].sum(axis=0)
+        counts[rank >= 0] = -1
+        current = np.flatnonzero(counts == 0)
+        front += 1
+    return rank
+
+
+def bench_sort(sizes, seed):
+    rng = np.random.default_rng(seed)
+    print(f"{'points':>8}{'fronts':>8}{'ENS-BS ms':>12}{'naive ms':>11}")
+    for n in sizes:
+        points = rng.integers(0, 1000, size=(n, 3), dtype=np.int32)
+        start = time.perf_counter()
+        fronts = jb.non_dominated_sort(points)
+        fast_s = time.perf_counter() - start
+        start = time.perf_counter()
+        expected = naive_sort(points)
+        naive_s = time.perf_counter() - start
+
+        rank = np.empty(n, dtype=int)
+        for r, front in enumerate(fronts):
+            rank[front] = r
+        if not np.array_equal(rank, expected):
+            sys.exit(f"{n} points: fronts differ from the naive sort")
+        print(f"{n:>8}{len(fronts):>8}{fast_s * 1e3:>12.2f}{naive_s * 1e3:>11.2f}")
+
+
+def bench_runs(files, args):
+    print(f"\n{'instance':<14}{'front':>6}{'makespan':>14}{'transport':>14}{'idle':>14}{'time s':>9}")
+    for path in files:
+        instance = jb.load_instance_from_file(path)
+        params = jb.GeneticParams()
+        params.population_size = args.population
+        params.generations = args.generations
+        params.seed = args.seed
+        start = time.perf_counter()
+        front = jb.run_nsga2(instance, params)
+        elapsed = time.perf_counter() - start
+        objectives = front.objectives
+        ranges = "".join(f"{f'{lo}-{hi}':>14}" for lo, hi in zip(objectives.min(axis=0), objectives.max(axis=0)))
+        print(f"{Path(path).stem:<14}{len(front):>6}{ranges}{elapsed:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="*", default=[200, 1000, 4000])
+    parser.add_argument("--files", nargs="*", default=[str(ROOT / "data/instances/flexible.txt")],
+                        help="instance files for NSGA-II runs")
+    parser.add_argument("--population", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    bench_sort(args.points, args.seed)
+    if args.files:
+        bench_runs(args.files, args)
+
+
+if __name__ == "__main__":
+    main()
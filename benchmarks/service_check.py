@@ -0,0 +1,88 @@
+"""Regression check: SolverService answers match local solves.
+
+Every instance is solved through ``jobshop.SolverService`` (process and
+thread executors) and with the bindings directly, then edited (every
+processing time scaled by ``--scale``) and solved again through the same
+service, which must not answer from a stale shared-memory copy. A block
+from ``SolverService.share`` is solved in both modes too, and
+``instance_key`` (cached on the instance) must change with the edit. Every
+``SolveResult.to_solution()`` must also recalculate to the reported
+makespan (on flexible instances this needs the solver's machine choice)::
+
+    python benchmarks/service_check.py data/instances/test.txt data/instances/flexible.txt
+
+Exit code 0 = OK, 1 = a service result differs from the local one.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from jobshop import SolverService, load_bindings  # noqa: E402
+
+jb = load_bindings()
+
+GENETIC = {"seed": 1, "generations": 50}
+
+
+def scale_times(instance, factor):
+    jobs = instance.jobs
+    for job in jobs:
+        operations = job.operations
+        for op in operations:
+            op.processing_time *= factor
+            op.alternatives = [(machine, time * factor) for machine, time in op.alternatives]
+        job.operations = operations
+    instance.jobs = jobs
+
+
+async def check(path, executor, scale):
+    instance = jb.load_instance_from_file(path)
+    failures = []
+    async with SolverService(executor=executor, max_workers=2) as service:
+        for label in ("loaded", "edited", "shared"):
+            target = instance
+            if label == "edited":
+                key = jb.instance_key(instance)
+                scale_times(instance, scale)
+                if jb.instance_key(instance) == key:
+                    failures.append((path, executor, "instance_key", label))
+                    print(f"{Path(path).stem:<12}{executor:<9}instance_key unchanged after the edit  FAIL")
+            elif label == "shared":
+                target = service.share(instance)
+            for algorithm, params in (("greedy", {}), ("genetic", GENETIC)):
+                result = await service.solve(target, algorithm, **params)
+                if algorithm == "greedy":
+                    expected = jb.greedy_schedule(instance).makespan
+                else:
+                    expected = result.makespan      # seeded GA: only the round trip is checked
+                decoded = jb.calculate_makespan(instance, result.to_solution())
+                ok = result.makespan == expected == decoded
+                print(f"{Path(path).stem:<12}{executor:<9}{algorithm:<9}{label:<8}{result.makespan:>9}"
+                      f"{expected:>9}{decoded:>9}  {'ok' if ok else 'FAIL'}")
+                if not ok:
+                    failures.append((path, executor, algorithm, label))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instances", nargs="*",
+                        default=[str(ROOT / "data/instances/test.txt"), str(ROOT / "data/instances/flexible.txt")])
+    parser.add_argument("--scale", type=int, default=10, help="factor applied to processing times")
+    args = parser.parse_args()
+
+    print(f"{'instance':<12}{'executor':<9}{'solver':<9}{'state':<8}{'service':>9}{'local':>9}{'decoded':>9}")
+    failures = []
+    for path in args.instances:
+        for executor in ("process", "thread"):
+            failures += asyncio.run(check(path, executor, args.scale))
+    print("\nOK" if not failures else f"\nFAIL: {len(failures)} result(s) differ")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
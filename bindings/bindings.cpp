@@ -1,14 +1,109 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+#include <pybind11/operators.h>
+#include <memory>
+#include <string>
 #include "jobshop/genetic.hpp"
+#include "jobshop/nsga2.hpp"
+#include "jobshop/decoder.hpp"
 #include "jobshop/greedy.hpp"
 #include "jobshop/exact.hpp"
+#include "jobshop/portfolio.hpp"
+#include "jobshop/instance_stats.hpp"
+#include "jobshop/disjunctive_graph.hpp"
 #include "jobshop/file_io.hpp"
 #include "jobshop/solution.hpp"
+#include "jobshop/serialize.hpp"
+#include "jobshop/result_cache.hpp"
+#include <cstring>
 
 namespace py = pybind11;
 using namespace jobshop;
 
+namespace {
+
+py::bytes to_bytes(const std::vector<std::uint8_t>& buffer) {
+    return py::bytes(reinterpret_cast<const char*>(buffer.data()), buffer.size());
+}
+
+/**
+ * View any buffer-protocol object (bytes, memoryview, SharedMemory.buf)
+ * as a contiguous byte range, without copying it
+ */
+std::pair<const std::uint8_t*, std::size_t> byte_view(const py::buffer& buffer, py::buffer_info& info) {
+    info = buffer.request();
+    py::ssize_t expected = info.itemsize;
+    for (py::ssize_t i = info.ndim - 1; i >= 0; --i) {
+        if (info.strides[static_cast<size_t>(i)] != expected) {
+            throw std::invalid_argument("Buffer must be C-contiguous");
+        }
+        expected *= info.shape[static_cast<size_t>(i)];
+    }
+    return {static_cast<const std::uint8_t*>(info.ptr),
+            static_cast<std::size_t>(info.size * info.itemsize)};
+}
+
+JobShopInstance instance_from_buffer(const py::buffer& buffer) {
+    py::buffer_info info;
+    auto [data, size] = byte_view(buffer, info);
+    return deserialize_instance(data, size);
+}
+
+Solution solution_from_buffer(const py::buffer& buffer) {
+    py::buffer_info info;
+    auto [data, size] = byte_view(buffer, info);
+    return deserialize_solution(data, size);
+}
+
+/**
+ * Hand a vector over to NumPy without copying (the array owns it)
+ */
+template <typename T>
+py::array_t<T> to_array(std::vector<T>&& values) {
+    auto* owned = new std::vector<T>(std::move(values));
+    py::capsule free_when_done(owned, [](void* p) { delete static_cast<std::vector<T>*>(p); });
+    return py::array_t<T>(static_cast<py::ssize_t>(owned->size()), owned->data(), free_when_done);
+}
+
+/**
+ * Objective vectors as an (n, NUM_OBJECTIVES) int32 array
+ */
+py::array_t<std::int32_t> objectives_array(const std::vector<Objectives>& objectives) {
+    static_assert(sizeof(Objectives) == NUM_OBJECTIVES * sizeof(std::int32_t), "Objectives must be packed");
+    py::array_t<std::int32_t> array({static_cast<py::ssize_t>(objectives.size()),
+                                     static_cast<py::ssize_t>(NUM_OBJECTIVES)});
+    if (!objectives.empty()) {
+        std::memcpy(array.mutable_data(), objectives.data(), objectives.size() * sizeof(Objectives));
+    }
+    return array;
+}
+
+/**
+ * Adapt a Python callable to ProgressCallback.
+ *
+ * The solver runs with the GIL released, so the callable is held through a
+ * shared_ptr (copying GeneticParams in C++ never touches Python refcounts)
+ * and the GIL is taken only for the call and for the final release.
+ * The best solution is copied to Python only when it improved, otherwise
+ * the callable gets None.
+ */
+ProgressCallback wrap_progress(const py::object& callable) {
+    if (callable.is_none()) {
+        return {};
+    }
+    std::shared_ptr<py::object> fn(new py::object(callable), [](py::object* p) {
+        py::gil_scoped_acquire gil;
+        delete p;
+    });
+    return [fn](const GenerationStats& stats, const Solution& best) {
+        py::gil_scoped_acquire gil;
+        (*fn)(stats, stats.improved ? py::cast(best) : py::none());
+    };
+}
+
+} // namespace
+
 PYBIND11_MODULE(bindings, m) {
     m.doc() = "Job Shop Scheduling with Transport Times Optimizer";
 
@@ -17,30 +112,215 @@ PYBIND11_MODULE(bindings, m) {
     // Operation
     py::class_<Operation>(m, "Operation")
         .def(py::init<>())
-        .def_readwrite("job_id", &Operation::job_id)
         .def_readwrite("operation_id", &Operation::operation_id)
         .def_readwrite("machine_id", &Operation::machine_id)
-        .def_readwrite("processing_time", &Operation::processing_time);
+        .def_readwrite("processing_time", &Operation::processing_time)
+        .def_readwrite("alternatives", &Operation::alternatives,
+             "Eligible (machine, processing time) pairs; empty = only machine_id")
+        .def(py::pickle(
+            [](const Operation& op) {
+                return py::make_tuple(op.operation_id, op.machine_id, op.processing_time, op.alternatives);
+            },
+            [](const py::tuple& t) {
+                std::vector<std::pair<size_t, int>> alternatives;
+                if (t.size() > 3) alternatives = t[3].cast<std::vector<std::pair<size_t, int>>>();
+                return Operation{t[0].cast<size_t>(), t[1].cast<size_t>(), t[2].cast<int>(), std::move(alternatives)};
+            }));
 
     // Job
     py::class_<Job>(m, "Job")
         .def(py::init<>())
         .def_readwrite("job_id", &Job::job_id)
-        .def_readwrite("operations", &Job::operations);
+        .def_readwrite("operations", &Job::operations)
+        .def(py::pickle(
+            [](const Job& job) { return py::make_tuple(job.job_id, job.operations); },
+            [](const py::tuple& t) {
+                return Job{t[0].cast<size_t>(), t[1].cast<std::vector<Operation>>()};
+            }));
+
+    // InstanceStats
+    py::class_<InstanceStats>(m, "InstanceStats")
+        .def(py::init<>())
+        .def_readonly("num_jobs", &InstanceStats::num_jobs)
+        .def_readonly("num_machines", &InstanceStats::num_machines)
+        .def_readonly("num_operations", &InstanceStats::num_operations)
+        .def_readonly("total_processing", &InstanceStats::total_processing)
+        .def_readonly("total_transport", &InstanceStats::total_transport)
+        .def_readonly("job_lower_bound", &InstanceStats::job_lower_bound)
+        .def_readonly("critical_job", &InstanceStats::critical_job)
+        .def_readonly("machine_lower_bound", &InstanceStats::machine_lower_bound)
+        .def_readonly("bottleneck_machine", &InstanceStats::bottleneck_machine)
+        .def_readonly("lower_bound", &InstanceStats::lower_bound)
+        .def_readonly("machine_load", &InstanceStats::machine_load)
+        .def_readonly("op_tail", &InstanceStats::op_tail)
+        .def_readonly("load_imbalance", &InstanceStats::load_imbalance)
+        .def_readonly("transport_ratio", &InstanceStats::transport_ratio)
+        .def_readonly("flexible_operations", &InstanceStats::flexible_operations)
+        .def("__repr__", [](const InstanceStats& s) {
+            return "<InstanceStats lower_bound=" + std::to_string(s.lower_bound) +
+                   " bottleneck_machine=" + std::to_string(s.bottleneck_machine) + ">";
+        });
 
-    // JobShopInstance
+    // JobShopInstance: flat arrays in C++, jobs / transport_times are copies
+    // built on access (setters convert back and drop the cached statistics)
     py::class_<JobShopInstance>(m, "JobShopInstance")
         .def(py::init<>())
-        .def_readwrite("jobs", &JobShopInstance::jobs)
-        .def_readwrite("num_machines", &JobShopInstance::num_machines)
-        .def_readwrite("transport_times", &JobShopInstance::transport_times);
+        .def_property("jobs",
+             [](const JobShopInstance& instance) { return instance_jobs(instance); },
+             [](JobShopInstance& instance, const std::vector<Job>& jobs) {
+                 set_jobs(instance, jobs);
+                 invalidate_stats(instance);
+             })
+        .def_property("num_machines",
+             [](const JobShopInstance& instance) { return instance.num_machines; },
+             [](JobShopInstance& instance, size_t num_machines) {
+                 resize_machines(instance, num_machines);
+                 invalidate_stats(instance);
+             })
+        .def_property("transport_times",
+             [](const JobShopInstance& instance) { return transport_matrix(instance); },
+             [](JobShopInstance& instance, const std::vector<std::vector<int>>& transport_times) {
+                 set_transport_times(instance, transport_times);
+                 invalidate_stats(instance);
+             })
+        .def_property_readonly("num_jobs", &JobShopInstance::num_jobs)
+        .def_property_readonly("num_operations", &JobShopInstance::num_operations)
+        .def_property_readonly("is_flexible", &JobShopInstance::is_flexible,
+             "True if some operation can run on more than one machine")
+        .def_property_readonly("job_offsets",
+             [](const JobShopInstance& instance) { auto copy = instance.job_offset; return to_array(std::move(copy)); },
+             "Start of every job in the operation arrays (num_jobs + 1 entries), numpy copy")
+        .def_property_readonly("op_machines",
+             [](const JobShopInstance& instance) { auto copy = instance.op_machine; return to_array(std::move(copy)); },
+             "Machine of every operation, numpy copy")
+        .def_property_readonly("op_times",
+             [](const JobShopInstance& instance) { auto copy = instance.op_time; return to_array(std::move(copy)); },
+             "Processing time of every operation, numpy copy")
+        .def_property_readonly("stats",
+             [](const JobShopInstance& instance) { return instance_stats(instance); },
+             "Lower bounds and features, computed once and cached on the instance")
+        .def(py::pickle(
+            [](const JobShopInstance& instance) { return to_bytes(serialize_instance(instance)); },
+            [](const py::bytes& state) { return instance_from_buffer(py::buffer(state)); }))
+        .def("to_buffer",
+             [](const JobShopInstance& instance) { return to_bytes(serialize_instance(instance)); },
+             "Serialize instance into one compact bytes block")
+        .def("buffer_size",
+             &serialized_instance_size,
+             "Size in bytes of the serialized instance")
+        .def("write_buffer",
+             [](const JobShopInstance& instance, const py::buffer& target) {
+                 py::buffer_info info = target.request(true);
+                 std::vector<std::uint8_t> data = serialize_instance(instance);
+                 if (static_cast<std::size_t>(info.size * info.itemsize) < data.size()) {
+                     throw std::invalid_argument("Target buffer is too small");
+                 }
+                 std::memcpy(info.ptr, data.data(), data.size());
+                 return data.size();
+             },
+             py::arg("target"),
+             "Serialize into a writable buffer (e.g. SharedMemory.buf), returns bytes written")
+        .def_static("from_buffer", &instance_from_buffer,
+             py::arg("buffer"),
+             "Rebuild instance directly from a bytes-like or shared-memory buffer");
 
     // Solution
     py::class_<Solution>(m, "Solution")
         .def(py::init<>())
         .def_readwrite("operation_sequence", &Solution::operation_sequence)
         .def_readwrite("start_times", &Solution::start_times)
-        .def_readwrite("makespan", &Solution::makespan);
+        .def_readwrite("machine_choice", &Solution::machine_choice,
+             "Chosen alternative of every operation (by operation index); empty = defaults")
+        .def_readwrite("makespan", &Solution::makespan)
+        .def(py::pickle(
+            [](const Solution& solution) { return to_bytes(serialize_solution(solution)); },
+            [](const py::bytes& state) { return solution_from_buffer(py::buffer(state)); }))
+        .def("to_buffer",
+             [](const Solution& solution) { return to_bytes(serialize_solution(solution)); },
+             "Serialize solution into one compact bytes block")
+        .def_static("from_buffer", &solution_from_buffer,
+             py::arg("buffer"),
+             "Rebuild solution from a bytes-like buffer");
+
+    // GenerationStats
+    py::class_<GenerationStats>(m, "GenerationStats")
+        .def(py::init<>())
+        .def_readwrite("generation", &GenerationStats::generation)
+        .def_readwrite("best_makespan", &GenerationStats::best_makespan)
+        .def_readwrite("mean_makespan", &GenerationStats::mean_makespan)
+        .def_readwrite("improved", &GenerationStats::improved)
+        .def_readwrite("lower_bound", &GenerationStats::lower_bound)
+        .def("__repr__", [](const GenerationStats& s) {
+            return "<GenerationStats generation=" + std::to_string(s.generation) +
+                   " best=" + std::to_string(s.best_makespan) + ">";
+        });
+
+    // DecoderKind
+    py::enum_<DecoderKind>(m, "DecoderKind")
+        .value("SemiActive", DecoderKind::SemiActive)
+        .value("Active", DecoderKind::Active)
+        .value("NonDelay", DecoderKind::NonDelay)
+        .value("Hybrid", DecoderKind::Hybrid);
+
+    py::enum_<CrossoverKind>(m, "CrossoverKind")
+        .value("OX", CrossoverKind::OX)
+        .value("JOX", CrossoverKind::JOX);
+
+    py::enum_<MutationKind>(m, "MutationKind")
+        .value("Swap", MutationKind::Swap)
+        .value("Insert", MutationKind::Insert)
+        .value("Inversion", MutationKind::Inversion);
+
+    // GeneticParams
+    py::class_<GeneticParams>(m, "GeneticParams")
+        .def(py::init<>())
+        .def_readwrite("population_size", &GeneticParams::population_size)
+        .def_readwrite("generations", &GeneticParams::generations)
+        .def_readwrite("tournament_size", &GeneticParams::tournament_size)
+        .def_readwrite("mutation_prob", &GeneticParams::mutation_prob)
+        .def_readwrite("seed", &GeneticParams::seed)
+        .def_readwrite("crossover", &GeneticParams::crossover)
+        .def_readwrite("mutation", &GeneticParams::mutation)
+        .def_readwrite("decoder", &GeneticParams::decoder)
+        .def_readwrite("decoder_delta", &GeneticParams::decoder_delta)
+        .def_readwrite("frozen_prefix", &GeneticParams::frozen_prefix)
+        .def_readwrite("checkpoint_path", &GeneticParams::checkpoint_path)
+        .def_readwrite("checkpoint_interval", &GeneticParams::checkpoint_interval)
+        .def_readwrite("stop_at_lower_bound", &GeneticParams::stop_at_lower_bound)
+        .def_property("on_progress",
+             [](const GeneticParams& p) { return static_cast<bool>(p.on_progress); },
+             [](GeneticParams& p, const py::object& callable) { p.on_progress = wrap_progress(callable); },
+             "Callable (stats, best_or_None) invoked after every generation on the solver thread; "
+             "reading it tells whether one is set")
+        .def(py::pickle(
+            [](const GeneticParams& p) {
+                return py::make_tuple(p.population_size, p.generations, p.tournament_size,
+                                      p.mutation_prob, p.seed, p.frozen_prefix,
+                                      p.checkpoint_path, p.checkpoint_interval,
+                                      p.decoder, p.decoder_delta, p.crossover, p.mutation,
+                                      p.stop_at_lower_bound);
+            },
+            [](const py::tuple& t) {
+                GeneticParams p;
+                p.population_size = t[0].cast<size_t>();
+                p.generations = t[1].cast<size_t>();
+                p.tournament_size = t[2].cast<size_t>();
+                p.mutation_prob = t[3].cast<double>();
+                p.seed = t[4].cast<unsigned int>();
+                p.frozen_prefix = t[5].cast<size_t>();
+                p.checkpoint_path = t[6].cast<std::string>();
+                p.checkpoint_interval = t[7].cast<size_t>();
+                if (t.size() > 8) {
+                    p.decoder = t[8].cast<DecoderKind>();
+                    p.decoder_delta = t[9].cast<double>();
+                }
+                if (t.size() > 10) {
+                    p.crossover = t[10].cast<CrossoverKind>();
+                    p.mutation = t[11].cast<MutationKind>();
+                }
+                if (t.size() > 12) p.stop_at_lower_bound = t[12].cast<bool>();
+                return p;
+            }));
 
     // ========== FILE I/O ==========
     
@@ -55,55 +335,563 @@ PYBIND11_MODULE(bindings, m) {
           py::arg("solution"),
           "Calculate makespan for a solution");
 
+    m.def("makespan_with_cutoff",
+          [](const JobShopInstance& instance, const Solution& solution, int cutoff) {
+              size_t decoded = 0;
+              int makespan = makespan_with_cutoff(instance, solution, cutoff, &decoded);
+              return py::make_tuple(makespan, decoded);
+          },
+          py::arg("instance"),
+          py::arg("solution"),
+          py::arg("cutoff"),
+          "Makespan if below cutoff, otherwise a bound >= cutoff; returns (value, operations decoded)");
+
+    m.def("schedule_table",
+          [](const JobShopInstance& instance, const Solution& solution) {
+              ScheduleTable table;
+              {
+                  py::gil_scoped_release release;
+                  table = schedule_table(instance, solution);
+              }
+              py::dict columns;
+              columns["job"] = to_array(std::move(table.job));
+              columns["op"] = to_array(std::move(table.op));
+              columns["machine"] = to_array(std::move(table.machine));
+              columns["start"] = to_array(std::move(table.start));
+              columns["duration"] = to_array(std::move(table.duration));
+              columns["end"] = to_array(std::move(table.end));
+              columns["transport_in"] = to_array(std::move(table.transport_in));
+              return columns;
+          },
+          py::arg("instance"),
+          py::arg("solution"),
+          "Per-operation columns as int32 NumPy arrays: job, op, machine, start, duration, end, transport_in");
+
+    m.def("decode_schedule", &decode_schedule,
+          py::arg("instance"),
+          py::arg("solution"),
+          py::arg("decoder"),
+          py::arg("delta") = 0.5,
+          py::arg("frozen_prefix") = 0,
+          "Decode solution in place with the given decoder, returns makespan");
+
+    m.attr("EVAL_LANES") = EVAL_LANES;
+
+    m.def("evaluate_population",
+          [](const JobShopInstance& instance, const py::list& population, DecoderKind decoder,
+             double delta, size_t frozen_prefix, bool batched) {
+              std::vector<Solution> solutions;
+              solutions.reserve(population.size());
+              for (const auto& item : population) solutions.push_back(item.cast<Solution>());
+              {
+                  py::gil_scoped_release release;
+                  evaluate_population(instance, solutions, decoder, delta, frozen_prefix, batched);
+              }
+              // Results go back into the list's objects, as with calculate_makespan
+              std::vector<int> makespans(solutions.size());
+              for (size_t i = 0; i < solutions.size(); ++i) {
+                  makespans[i] = solutions[i].makespan;
+                  population[i].cast<Solution&>() = std::move(solutions[i]);
+              }
+              return to_array(std::move(makespans));
+          },
+          py::arg("instance"),
+          py::arg("population"),
+          py::arg("decoder") = DecoderKind::SemiActive,
+          py::arg("delta") = 0.5,
+          py::arg("frozen_prefix") = 0,
+          py::arg("batched") = true,
+          "Decode a list of solutions in place (semi-active in lockstep batches), "
+          "returns the makespans as an int32 NumPy array");
+
+    m.def("parse_decoder", &parse_decoder,
+          py::arg("name"),
+          "DecoderKind from 'semi-active', 'active', 'non-delay' or 'hybrid'");
+
+    m.def("analyze_instance", &analyze_instance,
+          py::arg("instance"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Compute instance statistics without using the cache");
+
+    m.def("optimality_gap", &optimality_gap,
+          py::arg("makespan"),
+          py::arg("lower_bound"),
+          "(makespan - lower_bound) / lower_bound");
+
+    m.def("sequential_solution", &sequential_solution,
+          py::arg("instance"),
+          "Job-after-job baseline solution (with start times and makespan)");
+
     // ========== GENETIC ALGORITHM ==========
     
-    m.def("generate_random_solution", &generate_random_solution,
+    m.def("generate_random_solution",
+          py::overload_cast<const JobShopInstance&, unsigned int>(&generate_random_solution),
           py::arg("instance"),
           py::arg("seed") = 0,
           "Generate a random solution");
     
-    m.def("generate_population", &generate_population,
+    m.def("generate_population",
+          py::overload_cast<const JobShopInstance&, size_t, unsigned int>(&generate_population),
           py::arg("instance"),
           py::arg("population_size"),
           py::arg("seed") = 0,
           "Generate initial population");
     
-    m.def("tournament_selection", &tournament_selection,
+    m.def("tournament_selection",
+          py::overload_cast<const std::vector<Solution>&, const JobShopInstance&, size_t, unsigned int>(
+              &tournament_selection),
           py::arg("population"),
           py::arg("instance"),
           py::arg("tournament_size"),
           py::arg("seed") = 0,
           "Tournament selection");
     
-    m.def("order_crossover", &order_crossover,
+    m.def("order_crossover",
+          py::overload_cast<const Solution&, const Solution&, unsigned int>(&order_crossover),
           py::arg("parent1"),
           py::arg("parent2"),
           py::arg("seed") = 0,
           "Order Crossover (OX)");
+
+    m.def("job_order_crossover",
+          py::overload_cast<const Solution&, const Solution&, unsigned int>(&job_order_crossover),
+          py::arg("parent1"),
+          py::arg("parent2"),
+          py::arg("seed") = 0,
+          "Job-based Order Crossover (JOX)");
     
-    m.def("mutate_swap", &mutate_swap,
+    m.def("mutate_swap",
+          py::overload_cast<Solution&, unsigned int>(&mutate_swap),
           py::arg("solution"),
           py::arg("seed") = 0,
           "Swap mutation");
+
+    m.def("mutate_insert",
+          py::overload_cast<Solution&, unsigned int>(&mutate_insert),
+          py::arg("solution"),
+          py::arg("seed") = 0,
+          "Insert mutation");
+
+    m.def("mutate_inversion",
+          py::overload_cast<Solution&, unsigned int>(&mutate_inversion),
+          py::arg("solution"),
+          py::arg("seed") = 0,
+          "Inversion mutation");
+
+    m.def("parse_crossover", &parse_crossover,
+          py::arg("name"),
+          "CrossoverKind from 'ox' or 'jox'");
+
+    m.def("parse_mutation", &parse_mutation,
+          py::arg("name"),
+          "MutationKind from 'swap', 'insert' or 'inversion'");
+
+    m.def("load_genetic_profile", &load_genetic_profile,
+          py::arg("path"),
+          py::arg("defaults") = GeneticParams{},
+          "GeneticParams from a profile file (key = value lines)");
+
+    m.def("save_genetic_profile", &save_genetic_profile,
+          py::arg("path"),
+          py::arg("params"),
+          py::arg("comment") = "",
+          "Write the profile keys of params; comment lines are prefixed with '#'");
     
-    m.def("run_genetic", &run_genetic,
+    m.def("run_genetic",
+          py::overload_cast<const JobShopInstance&, size_t, size_t, size_t, double, unsigned int>(
+              &run_genetic),
           py::arg("instance"),
           py::arg("population_size"),
           py::arg("generations"),
           py::arg("tournament_size"),
           py::arg("mutation_prob"),
           py::arg("seed") = 0,
+          py::call_guard<py::gil_scoped_release>(),
           "Run genetic algorithm");
+    
+    m.def("run_genetic",
+          py::overload_cast<const JobShopInstance&, const GeneticParams&>(&run_genetic),
+          py::arg("instance"),
+          py::arg("params"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Run genetic algorithm with GeneticParams (supports checkpointing)");
+    
+    m.def("resume_genetic", &resume_genetic,
+          py::arg("instance"),
+          py::arg("snapshot_path"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Continue an interrupted genetic run from a snapshot file");
+    
+    m.def("repair_solution",
+          [](const JobShopInstance& instance, const Solution& previous,
+             const std::vector<std::pair<size_t, size_t>>& frozen, unsigned int seed) {
+              Rng rng(resolve_seed(seed));
+              return repair_solution(instance, previous, frozen, rng);
+          },
+          py::arg("instance"),
+          py::arg("previous"),
+          py::arg("frozen") = std::vector<std::pair<size_t, size_t>>(),
+          py::arg("seed") = 0,
+          "Repair a previous solution for an edited instance (frozen operations first)");
+    
+    m.def("reoptimize_genetic", &reoptimize_genetic,
+          py::arg("instance"),
+          py::arg("previous"),
+          py::arg("frozen"),
+          py::arg("params"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Warm-start genetic re-optimization from previous solution(s)");
+
+    // ========== NSGA-II ==========
+
+    py::tuple objective_names(NUM_OBJECTIVES);
+    for (size_t k = 0; k < NUM_OBJECTIVES; ++k) objective_names[k] = objective_name(k);
+    m.attr("OBJECTIVES") = objective_names;
+
+    py::class_<ParetoFront>(m, "ParetoFront")
+        .def_readonly("solutions", &ParetoFront::solutions)
+        .def_property_readonly("objectives",
+             [](const ParetoFront& front) { return objectives_array(front.objectives); },
+             "(n, 3) int32 array: makespan, transport, idle of every solution (see OBJECTIVES)")
+        .def_readonly("generations", &ParetoFront::generations)
+        .def("__len__", [](const ParetoFront& front) { return front.solutions.size(); })
+        .def("__repr__", [](const ParetoFront& front) {
+            return "<ParetoFront solutions=" + std::to_string(front.solutions.size()) +
+                   " generations=" + std::to_string(front.generations) + ">";
+        });
+
+    m.def("run_nsga2", &run_nsga2,
+          py::arg("instance"),
+          py::arg("params"),
+          py::call_guard<py::gil_scoped_release>(),
+          "NSGA-II over makespan, transport and idle time with GeneticParams; returns the ParetoFront");
+
+    m.def("evaluate_objectives",
+          [](const JobShopInstance& instance, Solution& solution, DecoderKind decoder, double delta) {
+              const Objectives objectives = evaluate_objectives(instance, solution, decoder, delta);
+              return py::make_tuple(objectives[0], objectives[1], objectives[2]);
+          },
+          py::arg("instance"),
+          py::arg("solution"),
+          py::arg("decoder") = DecoderKind::SemiActive,
+          py::arg("delta") = 0.5,
+          "Decode solution in place, returns (makespan, transport, idle)");
+
+    m.def("non_dominated_sort",
+          [](const py::array_t<std::int32_t, py::array::c_style | py::array::forcecast>& points) {
+              if (points.ndim() != 2 || points.shape(1) != static_cast<py::ssize_t>(NUM_OBJECTIVES)) {
+                  throw std::invalid_argument("points must have shape (n, " + std::to_string(NUM_OBJECTIVES) + ")");
+              }
+              std::vector<Objectives> values(static_cast<size_t>(points.shape(0)));
+              if (!values.empty()) std::memcpy(values.data(), points.data(), values.size() * sizeof(Objectives));
+              py::gil_scoped_release release;
+              return non_dominated_sort(values);
+          },
+          py::arg("points"),
+          "Fronts (lists of row indices, best first) of an (n, 3) objective array");
 
     // ========== GREEDY ALGORITHM ==========
     
     m.def("greedy_schedule", &greedy_schedule,
           py::arg("instance"),
+          py::call_guard<py::gil_scoped_release>(),
           "Run greedy scheduling algorithm");
 
+    py::enum_<DispatchRule>(m, "DispatchRule")
+        .value("SPT", DispatchRule::SPT)
+        .value("LPT", DispatchRule::LPT)
+        .value("MWKR", DispatchRule::MWKR)
+        .value("LWKR", DispatchRule::LWKR)
+        .value("MOPNR", DispatchRule::MOPNR)
+        .value("FIFO", DispatchRule::FIFO);
+
+    m.def("dispatch_schedule", &dispatch_schedule,
+          py::arg("instance"),
+          py::arg("rule"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Non-delay dispatching with a priority rule");
+
+    m.def("parse_dispatch_rule", &parse_dispatch_rule,
+          py::arg("name"),
+          "DispatchRule from its name (spt, lpt, mwkr, lwkr, mopnr, fifo)");
+
     // ========== EXACT ALGORITHM ==========
+
+    py::enum_<ExactSearch>(m, "ExactSearch")
+        .value("ASTAR", ExactSearch::AStar)
+        .value("IDASTAR", ExactSearch::IDAStar);
+
+    m.def("parse_exact_search", &parse_exact_search,
+          py::arg("name"),
+          "ExactSearch from its name (astar, ida)");
+
+    py::class_<ExactStats>(m, "ExactStats")
+        .def(py::init<>())
+        .def_readonly("expanded", &ExactStats::expanded)
+        .def_readonly("generated", &ExactStats::generated)
+        .def_readonly("stored_states", &ExactStats::stored_states)
+        .def_readonly("iterations", &ExactStats::iterations)
+        .def_readonly("table_hits", &ExactStats::table_hits)
+        .def_readonly("table_slots", &ExactStats::table_slots)
+        .def_readonly("table_replacements", &ExactStats::table_replacements)
+        .def_readonly("switched_to_ida", &ExactStats::switched_to_ida)
+        .def("__repr__", [](const ExactStats& s) {
+            return "<ExactStats expanded=" + std::to_string(s.expanded) +
+                   " stored=" + std::to_string(s.stored_states) +
+                   " iterations=" + std::to_string(s.iterations) + ">";
+        });
+
+    auto exact_limits = [](int upper_bound, size_t max_states, const std::string& search,
+                           size_t table_mb, size_t node_mb) {
+        ExactLimits limits;
+        if (upper_bound > 0) limits.upper_bound = [upper_bound] { return upper_bound; };
+        limits.max_states = max_states;
+        limits.search = parse_exact_search(search);
+        limits.table_mb = table_mb;
+        limits.node_mb = node_mb;
+        return limits;
+    };
     
-    m.def("solve_exact", &solve_exact,
+    m.def("solve_exact",
+          [exact_limits](const JobShopInstance& instance, int upper_bound, size_t max_states,
+                         const std::string& search, size_t table_mb, size_t node_mb) {
+              return solve_exact(instance, exact_limits(upper_bound, max_states, search, table_mb, node_mb));
+          },
+          py::arg("instance"),
+          py::arg("upper_bound") = 0,
+          py::arg("max_states") = 0,
+          py::arg("search") = "astar",
+          py::arg("table_mb") = ExactLimits{}.table_mb,
+          py::arg("node_mb") = ExactLimits{}.node_mb,
+          py::call_guard<py::gil_scoped_release>(),
+          "Run exact algorithm (A* search, or IDA* with search=\"ida\"). With upper_bound "
+          "only strictly better solutions are searched for; an empty Solution means none "
+          "exists (or max_states was reached)");
+
+    m.def("solve_exact_stats",
+          [exact_limits](const JobShopInstance& instance, int upper_bound, size_t max_states,
+                         const std::string& search, size_t table_mb, size_t node_mb) {
+              ExactStats stats;
+              bool complete = false;
+              Solution solution = solve_exact(instance, exact_limits(upper_bound, max_states, search, table_mb, node_mb),
+                                              &complete, &stats);
+              return std::make_tuple(solution, complete, stats);
+          },
+          py::arg("instance"),
+          py::arg("upper_bound") = 0,
+          py::arg("max_states") = 0,
+          py::arg("search") = "astar",
+          py::arg("table_mb") = ExactLimits{}.table_mb,
+          py::arg("node_mb") = ExactLimits{}.node_mb,
+          py::call_guard<py::gil_scoped_release>(),
+          "solve_exact returning (Solution, complete, ExactStats)");
+
+    // ========== DISJUNCTIVE GRAPH ==========
+
+    py::class_<CriticalBlock>(m, "CriticalBlock")
+        .def_readonly("machine", &CriticalBlock::machine)
+        .def_readonly("operations", &CriticalBlock::operations)
+        .def("__repr__", [](const CriticalBlock& b) {
+            return "<CriticalBlock machine=" + std::to_string(b.machine) +
+                   " operations=" + std::to_string(b.operations.size()) + ">";
+        });
+
+    py::class_<DisjunctiveGraph>(m, "DisjunctiveGraph")
+        .def(py::init<const JobShopInstance&, const Solution&>(),
+             py::arg("instance"),
+             py::arg("solution"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Graph of the solution's machine order (from start_times when filled in)")
+        .def_property_readonly("num_operations", &DisjunctiveGraph::num_operations)
+        .def_property_readonly("num_machines", &DisjunctiveGraph::num_machines)
+        .def_property_readonly("makespan", &DisjunctiveGraph::makespan)
+        .def_property_readonly("heads",
+             [](const DisjunctiveGraph& graph) { auto copy = graph.heads(); return to_array(std::move(copy)); },
+             "Earliest start of every operation (by op index), numpy copy")
+        .def_property_readonly("tails",
+             [](const DisjunctiveGraph& graph) { auto copy = graph.tails(); return to_array(std::move(copy)); },
+             "Longest path from the end of every operation to the end of the schedule, numpy copy")
+        .def_property_readonly("slack",
+             [](const DisjunctiveGraph& graph) {
+                 std::vector<std::int32_t> slack(graph.num_operations());
+                 for (size_t i = 0; i < slack.size(); ++i) slack[i] = graph.slack(i);
+                 return to_array(std::move(slack));
+             },
+             "makespan - (head + time + tail) of every operation, 0 = critical; numpy array")
+        .def("machine_order", &DisjunctiveGraph::machine_order,
+             py::arg("machine"),
+             "Op indices of a machine in processing order")
+        .def("critical_path", &DisjunctiveGraph::critical_path,
+             "Op indices of one longest path, in order")
+        .def("critical_blocks", &DisjunctiveGraph::critical_blocks,
+             "Critical path cut into machine blocks")
+        .def("critical_moves", &DisjunctiveGraph::critical_moves,
+             "N5 swaps (u, v) on the critical path, u directly before v")
+        .def("swap_estimate", &DisjunctiveGraph::swap_estimate,
+             py::arg("u"),
+             py::arg("v"),
+             "Estimated makespan after swapping adjacent operations u, v (O(1), graph unchanged)")
+        .def("swap", &DisjunctiveGraph::swap,
+             py::arg("u"),
+             py::arg("v"),
+             "Swap adjacent operations u, v and update heads / tails incrementally; "
+             "False (graph unchanged) if that would create a cycle")
+        .def("to_solution", &DisjunctiveGraph::to_solution,
+             "Solution with the current machine order and start times")
+        .def("__repr__", [](const DisjunctiveGraph& g) {
+            return "<DisjunctiveGraph operations=" + std::to_string(g.num_operations()) +
+                   " makespan=" + std::to_string(g.makespan()) + ">";
+        });
+
+    py::class_<BottleneckReport>(m, "BottleneckReport")
+        .def_readonly("makespan", &BottleneckReport::makespan)
+        .def_readonly("path_operations", &BottleneckReport::path_operations)
+        .def_readonly("path_processing", &BottleneckReport::path_processing)
+        .def_readonly("path_transport", &BottleneckReport::path_transport)
+        .def_readonly("blocks", &BottleneckReport::blocks)
+        .def_readonly("critical_operations", &BottleneckReport::critical_operations)
+        .def_readonly("machine_load", &BottleneckReport::machine_load)
+        .def_readonly("machine_critical", &BottleneckReport::machine_critical)
+        .def_readonly("machine_path", &BottleneckReport::machine_path)
+        .def_readonly("bottleneck_machine", &BottleneckReport::bottleneck_machine)
+        .def_readonly("mean_slack", &BottleneckReport::mean_slack)
+        .def("__repr__", [](const BottleneckReport& r) {
+            return "<BottleneckReport makespan=" + std::to_string(r.makespan) +
+                   " bottleneck_machine=" + std::to_string(r.bottleneck_machine) + ">";
+        });
+
+    m.def("bottleneck_report", &bottleneck_report,
+          py::arg("graph"),
+          "Critical path composition and per-machine critical load of a DisjunctiveGraph");
+
+    // ========== PORTFOLIO ==========
+
+    py::class_<MemberReport>(m, "MemberReport")
+        .def(py::init<>())
+        .def_readonly("name", &MemberReport::name)
+        .def_readonly("best_makespan", &MemberReport::best_makespan)
+        .def_readonly("time_to_best", &MemberReport::time_to_best)
+        .def_readonly("improvements", &MemberReport::improvements)
+        .def_readonly("runtime", &MemberReport::runtime)
+        .def_readonly("finished", &MemberReport::finished)
+        .def("__repr__", [](const MemberReport& r) {
+            return "<MemberReport " + r.name + " best=" + std::to_string(r.best_makespan) +
+                   " improvements=" + std::to_string(r.improvements) + ">";
+        });
+
+    py::class_<PortfolioResult>(m, "PortfolioResult")
+        .def(py::init<>())
+        .def_readonly("best", &PortfolioResult::best)
+        .def_readonly("best_member", &PortfolioResult::best_member)
+        .def_readonly("proven_optimal", &PortfolioResult::proven_optimal)
+        .def_readonly("lower_bound", &PortfolioResult::lower_bound)
+        .def_readonly("elapsed", &PortfolioResult::elapsed)
+        .def_readonly("members", &PortfolioResult::members);
+
+    py::class_<PortfolioParams>(m, "PortfolioParams")
+        .def(py::init<>())
+        .def_readwrite("time_limit", &PortfolioParams::time_limit)
+        .def_readwrite("threads", &PortfolioParams::threads)
+        .def_readwrite("greedy", &PortfolioParams::greedy)
+        .def_readwrite("dispatch_rules", &PortfolioParams::dispatch_rules)
+        .def_readwrite("exact_max_states", &PortfolioParams::exact_max_states)
+        .def_readwrite("genetic", &PortfolioParams::genetic)
+        .def_readwrite("target_makespan", &PortfolioParams::target_makespan);
+
+    m.def("default_genetic_members", &default_genetic_members,
+          py::arg("count"),
+          py::arg("base") = GeneticParams{},
+          "GA configurations differing in seed and decoder, running until the deadline");
+
+    m.def("run_portfolio", &run_portfolio,
+          py::arg("instance"),
+          py::arg("params"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Race greedy, dispatch rules, exact and GA members under one deadline");
+
+    // ========== RESULT CACHE ==========
+
+    py::class_<CacheKey>(m, "CacheKey")
+        .def(py::init<>())
+        .def_readonly("hi", &CacheKey::hi)
+        .def_readonly("lo", &CacheKey::lo)
+        .def("hex", &CacheKey::hex)
+        .def(py::self == py::self)
+        .def(py::self != py::self)
+        .def("__hash__", [](const CacheKey& key) { return CacheKeyHash{}(key); })
+        .def("__repr__", [](const CacheKey& key) { return "<CacheKey " + key.hex() + ">"; });
+
+    m.def("instance_key", &instance_key,
+          py::arg("instance"),
+          "Canonical content hash of an instance");
+
+    m.def("request_key", &request_key,
+          py::arg("instance_key"),
+          py::arg("algorithm"),
+          py::arg("params") = "",
+          "Key of a solve request: instance key + algorithm + canonical parameter text");
+
+    m.def("genetic_params_key", &genetic_params_key,
+          py::arg("params"),
+          "Canonical text of the GA parameters that change the result");
+
+    py::class_<CacheStats>(m, "CacheStats")
+        .def(py::init<>())
+        .def_readonly("memory_hits", &CacheStats::memory_hits)
+        .def_readonly("disk_hits", &CacheStats::disk_hits)
+        .def_readonly("misses", &CacheStats::misses)
+        .def_readonly("stores", &CacheStats::stores)
+        .def_readonly("evictions", &CacheStats::evictions)
+        .def_readonly("memory_entries", &CacheStats::memory_entries)
+        .def_readonly("disk_bytes", &CacheStats::disk_bytes)
+        .def("__repr__", [](const CacheStats& s) {
+            return "<CacheStats hits=" + std::to_string(s.memory_hits) + "+" + std::to_string(s.disk_hits) +
+                   " misses=" + std::to_string(s.misses) + " stores=" + std::to_string(s.stores) + ">";
+        });
+
+    py::class_<ResultCache>(m, "ResultCache")
+        .def(py::init<std::string, size_t, std::uint64_t>(),
+             py::arg("directory") = "",
+             py::arg("memory_entries") = 64,
+             py::arg("disk_limit") = 64ull << 20,
+             "Solve-result cache: in-memory LRU + optional directory limited to disk_limit bytes")
+        .def("lookup", &ResultCache::lookup,
+             py::arg("instance_key"),
+             py::arg("request_key"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Cached Solution of a request or None")
+        .def("store", &ResultCache::store,
+             py::arg("instance_key"),
+             py::arg("request_key"),
+             py::arg("solution"),
+             py::call_guard<py::gil_scoped_release>())
+        .def("seeds", &ResultCache::seeds,
+             py::arg("instance_key"),
+             py::arg("count"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Best distinct cached solutions of the instance (any algorithm and parameters)")
+        .def("clear", &ResultCache::clear)
+        .def("stats", &ResultCache::stats)
+        .def_property_readonly("directory", &ResultCache::directory);
+
+    py::class_<CacheOutcome>(m, "CacheOutcome")
+        .def(py::init<>())
+        .def_readonly("hit", &CacheOutcome::hit)
+        .def_readonly("warm_seeds", &CacheOutcome::warm_seeds)
+        .def_readonly("request", &CacheOutcome::request);
+
+    m.def("solve_cached",
+          [](ResultCache& cache, const JobShopInstance& instance, const std::string& algorithm,
+             const GeneticParams& params, bool warm_start) {
+              CacheOutcome outcome;
+              Solution solution = solve_cached(cache, instance, algorithm, params, warm_start, &outcome);
+              return std::make_pair(solution, outcome);
+          },
+          py::arg("cache"),
           py::arg("instance"),
-          "Run exact algorithm (A* search)");
+          py::arg("algorithm"),
+          py::arg("params") = GeneticParams{},
+          py::arg("warm_start") = false,
+          py::call_guard<py::gil_scoped_release>(),
+          "Solve greedy/exact/genetic through the cache; returns (Solution, CacheOutcome)");
 }
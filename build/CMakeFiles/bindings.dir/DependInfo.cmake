@@ -0,0 +1,35 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/bindings/bindings.cpp" "CMakeFiles/bindings.dir/bindings/bindings.cpp.o" "gcc" "CMakeFiles/bindings.dir/bindings/bindings.cpp.o.d"
+  "/root/package/src/core/decoder.cpp" "CMakeFiles/bindings.dir/src/core/decoder.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/core/decoder.cpp.o.d"
+  "/root/package/src/core/disjunctive_graph.cpp" "CMakeFiles/bindings.dir/src/core/disjunctive_graph.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/core/disjunctive_graph.cpp.o.d"
+  "/root/package/src/core/evaluate.cpp" "CMakeFiles/bindings.dir/src/core/evaluate.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/core/evaluate.cpp.o.d"
+  "/root/package/src/core/instance_stats.cpp" "CMakeFiles/bindings.dir/src/core/instance_stats.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/core/instance_stats.cpp.o.d"
+  "/root/package/src/core/serialize.cpp" "CMakeFiles/bindings.dir/src/core/serialize.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/core/serialize.cpp.o.d"
+  "/root/package/src/core/solution.cpp" "CMakeFiles/bindings.dir/src/core/solution.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/core/solution.cpp.o.d"
+  "/root/package/src/exact/exact.cpp" "CMakeFiles/bindings.dir/src/exact/exact.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/exact/exact.cpp.o.d"
+  "/root/package/src/genetic/checkpoint.cpp" "CMakeFiles/bindings.dir/src/genetic/checkpoint.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/genetic/checkpoint.cpp.o.d"
+  "/root/package/src/genetic/genetic.cpp" "CMakeFiles/bindings.dir/src/genetic/genetic.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/genetic/genetic.cpp.o.d"
+  "/root/package/src/genetic/nsga2.cpp" "CMakeFiles/bindings.dir/src/genetic/nsga2.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/genetic/nsga2.cpp.o.d"
+  "/root/package/src/genetic/profile.cpp" "CMakeFiles/bindings.dir/src/genetic/profile.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/genetic/profile.cpp.o.d"
+  "/root/package/src/genetic/warm_start.cpp" "CMakeFiles/bindings.dir/src/genetic/warm_start.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/genetic/warm_start.cpp.o.d"
+  "/root/package/src/greedy/greedy.cpp" "CMakeFiles/bindings.dir/src/greedy/greedy.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/greedy/greedy.cpp.o.d"
+  "/root/package/src/io/file_io.cpp" "CMakeFiles/bindings.dir/src/io/file_io.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/io/file_io.cpp.o.d"
+  "/root/package/src/io/result_cache.cpp" "CMakeFiles/bindings.dir/src/io/result_cache.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/io/result_cache.cpp.o.d"
+  "/root/package/src/portfolio/portfolio.cpp" "CMakeFiles/bindings.dir/src/portfolio/portfolio.cpp.o" "gcc" "CMakeFiles/bindings.dir/src/portfolio/portfolio.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
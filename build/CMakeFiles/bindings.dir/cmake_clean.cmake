@@ -0,0 +1,43 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/bindings.dir/bindings/bindings.cpp.o"
+  "CMakeFiles/bindings.dir/bindings/bindings.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/core/decoder.cpp.o"
+  "CMakeFiles/bindings.dir/src/core/decoder.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/core/disjunctive_graph.cpp.o"
+  "CMakeFiles/bindings.dir/src/core/disjunctive_graph.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/core/evaluate.cpp.o"
+  "CMakeFiles/bindings.dir/src/core/evaluate.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/core/instance_stats.cpp.o"
+  "CMakeFiles/bindings.dir/src/core/instance_stats.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/core/serialize.cpp.o"
+  "CMakeFiles/bindings.dir/src/core/serialize.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/core/solution.cpp.o"
+  "CMakeFiles/bindings.dir/src/core/solution.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/exact/exact.cpp.o"
+  "CMakeFiles/bindings.dir/src/exact/exact.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/genetic/checkpoint.cpp.o"
+  "CMakeFiles/bindings.dir/src/genetic/checkpoint.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/genetic/genetic.cpp.o"
+  "CMakeFiles/bindings.dir/src/genetic/genetic.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/genetic/nsga2.cpp.o"
+  "CMakeFiles/bindings.dir/src/genetic/nsga2.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/genetic/profile.cpp.o"
+  "CMakeFiles/bindings.dir/src/genetic/profile.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/genetic/warm_start.cpp.o"
+  "CMakeFiles/bindings.dir/src/genetic/warm_start.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/greedy/greedy.cpp.o"
+  "CMakeFiles/bindings.dir/src/greedy/greedy.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/io/file_io.cpp.o"
+  "CMakeFiles/bindings.dir/src/io/file_io.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/io/result_cache.cpp.o"
+  "CMakeFiles/bindings.dir/src/io/result_cache.cpp.o.d"
+  "CMakeFiles/bindings.dir/src/portfolio/portfolio.cpp.o"
+  "CMakeFiles/bindings.dir/src/portfolio/portfolio.cpp.o.d"
+  "python_module/bindings.cpython-311-x86_64-linux-gnu.so"
+  "python_module/bindings.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/bindings.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
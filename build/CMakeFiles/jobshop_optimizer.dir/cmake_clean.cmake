@@ -0,0 +1,47 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/jobshop_optimizer.dir/src/core/decoder.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/decoder.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/disjunctive_graph.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/disjunctive_graph.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/evaluate.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/evaluate.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/instance_stats.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/instance_stats.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/serialize.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/serialize.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/solution.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/core/solution.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/exact/exact.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/exact/exact.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/checkpoint.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/checkpoint.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/genetic.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/genetic.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/nsga2.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/nsga2.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/profile.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/profile.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/warm_start.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/genetic/warm_start.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/greedy/greedy.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/greedy/greedy.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/io/file_io.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/io/file_io.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/io/result_cache.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/io/result_cache.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/main.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/main.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/portfolio/portfolio.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/portfolio/portfolio.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/server/json.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/server/json.cpp.o.d"
+  "CMakeFiles/jobshop_optimizer.dir/src/server/server.cpp.o"
+  "CMakeFiles/jobshop_optimizer.dir/src/server/server.cpp.o.d"
+  "bin/jobshop_optimizer"
+  "bin/jobshop_optimizer.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/jobshop_optimizer.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -25,11 +25,64 @@ DEFAULT_PARAMS = {
     "tournament_size": 3,
     "mutation_prob": 0.2,
     "seed": 0,
+    "crossover": "ox",
+    "mutation": "swap",
+    "decoder": "semi-active",
+    "decoder_delta": 0.5,
 }
 
+# Algorithms (GUI label -> name); GA_ALGORITHMS use the GA parameters
+ALGORITHMS = {
+    "Genetic": "genetic",
+    "Pareto (NSGA-II)": "nsga2",
+    "Greedy": "greedy",
+    "Exact": "exact",
+}
+GA_ALGORITHMS = ("genetic", "nsga2")
+
+# GA schedule decoders (GUI label -> name for bindings.parse_decoder)
+DECODERS = {
+    "Semi-active": "semi-active",
+    "Active (gap filling)": "active",
+    "Non-delay": "non-delay",
+    "Hybrid": "hybrid",
+}
+
+# GA operators (GUI label -> name for bindings.parse_crossover / parse_mutation)
+CROSSOVERS = {
+    "OX (order)": "ox",
+    "JOX (job-based order)": "jox",
+}
+MUTATIONS = {
+    "Swap": "swap",
+    "Insert": "insert",
+    "Inversion": "inversion",
+}
+
+# Profile from python -m jobshop.tune; if it exists it replaces DEFAULT_PARAMS at startup
+DEFAULT_PROFILE = "profiles/default.profile"
+PROFILE_DIR = "profiles"
+
+# Background import polling (ms between checks)
+PROGRESS_POLL_MS = 100
+
+# UI frame: every this many ms the Tk thread drains the event bus and solver
+# progress (status, console, convergence curve); the Gantt chart less often during a run
+UI_FRAME_MS = 33
+GANTT_REDRAW_MS = 250
+
+# The console keeps only this many recent lines (ring buffer)
+CONSOLE_MAX_LINES = 2000
+
 # Ścieżki
 DATA_DIR = "data/instances"
 
+# Result cache (bindings.ResultCache): a repeated request is not solved
+# again, the GA starts from the best stored schedules of the instance
+CACHE_DIR = ".jobshop-cache"
+CACHE_LIMIT_MB = 64
+CACHE_WARM_START = True
+
 # Card styling (dla kafelków)
 CARD_PADX = 15
 CARD_PADY = 15
@@ -12,7 +12,7 @@ class ExportDialog(ctk.CTkToplevel):
         super().__init__(parent)
         
         self.title("Export")
-        self.geometry("340x320") # Znacznie mniejszy rozmiar
+        self.geometry("340x355") # Much smaller size
         self.resizable(False, False)
         
         # Center on parent
@@ -23,6 +23,7 @@ class ExportDialog(ctk.CTkToplevel):
         self.csv_var = ctk.BooleanVar(value=True)
         self.json_var = ctk.BooleanVar(value=False)
         self.png_var = ctk.BooleanVar(value=False)
+        self.columnar_var = ctk.BooleanVar(value=False)
         self.save_path = None
         self.result = None
         
@@ -48,6 +49,7 @@ class ExportDialog(ctk.CTkToplevel):
         self._make_checkbox(check_bg, "CSV (Data Table)", self.csv_var)
         self._make_checkbox(check_bg, "JSON (Raw Data)", self.json_var)
         self._make_checkbox(check_bg, "PNG (Gantt Chart)", self.png_var)
+        self._make_checkbox(check_bg, "Parquet / NPZ (Columnar)", self.columnar_var)
         
         # --- 2. LOKALIZACJA ---
         path_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -154,7 +156,8 @@ class ExportDialog(ctk.CTkToplevel):
              return
 
         # Walidacja formatów
-        if not (self.csv_var.get() or self.json_var.get() or self.png_var.get()):
+        if not (self.csv_var.get() or self.json_var.get() or self.png_var.get()
+                or self.columnar_var.get()):
             # Można tu mignąć ramką checkboxów, ale prościej zablokować akcję
             return
 
@@ -162,7 +165,8 @@ class ExportDialog(ctk.CTkToplevel):
             'path': self.save_path,
             'csv': self.csv_var.get(),
             'json': self.json_var.get(),
-            'png': self.png_var.get()
+            'png': self.png_var.get(),
+            'columnar': self.columnar_var.get()
         }
         self.destroy()
 
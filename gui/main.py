@@ -18,22 +18,30 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "build" / "python_module")
 # Add gui directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Importy GUI
-from widgets import HeaderFrame, SidebarFrame, ConsoleFrame, GanttFrame, ButtonsFrame
-from config import WINDOW_WIDTH, WINDOW_HEIGHT
-from utils.export import ScheduleExporter
+# GUI imports (light ones only: matplotlib, NumPy and bindings load in the background,
+# see BACKGROUND_IMPORTS; benchmarks/gui_importtime.py guards this list)
+from widgets import HeaderFrame, SidebarFrame, ConsoleFrame, GanttFrame, ButtonsFrame, ConvergenceFrame
+from config import (WINDOW_WIDTH, WINDOW_HEIGHT, PROGRESS_POLL_MS, UI_FRAME_MS, GANTT_REDRAW_MS, CONSOLE_MAX_LINES,
+                    CACHE_DIR, CACHE_LIMIT_MB, CACHE_WARM_START, GA_ALGORITHMS)
+from utils.deferred import BackgroundImports
+from utils.events import UIEventBus
+from utils.progress import ProgressFeed
 
 # --- NOWE IMPORTY DIALOGÓW ---
 from gui.dialogs.status_dialog import StatusDialog
 from gui.dialogs.export_dialog import ExportDialog
 
-# Try to import bindings
-try:
-    import bindings as jb
-    BINDINGS_AVAILABLE = True
-except ImportError as e:
-    BINDINGS_AVAILABLE = False
-    IMPORT_ERROR = str(e)
+# Loaded after the window is first drawn, in this order
+BACKGROUND_IMPORTS = (
+    "bindings",
+    "numpy",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_tkagg",
+    "utils.gantt_render",
+)
+
+# The bindings module, set by JobShopApp._on_imports_done
+jb = None
 
 
 class JobShopApp(ctk.CTk):
@@ -47,20 +55,94 @@ class JobShopApp(ctk.CTk):
         ctk.set_default_color_theme("blue")
         
         self.instance = None
+        self.instance_key = None
         self.best_solution = None
+        self.front = None           # ParetoFront of the last NSGA-II run
         self.is_running = False
+        self.cache = None
+
+        # All UI updates reach the widgets in _frame, once per frame
+        self.events = UIEventBus(CONSOLE_MAX_LINES)
+        self.feed = None            # ProgressFeed of the running solve
+        self.pending_best = None    # improvement waiting for a Gantt redraw
+        self.gantt_drawn_at = 0.0
         
-        # Obsługa błędu importu przy starcie (StatusDialog zamiast messagebox)
-        if not BINDINGS_AVAILABLE:
-            self.after(200, lambda: StatusDialog(
+        self.create_widgets()
+        self.after(UI_FRAME_MS, self._frame)
+
+        # Heavy modules only once the window has been drawn
+        self.imports = BackgroundImports(*BACKGROUND_IMPORTS)
+        self.after_idle(self._start_imports)
+
+    # --- LAZY STARTUP ---
+
+    def _start_imports(self):
+        self.imports.start()
+        self.after(PROGRESS_POLL_MS, self._poll_imports)
+
+    def _poll_imports(self):
+        if not self.imports.done:
+            self.after(PROGRESS_POLL_MS, self._poll_imports)
+            return
+        self._on_imports_done()
+
+    def _on_imports_done(self):
+        """Tk thread: everything from BACKGROUND_IMPORTS is loaded (or failed)"""
+        global jb
+        if jb is not None:
+            return
+        try:
+            jb = self.imports.get("bindings")
+        except ImportError as e:
+            self.header.set_bindings_status(False)
+            # Import error handling (StatusDialog instead of a messagebox)
+            StatusDialog(
                 self, 
                 "Critical Error", 
                 "Failed to import C++ bindings. The application cannot function correctly.",
-                details=f"{IMPORT_ERROR}\n\nMake sure you compiled the project using CMake.",
+                details=f"{e}\n\nMake sure you compiled the project using CMake.",
                 type_="error"
-            ))
-        
-        self.create_widgets()
+            )
+            return
+
+        self.header.set_bindings_status(True)
+        try:
+            self.cache = jb.ResultCache(CACHE_DIR, disk_limit=CACHE_LIMIT_MB << 20)
+        except Exception:
+            self.cache = jb.ResultCache()  # directory unavailable: memory only
+        self.sidebar.load_default_profile()
+        self.gantt.attach_plot()
+        self.convergence.attach_plot()
+        self.console.insert_log(f"Libraries loaded in background ({self.imports.elapsed:.2f}s)")
+
+    # --- UI FRAME ---
+
+    def _frame(self):
+        """Tk thread, every UI_FRAME_MS: apply what was posted since the last frame"""
+        try:
+            records, status = self.events.drain()
+            for method, args in records:
+                getattr(self.console, method)(*args)
+            if status is not None:
+                self.header.update_status(*status)
+            if self.feed is not None:
+                self._drain_progress()
+            self.console.flush()
+        finally:
+            self.after(UI_FRAME_MS, self._frame)
+
+    def _require_bindings(self):
+        """True when the bindings are usable; waits for the background load"""
+        if jb is None:
+            if not self.imports.done:
+                self.update_status("Loading libraries...")
+                self.update_idletasks()
+            try:
+                self.imports.get("bindings")
+            except ImportError:
+                pass
+            self._on_imports_done()
+        return jb is not None
     
     def create_widgets(self):
         """Create UI layout - ORYGINALNY KOD BEZ ZMIAN"""
@@ -70,7 +152,7 @@ class JobShopApp(ctk.CTk):
         header_frame = ctk.CTkFrame(self, fg_color="#0d1117", corner_radius=0)
         header_frame.pack(side="top", fill="x", padx=15, pady=(15, 10))
         
-        self.header = HeaderFrame(header_frame, bindings_available=BINDINGS_AVAILABLE)
+        self.header = HeaderFrame(header_frame, bindings_available=None)
         self.header.pack(fill="x")
         
         # --- MAIN CONTAINER ---
@@ -128,22 +210,45 @@ class JobShopApp(ctk.CTk):
         self.gantt.pack(fill="both", expand=True, padx=15, pady=15)
         self.gantt.configure(fg_color="#161b22")
         
+        # Bottom row: logs + convergence
+        bottom_row = ctk.CTkFrame(right_container, fg_color="#0d1117")
+        bottom_row.grid(row=1, column=0, sticky="nsew", pady=0)
+        bottom_row.grid_rowconfigure(0, weight=1)
+        bottom_row.grid_columnconfigure(0, weight=60)
+        bottom_row.grid_columnconfigure(1, weight=40)
+
         # Logs card
         logs_card = ctk.CTkFrame(
-            right_container,
+            bottom_row,
             fg_color="#161b22",
             corner_radius=10,
             border_width=1,
             border_color="#30363d"
         )
-        logs_card.grid(row=1, column=0, sticky="nsew", pady=0)
+        logs_card.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
         
         self.console = ConsoleFrame(logs_card)
         self.console.pack(fill="both", expand=True, padx=15, pady=15)
         self.console.configure(fg_color="#161b22")
+
+        # Convergence card
+        convergence_card = ctk.CTkFrame(
+            bottom_row,
+            fg_color="#161b22",
+            corner_radius=10,
+            border_width=1,
+            border_color="#30363d"
+        )
+        convergence_card.grid(row=0, column=1, sticky="nsew")
+
+        self.convergence = ConvergenceFrame(convergence_card)
+        self.convergence.pack(fill="both", expand=True, padx=15, pady=15)
+        self.convergence.configure(fg_color="#161b22")
     
     def load_instance(self):
         """Load instance from file"""
+        if not self._require_bindings():
+            return None
         from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             initialdir="data/instances",
@@ -165,23 +270,24 @@ class JobShopApp(ctk.CTk):
             
             self.instance = jb.load_instance_from_file(file_path)
             
-            jobs = len(self.instance.jobs)
+            jobs = self.instance.num_jobs
             machines = self.instance.num_machines
             
             if jobs == 0 or machines == 0:
                 raise ValueError("Instance contains 0 jobs or 0 machines.")
             
-            seq_sol = jb.Solution()
-            for j in range(jobs):
-                for op in range(machines):
-                    seq_sol.operation_sequence.append((j, op))
-            
-            baseline = jb.calculate_makespan(self.instance, seq_sol)
+            baseline = jb.sequential_solution(self.instance).makespan
             
             self.console.log_loaded(file_name, jobs, machines, baseline)
+            self.console.log_stats(self.instance.stats)
+
+            self.instance_key = jb.instance_key(self.instance)
+            known = self.cache.seeds(self.instance_key, 1)
+            if known:
+                self.console.log_cached(known[0].makespan)
             
             self.header.set_instance_info(file_name, jobs, machines)
-            self.header.update_status("Ready", "#8b949e")
+            self.events.status("Ready", "#8b949e")
             self.buttons.enable_optimize()
             
             return (file_path, jobs, machines)
@@ -192,12 +298,15 @@ class JobShopApp(ctk.CTk):
             StatusDialog(self, "Load Error", f"Failed to load instance: {file_name}", details=error_msg, type_="error")
             
             self.console.log_error(error_msg)
-            self.header.update_status("Error", "#ff0000")
+            self.events.status("Error", "#ff0000")
             self.instance = None
+            self.instance_key = None
             return None
     
     def run_optimization(self):
         """Run optimization in separate thread"""
+        if not self._require_bindings():
+            return
         # 1. Sprawdź czy instancja jest załadowana
         if not self.instance:
             StatusDialog(self, "Action Required", "Please load an instance first.", type_="info")
@@ -210,10 +319,21 @@ class JobShopApp(ctk.CTk):
         
         # --- NOWOŚĆ: OSTRZEŻENIE DLA ALGORYTMU EXACT ---
         if params.get('algorithm') == 'exact':
-            # Obliczamy całkowitą liczbę operacji
-            n_jobs = len(self.instance.jobs)
+            # The exact solver handles fixed routes only (as in the CLI)
+            if self.instance.is_flexible:
+                StatusDialog(
+                    self,
+                    "Not Supported",
+                    "The exact solver only handles fixed routes; this instance has machine alternatives.",
+                    details="Use 'Genetic', 'Pareto (NSGA-II)' or 'Greedy' instead.",
+                    type_="info"
+                )
+                return
+
+            # Total number of operations (routes may differ in length)
+            n_jobs = self.instance.num_jobs
             n_machines = self.instance.num_machines
-            total_ops = n_jobs * n_machines
+            total_ops = self.instance.num_operations
             
             # Próg bezpieczeństwa: np. 12 operacji (np. 4x3). 
             # Powyżej tego A* / Branch&Bound robi się ekstremalnie wolny.
@@ -239,63 +359,122 @@ class JobShopApp(ctk.CTk):
         # 3. Uruchomienie wątku (jeśli wszystko OK)
         self.is_running = True
         self.buttons.disable_optimize()
-        
+
+        # Tk widgets change only on the main thread; the worker thread writes
+        # only to the ProgressFeed and the event bus, drained in _frame
+        algorithm = params.get("algorithm", "genetic")
+        self.events.status("Running...", "#ffaa00")
+        if algorithm in GA_ALGORITHMS:
+            self.console.log_ga_params(params)
+        self.console.log_running("NSGA-II" if algorithm == "nsga2" else algorithm.capitalize())
+        self.convergence.clear()
+
+        self.feed = ProgressFeed(self.events)
+        self.pending_best = None
         thread = threading.Thread(
             target=self._run_optimization_thread,
-            args=(params,)
+            args=(params, self.feed)
         )
         thread.daemon = True
         thread.start()
     
-    def _run_optimization_thread(self, params):
-        """Execute optimization in thread"""
+    def _run_optimization_thread(self, params, feed):
+        """Execute optimization in thread (no Tk calls here)"""
         try:
             algorithm = params.get("algorithm", "genetic")
-            
-            self.header.update_status("Running...", "#ffaa00")
-            
-            if algorithm == "genetic":
-                self.console.log_ga_params(params)
-            
-            self.console.log_running(algorithm.capitalize())
-            self.update_idletasks()
-            
             start_time = time.time()
             
-            if algorithm == "genetic":
-                self.best_solution = jb.run_genetic(
-                    self.instance,
-                    params['population_size'],
-                    params['generations'],
-                    params['tournament_size'],
-                    params['mutation_prob'],
-                    params['seed']
-                )
-            elif algorithm == "greedy":
-                self.best_solution = jb.greedy_schedule(self.instance)
-            elif algorithm == "exact":
-                self.best_solution = jb.solve_exact(self.instance)
+            if algorithm in GA_ALGORITHMS:
+                ga = jb.GeneticParams()
+                ga.population_size = params['population_size']
+                ga.generations = params['generations']
+                ga.tournament_size = params['tournament_size']
+                ga.mutation_prob = params['mutation_prob']
+                ga.seed = params['seed']
+                ga.crossover = jb.parse_crossover(params['crossover'])
+                ga.mutation = jb.parse_mutation(params['mutation'])
+                ga.decoder = jb.parse_decoder(params['decoder'])
+                ga.decoder_delta = params['decoder_delta']
+                ga.on_progress = feed.on_progress
+            else:
+                ga = jb.GeneticParams()
+
+            front = None
+            if algorithm == "nsga2":
+                # Pareto front (not cached); the first point has the shortest makespan
+                front = jb.run_nsga2(self.instance, ga)
+                solution, outcome = front.solutions[0], None
+            else:
+                # Same problem with the same parameters = result from the cache
+                solution, outcome = jb.solve_cached(self.cache, self.instance, algorithm, ga, CACHE_WARM_START)
             
             elapsed_time = time.time() - start_time
-            makespan = jb.calculate_makespan(self.instance, self.best_solution)
-            
-            self.console.log_completed(makespan, elapsed_time)
+            makespan = jb.calculate_makespan(self.instance, solution)
+            if outcome is not None:
+                self.events.log("log_cache_outcome", outcome)
+            feed.finish((solution, makespan, elapsed_time, front))
             
+        except Exception as e:
+            self.events.log("log_error", str(e))
+            feed.fail(e)
+
+    def _drain_progress(self):
+        """Tk thread (from _frame): draw what the solver reported since the last frame"""
+        feed = self.feed
+        points, best, done = feed.drain()
+        self.convergence.extend(points)
+
+        if not done:
+            # Gantt only when the incumbent improves (the newest one collected),
+            # at most every GANTT_REDRAW_MS - drawing takes longer than a frame
+            if best is not None:
+                self.pending_best = best
+            now = time.perf_counter()
+            if self.pending_best is not None and now - self.gantt_drawn_at >= GANTT_REDRAW_MS / 1000:
+                self.gantt.draw_gantt(self.instance, self.pending_best)
+                self.pending_best = None
+                self.gantt_drawn_at = now
+            return
+
+        self.feed = None
+        self.pending_best = None
+        try:
+            if feed.error is not None:
+                # the worker thread has already posted log_error
+                self.events.status("Error", "#ff0000")
+                return
+
+            self.best_solution, makespan, elapsed_time, self.front = feed.result
+            gap = jb.optimality_gap(makespan, self.instance.stats.lower_bound)
+            self.console.log_completed(makespan, elapsed_time, gap)
             self.gantt.draw_gantt(self.instance, self.best_solution)
+            if self.front is not None:
+                self.console.log_front(self.front.objectives)
+                self.convergence.show_front(self.front.objectives, self.show_front_solution)
+                self.convergence.mark_front_point(0)
             self.buttons.enable_export()
             
-            self.header.update_status(
+            self.events.status(
                 f"Completed: {makespan} ({elapsed_time:.2f}s)",
                 "#00ff00"
             )
-            
-        except Exception as e:
-            self.console.log_error(str(e))
-            self.header.update_status("Error", "#ff0000")
         finally:
             self.is_running = False
             self.buttons.enable_optimize()
 
+
+    def show_front_solution(self, index):
+        """Tk thread: render the clicked point of the Pareto front (it is also what gets exported)"""
+        if self.front is None or self.is_running:
+            return
+        self.best_solution = self.front.solutions[index]
+        makespan, transport, idle = self.front.objectives[index]
+        self.gantt.draw_gantt(self.instance, self.best_solution)
+        self.convergence.mark_front_point(index)
+        self.events.status(
+            f"Front {index + 1}/{len(self.front)}: makespan {makespan}, transport {transport}, idle {idle}",
+            "#00ff00"
+        )
     
     def export_schedule(self):
         """Export schedule"""
@@ -312,6 +491,7 @@ class JobShopApp(ctk.CTk):
             return
         
         result = dialog.result
+        from utils.export import ScheduleExporter
         save_path = result['path']
         
         try:
@@ -338,6 +518,16 @@ class JobShopApp(ctk.CTk):
                 exported.append(Path(path).name)
                 self.console.insert_log(f"Exported: {Path(path).name}\n")
             
+            if result['columnar']:
+                filename = f"schedule_{timestamp}.parquet"
+                path = ScheduleExporter.export_to_columnar(
+                    self.instance,
+                    self.best_solution,
+                    output_path=save_path / filename
+                )
+                exported.append(Path(path).name)
+                self.console.insert_log(f"Exported: {Path(path).name}\n")
+            
             if result['png'] and self.gantt.fig:
                 filename = f"gantt_{timestamp}.png"
                 path = ScheduleExporter.export_gantt_image(
@@ -347,7 +537,7 @@ class JobShopApp(ctk.CTk):
                 exported.append(Path(path).name)
                 self.console.insert_log(f"Exported: {Path(path).name}\n")
             
-            self.header.update_status("Exported!", "#00ff00")
+            self.events.status("Exported!", "#00ff00")
             
             # ZMIANA: StatusDialog Sukces
             files_list = "\n".join([f"• {x}" for x in exported])
@@ -374,12 +564,14 @@ class JobShopApp(ctk.CTk):
         """Clear all results"""
         self.console.clear()
         self.gantt.clear()
+        self.convergence.clear()
         self.best_solution = None
+        self.front = None
         self.buttons.disable_export()
-        self.header.update_status("Ready", "#8b949e")
+        self.events.status("Ready", "#8b949e")
     
     def update_status(self, message):
-        """Update status in header"""
+        """Update status in header (at once, for a Tk thread about to block)"""
         self.header.update_status(message)
 
 
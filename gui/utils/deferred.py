@@ -0,0 +1,49 @@
+"""Background imports: the window draws before matplotlib and bindings load."""
+import importlib
+import threading
+import time
+
+
+class BackgroundImports:
+    """Import modules on a worker thread.
+
+    ``start`` returns at once; the Tk thread polls ``done`` from ``after()``
+    and then builds its widgets, whose own ``import`` statements find the
+    modules already in ``sys.modules``. Code that needs a module earlier
+    calls ``get``, which waits for the worker (Python's import lock makes a
+    concurrent import of the same module safe either way).
+    """
+
+    def __init__(self, *names):
+        self.names = names
+        self.modules = {}
+        self.errors = {}
+        self.elapsed = 0.0
+        self._thread = threading.Thread(target=self._run, name="background-imports", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        start = time.perf_counter()
+        for name in self.names:
+            try:
+                self.modules[name] = importlib.import_module(name)
+            except Exception as e:  # noqa: BLE001 - the error is reported on the Tk thread
+                self.errors[name] = e
+        self.elapsed = time.perf_counter() - start
+
+    @property
+    def done(self):
+        return not self._thread.is_alive() and self._thread.ident is not None
+
+    def get(self, name):
+        """Module name, waiting for the worker; re-raises its import error."""
+        if self._thread.ident is not None:
+            self._thread.join()
+        if name in self.errors:
+            raise self.errors[name]
+        if name not in self.modules:
+            self.modules[name] = importlib.import_module(name)
+        return self.modules[name]
@@ -0,0 +1,47 @@
+"""UI event bus: many threads post, the Tk thread drains once per frame."""
+import threading
+from collections import deque
+
+
+class UIEventBus:
+    """Thread-safe, coalescing queue of console and status updates.
+
+    Any thread posts (``log``, ``status``); the Tk thread calls ``drain``
+    once per frame from ``after()`` and applies the batch. Only the newest
+    status survives until the next frame, console records go to a deque
+    capped at ``max_records`` (the console keeps no more lines than that
+    anyway), so a burst of messages costs the poster an append and the UI
+    one frame of work, whatever its size. Same shape as ProgressFeed.
+    """
+
+    def __init__(self, max_records):
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._status = None
+
+    # --- ANY THREAD ---
+
+    def log(self, method, *args):
+        """Queue ``ConsoleFrame.<method>(*args)``, e.g. ``log("log_error", msg)``."""
+        with self._lock:
+            self._records.append((method, args))
+
+    def status(self, text, color="#8b949e"):
+        """Header status; replaces one not yet shown."""
+        with self._lock:
+            self._status = (text, color)
+
+    # --- TK THREAD ---
+
+    def drain(self):
+        """Take everything queued since the last call.
+
+        Returns ``(records, status)``; ``records`` is a list of
+        ``(method, args)`` in posting order, ``status`` the newest
+        ``(text, color)`` or None.
+        """
+        with self._lock:
+            records = list(self._records)
+            self._records.clear()
+            status, self._status = self._status, None
+            return records, status
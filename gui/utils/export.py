@@ -1,85 +1,123 @@
-import csv
+import json
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+from utils.schedule import schedule_columns
+
+CHUNK_ROWS = 8192          # Rows formatted and written at once
+COLUMNS = ("job", "op", "machine", "start", "duration", "end")
+
+
+def _chunks(columns, chunk_rows=CHUNK_ROWS):
+    """Consecutive column chunks as Python lists (one conversion per chunk)."""
+    n = len(columns["job"])
+    for lo in range(0, n, chunk_rows):
+        yield [columns[name][lo:lo + chunk_rows].tolist() for name in COLUMNS]
+
 
 class ScheduleExporter:
-    """Eksportuj harmonogram do różnych formatów"""
-    
+    """Export a schedule to various formats
+
+    All exporters work on the column arrays from ``schedule_columns`` and
+    write in chunks, so memory stays flat for large schedules.
+    """
+
     @staticmethod
     def export_to_csv(instance, solution, output_path=None):
         """Eksportuj do CSV"""
         if output_path is None:
             output_path = Path("schedules") / f"schedule_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
+
         output_path.parent.mkdir(exist_ok=True)
-        
+        columns = schedule_columns(instance, solution)
+
         with open(output_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Job', 'Operation', 'Machine', 'Start Time', 'Duration', 'End Time'])
-            
-            for i, (job_id, op_id) in enumerate(solution.operation_sequence):
-                start_time = solution.start_times[i]
-                operation = instance.jobs[job_id].operations[op_id]
-                duration = operation.processing_time
-                end_time = start_time + duration
-                
-                writer.writerow([
-                    f'J{job_id}',
-                    f'O{op_id}',
-                    f'M{operation.machine_id}',
-                    f'{start_time:.2f}',
-                    f'{duration:.2f}',
-                    f'{end_time:.2f}'
-                ])
-        
+            f.write("Job,Operation,Machine,Start Time,Duration,End Time\r\n")
+            for job, op, machine, start, duration, end in _chunks(columns):
+                # Times are integers, so '%d.00' == f'{t:.2f}'
+                f.write("".join(
+                    f"J{j},O{o},M{m},{s}.00,{d}.00,{e}.00\r\n"
+                    for j, o, m, s, d, e in zip(job, op, machine, start, duration, end)
+                ))
+
         return output_path
-    
+
     @staticmethod
     def export_to_json(instance, solution, output_path=None):
-        """Eksportuj do JSON"""
-        import json
-        
+        """Export to JSON (streamed, without building the document in memory)"""
         if output_path is None:
             output_path = Path("schedules") / f"schedule_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
+
         output_path.parent.mkdir(exist_ok=True)
-        
-        makespan = max([solution.start_times[i] + instance.jobs[job_id].operations[op_id].processing_time 
-                       for i, (job_id, op_id) in enumerate(solution.operation_sequence)])
-        
-        schedule_data = {
-            'makespan': makespan,
-            'jobs': len(instance.jobs),
-            'machines': instance.num_machines,
-            'operations': []
-        }
-        
-        for i, (job_id, op_id) in enumerate(solution.operation_sequence):
-            start_time = solution.start_times[i]
-            operation = instance.jobs[job_id].operations[op_id]
-            
-            schedule_data['operations'].append({
-                'job_id': int(job_id),
-                'operation_id': int(op_id),
-                'machine_id': int(operation.machine_id),
-                'start_time': float(start_time),
-                'duration': float(operation.processing_time),
-                'end_time': float(start_time + operation.processing_time)
-            })
-        
+        columns = schedule_columns(instance, solution)
+        makespan = int(columns["end"].max()) if len(columns["end"]) else 0
+
         with open(output_path, 'w') as f:
-            json.dump(schedule_data, f, indent=2)
-        
+            header = json.dumps({
+                'makespan': makespan,
+                'jobs': instance.num_jobs,
+                'machines': instance.num_machines,
+            }, indent=2)
+            f.write(header[:-2] + ',\n  "operations": [')
+            separator = "\n"
+            for job, op, machine, start, duration, end in _chunks(columns):
+                f.write(separator + ",\n".join(
+                    f'    {{"job_id": {j}, "operation_id": {o}, "machine_id": {m}, '
+                    f'"start_time": {s}.0, "duration": {d}.0, "end_time": {e}.0}}'
+                    for j, o, m, s, d, e in zip(job, op, machine, start, duration, end)
+                ))
+                separator = ",\n"
+            f.write("\n  ]\n}\n")
+
         return output_path
-    
+
+    @staticmethod
+    def export_to_columnar(instance, solution, output_path=None):
+        """Export the columns to Parquet (when pyarrow is available) or to .npz
+
+        The suffix of ``output_path`` is replaced by the format actually
+        written; the returned path points at the file.
+        """
+        if output_path is None:
+            output_path = Path("schedules") / f"schedule_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+
+        output_path.parent.mkdir(exist_ok=True)
+        columns = schedule_columns(instance, solution)
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            output_path = output_path.with_suffix(".npz")
+            # Uncompressed: np.load maps the arrays directly
+            np.savez(output_path, **columns)
+        else:
+            output_path = output_path.with_suffix(".parquet")
+            table = pa.table(dict(columns))
+            pq.write_table(table, output_path)
+
+        return output_path
+
+    @staticmethod
+    def load_columnar(path):
+        """Read a file from ``export_to_columnar`` as a dict of NumPy arrays."""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+            table = pq.read_table(path)
+            return {name: table.column(name).to_numpy() for name in table.column_names}
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+
     @staticmethod
     def export_gantt_image(fig, output_path=None):
         """Eksportuj Gantt do PNG"""
         if output_path is None:
             output_path = Path("schedules") / f"gantt_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        
+
         output_path.parent.mkdir(exist_ok=True)
         fig.savefig(output_path, dpi=150, facecolor='#1a1a1a')
-        
+
         return output_path
@@ -0,0 +1,251 @@
+"""Collection-based Gantt chart renderer (no Tk dependency).
+
+All bars are one ``PolyCollection`` built from NumPy arrays, the zebra
+stripes are a second one. Labels are level-of-detail: after every zoom
+or resize a vectorized pass picks the bars wide enough (in pixels) to
+hold their text, and a small pool of reusable ``Text`` artists shows them.
+"""
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+
+# --- CONFIGURATION (GitHub Dark Theme Palette) ---
+BG_COLOR = "#161b22"       # Frame background
+PLOT_AREA_BG = "#0d1117"   # Background of the plot area itself (darker)
+AXIS_COLOR = "#8b949e"     # Grey axis text
+TEXT_COLOR = "#e6edf3"     # Main text
+GRID_COLOR = "#30363d"     # Grid colour
+STRIPE_COLOR = "#1c2128"   # Stripe colour (zebra striping)
+EDGE_COLOR = "#ffffff"     # A white outline separates the jobs
+CRITICAL_COLOR = "#f85149" # Outline of critical operations (zero slack)
+
+BAR_HEIGHT = 0.7           # A height of 0.7 leaves a clean gap
+MAX_LABELS = 400           # Above this many, labels wait for a zoom
+
+
+def bar_vertices(rows, left, width, height=BAR_HEIGHT):
+    """Rectangles (n, 4, 2) for a PolyCollection, vectorized."""
+    x0 = np.asarray(left, dtype=float)
+    x1 = x0 + np.asarray(width, dtype=float)
+    y0 = np.asarray(rows, dtype=float) - height / 2
+    y1 = y0 + height
+    return np.stack(
+        [np.stack([x0, y0], axis=-1), np.stack([x0, y1], axis=-1),
+         np.stack([x1, y1], axis=-1), np.stack([x1, y0], axis=-1)],
+        axis=1,
+    )
+
+
+def job_palette(num_jobs):
+    """RGBA colours (num_jobs, 4) and contrasting text colours for every job."""
+    # tab20 for many jobs, Set3 for fewer (easier on the eye)
+    cmap = colormaps['tab20' if num_jobs > 12 else 'Set3']
+    colors = np.asarray(cmap(np.arange(num_jobs) % 20), dtype=float).reshape(-1, 4)
+    # Luminance: light background -> black text, dark -> white
+    luminance = colors[:, :3] @ np.array([0.299, 0.587, 0.114])
+    text = np.where(luminance[:, None] > 0.5, (0.0, 0.0, 0.0, 1.0), (1.0, 1.0, 1.0, 1.0))
+    return colors, text
+
+
+class GanttRenderer:
+    """Draws a schedule on existing axes; the figure lives between draws."""
+
+    def __init__(self, fig, ax):
+        self.fig = fig
+        self.ax = ax
+        self._bars = None
+        self._stripes = None
+        self._labels = []           # pool of reused Text artists
+        self._data = None
+        self._makespan = 0
+        self._shape = None          # (machines, jobs, operations) of the drawn schedule
+        self._xlim_cid = None
+
+    # --- DATA ---
+
+    def set_schedule(self, columns, num_machines, num_jobs):
+        """Draw a schedule from ``schedule_columns`` columns (NumPy arrays).
+
+        When the chart already shows a schedule of the same shape (e.g. a
+        newer incumbent during a GA run), only the bar vertices, colors and
+        labels are updated in place and a zoomed-in view is kept. With a
+        ``slack`` column (``schedule_slack``) the critical operations get a
+        thick red outline.
+        """
+        job = np.asarray(columns["job"])
+        start = np.asarray(columns["start"], dtype=float)
+        duration = np.asarray(columns["duration"], dtype=float)
+        machine = np.asarray(columns["machine"])
+
+        colors, text_colors = job_palette(num_jobs)
+        self._data = {
+            "job": job,
+            "start": start,
+            "duration": duration,
+            "center": start + duration / 2,
+            "machine": machine,
+            # width of the "J<id>" text in characters
+            "chars": np.floor(np.log10(np.maximum(job, 1))).astype(int) + 2,
+            "text_color": text_colors[job] if len(job) else text_colors[:0],
+        }
+        previous_view = self._full_view()
+        self._makespan = float((start + duration).max()) if len(job) else 0.0
+        verts = bar_vertices(machine, start, duration)
+        facecolors = colors[job] if len(job) else 'none'
+        edgecolors, linewidths = self._outline(columns.get("slack"), len(job))
+
+        if self._bars is not None and self._shape == (num_machines, num_jobs, len(job)):
+            self._bars.set_verts(verts)
+            self._bars.set_facecolor(facecolors)
+            self._bars.set_edgecolor(edgecolors)
+            self._bars.set_linewidth(linewidths)
+            if self.ax.get_xlim() == previous_view:
+                self.ax.set_xlim(*self._full_view(), emit=False)
+            self.update_labels()
+            return
+
+        self._reset_axes()
+        self._shape = (num_machines, num_jobs, len(job))
+        self._render_stripes(num_machines)
+        self._bars = PolyCollection(
+            verts,
+            facecolors=facecolors,
+            edgecolors=edgecolors,
+            linewidths=linewidths,
+            alpha=0.9,
+            zorder=3,
+        )
+        self.ax.add_collection(self._bars, autolim=False)
+        self._setup_axes(num_machines)
+        self._xlim_cid = self.ax.callbacks.connect('xlim_changed', lambda _ax: self.update_labels())
+        self.update_labels()
+
+    def show_placeholder(self):
+        """Welcome screen instead of the chart."""
+        self._data = None
+        self._reset_axes()
+        self.ax.set_facecolor(BG_COLOR)
+        self.ax.axis('off')
+        self.ax.text(
+            0.5, 0.60, "Welcome to Job Shop Optimizer",
+            ha='center', va='center', fontsize=22, color=TEXT_COLOR, weight='bold',
+            fontfamily='sans-serif', transform=self.ax.transAxes,
+        )
+        self.ax.text(
+            0.5, 0.40, "The Gantt Chart will appear here",
+            ha='center', va='center', fontsize=12, color="#58a6ff",
+            fontfamily='sans-serif', transform=self.ax.transAxes,
+        )
+
+    # --- VIEW ---
+
+    def reset_view(self):
+        if self._data is not None:
+            self.ax.set_xlim(*self._full_view())
+
+    def _full_view(self):
+        return (0.0, max(self._makespan, 1) * 1.02)
+
+    def zoom(self, center, factor):
+        """Zoom the X axis around ``center`` (factor < 1 zooms in)."""
+        if self._data is None:
+            return
+        x0, x1 = self.ax.get_xlim()
+        full = self._full_view()[1]
+        width = min((x1 - x0) * factor, full)
+        left = center - (center - x0) * (width / (x1 - x0))
+        left = min(max(left, 0.0), full - width)
+        self.ax.set_xlim(left, left + width)
+
+    def update_labels(self):
+        """Vectorized choice of the labels that fit their bars in the current view."""
+        data = self._data
+        if data is None:
+            return
+        x0, x1 = self.ax.get_xlim()
+        px_per_unit = self.ax.bbox.width / max(x1 - x0, 1e-9)
+
+        visible = (data["start"] + data["duration"] > x0) & (data["start"] < x1)
+        count = int(np.count_nonzero(visible))
+        if count > 100: fontsize = 6
+        elif count > 50: fontsize = 8
+        else: fontsize = 9
+
+        # ~0.7 em per character + margin; px = pt * dpi / 72
+        char_px = 0.7 * fontsize * self.fig.dpi / 72
+        fits = data["duration"] * px_per_unit >= data["chars"] * char_px + 4
+        idx = np.flatnonzero(visible & fits)
+        if len(idx) > MAX_LABELS:
+            idx = idx[:0]           # too dense - labels appear after zooming in
+
+        self._ensure_label_pool(len(idx))
+        for text, i in zip(self._labels, idx):
+            text.set_position((data["center"][i], data["machine"][i]))
+            text.set_text(f"J{data['job'][i]}")
+            text.set_color(data["text_color"][i])
+            text.set_fontsize(fontsize)
+            text.set_visible(True)
+        for text in self._labels[len(idx):]:
+            text.set_visible(False)
+
+    # --- INTERNALS ---
+
+    @staticmethod
+    def _outline(slack, count):
+        """Edge colours and widths: critical operations highlighted"""
+        if slack is None:
+            return EDGE_COLOR, 0.5
+        critical = np.asarray(slack) == 0
+        edgecolors = np.where(critical[:, None], to_rgba(CRITICAL_COLOR), to_rgba(EDGE_COLOR))
+        linewidths = np.where(critical, 1.8, 0.5)
+        return (edgecolors if count else 'none'), linewidths
+
+    def _reset_axes(self):
+        if self._xlim_cid is not None:
+            self.ax.callbacks.disconnect(self._xlim_cid)
+            self._xlim_cid = None
+        self.ax.cla()
+        self._shape = None
+        self._bars = None
+        self._stripes = None
+        self._labels = []
+
+    def _ensure_label_pool(self, n):
+        while len(self._labels) < n:
+            self._labels.append(self.ax.text(
+                0, 0, "", ha='center', va='center', fontweight='bold',
+                zorder=4, clip_on=True, visible=False,
+            ))
+
+    def _render_stripes(self, num_machines):
+        """Zebra stripes: x in axes coordinates (full width), y in data."""
+        rows = np.arange(0, num_machines, 2)
+        self._stripes = PolyCollection(
+            bar_vertices(rows, np.zeros(len(rows)), np.ones(len(rows)), height=1.0),
+            facecolors=STRIPE_COLOR, edgecolors='none', zorder=0,
+            transform=self.ax.get_yaxis_transform(),
+        )
+        self.ax.add_collection(self._stripes, autolim=False)
+
+    def _setup_axes(self, num_machines):
+        ax = self.ax
+        ax.axis('on')
+        ax.set_facecolor(PLOT_AREA_BG)
+        ax.grid(True, axis='x', color=GRID_COLOR, alpha=0.5, linestyle='--', linewidth=0.8, zorder=1)
+        ax.set_axisbelow(True)
+
+        ax.set_xlabel('Time [units]', color=AXIS_COLOR, fontsize=10, labelpad=8)
+        ax.set_xlim(*self._full_view())
+
+        ax.set_ylabel('Machines', color=AXIS_COLOR, fontsize=10, labelpad=8)
+        ax.set_yticks(range(num_machines))
+        ax.set_yticklabels([f"M{i}" for i in range(num_machines)],
+                           color=TEXT_COLOR, fontsize=9, fontweight='bold')
+        ax.set_ylim(-0.6, num_machines - 0.4)
+
+        ax.tick_params(axis='x', colors=AXIS_COLOR, labelsize=9)
+        ax.tick_params(axis='y', length=0, labelcolor=TEXT_COLOR)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        ax.axvline(x=0, color=GRID_COLOR, linewidth=1)
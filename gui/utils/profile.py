@@ -0,0 +1,26 @@
+"""GA parameter profiles (files written by ``python -m jobshop.tune``)."""
+from gui.config import CROSSOVERS, DECODERS, MUTATIONS
+
+
+def read_profile(path):
+    """Read a profile as a dict of sidebar parameters (operators as names).
+
+    Parsing and validation are done by ``bindings.load_genetic_profile``,
+    the same reader the CLI uses for ``-profile``.
+    """
+    import bindings as jb
+
+    params = jb.load_genetic_profile(str(path))
+    crossovers = {jb.parse_crossover(name): name for name in CROSSOVERS.values()}
+    mutations = {jb.parse_mutation(name): name for name in MUTATIONS.values()}
+    decoders = {jb.parse_decoder(name): name for name in DECODERS.values()}
+    return {
+        "population_size": params.population_size,
+        "generations": params.generations,
+        "tournament_size": params.tournament_size,
+        "mutation_prob": params.mutation_prob,
+        "crossover": crossovers[params.crossover],
+        "mutation": mutations[params.mutation],
+        "decoder": decoders[params.decoder],
+        "decoder_delta": params.decoder_delta,
+    }
@@ -0,0 +1,65 @@
+"""Progress queue between the solver thread and the Tk thread."""
+import threading
+
+
+class ProgressFeed:
+    """Thread-safe, coalescing progress buffer.
+
+    The solver thread only appends (``on_progress``, ``finish``, ``fail``);
+    the Tk thread periodically calls ``drain`` from ``after()``. Convergence
+    points are accumulated, of the improved solutions only the newest one is
+    kept, so a slow UI never makes the solver wait or draw stale schedules.
+    With an ``events`` bus (UIEventBus) every improvement also posts the
+    header status, which the bus coalesces to the newest.
+    """
+
+    def __init__(self, events=None):
+        self._events = events
+        self._lock = threading.Lock()
+        self._points = []
+        self._best = None
+        self._done = False
+        self._result = None
+        self._error = None
+
+    # --- SOLVER THREAD ---
+
+    def on_progress(self, stats, best):
+        """GeneticParams.on_progress callback."""
+        with self._lock:
+            self._points.append((stats.generation, stats.best_makespan, stats.mean_makespan))
+            if best is not None:
+                self._best = best
+        if self._events is not None and stats.improved:
+            self._events.status(f"Running... best {stats.best_makespan}", "#ffaa00")
+
+    def finish(self, result):
+        with self._lock:
+            self._result = result
+            self._done = True
+
+    def fail(self, error):
+        with self._lock:
+            self._error = error
+            self._done = True
+
+    # --- TK THREAD ---
+
+    def drain(self):
+        """Take everything queued since the last call.
+
+        Returns ``(points, best, done)``; ``best`` is the newest improved
+        solution or None.
+        """
+        with self._lock:
+            points, self._points = self._points, []
+            best, self._best = self._best, None
+            return points, best, self._done
+
+    @property
+    def result(self):
+        return self._result
+
+    @property
+    def error(self):
+        return self._error
@@ -0,0 +1,27 @@
+"""Columnar view of a schedule (NumPy arrays instead of a list of dicts)."""
+
+
+def schedule_columns(instance, solution):
+    """Return the schedule columns as NumPy arrays (int32).
+
+    Keys: ``job``, ``op``, ``machine``, ``start``, ``duration``, ``end``,
+    ``transport_in``, one entry per operation in
+    ``solution.operation_sequence`` order. Built in C++ in a single call
+    (``bindings.schedule_table``), so no per-operation pybind lookups.
+    """
+    import bindings as jb
+
+    return jb.schedule_table(instance, solution)
+
+
+def schedule_slack(instance, solution, columns):
+    """Slack of every operation, in the column order of ``schedule_columns``.
+
+    How long an operation may be delayed without delaying the whole
+    schedule; 0 marks the critical operations. Computed from the
+    disjunctive graph of the solution (``bindings.DisjunctiveGraph``).
+    """
+    import bindings as jb
+
+    graph = jb.DisjunctiveGraph(instance, solution)
+    return graph.slack[instance.job_offsets[columns["job"]] + columns["op"]]
@@ -3,5 +3,6 @@ from .sidebar import SidebarFrame
 from .console import ConsoleFrame
 from .gantt import GanttFrame
 from .buttons import ButtonsFrame
+from .convergence import ConvergenceFrame
 
-__all__ = ["HeaderFrame", "SidebarFrame", "ConsoleFrame", "GanttFrame", "ButtonsFrame"]
+__all__ = ["HeaderFrame", "SidebarFrame", "ConsoleFrame", "GanttFrame", "ButtonsFrame", "ConvergenceFrame"]
@@ -1,6 +1,9 @@
 import customtkinter as ctk
+from collections import deque
 from datetime import datetime
 
+from gui.config import CONSOLE_MAX_LINES
+
 # Paleta kolorów (Minimalistyczna)
 COLOR_TIMESTAMP = "#505050"  # Bardzo ciemny szary
 COLOR_TEXT = "#c9d1d9"       # Standardowy tekst
@@ -13,10 +16,17 @@ COLOR_VALUE = "#a5d6ff"      # Jasnoniebieski
 class ConsoleFrame(ctk.CTkFrame):
     """
     Konsola z logami - Wersja Compact & Crash-Free.
+
+    The log_* methods only buffer lines; flush() (once per UI frame) inserts
+    them in one pass and trims the console to the last max_lines lines.
     """
     
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, max_lines=CONSOLE_MAX_LINES, **kwargs):
         super().__init__(parent, **kwargs)
+
+        self.max_lines = max_lines
+        self._line = []                           # (text, tag) segments of the current line
+        self._pending = deque(maxlen=max_lines)   # complete lines waiting for flush()
         
         # Tytuł - zmniejszony padding
         title_label = ctk.CTkLabel(
@@ -50,9 +60,25 @@ class ConsoleFrame(ctk.CTkFrame):
         self.textbox.configure(state="disabled")
 
     def _write(self, text, tag="normal"):
-        """Prywatna metoda do pisania"""
+        """Private write helper (buffered; a line ends at \\n)"""
+        self._line.append((text, tag))
+        if text.endswith("\n"):
+            self._pending.append(self._line)
+            self._line = []
+
+    def flush(self):
+        """Insert the buffered lines (Tk thread, once per frame)"""
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, deque(maxlen=self.max_lines)
         self.textbox.configure(state="normal")
-        self.textbox.insert("end", text, tag)
+        for line in lines:
+            for text, tag in line:
+                self.textbox.insert("end", text, tag)
+        # Ring buffer: the last max_lines lines stay
+        count = int(self.textbox.index("end-1c").split(".")[0]) - 1
+        if count > self.max_lines:
+            self.textbox.delete("1.0", f"{count - self.max_lines + 1}.0")
         self.textbox.configure(state="disabled")
         self.textbox.see("end")
 
@@ -67,9 +93,17 @@ class ConsoleFrame(ctk.CTkFrame):
         """Log ładowania - Jedna linia"""
         self._write_ts()
         self._write(f"Loaded: {filename} ", "success")
-        self._write(f"({jobs}J x {machines}M)\n ", "value")
+        self._write(f"({jobs}J x {machines}M)\n", "value")
         # self._write(f"| Base: {baseline}\n", "normal")
 
+    def log_stats(self, stats):
+        """Lower bound and instance features - one line"""
+        self._write_ts()
+        self._write("Instance: ", "header")
+        info = (f"LB={stats.lower_bound} Bottleneck=M{stats.bottleneck_machine} "
+                f"Imbalance={stats.load_imbalance:.2f} Transport={stats.transport_ratio:.0%}")
+        self._write(f"{info}\n", "value")
+
     def log_algorithm_selected(self, algorithm):
         pass 
 
@@ -78,7 +112,7 @@ class ConsoleFrame(ctk.CTkFrame):
         self._write_ts()
         self._write("GA Config: ", "header")
         # Skrócony zapis w jednej linii
-        info = f"Pop={p['population_size']} Gen={p['generations']} Tour={p['tournament_size']} Mut={p['mutation_prob']:.2f} Seed={p['seed']}"
+        info = f"Pop={p['population_size']} Gen={p['generations']} Tour={p['tournament_size']} Mut={p['mutation_prob']:.2f} Ops={p['crossover']}+{p['mutation']} Seed={p['seed']}"
         self._write(f"{info}\n", "value")
 
     def log_running(self, algorithm):
@@ -86,13 +120,39 @@ class ConsoleFrame(ctk.CTkFrame):
         self._write_ts()
         self._write(f"Started: {algorithm}...\n", "warning")
 
-    def log_completed(self, makespan, elapsed_time):
-        """Log wyniku - Jedna linia"""
+    def log_completed(self, makespan, elapsed_time, gap=None):
+        """Result log - one line (gap = distance from the lower bound)"""
         self._write_ts()
         self._write("Done: ", "success")
         self._write(f"Makespan={makespan} ", "header")
+        if gap is not None:
+            self._write("Gap=optimal " if gap == 0 else f"Gap={gap:.1%} ", "success" if gap == 0 else "value")
         self._write(f"({elapsed_time:.2f}s)\n", "normal")
 
+    def log_front(self, objectives):
+        """Pareto front after NSGA-II - objective ranges on one line"""
+        self._write_ts()
+        self._write("Pareto front: ", "header")
+        makespan, transport, idle = objectives[:, 0], objectives[:, 1], objectives[:, 2]
+        info = (f"{len(objectives)} schedule(s) Makespan={makespan.min()}-{makespan.max()} "
+                f"Transport={transport.min()}-{transport.max()} Idle={idle.min()}-{idle.max()}")
+        self._write(f"{info}\n", "value")
+
+    def log_cached(self, best_makespan):
+        """Best stored result of the instance (on load)"""
+        self._write_ts()
+        self._write("Cache: ", "header")
+        self._write(f"best known makespan {best_makespan}\n", "value")
+
+    def log_cache_outcome(self, outcome):
+        """Where a result came from: the cache or a warm-started GA"""
+        if outcome.hit:
+            self._write_ts()
+            self._write("Cache: result reused, nothing solved\n", "success")
+        elif outcome.warm_seeds:
+            self._write_ts()
+            self._write(f"Cache: GA seeded with {outcome.warm_seeds} cached schedule(s)\n", "value")
+
     def log_error(self, error_msg):
         """Log błędu"""
         self._write_ts()
@@ -112,6 +172,8 @@ class ConsoleFrame(ctk.CTkFrame):
             self._write(text.strip() + "\n", tag)
 
     def clear(self):
+        self._line = []
+        self._pending.clear()
         self.textbox.configure(state="normal")
         self.textbox.delete("1.0", "end")
         self.textbox.configure(state="disabled")
\ No newline at end of file
@@ -0,0 +1,153 @@
+import customtkinter as ctk
+
+from gui.config import TEXT_SECONDARY
+
+BEST_COLOR = "#3fb950"     # Green - best so far
+MEAN_COLOR = "#58a6ff"     # Blue - population mean
+PICKED_COLOR = "#f85149"   # Outline of the picked Pareto front point
+
+
+class ConvergenceFrame(ctk.CTkFrame):
+    """
+    GA convergence plot: best and mean makespan over the generations.
+    Two lines updated in place (set_data), the canvas is created once.
+    Like ``GanttFrame`` it builds the figure in ``attach_plot``, after the
+    window is up.
+
+    After an NSGA-II run ``show_front`` replaces the curves with the Pareto
+    front (makespan vs idle time, colored by transport); clicking a point
+    calls back with its index. ``clear`` goes back to the curves.
+    """
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        title_label = ctk.CTkLabel(
+            self,
+            text="Convergence",
+            font=("Segoe UI", 12, "bold"),
+            text_color="#ffffff"
+        )
+        title_label.pack(anchor="w", pady=(0, 2), padx=5)
+
+        self.fig = None
+        self.loading_label = ctk.CTkLabel(self, text="Loading chart...", text_color=TEXT_SECONDARY)
+        self.loading_label.pack(expand=True)
+
+        self._generations = []
+        self._best = []
+        self._mean = []
+        self._front = None          # Pareto front scatter (show_front mode)
+        self._picked = None
+        self._on_pick = None
+
+    def attach_plot(self):
+        """Create figure and canvas (Tk thread); no-op once done"""
+        if self.fig is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        from utils.gantt_render import AXIS_COLOR, BG_COLOR, GRID_COLOR, PLOT_AREA_BG
+
+        self.loading_label.destroy()
+        self.fig = Figure(figsize=(4, 2), dpi=100, facecolor=BG_COLOR)
+        self.fig.subplots_adjust(left=0.16, right=0.97, top=0.95, bottom=0.22)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_facecolor(PLOT_AREA_BG)
+        self.ax.tick_params(colors=AXIS_COLOR, labelsize=8)
+        self.ax.grid(True, color=GRID_COLOR, alpha=0.5, linestyle='--', linewidth=0.8)
+        self.ax.set_xlabel('Generation', color=AXIS_COLOR, fontsize=8)
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+
+        self.best_line, = self.ax.plot([], [], color=BEST_COLOR, linewidth=1.5, label="best")
+        self.mean_line, = self.ax.plot([], [], color=MEAN_COLOR, linewidth=1.0, alpha=0.8, label="mean")
+        self.legend = self.ax.legend(loc="upper right", fontsize=8, frameon=False)
+        for text in self.legend.get_texts():
+            text.set_color(AXIS_COLOR)
+
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=2, pady=2)
+        self.canvas.mpl_connect('pick_event', self._on_pick_event)
+        self._redraw()
+
+    def extend(self, points):
+        """Append points (generation, best, mean) and redraw once."""
+        if not points:
+            return
+        generations, best, mean = zip(*points)
+        self._generations.extend(generations)
+        self._best.extend(best)
+        self._mean.extend(mean)
+        self.attach_plot()
+        self._redraw()
+
+    def _redraw(self):
+        import numpy as np
+
+        x = np.asarray(self._generations)
+        self.best_line.set_data(x, np.asarray(self._best))
+        self.mean_line.set_data(x, np.asarray(self._mean))
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    # --- PARETO FRONT ---
+
+    def show_front(self, objectives, on_pick):
+        """Draw a front (array (n, 3): makespan, transport, idle) instead of the curves."""
+        import numpy as np
+
+        from utils.gantt_render import AXIS_COLOR
+
+        self.attach_plot()
+        self._remove_front()
+        objectives = np.asarray(objectives)
+        makespan, transport, idle = objectives[:, 0], objectives[:, 1], objectives[:, 2]
+        for artist in (self.best_line, self.mean_line, self.legend):
+            artist.set_visible(False)
+
+        self._on_pick = on_pick
+        self._front = self.ax.scatter(makespan, idle, c=transport, cmap='viridis', s=28,
+                                      picker=5, zorder=3)
+        self._picked = self.ax.scatter([], [], s=90, facecolors='none', edgecolors=PICKED_COLOR,
+                                       linewidths=1.5, zorder=4)
+        self.ax.set_xlabel('Makespan (color: transport, click to show)', color=AXIS_COLOR, fontsize=8)
+        self.ax.set_ylabel('Idle', color=AXIS_COLOR, fontsize=8)
+        # scatter is not part of relim(), so the limits are computed here
+        for values, set_lim in ((makespan, self.ax.set_xlim), (idle, self.ax.set_ylim)):
+            pad = max((values.max() - values.min()) * 0.1, 1)
+            set_lim(values.min() - pad, values.max() + pad)
+        self.canvas.draw_idle()
+
+    def mark_front_point(self, index):
+        """Outline the picked front point"""
+        if self._front is None:
+            return
+        self._picked.set_offsets(self._front.get_offsets()[index:index + 1])
+        self.canvas.draw_idle()
+
+    def _on_pick_event(self, event):
+        if self._front is not None and event.artist is self._front and len(event.ind):
+            self._on_pick(int(event.ind[0]))
+
+    def _remove_front(self):
+        if self._front is not None:
+            self._front.remove()
+            self._picked.remove()
+            self._front = self._picked = self._on_pick = None
+
+    def clear(self):
+        self._generations.clear()
+        self._best.clear()
+        self._mean.clear()
+        if self.fig is not None:
+            if self._front is not None:
+                self._remove_front()
+                for artist in (self.best_line, self.mean_line, self.legend):
+                    artist.set_visible(True)
+                self.ax.set_xlabel('Generation')
+                self.ax.set_ylabel('')
+                self.ax.set_autoscale_on(True)
+            self._redraw()
@@ -46,18 +46,14 @@ class HeaderFrame(ctk.CTkFrame):
         self._create_separator()
         
         # --- PRAWO: Status bindingów ---
-        # Używamy kolorów spójnych z konsolą (GitHub theme)
-        status_color = "#3fb950" if bindings_available else "#f85149" # Stonowany zielony/czerwony
-        status_text = "C++ Bindings Loaded" if bindings_available else "C++ Bindings Error"
-        
         self.bindings_label = ctk.CTkLabel(
             self,
-            text=status_text,
-            text_color=status_color,
+            text="",
             font=("Segoe UI", 12, "bold"), # Pogrubienie dla ważnego statusu
             anchor="e"
         )
         self.bindings_label.pack(side="right", padx=15, pady=8)
+        self.set_bindings_status(bindings_available)
     
     def _create_separator(self):
         """Tworzy estetyczny pionowy separator"""
@@ -78,6 +74,18 @@ class HeaderFrame(ctk.CTkFrame):
             text_color="#e6edf3" # Jaśniejszy kolor po załadowaniu
         )
     
+    def set_bindings_status(self, available):
+        """True / False, None = still loading in the background"""
+        self.bindings_available = available
+        # Colours match the console (GitHub theme)
+        if available is None:
+            text, color = "Loading C++ Bindings...", "#d29922"
+        elif available:
+            text, color = "C++ Bindings Loaded", "#3fb950"  # Muted green
+        else:
+            text, color = "C++ Bindings Error", "#f85149"   # Muted red
+        self.bindings_label.configure(text=text, text_color=color)
+
     def update_status(self, text, color="#8b949e"):
         """Aktualizuj status"""
         self.status_label.configure(text=text, text_color=color)
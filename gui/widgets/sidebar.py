@@ -1,5 +1,9 @@
+from pathlib import Path
+
 import customtkinter as ctk
-from gui.config import DEFAULT_PARAMS
+from gui.config import (DEFAULT_PARAMS, DECODERS, CROSSOVERS, MUTATIONS, DEFAULT_PROFILE, PROFILE_DIR,
+                        ALGORITHMS, GA_ALGORITHMS)
+from utils.profile import read_profile
 from gui.dialogs.status_dialog import StatusDialog, COLOR_ERROR, COLOR_WARNING, COLOR_NORMAL
 
 class SidebarFrame(ctk.CTkFrame):
@@ -21,7 +25,8 @@ class SidebarFrame(ctk.CTkFrame):
             "generations":     {"type": int, "min": 1, "max": 1_000_000},
             "tournament_size": {"type": int, "min": 1, "max": None}, 
             "mutation_prob":   {"type": float, "min": 0.0, "max": 1.0},
-            "seed":            {"type": int, "min": 0, "max": 4294967295}
+            "seed":            {"type": int, "min": 0, "max": 4294967295},
+            "decoder_delta":   {"type": float, "min": 0.0, "max": 1.0}
         }
 
         # Soft Limits
@@ -52,11 +57,30 @@ class SidebarFrame(ctk.CTkFrame):
         ).pack(anchor="w", pady=(10, 5), padx=15)
         
         self.params_widgets = {}
+        self.option_widgets = {}
         for param in ["population_size", "generations", "tournament_size", "mutation_prob", "seed"]:
             self._create_param_field(param)
+        self._create_option_field("crossover", "Crossover", CROSSOVERS)
+        self._create_option_field("mutation", "Mutation Operator", MUTATIONS)
+        self._create_option_field("decoder", "Decoder", DECODERS)
+        # Delta is used only by the hybrid decoder
+        self._create_param_field("decoder_delta")
+        ctk.CTkButton(
+            self.ga_container, text="Load Profile", command=self._on_load_profile,
+            height=28, fg_color="#30363d", hover_color="#484f58"
+        ).pack(fill="x", pady=(8, 5), padx=15)
 
         self._update_param_visibility()
 
+    def load_default_profile(self):
+        """DEFAULT_PROFILE into the fields if it exists (bindings reads it, so
+        this is called only after they have loaded in the background)"""
+        if Path(DEFAULT_PROFILE).exists():
+            try:
+                self.apply_profile(read_profile(DEFAULT_PROFILE))
+            except (RuntimeError, ValueError):
+                pass  # Broken profile - DEFAULT_PARAMS stay
+
     def _setup_file_section(self):
         ctk.CTkLabel(self.scrollable_frame, text="Load Instance", font=("Segoe UI", 13, "bold"), text_color="white").pack(anchor="w", pady=(15, 5), padx=15)
         self.instance_file = ctk.CTkEntry(self.scrollable_frame, placeholder_text="No file selected", fg_color="#0d1117", state="readonly", height=30, border_color="#30363d")
@@ -67,7 +91,7 @@ class SidebarFrame(ctk.CTkFrame):
     def _setup_algo_section(self):
         ctk.CTkLabel(self.scrollable_frame, text="Algorithm", font=("Segoe UI", 13, "bold"), text_color="white").pack(anchor="w", pady=(0, 5), padx=15)
         self.algorithm_dropdown = ctk.CTkOptionMenu(
-            self.scrollable_frame, values=["Genetic", "Greedy", "Exact"], 
+            self.scrollable_frame, values=list(ALGORITHMS), 
             command=self._on_algorithm_change, height=30, fg_color="#0078ff", button_color="#0066cc"
         )
         self.algorithm_dropdown.set("Genetic")
@@ -75,7 +99,7 @@ class SidebarFrame(ctk.CTkFrame):
         
         self.exact_warning = ctk.CTkLabel(
             self.scrollable_frame, 
-            text="Warning: Not recommended for instances > 4x3. High complexity.", 
+            text="Warning: Not recommended above 12 operations (4x3). High complexity.", 
             text_color=COLOR_WARNING, font=("Segoe UI", 11), justify="left", wraplength=240, anchor="w"
         )
         self.algo_separator = ctk.CTkFrame(self.scrollable_frame, height=1, fg_color=COLOR_NORMAL)
@@ -84,6 +108,7 @@ class SidebarFrame(ctk.CTkFrame):
     def _create_param_field(self, param_key):
         display = param_key.replace("_", " ").title()
         if param_key == "seed": display = "Random Seed (0=Random)"
+        if param_key == "decoder_delta": display = "Hybrid Delta (0=Non-delay, 1=Active)"
         frame = ctk.CTkFrame(self.ga_container, fg_color="transparent")
         frame.pack(fill="x", pady=2, padx=15)
         ctk.CTkLabel(frame, text=f"{display}:", text_color="#b0b8c3", font=("Segoe UI", 11)).pack(anchor="w")
@@ -95,16 +120,53 @@ class SidebarFrame(ctk.CTkFrame):
         entry.bind("<Return>", lambda e, k=param_key: self._validate_field_live(k))
         self.params_widgets[param_key] = entry
 
+    def _create_option_field(self, param_key, display, options):
+        """Option menu; options: GUI label -> parameter value"""
+        frame = ctk.CTkFrame(self.ga_container, fg_color="transparent")
+        frame.pack(fill="x", pady=2, padx=15)
+        ctk.CTkLabel(frame, text=f"{display}:", text_color="#b0b8c3", font=("Segoe UI", 11)).pack(anchor="w")
+        menu = ctk.CTkOptionMenu(
+            frame, values=list(options), height=28, fg_color="#0d1117", button_color="#30363d"
+        )
+        menu.set(next(k for k, v in options.items() if v == DEFAULT_PARAMS[param_key]))
+        menu.pack(fill="x", pady=(2, 5))
+        self.option_widgets[param_key] = (menu, options)
+
+    def apply_profile(self, profile):
+        """Fill the fields from a profile (read_profile); the seed is left unchanged"""
+        for key, value in profile.items():
+            if key in self.params_widgets:
+                entry = self.params_widgets[key]
+                entry.delete(0, "end")
+                entry.insert(0, str(value))
+                self._validate_field_live(key)
+            elif key in self.option_widgets:
+                menu, options = self.option_widgets[key]
+                menu.set(next(k for k, v in options.items() if v == value))
+
+    def _on_load_profile(self):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(
+            initialdir=PROFILE_DIR,
+            filetypes=[("GA Profiles", "*.profile"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.apply_profile(read_profile(path))
+        except (RuntimeError, ValueError) as e:
+            StatusDialog(self.winfo_toplevel(), "Profile Error", "Cannot load profile:", str(e), type_="error")
+
     def _update_param_visibility(self):
         self.ga_container.pack_forget()
         self.exact_warning.pack_forget()
-        if self.selected_algorithm == "genetic":
+        if self.selected_algorithm in GA_ALGORITHMS:
             self.ga_container.pack(fill="x", pady=0)
         elif self.selected_algorithm == "exact":
             self.exact_warning.pack(in_=self.scrollable_frame, before=self.algo_separator, fill="x", pady=(5, 5), padx=20)
 
     def _on_algorithm_change(self, choice):
-        self.selected_algorithm = {"Genetic": "genetic", "Greedy": "greedy", "Exact": "exact"}.get(choice, "genetic")
+        self.selected_algorithm = ALGORITHMS.get(choice, "genetic")
         self._update_param_visibility()
         if self.on_algorithm_change_callback: self.on_algorithm_change_callback(self.selected_algorithm)
 
@@ -125,10 +187,10 @@ class SidebarFrame(ctk.CTkFrame):
             entry.configure(border_color=COLOR_ERROR)
 
     def get_parameters(self):
-        if self.selected_algorithm != "genetic":
+        if self.selected_algorithm not in GA_ALGORITHMS:
             return {"algorithm": self.selected_algorithm}
 
-        clean_params = {"algorithm": "genetic"}
+        clean_params = {"algorithm": self.selected_algorithm}
         errors_list = []
         warnings_list = []
         
@@ -154,6 +216,9 @@ class SidebarFrame(ctk.CTkFrame):
                 errors_list.append(f"• {nice_name}: {str(e)}")
                 widget.configure(border_color=COLOR_ERROR)
 
+        for key, (menu, options) in self.option_widgets.items():
+            clean_params[key] = options[menu.get()]
+
         if "population_size" in clean_params and "tournament_size" in clean_params:
             if clean_params["tournament_size"] > clean_params["population_size"]:
                 errors_list.append("• Tournament Size > Population Size")
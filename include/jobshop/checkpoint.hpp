@@ -0,0 +1,91 @@
+#ifndef JOBSHOP_CHECKPOINT_HPP
+#define JOBSHOP_CHECKPOINT_HPP
+
+#include "jobshop/genetic.hpp"
+#include <condition_variable>
+#include <cstdint>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * Genetic run snapshot: parameters + state
+ */
+struct GeneticSnapshot {
+    GeneticParams params;
+    GeneticState state;
+};
+
+/**
+ * Encode snapshot into a compact binary buffer.
+ *
+ * Layout (little-endian):
+ * - magic "JSGA", format version
+ * - parameters, instance shape (jobs, machines, operations)
+ * - generation counter, RNG state
+ * - population: cached fitness + genome (job IDs, 1/2/4 bytes per gene)
+ *   + machine assignment of flexible instances (1/2 bytes per operation)
+ * - best solution: makespan + genome (+ assignment)
+ */
+std::vector<std::uint8_t> encode_snapshot(const JobShopInstance& instance,
+                                          const GeneticParams& params,
+                                          const GeneticState& state);
+
+/**
+ * Decode snapshot, validating it against the instance.
+ * Start times of the best solution are recomputed.
+ */
+GeneticSnapshot decode_snapshot(const JobShopInstance& instance,
+                                const std::vector<std::uint8_t>& buffer);
+
+/**
+ * Read snapshot file
+ */
+GeneticSnapshot load_snapshot(const JobShopInstance& instance, const std::string& path);
+
+/**
+ * Write buffer to path atomically (temporary file + rename)
+ */
+void write_snapshot_file(const std::string& path, const std::vector<std::uint8_t>& buffer);
+
+/**
+ * Background snapshot writer.
+ *
+ * submit() only hands the encoded buffer over; file I/O happens on the
+ * writer thread. If the disk is slower than the engine, older pending
+ * snapshots are dropped in favour of the newest one.
+ */
+class CheckpointWriter {
+public:
+    explicit CheckpointWriter(std::string path);
+    ~CheckpointWriter();
+
+    CheckpointWriter(const CheckpointWriter&) = delete;
+    CheckpointWriter& operator=(const CheckpointWriter&) = delete;
+
+    void submit(std::vector<std::uint8_t> buffer);
+
+    /**
+     * Block until the pending snapshot is on disk
+     */
+    void flush();
+
+private:
+    void worker_loop();
+
+    std::string path_;
+    std::mutex mutex_;
+    std::condition_variable cv_;
+    std::vector<std::uint8_t> pending_;
+    bool has_pending_ = false;
+    bool writing_ = false;
+    bool stop_ = false;
+    std::thread worker_;
+};
+
+} // namespace jobshop
+
+#endif // JOBSHOP_CHECKPOINT_HPP
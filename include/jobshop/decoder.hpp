@@ -0,0 +1,69 @@
+#ifndef JOBSHOP_DECODER_HPP
+#define JOBSHOP_DECODER_HPP
+
+#include "jobshop/solution.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * How an operation sequence is turned into a schedule
+ */
+enum class DecoderKind : std::uint8_t {
+    SemiActive = 0,  // append after the machine's last operation (calculate_makespan)
+    Active = 1,      // sequence order, each operation into the earliest idle gap that fits
+    NonDelay = 2,    // Giffler-Thompson, never idle a machine while an operation is ready
+    Hybrid = 3,      // Giffler-Thompson with delay parameter delta (0 = non-delay, 1 = active)
+};
+
+const char* decoder_name(DecoderKind kind);
+
+/**
+ * Parse "semi-active", "active", "non-delay" or "hybrid"
+ */
+DecoderKind parse_decoder(const std::string& name);
+
+/**
+ * Decode solution.operation_sequence into start_times and makespan.
+ *
+ * For the Giffler-Thompson decoders the sequence is a priority list: among
+ * the operations competing for a machine, the one appearing first wins.
+ *
+ * Except for SemiActive, the sequence after frozen_prefix is rewritten in
+ * start-time order, so calculate_makespan reproduces the same schedule
+ * (Lamarckian write-back). The first frozen_prefix operations are decoded
+ * in sequence order and nothing is placed before them on their machines.
+ *
+ * @param delta Only used by Hybrid, clamped to [0, 1]
+ * @return Makespan
+ */
+int decode_schedule(const JobShopInstance& instance, Solution& solution,
+                    DecoderKind kind, double delta = 0.5, std::size_t frozen_prefix = 0);
+
+/**
+ * Genomes decoded side by side by the batch evaluator (more lanes run out
+ * of registers and are slower on x86-64)
+ */
+constexpr std::size_t EVAL_LANES = 4;
+
+/**
+ * Decode every solution of a population (start_times and makespan),
+ * the same result as decode_schedule on each one.
+ *
+ * SemiActive is decoded EVAL_LANES genomes at a time in lockstep: one lane
+ * per individual, state arrays interleaved by lane, so the independent
+ * max/add chains overlap instead of waiting on each other. The other
+ * decoders run one solution at a time.
+ *
+ * @param batched false = one calculate_makespan per solution (reference path)
+ */
+void evaluate_population(const JobShopInstance& instance, std::vector<Solution>& population,
+                         DecoderKind kind = DecoderKind::SemiActive, double delta = 0.5,
+                         std::size_t frozen_prefix = 0, bool batched = true);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_DECODER_HPP
@@ -0,0 +1,179 @@
+#ifndef JOBSHOP_DISJUNCTIVE_GRAPH_HPP
+#define JOBSHOP_DISJUNCTIVE_GRAPH_HPP
+
+#include "jobshop/solution.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <utility>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * Consecutive operations of the critical path processed back to back on
+ * one machine
+ */
+struct CriticalBlock {
+    std::size_t machine = 0;
+    std::vector<std::uint32_t> operations;  // op_index, in processing order
+};
+
+/**
+ * Disjunctive graph of a schedule.
+ *
+ * Nodes are the operations (by op_index). Job arcs link consecutive
+ * operations of a job and weigh the processing time of the first plus the
+ * transport between their machines; machine arcs link consecutive
+ * operations of a machine and weigh the processing time of the first.
+ *
+ * head(i) is the longest path from the start to operation i, i.e. its
+ * semi-active start time; tail(i) is the longest path from the end of i to
+ * the end of the schedule. An operation with head + time + tail ==
+ * makespan is critical, the difference is its slack: how much it may be
+ * delayed (or lengthened) without delaying the schedule.
+ *
+ * Heads and tails are computed over a topological order in O(operations).
+ * swap() exchanges two adjacent operations of a machine and repairs the
+ * order and the heads / tails locally, so a search can apply a move and
+ * read the new makespan without rebuilding the graph; swap_estimate()
+ * predicts the makespan of a swap in O(1) without applying it.
+ */
+class DisjunctiveGraph {
+public:
+    static constexpr std::uint32_t NONE = std::numeric_limits<std::uint32_t>::max();
+
+    /**
+     * Machine order from solution.start_times when they are filled in
+     * (ties by sequence position), otherwise from operation_sequence; the
+     * machine of every operation from solution.machine_choice.
+     * Throws std::invalid_argument if the sequence is not a permutation of
+     * the instance's operations or the start times contradict the routes.
+     */
+    DisjunctiveGraph(const JobShopInstance& instance, const Solution& solution);
+
+    std::size_t num_operations() const { return time_.size(); }
+    std::size_t num_machines() const { return machine_order_.size(); }
+    int makespan() const { return makespan_; }
+
+    std::size_t job(std::size_t index) const { return job_[index]; }
+    std::size_t machine(std::size_t index) const { return machine_[index]; }
+    int time(std::size_t index) const { return time_[index]; }
+    int transport_in(std::size_t index) const { return transport_in_[index]; }
+
+    int head(std::size_t index) const { return head_[index]; }
+    int tail(std::size_t index) const { return tail_[index]; }
+    int slack(std::size_t index) const { return makespan_ - head_[index] - time_[index] - tail_[index]; }
+    bool is_critical(std::size_t index) const { return slack(index) == 0; }
+
+    const std::vector<int>& heads() const { return head_; }
+    const std::vector<int>& tails() const { return tail_; }
+
+    // Neighbours in the graph, NONE at the ends
+    std::uint32_t job_prev(std::size_t index) const { return job_prev_[index]; }
+    std::uint32_t job_next(std::size_t index) const { return job_next_[index]; }
+    std::uint32_t machine_prev(std::size_t index) const { return machine_prev_[index]; }
+    std::uint32_t machine_next(std::size_t index) const { return machine_next_[index]; }
+
+    /**
+     * Operations of a machine in processing order (op_index)
+     */
+    const std::vector<std::uint32_t>& machine_order(std::size_t machine) const { return machine_order_[machine]; }
+
+    /**
+     * One longest path, from an operation starting at 0 to one ending at
+     * the makespan. Where two arcs are tight the machine arc is followed.
+     */
+    std::vector<std::uint32_t> critical_path() const;
+
+    /**
+     * critical_path() cut into machine blocks (a block of one operation is
+     * an operation entered and left by job arcs)
+     */
+    std::vector<CriticalBlock> critical_blocks() const;
+
+    /**
+     * Swaps of the N5 neighbourhood (Nowicki-Smutnicki): the first two and
+     * the last two operations of every block, except the start of the
+     * first block and the end of the last one. Every pair (u, v) has u
+     * directly before v on its machine. An empty list means no swap can
+     * shorten the critical path.
+     */
+    std::vector<std::pair<std::uint32_t, std::uint32_t>> critical_moves() const;
+
+    /**
+     * Makespan estimate after swapping u and v (u directly before v on a
+     * machine), from the heads and tails of their neighbours (Taillard).
+     * Exact when the new longest path goes through u or v.
+     */
+    int swap_estimate(std::uint32_t u, std::uint32_t v) const;
+
+    /**
+     * Swap u and v (u directly before v on a machine) and update the
+     * graph. Only the operations between u and v in the topological order
+     * are reordered (Pearce-Kelly), and heads / tails are recomputed only
+     * where a predecessor (successor) changed.
+     *
+     * @return false if the swap would create a cycle; the graph is unchanged
+     */
+    bool swap(std::uint32_t u, std::uint32_t v);
+
+    /**
+     * Solution with the current machine order: operations in topological
+     * order, start times = heads
+     */
+    Solution to_solution() const;
+
+private:
+    void build_order();
+    void full_update();
+    void update_makespan();
+    int head_from_preds(std::uint32_t index) const;
+    int tail_from_succs(std::uint32_t index) const;
+    void check_adjacent(std::uint32_t u, std::uint32_t v) const;
+    void relink(std::uint32_t u, std::uint32_t v);
+
+    std::vector<std::uint32_t> job_offset_;
+    std::vector<std::uint32_t> job_;
+    std::vector<std::uint16_t> machine_;
+    std::vector<std::uint16_t> machine_choice_;
+    std::vector<std::int32_t> time_;
+    std::vector<std::int32_t> transport_in_;    // transport from the job's previous machine
+    std::vector<std::uint32_t> job_prev_, job_next_;
+    std::vector<std::uint32_t> machine_prev_, machine_next_;
+    std::vector<std::vector<std::uint32_t>> machine_order_;
+    std::vector<std::uint32_t> machine_pos_;    // position in machine_order_
+
+    std::vector<std::uint32_t> order_;          // topological order
+    std::vector<std::uint32_t> order_pos_;
+    std::vector<int> head_, tail_;
+    int makespan_ = 0;
+
+    // Scratch of swap()
+    std::vector<std::uint8_t> mark_;
+    std::vector<std::uint32_t> stack_, forward_, backward_, slots_;
+};
+
+/**
+ * Why the makespan is what it is
+ */
+struct BottleneckReport {
+    int makespan = 0;
+    std::size_t path_operations = 0;
+    long long path_processing = 0;      // processing time on the critical path
+    long long path_transport = 0;       // transport on its job arcs
+    std::size_t blocks = 0;             // machine blocks of the path
+    std::size_t critical_operations = 0;  // all operations with zero slack
+
+    std::vector<long long> machine_load;          // processing time per machine
+    std::vector<long long> machine_critical;      // processing of zero-slack operations per machine
+    std::vector<long long> machine_path;          // processing on the critical path per machine
+    std::size_t bottleneck_machine = 0;           // most time on the critical path
+    double mean_slack = 0.0;                      // over all operations
+};
+
+BottleneckReport bottleneck_report(const DisjunctiveGraph& graph);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_DISJUNCTIVE_GRAPH_HPP
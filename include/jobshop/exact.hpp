@@ -2,21 +2,100 @@
 #define JOBSHOP_EXACT_HPP
 
 #include "jobshop/solution.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <string>
 
 namespace jobshop {
 
+/**
+ * Search strategy of the exact solver
+ */
+enum class ExactSearch : std::uint8_t {
+    AStar = 0,    // best-first, keeps every generated state (fastest, memory grows)
+    IDAStar = 1,  // iterative deepening on f, memory linear in depth + fixed table
+};
+
+const char* exact_search_name(ExactSearch search);
+
+/**
+ * Parse "astar" or "ida"
+ */
+ExactSearch parse_exact_search(const std::string& name);
+
+/**
+ * Optional limits of an exact search (all default to "none")
+ */
+struct ExactLimits {
+    // Makespan of the best known solution; states with f >= bound are
+    // pruned, so only strictly better solutions are searched for.
+    // Polled during the search, the bound may shrink while it runs.
+    std::function<int()> upper_bound;
+
+    // Polled every few hundred expansions
+    std::function<bool()> should_stop;
+
+    // Stop after this many stored states (0 = unlimited) and return no
+    // solution. IDA* stores no states, there it caps the number of expansions.
+    std::size_t max_states = 0;
+
+    ExactSearch search = ExactSearch::AStar;
+
+    // Transposition table in MB (rounded down to a power of two, at least
+    // one 64-byte bucket). A*: states already generated; IDA*: bounds of
+    // searched subtrees. When full, entries deep in the schedule are
+    // replaced first - lost entries cost re-expansions, never memory.
+    std::size_t table_mb = 16;
+
+    // A*: memory for stored nodes and the open list (~28 bytes per
+    // state, never exceeded). When it is full the search continues as
+    // IDA* from the lowest f still open - slower, same optimum.
+    std::size_t node_mb = 1024;
+};
+
+/**
+ * Counters of one exact search
+ */
+struct ExactStats {
+    std::size_t expanded = 0;       // states whose successors were generated
+    std::size_t generated = 0;      // successors evaluated (heuristic computed)
+    std::size_t stored_states = 0;  // A*: nodes kept (peak)
+    std::size_t iterations = 0;     // IDA*: f-thresholds searched (A*: 1)
+    std::size_t table_hits = 0;     // successors cut off by the transposition table
+    std::size_t table_slots = 0;
+    std::size_t table_replacements = 0;  // entries evicted by other states
+    bool switched_to_ida = false;   // A* ran out of node_mb and finished as IDA*
+};
+
 /**
  * Exact A* solver for Job Shop Scheduling with transport times.
  *
- * Uses A* algorithm with admissible heuristic to find optimal solution.
+ * Uses A* algorithm with admissible heuristic to find optimal solution
+ * (ExactLimits::search selects IDA* with the same heuristic instead).
  * WARNING: This is exponential in complexity. Use only for small instances
  * (typically up to 10x10 or smaller depending on structure).
+ * Flexible instances (machine alternatives) are not supported
+ * (std::invalid_argument).
  *
  * @param instance Job shop instance with jobs, machines, and transport times
  * @return Optimal Solution (operation sequence with start times and makespan)
  */
 Solution solve_exact(const JobShopInstance& instance);
 
+/**
+ * Bounded exact search.
+ *
+ * @param complete Set to true when the search space was exhausted: a
+ *                 returned solution is optimal, an empty one means no
+ *                 solution beats the final upper bound (which is then
+ *                 proven optimal). False when a limit stopped the search.
+ * @param stats    Optional counters of the search
+ * @return Optimal solution, or an empty Solution (no operations)
+ */
+Solution solve_exact(const JobShopInstance& instance, const ExactLimits& limits,
+                     bool* complete = nullptr, ExactStats* stats = nullptr);
+
 } // namespace jobshop
 
 #endif // JOBSHOP_EXACT_HPP
\ No newline at end of file
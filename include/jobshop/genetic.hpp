@@ -2,24 +2,137 @@
 #define JOBSHOP_GENETIC_HPP
 
 #include "jobshop/solution.hpp"
+#include "jobshop/rng.hpp"
+#include "jobshop/decoder.hpp"
 #include <vector>
-#include <random>
 #include <unordered_set>
 #include <algorithm>
 #include <utility>
 #include <cstddef>
-#include <ctime>
+#include <string>
+#include <functional>
+#include <cstdint>
 
 namespace jobshop {
 
+/**
+ * Crossover operator of a genetic run
+ */
+enum class CrossoverKind : std::uint8_t {
+    OX = 0,   // order crossover: segment of parent 1, rest in parent 2 order
+    JOX = 1,  // job-based order crossover: genes of a random job subset keep their parent 1 positions
+};
+
+/**
+ * Mutation operator of a genetic run
+ */
+enum class MutationKind : std::uint8_t {
+    Swap = 0,       // exchange two genes
+    Insert = 1,     // move one gene to another position
+    Inversion = 2,  // reverse a segment
+};
+
+const char* crossover_name(CrossoverKind kind);
+const char* mutation_name(MutationKind kind);
+
+/**
+ * Parse "ox" or "jox"
+ */
+CrossoverKind parse_crossover(const std::string& name);
+
+/**
+ * Parse "swap", "insert" or "inversion"
+ */
+MutationKind parse_mutation(const std::string& name);
+
+/**
+ * Progress of a genetic run, reported after every generation
+ */
+struct GenerationStats {
+    size_t generation = 0;       // number of completed generations
+    int best_makespan = 0;       // best makespan found so far
+    double mean_makespan = 0.0;  // mean fitness of the current population
+    bool improved = false;       // best solution improved in this generation
+    int lower_bound = 0;         // instance lower bound (best == bound means optimal)
+};
+
+/**
+ * Called on the solver thread; should only copy what it needs and return
+ * (e.g. push into a queue drained by the UI thread)
+ */
+using ProgressCallback = std::function<void(const GenerationStats& stats, const Solution& best)>;
+
+/**
+ * Parameters of a genetic run
+ */
+struct GeneticParams {
+    size_t population_size = 50;
+    size_t generations = 100;
+    size_t tournament_size = 3;
+    double mutation_prob = 0.2;
+    unsigned int seed = 0;
+    CrossoverKind crossover = CrossoverKind::OX;
+    MutationKind mutation = MutationKind::Swap;
+
+    // Schedule builder used to evaluate genomes (see decoder.hpp);
+    // decoder_delta is the delay parameter of DecoderKind::Hybrid
+    DecoderKind decoder = DecoderKind::SemiActive;
+    double decoder_delta = 0.5;
+
+    // Leading genome positions that crossover and mutation never touch
+    // (operations that already started, see reoptimize_genetic)
+    size_t frozen_prefix = 0;
+
+    // Checkpointing: a snapshot is written every checkpoint_interval
+    // generations (and at the end) when checkpoint_path is not empty.
+    std::string checkpoint_path;
+    size_t checkpoint_interval = 10;
+
+    // Optional per-generation progress report (not stored in snapshots)
+    ProgressCallback on_progress;
+
+    // Stop as soon as the best solution reaches the instance lower bound
+    // (it is then optimal)
+    bool stop_at_lower_bound = true;
+
+    // Optional early stop, polled after every generation (e.g. a deadline
+    // or a cancel flag). A stopped run returns its best solution so far and
+    // writes a final snapshot, so it can be resumed.
+    std::function<bool()> should_stop;
+};
+
+/**
+ * Complete state of a genetic run between two generations.
+ * Restoring it continues the run exactly as if it was never interrupted.
+ */
+struct GeneticState {
+    size_t generation = 0;             // number of completed generations
+    std::vector<Solution> population;  // Solution::makespan holds the cached fitness
+    Solution best;
+    Rng rng;
+};
+
+/**
+ * Genome encoding: the sequence of job IDs, one entry per operation.
+ * Any permutation decodes to a precedence-feasible solution, because the
+ * k-th occurrence of a job is its k-th operation.
+ */
+std::vector<size_t> solution_to_genes(const Solution& solution);
+Solution genes_to_solution(const std::vector<size_t>& genes);
+
+// Operators come in two flavours: the seed-based overloads are the
+// standalone (Python-facing) entry points, the Rng& overloads are what the
+// engines use so that one generator is threaded through a whole run.
+
 /**
  * Generate random solution (random permutation of operations)
  * 
  * @param instance Job shop instance
- * @param seed Random seed (0 = use time-based seed)
+ * @param seed Random seed (0 = random seed from std::random_device)
  * @return Randomly shuffled operation sequence
  */
 Solution generate_random_solution(const JobShopInstance& instance, unsigned int seed = 0);
+Solution generate_random_solution(const JobShopInstance& instance, Rng& rng);
 
 /**
  * Generate initial population of random solutions
@@ -28,6 +141,10 @@ std::vector<Solution> generate_population(
     const JobShopInstance& instance,
     size_t population_size,
     unsigned int seed = 0);
+std::vector<Solution> generate_population(
+    const JobShopInstance& instance,
+    size_t population_size,
+    Rng& rng);
 
 /**
  * Tournament selection - select best individual from random subset
@@ -37,6 +154,11 @@ Solution tournament_selection(
     const JobShopInstance& instance,
     size_t tournament_size,
     unsigned int seed = 0);
+Solution tournament_selection(
+    const std::vector<Solution>& population,
+    const JobShopInstance& instance,
+    size_t tournament_size,
+    Rng& rng);
 
 /**
  * Order Crossover (OX) - preserves relative order of operations
@@ -45,11 +167,84 @@ Solution order_crossover(
     const Solution& parent1,
     const Solution& parent2,
     unsigned int seed = 0);
+Solution order_crossover(
+    const Solution& parent1,
+    const Solution& parent2,
+    Rng& rng,
+    size_t frozen_prefix = 0);
+
+/**
+ * Job-based Order Crossover (JOX) - every gene of a random subset of jobs
+ * keeps its position from parent1, the other jobs fill the remaining
+ * positions in parent2 order
+ */
+Solution job_order_crossover(
+    const Solution& parent1,
+    const Solution& parent2,
+    unsigned int seed = 0);
+Solution job_order_crossover(
+    const Solution& parent1,
+    const Solution& parent2,
+    Rng& rng,
+    size_t frozen_prefix = 0);
 
 /**
  * Swap mutation - exchange two random operations
  */
 void mutate_swap(Solution& solution, unsigned int seed = 0);
+void mutate_swap(Solution& solution, Rng& rng, size_t frozen_prefix = 0);
+
+/**
+ * Insert mutation - move one random operation to a random position
+ */
+void mutate_insert(Solution& solution, unsigned int seed = 0);
+void mutate_insert(Solution& solution, Rng& rng, size_t frozen_prefix = 0);
+
+/**
+ * Inversion mutation - reverse a random segment
+ */
+void mutate_inversion(Solution& solution, unsigned int seed = 0);
+void mutate_inversion(Solution& solution, Rng& rng, size_t frozen_prefix = 0);
+
+// ===== MACHINE ASSIGNMENT (flexible instances) =====
+//
+// Flexible instances are evolved on two levels: the job sequence above
+// and Solution::machine_choice, the chosen alternative of every operation.
+// Each child gets both crossovers; each level mutates with mutation_prob.
+// For instances without alternatives these leave machine_choice empty
+// and draw no random numbers, so fixed-route runs are unchanged.
+
+/**
+ * Random assignment: every operation takes its fastest machine with
+ * probability 1/2, otherwise a uniformly random alternative
+ */
+std::vector<std::uint16_t> random_machine_choice(const JobShopInstance& instance, Rng& rng);
+
+/**
+ * Uniform crossover of the machine assignments of two parents.
+ * Operations in the first frozen_prefix positions of parent1's sequence
+ * keep parent1's machine.
+ */
+std::vector<std::uint16_t> assignment_crossover(
+    const JobShopInstance& instance,
+    const Solution& parent1,
+    const Solution& parent2,
+    Rng& rng,
+    size_t frozen_prefix = 0);
+
+/**
+ * Move one random (not frozen) flexible operation to another machine
+ */
+void mutate_assignment(const JobShopInstance& instance, Solution& solution, Rng& rng,
+                       size_t frozen_prefix = 0);
+
+/**
+ * One child with the operators of a run: crossover of the parents,
+ * mutation with params.mutation_prob and, on flexible instances, the same
+ * two steps for the machine assignment. Not evaluated.
+ */
+Solution make_offspring(const JobShopInstance& instance, const Solution& parent1, const Solution& parent2,
+                        Rng& rng, const GeneticParams& params);
 
 /**
  * Main genetic algorithm
@@ -70,6 +265,88 @@ Solution run_genetic(
     double mutation_prob,
     unsigned int seed = 0);
 
+/**
+ * Genetic algorithm driven by a parameter struct (supports checkpointing)
+ */
+Solution run_genetic(const JobShopInstance& instance, const GeneticParams& params);
+
+/**
+ * Evolve an existing state until params.generations generations are completed.
+ * Low-level entry point shared by run_genetic, resume and warm start.
+ */
+void evolve_genetic(const JobShopInstance& instance, const GeneticParams& params, GeneticState& state);
+
+/**
+ * Continue an interrupted run from a snapshot written by run_genetic.
+ * Parameters are taken from the snapshot, checkpointing continues into
+ * the same file.
+ *
+ * @param instance Instance the snapshot was created for
+ * @param snapshot_path Path to the snapshot file
+ * @return Best solution found
+ */
+Solution resume_genetic(const JobShopInstance& instance, const std::string& snapshot_path);
+
+// ===== PROFILES =====
+
+/**
+ * Read GA parameters from a profile file (e.g. written by the tuner).
+ *
+ * Format: one "key = value" per line, '#' starts a comment. Keys:
+ * population_size, generations, tournament_size, mutation_prob,
+ * crossover, mutation, decoder, decoder_delta. Missing keys keep their
+ * value from defaults, unknown keys are an error.
+ */
+GeneticParams load_genetic_profile(const std::string& path, const GeneticParams& defaults = {});
+
+/**
+ * Write the profile keys of params; comment lines go first, prefixed with '#'
+ */
+void save_genetic_profile(const std::string& path, const GeneticParams& params,
+                          const std::string& comment = "");
+
+// ===== WARM START (rolling-horizon replanning) =====
+
+/**
+ * Repair a solution from a previous planning cycle for an edited instance.
+ *
+ * The frozen operations are placed first, in the given order. The rest
+ * keeps the relative job order of the previous solution. Operations that
+ * no longer exist (removed jobs, shorter routes) are dropped. New
+ * operations (added jobs, longer routes) go in at random positions after
+ * the frozen prefix. On flexible instances the machine assignment of
+ * operations that still exist is kept.
+ *
+ * @param frozen Already started operations (job_id, operation_id); for every
+ *               job they must form a prefix of its route (0, 1, ..., k-1)
+ * @return Valid solution for instance (start times not computed)
+ */
+Solution repair_solution(
+    const JobShopInstance& instance,
+    const Solution& previous,
+    const std::vector<std::pair<size_t, size_t>>& frozen,
+    Rng& rng);
+
+/**
+ * Warm-start re-optimization.
+ *
+ * The initial population is built from the repaired previous solutions,
+ * mutated copies of them, and (for diversity) a share of random
+ * individuals. All of them start with the frozen prefix. Evolution then
+ * never moves the frozen operations, so their start times stay as they
+ * were.
+ *
+ * @param previous Solution(s) from the previous cycle (e.g. best or whole population)
+ * @param frozen Already started operations, see repair_solution
+ * @param params GA parameters (frozen_prefix is set automatically)
+ * @return Best solution found
+ */
+Solution reoptimize_genetic(
+    const JobShopInstance& instance,
+    const std::vector<Solution>& previous,
+    const std::vector<std::pair<size_t, size_t>>& frozen,
+    const GeneticParams& params);
+
 } // namespace jobshop
 
 #endif // JOBSHOP_GENETIC_HPP
@@ -2,11 +2,44 @@
 #define JOBSHOP_GREEDY_HPP
 
 #include "jobshop/solution.hpp"
+#include <cstdint>
+#include <string>
 
 namespace jobshop {
 
 // Tutaj można dodać deklaracje funkcji dla zachłannych algorytmów rozwiązywania problemu Job Shop
     Solution greedy_schedule(const JobShopInstance& instance);
+
+/**
+ * Priority rules for dispatch_schedule
+ */
+enum class DispatchRule : std::uint8_t {
+    SPT = 0,    // shortest processing time
+    LPT = 1,    // longest processing time
+    MWKR = 2,   // most work remaining in the job
+    LWKR = 3,   // least work remaining in the job
+    MOPNR = 4,  // most operations remaining in the job
+    FIFO = 5,   // earliest job release (ready time)
+};
+
+const char* dispatch_rule_name(DispatchRule rule);
+
+/**
+ * Parse "spt", "lpt", "mwkr", "lwkr", "mopnr" or "fifo"
+ */
+DispatchRule parse_dispatch_rule(const std::string& name);
+
+/**
+ * Non-delay dispatching: at the earliest time t* an operation can start,
+ * the rule picks among the operations of that machine that can start at
+ * t*. No machine is ever left idle while an operation could run on it.
+ * Ties go to the lower job ID. Flexible operations use their default
+ * (fastest) machine.
+ *
+ * @return Solution with start times and makespan
+ */
+Solution dispatch_schedule(const JobShopInstance& instance, DispatchRule rule);
+
 } // namespace jobshop
 
 #endif // JOBSHOP_GREEDY_HPP
@@ -0,0 +1,61 @@
+#ifndef JOBSHOP_INSTANCE_STATS_HPP
+#define JOBSHOP_INSTANCE_STATS_HPP
+
+#include "jobshop/solution.hpp"
+#include <cstddef>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * Features and lower bounds of an instance, computed in one linear pass
+ */
+struct InstanceStats {
+    std::size_t num_jobs = 0;
+    std::size_t num_machines = 0;
+    std::size_t num_operations = 0;
+    long long total_processing = 0;
+    long long total_transport = 0;      // along every route (transport between consecutive operations)
+
+    // Job bound: longest route, processing + transport
+    int job_lower_bound = 0;
+    std::size_t critical_job = 0;
+
+    // Machine bound: min head + load + min tail over the operations of a
+    // machine (head = work and transport before the operation in its job,
+    // tail = after it). Flexible instances: only operations without
+    // alternatives count towards a machine, times and transports are the
+    // smallest over the alternatives, and total work / machines is a bound too.
+    int machine_lower_bound = 0;
+    std::size_t bottleneck_machine = 0;
+
+    int lower_bound = 0;                // max of the two bounds
+
+    std::size_t flexible_operations = 0;  // operations with more than one machine
+    std::vector<long long> machine_load;  // processing time per machine (default machines)
+    std::vector<int> op_tail;           // processing + transport after every operation in its job (default machines)
+    double load_imbalance = 0.0;        // max / mean machine load (1.0 = balanced)
+    double transport_ratio = 0.0;       // total_transport / total_processing
+};
+
+/**
+ * Compute the statistics (O(operations + machines))
+ */
+InstanceStats analyze_instance(const JobShopInstance& instance);
+
+/**
+ * Cached statistics of the instance (computed on first use, thread-safe).
+ * Code that modifies an instance in place must call invalidate_stats
+ * (it also drops the cached instance_key).
+ */
+const InstanceStats& instance_stats(const JobShopInstance& instance);
+void invalidate_stats(JobShopInstance& instance);
+
+/**
+ * Relative gap (makespan - lower_bound) / lower_bound, 0.0 when the bound is 0
+ */
+double optimality_gap(int makespan, int lower_bound);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_INSTANCE_STATS_HPP
@@ -0,0 +1,89 @@
+#ifndef JOBSHOP_JSON_HPP
+#define JOBSHOP_JSON_HPP
+
+#include <cstddef>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * Minimal JSON value for the solver daemon protocol.
+ *
+ * Objects keep their insertion order (responses read in the order they
+ * were built), numbers are doubles, integral ones are written without
+ * a fraction.
+ */
+class Json {
+public:
+    enum class Type { Null, Bool, Number, String, Array, Object };
+
+    Json() = default;
+    Json(bool value) : type_(Type::Bool), bool_(value) {}
+    Json(double value) : type_(Type::Number), number_(value) {}
+    Json(int value) : Json(static_cast<double>(value)) {}
+    Json(long value) : Json(static_cast<double>(value)) {}
+    Json(long long value) : Json(static_cast<double>(value)) {}
+    Json(unsigned long value) : Json(static_cast<double>(value)) {}
+    Json(unsigned long long value) : Json(static_cast<double>(value)) {}
+    Json(std::string value) : type_(Type::String), string_(std::move(value)) {}
+    Json(const char* value) : Json(std::string(value)) {}
+
+    static Json array();
+    static Json object();
+
+    Type type() const { return type_; }
+    bool is_null() const { return type_ == Type::Null; }
+    bool is_number() const { return type_ == Type::Number; }
+    bool is_string() const { return type_ == Type::String; }
+    bool is_array() const { return type_ == Type::Array; }
+    bool is_object() const { return type_ == Type::Object; }
+
+    /**
+     * Typed access; throws std::invalid_argument on a type mismatch
+     */
+    bool as_bool() const;
+    double as_number() const;
+    const std::string& as_string() const;
+    const std::vector<Json>& items() const;
+    const std::vector<std::pair<std::string, Json>>& members() const;
+
+    /**
+     * Object member or nullptr
+     */
+    const Json* find(const std::string& key) const;
+
+    /**
+     * Set (or replace) an object member
+     */
+    Json& set(const std::string& key, Json value);
+
+    /**
+     * Append to an array
+     */
+    Json& push_back(Json value);
+
+    /**
+     * Compact single-line text (no newlines, so one value = one protocol line)
+     */
+    std::string dump() const;
+    void dump(std::string& out) const;
+
+    /**
+     * Parse text; throws std::invalid_argument with the offset of the error
+     */
+    static Json parse(const std::string& text);
+
+private:
+    Type type_ = Type::Null;
+    bool bool_ = false;
+    double number_ = 0.0;
+    std::string string_;
+    std::vector<Json> items_;
+    std::vector<std::pair<std::string, Json>> members_;
+};
+
+} // namespace jobshop
+
+#endif // JOBSHOP_JSON_HPP
@@ -0,0 +1,94 @@
+#ifndef JOBSHOP_NSGA2_HPP
+#define JOBSHOP_NSGA2_HPP
+
+#include "jobshop/genetic.hpp"
+#include <array>
+#include <cstddef>
+#include <string>
+#include <vector>
+
+namespace jobshop {
+
+// ===== OBJECTIVES =====
+
+constexpr std::size_t NUM_OBJECTIVES = 3;
+
+/**
+ * Objectives of a schedule, all minimized:
+ *  [0] makespan
+ *  [1] total transport time (sum over consecutive operations of every job;
+ *      depends only on the machine assignment, so it is constant on
+ *      instances without alternatives)
+ *  [2] total idle time: gaps between the first start and the last finish
+ *      of every machine
+ */
+using Objectives = std::array<int, NUM_OBJECTIVES>;
+
+/**
+ * "makespan", "transport" or "idle"
+ */
+const char* objective_name(std::size_t objective);
+
+/**
+ * Decode a solution (start_times and makespan) and compute its objectives.
+ * SemiActive does it in one pass over the sequence; the other decoders
+ * run decode_schedule first and collect the objectives in a pass over
+ * the start times.
+ */
+Objectives evaluate_objectives(const JobShopInstance& instance, Solution& solution,
+                               DecoderKind decoder = DecoderKind::SemiActive, double delta = 0.5);
+
+/**
+ * a is no worse than b in every objective and better in at least one
+ */
+bool dominates(const Objectives& a, const Objectives& b);
+
+/**
+ * Fronts of non-dominated points, best first (indices into points).
+ *
+ * Efficient non-dominated sort with binary search (ENS-BS, Zhang et al.):
+ * the points are sorted lexicographically, so a point can only be
+ * dominated by points before it, and each goes to the first front with no
+ * member dominating it, found by binary search over the fronts. Equal
+ * points share a front. A point is compared with the members of O(log F)
+ * fronts only, newest first, and a check stops at the first dominating
+ * member; the worst case is the naive O(M N^2).
+ */
+std::vector<std::vector<std::size_t>> non_dominated_sort(const std::vector<Objectives>& points);
+
+/**
+ * NSGA-II crowding distance of every member of one front (same order as
+ * front); the extremes of each objective get infinity
+ */
+std::vector<double> crowding_distance(const std::vector<Objectives>& points,
+                                      const std::vector<std::size_t>& front);
+
+// ===== NSGA-II =====
+
+/**
+ * Non-dominated solutions of a run, one per distinct objective vector,
+ * sorted by makespan (then transport, idle)
+ */
+struct ParetoFront {
+    std::vector<Solution> solutions;     // with start times and makespan
+    std::vector<Objectives> objectives;
+    std::size_t generations = 0;         // completed generations
+};
+
+/**
+ * NSGA-II over makespan, transport and idle time.
+ *
+ * Same genome and operators as run_genetic (make_offspring); parents are
+ * chosen by tournament on (front, crowding distance) and the next
+ * population is the best population_size of parents + children.
+ *
+ * Uses population_size, generations, tournament_size, mutation_prob, seed,
+ * crossover, mutation, decoder, decoder_delta, frozen_prefix, on_progress
+ * (stats and best by makespan) and should_stop. A run does not stop at the
+ * lower bound and does not write checkpoints.
+ */
+ParetoFront run_nsga2(const JobShopInstance& instance, const GeneticParams& params);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_NSGA2_HPP
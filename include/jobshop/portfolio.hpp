@@ -0,0 +1,83 @@
+#ifndef JOBSHOP_PORTFOLIO_HPP
+#define JOBSHOP_PORTFOLIO_HPP
+
+#include "jobshop/solution.hpp"
+#include "jobshop/genetic.hpp"
+#include "jobshop/greedy.hpp"
+#include <cstddef>
+#include <string>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * Members and budget of a portfolio run
+ */
+struct PortfolioParams {
+    double time_limit = 10.0;   // wall-clock budget in seconds
+    size_t threads = 0;         // worker threads (0 = hardware concurrency)
+
+    bool greedy = true;                 // greedy_schedule
+    std::vector<DispatchRule> dispatch_rules = {
+        DispatchRule::SPT, DispatchRule::LPT, DispatchRule::MWKR,
+        DispatchRule::LWKR, DispatchRule::MOPNR, DispatchRule::FIFO,
+    };
+
+    // Exact search pruned by the shared incumbent; 0 states = no exact member
+    // (always left out for flexible instances)
+    size_t exact_max_states = 2000000;
+
+    // One GA member per entry; generations act as a cap, the deadline
+    // stops them first (see default_genetic_members)
+    std::vector<GeneticParams> genetic;
+
+    // Stop everything once the incumbent reaches this makespan,
+    // 0 = the instance lower bound (reaching it proves optimality)
+    int target_makespan = 0;
+};
+
+/**
+ * Contribution of one member
+ */
+struct MemberReport {
+    std::string name;
+    int best_makespan = 0;        // best solution of this member (0 = none)
+    double time_to_best = 0.0;    // seconds from the portfolio start to best_makespan
+    size_t improvements = 0;      // how many times it improved the shared incumbent
+    double runtime = 0.0;         // seconds it ran
+    bool finished = false;        // ended on its own, not stopped by the deadline
+};
+
+/**
+ * Result of a portfolio run
+ */
+struct PortfolioResult {
+    Solution best;
+    std::string best_member;      // member that produced best
+    bool proven_optimal = false;  // exact search exhausted below the incumbent, or best == lower_bound
+    int lower_bound = 0;          // instance lower bound (instance_stats)
+    double elapsed = 0.0;
+    std::vector<MemberReport> members;
+};
+
+/**
+ * GA configurations differing in seed and decoder (semi-active, active,
+ * non-delay, hybrid, repeated), all running until the deadline.
+ */
+std::vector<GeneticParams> default_genetic_members(size_t count, const GeneticParams& base = {});
+
+/**
+ * Run greedy, dispatch rules, exact search and several GA runs in parallel
+ * under one deadline.
+ *
+ * All members report into one shared incumbent. The exact search prunes
+ * with it as upper bound; when the search space is exhausted the
+ * incumbent is optimal and every member is stopped. Members are started
+ * in the order fast heuristics, exact, GA, so with fewer threads than
+ * members the cheap ones still run first.
+ */
+PortfolioResult run_portfolio(const JobShopInstance& instance, const PortfolioParams& params);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_PORTFOLIO_HPP
@@ -0,0 +1,158 @@
+#ifndef JOBSHOP_RESULT_CACHE_HPP
+#define JOBSHOP_RESULT_CACHE_HPP
+
+#include "jobshop/solution.hpp"
+#include "jobshop/genetic.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <list>
+#include <mutex>
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+namespace jobshop {
+
+/**
+ * 128-bit content hash (two independent 64-bit lanes)
+ */
+struct CacheKey {
+    std::uint64_t hi = 0;
+    std::uint64_t lo = 0;
+
+    bool operator==(const CacheKey& other) const { return hi == other.hi && lo == other.lo; }
+    bool operator!=(const CacheKey& other) const { return !(*this == other); }
+
+    /**
+     * 32 lowercase hex digits (also the on-disk file name)
+     */
+    std::string hex() const;
+};
+
+struct CacheKeyHash {
+    std::size_t operator()(const CacheKey& key) const { return static_cast<std::size_t>(key.lo ^ key.hi); }
+};
+
+/**
+ * Canonical hash of an instance: hash of serialize_instance, so equal
+ * instances get equal keys however they were loaded (TXT, CSV, bindings).
+ * Computed once per instance and cached like instance_stats
+ */
+CacheKey instance_key(const JobShopInstance& instance);
+
+/**
+ * Key of one solve request: instance + algorithm + canonical parameter text
+ */
+CacheKey request_key(const CacheKey& instance, const std::string& algorithm, const std::string& params = "");
+
+/**
+ * Canonical text of the GA parameters that change the result.
+ * Checkpointing, callbacks and should_stop are left out.
+ */
+std::string genetic_params_key(const GeneticParams& params);
+
+/**
+ * Hit/miss counters of a ResultCache
+ */
+struct CacheStats {
+    size_t memory_hits = 0;
+    size_t disk_hits = 0;
+    size_t misses = 0;
+    size_t stores = 0;
+    size_t evictions = 0;      // files removed from the disk tier
+    size_t memory_entries = 0;
+    std::uint64_t disk_bytes = 0;  // size of the disk tier after the last store
+};
+
+/**
+ * Solve-result cache with two tiers.
+ *
+ * - memory: LRU of the last memory_entries results
+ * - disk (optional): directory/<instance key>/<request key>.jss, one
+ *   serialize_solution file per result. When the files exceed disk_limit
+ *   bytes, the least recently used ones (file mtime, refreshed on every
+ *   hit) are removed. Files are written atomically, so several processes
+ *   can share one directory.
+ *
+ * Entries are grouped by instance, so the best results of other
+ * parameters can seed a new run (seeds()). All methods are thread-safe;
+ * disk I/O errors never fail a solve, they only make the disk tier miss.
+ */
+class ResultCache {
+public:
+    explicit ResultCache(std::string directory = "", size_t memory_entries = 64,
+                         std::uint64_t disk_limit = 64ull << 20);
+
+    /**
+     * Cached result of a request (memory first, then disk)
+     */
+    std::optional<Solution> lookup(const CacheKey& instance, const CacheKey& request);
+
+    /**
+     * Remember solution of a request in both tiers
+     */
+    void store(const CacheKey& instance, const CacheKey& request, const Solution& solution);
+
+    /**
+     * Up to count distinct cached solutions of the instance (any
+     * algorithm and parameters), best makespan first
+     */
+    std::vector<Solution> seeds(const CacheKey& instance, size_t count);
+
+    /**
+     * Drop every entry of both tiers
+     */
+    void clear();
+
+    CacheStats stats() const;
+    const std::string& directory() const { return directory_; }
+
+private:
+    struct Entry {
+        CacheKey instance;
+        CacheKey request;
+        Solution solution;
+    };
+
+    void remember(const CacheKey& instance, const CacheKey& request, const Solution& solution);
+    std::string entry_path(const CacheKey& instance, const CacheKey& request) const;
+    void write_entry(const CacheKey& instance, const CacheKey& request, const Solution& solution);
+    void evict_disk();
+
+    std::string directory_;
+    size_t memory_entries_;
+    std::uint64_t disk_limit_;
+
+    mutable std::mutex mutex_;
+    std::list<Entry> lru_;  // most recently used first
+    std::unordered_map<CacheKey, std::list<Entry>::iterator, CacheKeyHash> index_;
+    CacheStats stats_;
+};
+
+/**
+ * How solve_cached produced its result
+ */
+struct CacheOutcome {
+    bool hit = false;          // returned from the cache, nothing was solved
+    size_t warm_seeds = 0;     // cached solutions seeding the GA (0 = cold start)
+    CacheKey request;
+};
+
+/**
+ * Solve through the cache: "greedy", "exact" (solve_exact without limits,
+ * fixed routes only) or "genetic" (params).
+ *
+ * On a miss with warm_start, cached solutions of the same instance with
+ * other parameters seed the GA (reoptimize_genetic without frozen
+ * operations). A warm run is not the same run as a cold one, so its
+ * result is only stored under the warm request key. A GA with seed 0
+ * (random) is always run; its result is stored for later warm starts.
+ */
+Solution solve_cached(ResultCache& cache, const JobShopInstance& instance, const std::string& algorithm,
+                      const GeneticParams& params = {}, bool warm_start = false,
+                      CacheOutcome* outcome = nullptr);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_RESULT_CACHE_HPP
@@ -0,0 +1,121 @@
+#ifndef JOBSHOP_RNG_HPP
+#define JOBSHOP_RNG_HPP
+
+#include <array>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <random>
+#include <utility>
+
+namespace jobshop {
+
+/**
+ * Fast pseudo-random generator (xoshiro256**).
+ *
+ * 32 bytes of state instead of the ~2.5 KB of std::mt19937, so it is cheap to
+ * create and to pass around by reference through the genetic operators.
+ * Satisfies UniformRandomBitGenerator, so it also works with <random>.
+ */
+class Rng {
+public:
+    using result_type = std::uint64_t;
+    using State = std::array<std::uint64_t, 4>;
+
+    explicit Rng(std::uint64_t seed = 1) { reseed(seed); }
+
+    /**
+     * Expand a 64-bit seed into the full state with splitmix64
+     */
+    void reseed(std::uint64_t seed) {
+        for (auto& word : s_) {
+            seed += 0x9E3779B97F4A7C15ULL;
+            std::uint64_t z = seed;
+            z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+            z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+            word = z ^ (z >> 31);
+        }
+    }
+
+    static constexpr result_type min() { return 0; }
+    static constexpr result_type max() { return std::numeric_limits<result_type>::max(); }
+
+    result_type operator()() {
+        const std::uint64_t result = rotl(s_[1] * 5, 7) * 9;
+        const std::uint64_t t = s_[1] << 17;
+        s_[2] ^= s_[0];
+        s_[3] ^= s_[1];
+        s_[1] ^= s_[2];
+        s_[0] ^= s_[3];
+        s_[2] ^= t;
+        s_[3] = rotl(s_[3], 45);
+        return result;
+    }
+
+    /**
+     * Uniform integer in [0, n) (multiply-shift, no division)
+     */
+    std::size_t below(std::size_t n) {
+        const std::uint64_t x = (*this)() >> 32;
+        return static_cast<std::size_t>((x * static_cast<std::uint64_t>(n)) >> 32);
+    }
+
+    /**
+     * Uniform double in [0, 1)
+     */
+    double uniform01() {
+        return static_cast<double>((*this)() >> 11) * 0x1.0p-53;
+    }
+
+    /**
+     * 32-bit value, used to derive seeds for the standalone operators
+     */
+    unsigned int next_seed() {
+        return static_cast<unsigned int>((*this)() >> 32);
+    }
+
+    const State& state() const { return s_; }
+    void set_state(const State& state) { s_ = state; }
+
+private:
+    static std::uint64_t rotl(std::uint64_t x, int k) {
+        return (x << k) | (x >> (64 - k));
+    }
+
+    State s_{};
+};
+
+/**
+ * Fisher-Yates shuffle driven by Rng::below.
+ * Unlike std::shuffle the result does not depend on the standard library,
+ * so a given seed produces the same permutation on every platform.
+ */
+template <typename RandomIt>
+void shuffle(RandomIt first, RandomIt last, Rng& rng) {
+    const auto n = static_cast<std::size_t>(last - first);
+    for (std::size_t i = n; i > 1; --i) {
+        std::size_t j = rng.below(i);
+        using std::swap;
+        swap(first[static_cast<std::ptrdiff_t>(i - 1)], first[static_cast<std::ptrdiff_t>(j)]);
+    }
+}
+
+/**
+ * Seed 0 means "random": mix std::random_device with the clock so that
+ * calls made within the same second still get different streams.
+ */
+inline std::uint64_t resolve_seed(unsigned int seed) {
+    if (seed > 0) {
+        return seed;
+    }
+    std::random_device rd;
+    std::uint64_t entropy = (static_cast<std::uint64_t>(rd()) << 32) ^ rd();
+    entropy ^= static_cast<std::uint64_t>(
+        std::chrono::high_resolution_clock::now().time_since_epoch().count());
+    return entropy;
+}
+
+} // namespace jobshop
+
+#endif // JOBSHOP_RNG_HPP
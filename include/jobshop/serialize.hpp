@@ -0,0 +1,120 @@
+#ifndef JOBSHOP_SERIALIZE_HPP
+#define JOBSHOP_SERIALIZE_HPP
+
+#include "jobshop/solution.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include <vector>
+
+namespace jobshop {
+
+// ===== BINARY WRITER / READER =====
+
+/**
+ * Little-endian writer appending to a byte vector
+ */
+class ByteWriter {
+public:
+    explicit ByteWriter(std::vector<std::uint8_t>& out) : out_(out) {}
+
+    void u8(std::uint8_t v) { out_.push_back(v); }
+    void u32(std::uint32_t v) { put(v, 4); }
+    void u64(std::uint64_t v) { put(v, 8); }
+    void i32(int v) { u32(static_cast<std::uint32_t>(v)); }
+
+    void f64(double v) {
+        std::uint64_t bits;
+        std::memcpy(&bits, &v, sizeof(bits));
+        u64(bits);
+    }
+
+    /**
+     * Unsigned value stored on `width` bytes (1, 2, 4 or 8)
+     */
+    void put(std::uint64_t v, std::size_t width) {
+        for (std::size_t i = 0; i < width; ++i) {
+            out_.push_back(static_cast<std::uint8_t>(v >> (8 * i)));
+        }
+    }
+
+private:
+    std::vector<std::uint8_t>& out_;
+};
+
+/**
+ * Little-endian reader over a memory block (does not copy it)
+ */
+class ByteReader {
+public:
+    ByteReader(const std::uint8_t* data, std::size_t size) : data_(data), size_(size) {}
+    explicit ByteReader(const std::vector<std::uint8_t>& in) : ByteReader(in.data(), in.size()) {}
+
+    std::uint8_t u8() { return static_cast<std::uint8_t>(get(1)); }
+    std::uint32_t u32() { return static_cast<std::uint32_t>(get(4)); }
+    std::uint64_t u64() { return get(8); }
+    int i32() { return static_cast<int>(u32()); }
+
+    double f64() {
+        std::uint64_t bits = u64();
+        double v;
+        std::memcpy(&v, &bits, sizeof(v));
+        return v;
+    }
+
+    std::uint64_t get(std::size_t width) {
+        if (pos_ + width > size_) {
+            throw std::runtime_error("Buffer is truncated");
+        }
+        std::uint64_t v = 0;
+        for (std::size_t i = 0; i < width; ++i) {
+            v |= static_cast<std::uint64_t>(data_[pos_ + i]) << (8 * i);
+        }
+        pos_ += width;
+        return v;
+    }
+
+    bool at_end() const { return pos_ == size_; }
+    std::size_t remaining() const { return size_ - pos_; }
+
+    /**
+     * Guard against corrupt counts before allocating count * item_size bytes
+     */
+    std::size_t count(std::size_t item_size) {
+        std::size_t n = u32();
+        if (n > remaining() / item_size) {
+            throw std::runtime_error("Buffer is truncated");
+        }
+        return n;
+    }
+
+private:
+    const std::uint8_t* data_;
+    std::size_t size_;
+    std::size_t pos_ = 0;
+};
+
+// ===== INSTANCE / SOLUTION =====
+
+/**
+ * Serialize instance into one compact block.
+ *
+ * Layout: magic "JSPI", version, n_jobs, n_machines, operations per job,
+ * (machine_id, processing_time) per operation, transport matrix row-major.
+ * All values are 32-bit little-endian.
+ */
+std::vector<std::uint8_t> serialize_instance(const JobShopInstance& instance);
+std::size_t serialized_instance_size(const JobShopInstance& instance);
+JobShopInstance deserialize_instance(const std::uint8_t* data, std::size_t size);
+
+/**
+ * Serialize solution: magic "JSPS", version, operation sequence,
+ * start times, makespan.
+ */
+std::vector<std::uint8_t> serialize_solution(const Solution& solution);
+Solution deserialize_solution(const std::uint8_t* data, std::size_t size);
+
+} // namespace jobshop
+
+#endif // JOBSHOP_SERIALIZE_HPP
@@ -0,0 +1,84 @@
+#ifndef JOBSHOP_SERVER_HPP
+#define JOBSHOP_SERVER_HPP
+
+#include "jobshop/json.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace jobshop {
+
+/**
+ * Where the daemon listens: a Unix socket when socket_path is set,
+ * otherwise TCP on host:port (localhost only by default)
+ */
+struct Endpoint {
+    std::string socket_path;
+    std::string host = "127.0.0.1";
+    int port = 0;
+
+    std::string describe() const;
+};
+
+/**
+ * Default endpoint: <temp dir>/jobshop_optimizer.sock
+ */
+Endpoint default_endpoint();
+
+/**
+ * Daemon configuration
+ */
+struct ServerOptions {
+    Endpoint endpoint;
+    size_t threads = 0;              // solver workers (0 = hardware concurrency)
+    std::string cache_dir;           // ResultCache directory; empty = memory-only cache
+    std::uint64_t cache_limit = 64ull << 20;
+    bool log = true;                 // one line per request on stdout
+};
+
+/**
+ * Run the solver daemon until a "shutdown" request arrives.
+ *
+ * Protocol: one JSON object per line in both directions. Every request
+ * has "cmd"; responses carry "ok" and either the result or "error".
+ *
+ *   {"cmd":"load","path":"data/instances/large.txt","id":"large"}
+ *   {"cmd":"solve","id":"large","algorithm":"genetic","params":{"generations":500}}
+ *   {"cmd":"solve","path":"/abs/file.txt","algorithm":"greedy","schedule":false}
+ *   {"cmd":"solve","id":"small","algorithm":"exact","params":{"search":"ida"}}
+ *   {"cmd":"unload","id":"large"}   {"cmd":"list"}   {"cmd":"stats"}   {"cmd":"shutdown"}
+ *
+ * "params" keys the algorithm does not read are rejected.
+ *
+ * Loaded instances stay resident under their id (solve by "path" loads
+ * on first use and reloads when the file changes). Solves run on a pool
+ * of `threads` workers; a connection may send its next request only
+ * after the response to the previous one, concurrency comes from
+ * several connections.
+ */
+void run_server(const ServerOptions& options);
+
+/**
+ * Blocking client connection to a running daemon
+ */
+class ServerConnection {
+public:
+    explicit ServerConnection(const Endpoint& endpoint);
+    ~ServerConnection();
+
+    ServerConnection(const ServerConnection&) = delete;
+    ServerConnection& operator=(const ServerConnection&) = delete;
+
+    /**
+     * Send one request, wait for its response
+     */
+    Json request(const Json& request);
+
+private:
+    int fd_ = -1;
+    std::string buffer_;
+};
+
+} // namespace jobshop
+
+#endif // JOBSHOP_SERVER_HPP
@@ -2,19 +2,28 @@
 #define JOBSHOP_SOLUTION_HPP
 
 #include <vector>
+#include <memory>
 #include <utility>
 #include <cstddef>
-#include <unordered_map>
+#include <cstdint>
 #include <algorithm>
 #include <stdexcept>
 
 namespace jobshop {
 
+/**
+ * One operation of a route, as read from a file or given from Python.
+ * JobShopInstance keeps them in flat arrays (see set_jobs / instance_jobs).
+ *
+ * A flexible operation lists the machines it may run on in `alternatives`
+ * (machine, processing time); machine_id / processing_time are then its
+ * default, the fastest alternative.
+ */
 struct Operation {
-    std::size_t job_id; // TODO: do usuniecia
     std::size_t operation_id;
     std::size_t machine_id;
     int processing_time;
+    std::vector<std::pair<std::size_t, int>> alternatives;
 };
 
 struct Job {
@@ -22,21 +31,179 @@ struct Job {
     std::vector<Operation> operations;
 };
 
+struct InstanceStats;
+struct CacheKey;
+
+/**
+ * Instance as a structure of arrays.
+ *
+ * Operation k of job j has the global index job_offset[j] + k; jobs may
+ * have routes of different length. Its machine and processing time are
+ * op_machine / op_time at that index. Transport times are one row-major
+ * num_machines x num_machines matrix.
+ *
+ * Flexible instances also list, for every operation i, the machines it
+ * may run on: alt_machine / alt_time in [alt_offset[i], alt_offset[i + 1]).
+ * op_machine / op_time then hold the default (fastest) alternative, the
+ * one used by solutions without a machine assignment.
+ *
+ * Fill it with set_jobs and set_transport_times, which keep the arrays
+ * consistent.
+ */
 struct JobShopInstance {
-    std::vector<Job> jobs;
-    std::size_t num_machines;
-    std::vector<std::vector<int>> transport_times;
+    std::size_t num_machines = 0;
+    std::vector<std::uint32_t> job_offset{0};   // num_jobs + 1 entries
+    std::vector<std::uint16_t> op_machine;
+    std::vector<std::int32_t> op_time;
+    std::vector<std::int32_t> transport;        // [from * num_machines + to]
+
+    // Flexible routing; empty = every operation has exactly one machine
+    std::vector<std::uint32_t> alt_offset;      // num_operations + 1 entries
+    std::vector<std::uint16_t> alt_machine;
+    std::vector<std::int32_t> alt_time;
+
+    // Caches of instance_stats() and instance_key() (see instance_stats.hpp,
+    // result_cache.hpp), shared by copies; invalidate_stats drops both
+    mutable std::shared_ptr<const InstanceStats> stats_cache;
+    mutable std::shared_ptr<const CacheKey> key_cache;
+
+    std::size_t num_jobs() const { return job_offset.size() - 1; }
+    std::size_t num_operations() const { return op_machine.size(); }
+    std::size_t num_ops(std::size_t job) const { return job_offset[job + 1] - job_offset[job]; }
+    std::size_t op_index(std::size_t job, std::size_t op) const { return job_offset[job] + op; }
+    bool is_flexible() const { return !alt_offset.empty(); }
+    std::size_t num_alternatives(std::size_t index) const {
+        return is_flexible() ? alt_offset[index + 1] - alt_offset[index] : 1;
+    }
+
+    bool has_operation(std::size_t job, std::size_t op) const {
+        return job < num_jobs() && op < num_ops(job);
+    }
+    std::size_t machine(std::size_t job, std::size_t op) const { return op_machine[op_index(job, op)]; }
+    int processing_time(std::size_t job, std::size_t op) const { return op_time[op_index(job, op)]; }
+    int transport_time(std::size_t from, std::size_t to) const { return transport[from * num_machines + to]; }
+
+    /**
+     * Transport time before operation `op` of `job` (0 for the first one)
+     */
+    int transport_before(std::size_t job, std::size_t op) const {
+        if (op == 0) return 0;
+        const std::size_t i = op_index(job, op);
+        return transport_time(op_machine[i - 1], op_machine[i]);
+    }
 };
 
+/**
+ * Replace the routes; machine ids must fit std::uint16_t
+ */
+void set_jobs(JobShopInstance& instance, const std::vector<Job>& jobs);
+
+/**
+ * Routes as Job / Operation structs (copy, for Python and printing)
+ */
+std::vector<Job> instance_jobs(const JobShopInstance& instance);
+
+/**
+ * Replace the transport matrix; it must be square, num_machines becomes its size
+ */
+void set_transport_times(JobShopInstance& instance, const std::vector<std::vector<int>>& transport_times);
+
+/**
+ * Transport matrix as nested vectors (copy)
+ */
+std::vector<std::vector<int>> transport_matrix(const JobShopInstance& instance);
+
+/**
+ * Change the number of machines, keeping the overlapping part of the
+ * transport matrix (new entries are 0)
+ */
+void resize_machines(JobShopInstance& instance, std::size_t num_machines);
+
 struct Solution {
     std::vector<std::pair<size_t, size_t>> operation_sequence; // <job_id, operation_id>
     std::vector<int> start_times; // czasy startu operacji
     int makespan = 0;
+
+    // Flexible instances: chosen alternative of every operation, by
+    // op_index (not sequence position); empty = default machines
+    std::vector<std::uint16_t> machine_choice;
 };
 
-// Deklaracja funkcji obliczającej makespan
+/**
+ * Machine and processing time of every operation (by op_index) under one
+ * machine assignment. Points either into the instance or into a
+ * RoutingBuffer, so it is only valid while both are alive and unchanged.
+ */
+struct Routing {
+    const std::uint16_t* machine;
+    const std::int32_t* time;
+};
+
+/**
+ * Storage for resolved assignments, reused between calls so that
+ * evaluation does not allocate
+ */
+struct RoutingBuffer {
+    std::vector<std::uint16_t> machine;
+    std::vector<std::int32_t> time;
+};
+
+/**
+ * Resolve a machine assignment. Without one (or for a fixed instance)
+ * this is the instance's own arrays and costs nothing.
+ * Throws std::invalid_argument if the assignment does not fit the instance.
+ */
+Routing resolve_routing(const JobShopInstance& instance,
+                        const std::vector<std::uint16_t>& machine_choice,
+                        RoutingBuffer& buffer);
+
+/**
+ * Assignment that picks the default (fastest) alternative everywhere
+ */
+std::vector<std::uint16_t> default_machine_choice(const JobShopInstance& instance);
+
+// Makespan of a solution (allocates memory only on the first call in a thread)
 int calculate_makespan(const JobShopInstance& instance, Solution& solution);
 
+/**
+ * Semi-active makespan with early abort, for when only "is it below
+ * cutoff?" matters. Decoding stops (checked every 8 operations) once a
+ * finished operation plus the rest of its job, or a machine plus its
+ * unscheduled load, reaches cutoff. The solution is not modified (no
+ * start_times).
+ *
+ * @param decoded If not null, receives the number of operations decoded
+ * @return The makespan if it is below cutoff, otherwise a value >= cutoff
+ */
+int makespan_with_cutoff(const JobShopInstance& instance, const Solution& solution, int cutoff,
+                         std::size_t* decoded = nullptr);
+
+/**
+ * Decoded schedule as per-operation columns, in operation_sequence order
+ */
+struct ScheduleTable {
+    std::vector<std::int32_t> job;
+    std::vector<std::int32_t> op;
+    std::vector<std::int32_t> machine;
+    std::vector<std::int32_t> start;
+    std::vector<std::int32_t> duration;
+    std::vector<std::int32_t> end;
+    std::vector<std::int32_t> transport_in;  // transport from the previous machine of the job
+};
+
+/**
+ * Build the column view of a solution.
+ * Uses solution.start_times when they are filled in, otherwise decodes
+ * the sequence the same way as calculate_makespan.
+ */
+ScheduleTable schedule_table(const JobShopInstance& instance, const Solution& solution);
+
+/**
+ * Job after job, each in route order (the baseline shown after loading).
+ * Start times and makespan are computed.
+ */
+Solution sequential_solution(const JobShopInstance& instance);
+
 } // namespace jobshop
 
 #endif // JOBSHOP_SOLUTION_HPP
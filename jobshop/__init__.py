@@ -0,0 +1,11 @@
+"""Python package on top of the C++ ``bindings`` module.
+
+- :func:`solve` / :class:`SolverService` - asyncio API over a process or thread pool
+- :class:`SharedInstance` - instance serialized into shared memory for workers
+- :mod:`jobshop.tune` - GA parameter tuning (``python -m jobshop.tune``)
+"""
+from ._native import load_bindings
+from .service import ALGORITHMS, SolveResult, SolverService, solve
+from .shared import SharedInstance
+
+__all__ = ["ALGORITHMS", "SharedInstance", "SolveResult", "SolverService", "load_bindings", "solve"]
@@ -0,0 +1,22 @@
+"""Loading of the compiled C++ ``bindings`` module."""
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MODULE_DIR = ROOT_DIR / "build" / "python_module"
+
+
+def load_bindings():
+    """Import the pybind11 module built by CMake (build/python_module)."""
+    if sys.platform == "win32":
+        msys_bin = r"C:\msys64\ucrt64\bin"
+        if os.path.exists(msys_bin):
+            os.add_dll_directory(msys_bin)
+
+    module_dir = str(MODULE_DIR)
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+
+    import bindings
+    return bindings
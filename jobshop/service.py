@@ -0,0 +1,294 @@
+"""Asynchronous solver service (asyncio + process/thread pool).
+
+Usage::
+
+    from jobshop import SolverService
+
+    async with SolverService(executor="process", max_workers=4) as service:
+        result = await service.solve(instance, "genetic", generations=500)
+
+Concurrency is limited by ``max_concurrency`` (extra requests wait on a
+semaphore without blocking the event loop). Cancelling the awaiting task
+cancels a request that is still queued; a solve that already runs inside
+a worker cannot be interrupted, its result is discarded.
+
+With ``cache_dir`` every worker answers repeated requests from a
+``bindings.ResultCache`` in that directory (shared by all processes), and
+``warm_start=True`` seeds GA runs with cached solutions of the same
+instance whose parameters differ. Runs with ``seed=0`` (random) are never
+answered from the cache.
+"""
+import asyncio
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ._native import load_bindings
+from .shared import SharedInstance, attach_instance, start_tracker
+
+ALGORITHMS = ("genetic", "greedy", "exact", "portfolio")
+
+GENETIC_PARAMS = {
+    "population_size": 50,
+    "generations": 100,
+    "tournament_size": 3,
+    "mutation_prob": 0.2,
+    "seed": 0,
+    "crossover": "ox",
+    "mutation": "swap",
+    "decoder": "semi-active",
+    "decoder_delta": 0.5,
+}
+
+# Parameters given by name, converted to bindings enums
+_NAMED_PARAMS = {
+    "crossover": "parse_crossover",
+    "mutation": "parse_mutation",
+    "decoder": "parse_decoder",
+}
+
+# Shared-memory blocks kept by a service (least recently used are closed first)
+MAX_SHARED = 16
+
+PORTFOLIO_PARAMS = {
+    "time_limit": 10.0,
+    "threads": 0,
+    "genetic_members": 4,
+    "seed": 0,
+}
+
+
+@dataclass
+class SolveResult:
+    """Result of a single solve (picklable)."""
+
+    algorithm: str
+    makespan: int
+    elapsed: float
+    operation_sequence: list = field(default_factory=list)
+    start_times: list = field(default_factory=list)
+    machine_choice: list = field(default_factory=list)
+    cached: bool = False
+
+    def to_solution(self):
+        """Convert to a bindings.Solution (e.g. for the Gantt chart)."""
+        jb = load_bindings()
+        solution = jb.Solution()
+        solution.operation_sequence = self.operation_sequence
+        solution.start_times = self.start_times
+        solution.machine_choice = self.machine_choice
+        solution.makespan = self.makespan
+        return solution
+
+
+def _check_request(algorithm, params):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm}', expected one of {ALGORITHMS}")
+    allowed = {"genetic": GENETIC_PARAMS, "portfolio": PORTFOLIO_PARAMS}.get(algorithm, {})
+    unknown = set(params) - set(allowed)
+    if unknown:
+        raise TypeError(f"Unexpected parameters for '{algorithm}': {sorted(unknown)}")
+
+
+# (directory, disk_limit) -> bindings.ResultCache, one per worker process
+_caches = {}
+
+
+def open_cache(directory, disk_limit=64 << 20):
+    """ResultCache over directory, shared by every request of this process."""
+    key = (str(directory), disk_limit)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = load_bindings().ResultCache(key[0], disk_limit=disk_limit)
+    return cache
+
+
+def _genetic_params(jb, params):
+    ga = jb.GeneticParams()
+    for key, default in GENETIC_PARAMS.items():
+        value = params.get(key, default)
+        if key in _NAMED_PARAMS:
+            value = getattr(jb, _NAMED_PARAMS[key])(value)
+        setattr(ga, key, value)
+    return ga
+
+
+def _run_portfolio(jb, instance, params):
+    options = {**PORTFOLIO_PARAMS, **params}
+    base = jb.GeneticParams()
+    base.seed = options["seed"]
+    portfolio = jb.PortfolioParams()
+    portfolio.time_limit = options["time_limit"]
+    portfolio.threads = options["threads"]
+    portfolio.genetic = jb.default_genetic_members(options["genetic_members"], base)
+    return jb.run_portfolio(instance, portfolio).best
+
+
+def _run_solver(instance, algorithm, params, cache=None, warm_start=False):
+    """Run one algorithm on a JobShopInstance (executes inside the worker).
+
+    cache is ``(directory, disk_limit)`` of a ResultCache or None.
+    """
+    jb = load_bindings()
+    start = time.perf_counter()
+    hit = False
+
+    if cache is not None and algorithm == "portfolio":
+        # Not in solve_cached: the key is built from the full portfolio options
+        result_cache = open_cache(*cache)
+        instance_key = jb.instance_key(instance)
+        options = {**PORTFOLIO_PARAMS, **params}
+        request = jb.request_key(instance_key, algorithm, ";".join(f"{k}={options[k]!r}" for k in sorted(options)))
+        solution = result_cache.lookup(instance_key, request) if options["seed"] else None
+        hit = solution is not None
+        if not hit:
+            solution = _run_portfolio(jb, instance, params)
+            result_cache.store(instance_key, request, solution)
+    elif cache is not None:
+        ga = _genetic_params(jb, params) if algorithm == "genetic" else jb.GeneticParams()
+        solution, outcome = jb.solve_cached(open_cache(*cache), instance, algorithm, ga, warm_start)
+        hit = outcome.hit
+    elif algorithm == "genetic":
+        solution = jb.run_genetic(instance, _genetic_params(jb, params))
+    elif algorithm == "portfolio":
+        solution = _run_portfolio(jb, instance, params)
+    elif algorithm == "greedy":
+        solution = jb.greedy_schedule(instance)
+    else:
+        solution = jb.solve_exact(instance)
+
+    return SolveResult(
+        algorithm=algorithm,
+        makespan=solution.makespan,
+        elapsed=time.perf_counter() - start,
+        operation_sequence=list(solution.operation_sequence),
+        start_times=list(solution.start_times),
+        machine_choice=list(solution.machine_choice),
+        cached=hit,
+    )
+
+
+def _process_task(instance_ref, algorithm, params, cache, warm_start):
+    """Entry point in a worker (process or thread): attach the shared instance and solve."""
+    return _run_solver(attach_instance(*instance_ref), algorithm, params, cache, warm_start)
+
+
+class SolverService:
+    """Pool of solver workers with an asyncio front-end."""
+
+    def __init__(self, executor="process", max_workers=None, max_concurrency=None,
+                 cache_dir=None, cache_limit=64 << 20, warm_start=False):
+        if executor not in ("process", "thread"):
+            raise ValueError("executor must be 'process' or 'thread'")
+        self.executor_kind = executor
+        self.max_concurrency = max_concurrency
+        self.cache = (str(cache_dir), cache_limit) if cache_dir is not None else None
+        self.warm_start = warm_start
+        if executor == "process":
+            start_tracker()
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._semaphore = None
+        # instance_key (content hash) -> SharedInstance, least recently used first;
+        # a block is closed only when no submitted task still refers to it
+        self._shared = {}
+        self._in_flight = Counter()
+        self._lock = threading.Lock()
+
+    # --- SHARED INSTANCES ---
+
+    def share(self, instance):
+        """Place instance in shared memory once and reuse it for every request.
+
+        Blocks are keyed by the instance's content (``instance_key``), so an
+        instance edited between solves gets a fresh block instead of the
+        stale copy. The returned block stays open until MAX_SHARED newer
+        instances have been shared or the service is closed.
+        """
+        return self._share(load_bindings().instance_key(instance), instance, hold=False)
+
+    def _share(self, key, instance, hold):
+        with self._lock:
+            shared = self._shared.pop(key, None)
+            if shared is None:
+                shared = SharedInstance(instance)
+            self._shared[key] = shared
+            if hold:
+                self._in_flight[key] += 1
+            idle = [k for k in self._shared if k != key and not self._in_flight[k]]
+            for old in idle[:max(len(self._shared) - MAX_SHARED, 0)]:
+                self._shared.pop(old).close()
+        return shared
+
+    def _submit_shared(self, instance, *args):
+        """Submit _process_task with a shared block that stays open until the task ends."""
+        if isinstance(instance, SharedInstance):
+            return self._executor.submit(_process_task, instance.ref, *args)
+        key = load_bindings().instance_key(instance)
+        shared = self._share(key, instance, hold=True)
+        try:
+            future = self._executor.submit(_process_task, shared.ref, *args)
+        except BaseException:
+            self._task_done(key)
+            raise
+        future.add_done_callback(lambda _: self._task_done(key))
+        return future
+
+    def _task_done(self, key):
+        with self._lock:
+            self._in_flight[key] -= 1
+            if not self._in_flight[key]:
+                del self._in_flight[key]
+
+    # --- SOLVING ---
+
+    async def solve(self, instance, algorithm="genetic", **params):
+        """Solve instance without blocking the event loop."""
+        _check_request(algorithm, params)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency or 1_000_000)
+
+        async with self._semaphore:
+            if self.executor_kind == "process":
+                future = self._submit_shared(instance, algorithm, params, self.cache, self.warm_start)
+            elif isinstance(instance, SharedInstance):
+                # From share(): decode the block in the worker thread, once per block
+                future = self._executor.submit(_process_task, instance.ref, algorithm, params,
+                                               self.cache, self.warm_start)
+            else:
+                future = self._executor.submit(_run_solver, instance, algorithm, params,
+                                               self.cache, self.warm_start)
+
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+
+    def close(self, wait=True):
+        """Shut down the pool and release shared blocks."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            for shared in self._shared.values():
+                shared.close()
+            self._shared.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+_default_service = None
+
+
+async def solve(instance, algorithm="genetic", **params):
+    """Solve with a lazily created, module-wide process-pool service."""
+    global _default_service
+    if _default_service is None:
+        _default_service = SolverService()
+    return await _default_service.solve(instance, algorithm, **params)
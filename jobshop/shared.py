@@ -0,0 +1,83 @@
+"""Passing instances to worker processes through shared memory.
+
+The instance is serialized once (``JobShopInstance.write_buffer``) into a
+named shared-memory block. Workers decode it straight from the mapped
+block (``JobShopInstance.from_buffer``, no intermediate bytes copy) once
+per process, so a task only carries a short ``(name, size)`` reference.
+"""
+import os
+from multiprocessing import resource_tracker, shared_memory
+
+from ._native import load_bindings
+
+# Worker-side cache: shared block name -> decoded JobShopInstance
+MAX_ATTACHED = 32
+_attached = {}
+
+
+def encode_instance(instance):
+    """Serialize instance to bytes (compact C++ binary format)."""
+    return instance.to_buffer()
+
+
+def decode_instance(buffer):
+    """Rebuild a JobShopInstance from any bytes-like / shared-memory buffer."""
+    return load_bindings().JobShopInstance.from_buffer(buffer)
+
+
+def start_tracker():
+    """Start the shared-memory resource tracker before forking a worker pool.
+
+    Workers forked earlier would each start their own tracker when they
+    attach a block, and report it as leaked (and try to unlink it) on exit.
+    """
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+class SharedInstance:
+    """Instance placed in a named shared-memory block (owner side)."""
+
+    def __init__(self, instance):
+        self.size = instance.buffer_size()
+        self._shm = shared_memory.SharedMemory(create=True, size=self.size)
+        instance.write_buffer(self._shm.buf)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def ref(self):
+        """Picklable reference passed to workers."""
+        return (self._shm.name, self.size)
+
+    def close(self):
+        """Release the block (owner unlinks it)."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_instance(name, size):
+    """Worker side: decode the shared instance once per process."""
+    instance = _attached.get(name)
+    if instance is None:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            view = shm.buf[:size]
+            instance = decode_instance(view)
+            view.release()
+        finally:
+            shm.close()
+        if len(_attached) >= MAX_ATTACHED:
+            _attached.pop(next(iter(_attached)))
+        _attached[name] = instance
+    return instance
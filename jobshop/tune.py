@@ -0,0 +1,160 @@
+"""GA parameter tuning by successive halving.
+
+Samples GA configurations (population size, tournament size, mutation
+probability, crossover and mutation operator), runs every one on a set of
+instances in parallel and keeps the best ``1/eta`` of them for the next
+rung, which gets ``eta`` times the evaluation budget. Losing
+configurations are dropped after the cheap rungs. The winner is written
+to a profile file for the CLI (``-profile``) and the GUI::
+
+    python -m jobshop.tune data/instances/medium.txt data/instances/large.txt \\
+        -o profiles/default.profile --workers 4
+
+Budgets are counted in fitness evaluations (population x generations),
+so large and small populations are compared at equal cost.
+"""
+import argparse
+import asyncio
+import math
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+
+from ._native import load_bindings
+from .service import GENETIC_PARAMS, SolverService
+
+SEARCH_SPACE = {
+    "population_size": (20, 30, 50, 100),
+    "tournament_size": (2, 3, 5, 7),
+    "mutation_prob": (0.05, 0.1, 0.2, 0.3, 0.5),
+    "crossover": ("ox", "jox"),
+    "mutation": ("swap", "insert", "inversion"),
+}
+
+
+def sample_configs(count, seed=0):
+    """``count`` distinct configurations; the current defaults come first."""
+    rng = random.Random(seed)
+    baseline = {key: GENETIC_PARAMS[key] for key in SEARCH_SPACE}
+    configs = [baseline]
+    seen = {tuple(baseline.values())}
+    limit = math.prod(len(values) for values in SEARCH_SPACE.values())
+    while len(configs) < min(count, limit):
+        config = {key: rng.choice(values) for key, values in SEARCH_SPACE.items()}
+        if tuple(config.values()) not in seen:
+            seen.add(tuple(config.values()))
+            configs.append(config)
+    return configs
+
+
+def describe(config):
+    return (f"pop={config['population_size']} tour={config['tournament_size']} "
+            f"mut={config['mutation_prob']} {config['crossover']}+{config['mutation']}")
+
+
+async def successive_halving(service, instances, configs, budget, eta=3, seeds=2,
+                             decoder="semi-active", report=print):
+    """Race configs; returns ``[(config, score), ...]`` of the last rung, best first.
+
+    Score = mean relative excess of the makespan over the best makespan
+    any configuration reached on the same instance in the same rung
+    (0.0 = always the best). All configurations of a rung share the seeds.
+    """
+    alive = list(configs)
+    rung = 0
+    while True:
+        evaluations = budget * eta ** rung
+        run_seeds = [1 + rung * seeds + s for s in range(seeds)]
+        jobs = [(c, i, seed) for c in range(len(alive)) for i in range(len(instances)) for seed in run_seeds]
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            service.solve(
+                instances[i], "genetic",
+                **alive[c],
+                generations=max(1, evaluations // alive[c]["population_size"]),
+                seed=seed,
+                decoder=decoder,
+            )
+            for c, i, seed in jobs
+        ))
+
+        reference = [min(r.makespan for (_, i, _), r in zip(jobs, results) if i == inst)
+                     for inst in range(len(instances))]
+        scores = [0.0] * len(alive)
+        for (c, i, _), result in zip(jobs, results):
+            scores[c] += result.makespan / reference[i] - 1.0
+        runs_per_config = len(instances) * seeds
+        ranked = sorted(zip(alive, (s / runs_per_config for s in scores)), key=lambda item: item[1])
+
+        report(f"rung {rung}: {len(alive)} configs x {runs_per_config} runs, "
+               f"{evaluations} evaluations each, {time.perf_counter() - start:.1f}s; "
+               f"best {ranked[0][1]:.4f} ({describe(ranked[0][0])})")
+
+        keep = max(1, len(alive) // eta)
+        if keep == 1 or len(alive) == 1:
+            return ranked, evaluations
+        alive = [config for config, _ in ranked[:keep]]
+        rung += 1
+
+
+def write_profile(path, config, generations, decoder="semi-active", comment=""):
+    """Save a tuned configuration with bindings.save_genetic_profile."""
+    jb = load_bindings()
+    params = jb.GeneticParams()
+    params.population_size = config["population_size"]
+    params.tournament_size = config["tournament_size"]
+    params.mutation_prob = config["mutation_prob"]
+    params.crossover = jb.parse_crossover(config["crossover"])
+    params.mutation = jb.parse_mutation(config["mutation"])
+    params.decoder = jb.parse_decoder(decoder)
+    params.generations = generations
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    jb.save_genetic_profile(str(path), params, comment)
+    return path
+
+
+async def _tune(args):
+    jb = load_bindings()
+    instances = [jb.load_instance_from_file(path) for path in args.instances]
+    configs = sample_configs(args.configs, args.seed)
+
+    async with SolverService(executor="process", max_workers=args.workers) as service:
+        ranked, evaluations = await successive_halving(
+            service, instances, configs, args.budget, args.eta, args.seeds, args.decoder)
+
+    winner, score = ranked[0]
+    generations = max(1, evaluations // winner["population_size"])
+    comment = "\n".join([
+        f"Tuned {datetime.now():%Y-%m-%d %H:%M} by python -m jobshop.tune",
+        f"Instances: {', '.join(Path(p).name for p in args.instances)}",
+        f"{len(configs)} configurations, budget {args.budget} evaluations x eta {args.eta}, score {score:.4f}",
+    ])
+    path = write_profile(args.output, winner, generations, args.decoder, comment)
+    print(f"winner: {describe(winner)}, generations={generations}")
+    print(f"profile written to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune GA parameters with successive halving")
+    parser.add_argument("instances", nargs="+", help="instance files the configuration must do well on")
+    parser.add_argument("-o", "--output", default="profiles/default.profile")
+    parser.add_argument("--configs", type=int, default=27, help="configurations sampled for the first rung")
+    parser.add_argument("--budget", type=int, default=5000, help="fitness evaluations per run in the first rung")
+    parser.add_argument("--eta", type=int, default=3, help="keep 1/eta per rung, budget grows eta times")
+    parser.add_argument("--seeds", type=int, default=2, help="runs per configuration and instance")
+    parser.add_argument("--decoder", default="semi-active")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the configuration sampling")
+    args = parser.parse_args(argv)
+    if args.eta < 2:
+        parser.error("--eta must be at least 2")
+
+    asyncio.run(_tune(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+#include "jobshop/decoder.hpp"
+#include <algorithm>
+#include <limits>
+#include <numeric>
+#include <stdexcept>
+#include <vector>
+
+namespace jobshop {
+
+namespace {
+
+constexpr int OPEN_END = std::numeric_limits<int>::max();
+
+/**
+ * Idle intervals [start, end) of one machine, sorted and disjoint.
+ * The last one is open-ended, so a fitting gap always exists.
+ *
+ * Finding the first gap that ends after the release time is a binary
+ * search; from there only gaps too short for the operation are skipped.
+ */
+class MachineGaps {
+public:
+    explicit MachineGaps(int available_from = 0) : gaps_{{available_from, OPEN_END}} {}
+
+    /**
+     * Reserve the earliest slot of `duration` starting at or after `release`
+     */
+    int place(int release, int duration) {
+        auto it = std::upper_bound(gaps_.begin(), gaps_.end(), release,
+                                   [](int t, const Gap& gap) { return t < gap.end; });
+        for (;; ++it) {
+            int start = std::max(it->start, release);
+            if (it->end - start >= duration) {
+                reserve(it, start, start + duration);
+                return start;
+            }
+        }
+    }
+
+private:
+    struct Gap {
+        int start;
+        int end;
+    };
+
+    void reserve(std::vector<Gap>::iterator it, int start, int end) {
+        if (start == it->start) {
+            it->start = end;
+            if (it->start == it->end) gaps_.erase(it);
+        } else if (end == it->end) {
+            it->end = start;
+        } else {
+            Gap tail{end, it->end};
+            it->end = start;
+            gaps_.insert(it + 1, tail);
+        }
+    }
+
+    std::vector<Gap> gaps_;
+};
+
+/**
+ * Scheduling state shared by the decoders
+ */
+struct DecodeState {
+    const JobShopInstance& instance;
+    const Routing routing;  // machines and times under the solution's assignment
+    std::vector<int> machine_available;
+    std::vector<int> job_ready;
+    std::vector<size_t> next_op;
+
+    DecodeState(const JobShopInstance& inst, Routing assigned)
+        : instance(inst),
+          routing(assigned),
+          machine_available(inst.num_machines, 0),
+          job_ready(inst.num_jobs(), 0),
+          next_op(inst.num_jobs(), 0) {}
+
+    size_t machine(size_t job_id, size_t op_id) const { return routing.machine[instance.op_index(job_id, op_id)]; }
+    int duration(size_t job_id, size_t op_id) const { return routing.time[instance.op_index(job_id, op_id)]; }
+
+    /**
+     * Earliest start allowed by the job: previous finish + transport
+     */
+    int release(size_t job_id, size_t op_id) const {
+        int transport = 0;
+        if (op_id > 0) transport = instance.transport_time(machine(job_id, op_id - 1), machine(job_id, op_id));
+        return job_ready[job_id] + transport;
+    }
+
+    void commit(size_t job_id, size_t op_id, int start) {
+        const size_t index = instance.op_index(job_id, op_id);
+        int finish = start + routing.time[index];
+        job_ready[job_id] = finish;
+        machine_available[routing.machine[index]] =
+            std::max(machine_available[routing.machine[index]], finish);
+        ++next_op[job_id];
+    }
+};
+
+/**
+ * The decoders rely on the genome invariant: every operation exactly once,
+ * the k-th occurrence of a job is its operation k
+ */
+void check_sequence(const JobShopInstance& instance, const Solution& solution) {
+    std::vector<size_t> seen(instance.num_jobs(), 0);
+    const size_t total = instance.num_operations();
+
+    for (const auto& [job_id, op_id] : solution.operation_sequence) {
+        if (!instance.has_operation(job_id, op_id)) {
+            throw std::invalid_argument("Solution refers to an operation that is not in the instance");
+        }
+        if (op_id != seen[job_id]++) {
+            throw std::invalid_argument("Solution does not list the operations of a job in route order");
+        }
+    }
+    if (solution.operation_sequence.size() != total) {
+        throw std::invalid_argument("Solution does not contain every operation exactly once");
+    }
+}
+
+/**
+ * Sequence order, earliest fitting idle gap on the machine
+ */
+void decode_active(DecodeState& state, const Solution& solution, size_t frozen_prefix,
+                   std::vector<int>& starts) {
+    std::vector<MachineGaps> gaps;
+    gaps.reserve(state.instance.num_machines);
+    for (int available : state.machine_available) gaps.emplace_back(available);
+
+    for (size_t i = frozen_prefix; i < solution.operation_sequence.size(); ++i) {
+        auto [job_id, op_id] = solution.operation_sequence[i];
+        starts[i] = gaps[state.machine(job_id, op_id)].place(state.release(job_id, op_id),
+                                                             state.duration(job_id, op_id));
+        state.commit(job_id, op_id, starts[i]);
+    }
+}
+
+/**
+ * Giffler-Thompson with delay parameter delta (Bierwirth & Mattfeld).
+ * The machine of the earliest possible completion c* is scheduled next;
+ * candidates are its operations that can start before
+ * t* + delta * (c* - t*), the one earliest in the sequence wins.
+ * Returns the sequence positions in decoding order, start times by position.
+ */
+std::vector<size_t> decode_giffler_thompson(DecodeState& state, const Solution& solution,
+                                            size_t frozen_prefix, double delta,
+                                            std::vector<int>& starts) {
+    const JobShopInstance& instance = state.instance;
+    const size_t num_jobs = instance.num_jobs();
+    const auto& sequence = solution.operation_sequence;
+
+    // Position of every operation in the sequence = its priority
+    std::vector<size_t> position(instance.num_operations(), 0);
+    for (size_t i = 0; i < sequence.size(); ++i) {
+        position[instance.op_index(sequence[i].first, sequence[i].second)] = i;
+    }
+
+    // Head (next unscheduled operation) of every job; only the heads that
+    // depend on the machine just used are refreshed after each step
+    constexpr size_t DONE = std::numeric_limits<size_t>::max();
+    std::vector<size_t> head_machine(num_jobs, DONE);
+    std::vector<size_t> head_priority(num_jobs, 0);
+    std::vector<int> est(num_jobs, 0);
+    std::vector<int> completion(num_jobs, 0);
+    auto refresh = [&](size_t j) {
+        const size_t op_id = state.next_op[j];
+        if (op_id >= instance.num_ops(j)) {
+            head_machine[j] = DONE;
+            return;
+        }
+        const size_t index = instance.op_index(j, op_id);
+        head_machine[j] = state.routing.machine[index];
+        head_priority[j] = position[index];
+        est[j] = std::max(state.machine_available[head_machine[j]], state.release(j, op_id));
+        completion[j] = est[j] + state.routing.time[index];
+    };
+    for (size_t j = 0; j < num_jobs; ++j) refresh(j);
+
+    std::vector<size_t> on_machine;
+    on_machine.reserve(num_jobs);
+    std::vector<size_t> order;
+    order.reserve(sequence.size() - frozen_prefix);
+
+    for (size_t step = frozen_prefix; step < sequence.size(); ++step) {
+        // Earliest completion over all schedulable operations
+        int best_completion = OPEN_END;
+        size_t machine = 0;
+        for (size_t j = 0; j < num_jobs; ++j) {
+            if (head_machine[j] != DONE && completion[j] < best_completion) {
+                best_completion = completion[j];
+                machine = head_machine[j];
+            }
+        }
+
+        on_machine.clear();
+        int earliest_start = OPEN_END;
+        for (size_t j = 0; j < num_jobs; ++j) {
+            if (head_machine[j] == machine) {
+                on_machine.push_back(j);
+                earliest_start = std::min(earliest_start, est[j]);
+            }
+        }
+        const double limit = earliest_start + delta * (best_completion - earliest_start);
+
+        size_t chosen = DONE;
+        for (size_t j : on_machine) {
+            if (est[j] <= limit && (chosen == DONE || head_priority[j] < head_priority[chosen])) {
+                chosen = j;
+            }
+        }
+
+        starts[head_priority[chosen]] = est[chosen];
+        order.push_back(head_priority[chosen]);
+        state.commit(chosen, state.next_op[chosen], est[chosen]);
+        for (size_t j : on_machine) refresh(j);
+    }
+    return order;
+}
+
+} // namespace
+
+const char* decoder_name(DecoderKind kind) {
+    switch (kind) {
+        case DecoderKind::SemiActive: return "semi-active";
+        case DecoderKind::Active: return "active";
+        case DecoderKind::NonDelay: return "non-delay";
+        case DecoderKind::Hybrid: return "hybrid";
+    }
+    return "unknown";
+}
+
+DecoderKind parse_decoder(const std::string& name) {
+    for (DecoderKind kind : {DecoderKind::SemiActive, DecoderKind::Active,
+                             DecoderKind::NonDelay, DecoderKind::Hybrid}) {
+        if (name == decoder_name(kind)) return kind;
+    }
+    throw std::invalid_argument("Unknown decoder '" + name +
+                                "' (expected semi-active, active, non-delay or hybrid)");
+}
+
+int decode_schedule(const JobShopInstance& instance, Solution& solution,
+                    DecoderKind kind, double delta, std::size_t frozen_prefix) {
+    if (kind == DecoderKind::SemiActive) {
+        return calculate_makespan(instance, solution);
+    }
+    check_sequence(instance, solution);
+
+    auto& sequence = solution.operation_sequence;
+    const size_t n_ops = sequence.size();
+    frozen_prefix = std::min(frozen_prefix, n_ops);
+
+    // Frozen operations keep their semi-active times, nothing goes before them
+    RoutingBuffer routing_buffer;
+    DecodeState state(instance, resolve_routing(instance, solution.machine_choice, routing_buffer));
+    std::vector<int> starts(n_ops, 0);
+    for (size_t i = 0; i < frozen_prefix; ++i) {
+        auto [job_id, op_id] = sequence[i];
+        starts[i] = std::max(state.machine_available[state.machine(job_id, op_id)],
+                             state.release(job_id, op_id));
+        state.commit(job_id, op_id, starts[i]);
+    }
+
+    std::vector<size_t> order;
+    if (kind == DecoderKind::Active) {
+        decode_active(state, solution, frozen_prefix, starts);
+        order.resize(n_ops - frozen_prefix);
+        std::iota(order.begin(), order.end(), frozen_prefix);
+    } else {
+        double d = kind == DecoderKind::NonDelay ? 0.0 : std::clamp(delta, 0.0, 1.0);
+        order = decode_giffler_thompson(state, solution, frozen_prefix, d, starts);
+    }
+
+    // Write back in start-time order (decoding order breaks ties, so a job's
+    // operations stay in route order)
+    std::stable_sort(order.begin(), order.end(),
+                     [&starts](size_t a, size_t b) { return starts[a] < starts[b]; });
+
+    std::vector<std::pair<size_t, size_t>> rewritten(sequence.begin(), sequence.begin() + static_cast<std::ptrdiff_t>(frozen_prefix));
+    rewritten.reserve(n_ops);
+    solution.start_times.assign(starts.begin(), starts.begin() + static_cast<std::ptrdiff_t>(frozen_prefix));
+    solution.start_times.reserve(n_ops);
+    int makespan = 0;
+    for (size_t i = 0; i < frozen_prefix; ++i) {
+        makespan = std::max(makespan, starts[i] + state.duration(sequence[i].first, sequence[i].second));
+    }
+    for (size_t pos : order) {
+        rewritten.push_back(sequence[pos]);
+        solution.start_times.push_back(starts[pos]);
+        makespan = std::max(makespan, starts[pos] + state.duration(sequence[pos].first, sequence[pos].second));
+    }
+
+    sequence = std::move(rewritten);
+    solution.makespan = makespan;
+    return makespan;
+}
+
+} // namespace jobshop
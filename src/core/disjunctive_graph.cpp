@@ -0,0 +1,417 @@
+#include "jobshop/disjunctive_graph.hpp"
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+namespace jobshop {
+
+// ===== BUILD =====
+
+DisjunctiveGraph::DisjunctiveGraph(const JobShopInstance& instance, const Solution& solution) {
+    const size_t n = instance.num_operations();
+    if (solution.operation_sequence.size() != n) {
+        throw std::invalid_argument("Solution has " + std::to_string(solution.operation_sequence.size()) +
+                                    " operations, the instance " + std::to_string(n));
+    }
+    if (n >= NONE) throw std::invalid_argument("Instance has too many operations");
+
+    RoutingBuffer routing_buffer;
+    const Routing routing = resolve_routing(instance, solution.machine_choice, routing_buffer);
+    machine_choice_ = solution.machine_choice;
+    job_offset_ = instance.job_offset;
+    machine_.assign(routing.machine, routing.machine + n);
+    time_.assign(routing.time, routing.time + n);
+
+    // Technological arcs (fixed)
+    job_.resize(n);
+    transport_in_.resize(n);
+    job_prev_.resize(n);
+    job_next_.resize(n);
+    for (size_t j = 0; j < instance.num_jobs(); ++j) {
+        const std::uint32_t first = job_offset_[j];
+        const std::uint32_t end = job_offset_[j + 1];
+        for (std::uint32_t index = first; index < end; ++index) {
+            job_[index] = static_cast<std::uint32_t>(j);
+            job_prev_[index] = index > first ? index - 1 : NONE;
+            job_next_[index] = index + 1 < end ? index + 1 : NONE;
+            transport_in_[index] = index > first ? instance.transport_time(machine_[index - 1], machine_[index]) : 0;
+        }
+    }
+
+    // Machine order: by start times if present, otherwise by the sequence
+    std::vector<std::uint32_t> by_sequence(n);
+    std::vector<std::uint8_t> seen(n, 0);
+    for (size_t i = 0; i < n; ++i) {
+        const auto [job_id, op_id] = solution.operation_sequence[i];
+        if (!instance.has_operation(job_id, op_id)) {
+            throw std::invalid_argument("Solution refers to an operation that is not in the instance");
+        }
+        const size_t index = instance.op_index(job_id, op_id);
+        if (seen[index]) {
+            throw std::invalid_argument("Operation " + std::to_string(op_id) + " of job " +
+                                        std::to_string(job_id) + " appears twice in the solution");
+        }
+        seen[index] = 1;
+        by_sequence[i] = static_cast<std::uint32_t>(index);
+    }
+    if (solution.start_times.size() == n) {
+        std::vector<size_t> positions(n);
+        for (size_t i = 0; i < n; ++i) positions[i] = i;
+        std::stable_sort(positions.begin(), positions.end(), [&](size_t a, size_t b) {
+            return solution.start_times[a] < solution.start_times[b];
+        });
+        std::vector<std::uint32_t> by_start(n);
+        for (size_t i = 0; i < n; ++i) by_start[i] = by_sequence[positions[i]];
+        by_sequence = std::move(by_start);
+    }
+
+    machine_order_.assign(instance.num_machines, {});
+    for (const std::uint32_t index : by_sequence) machine_order_[machine_[index]].push_back(index);
+    machine_prev_.resize(n);
+    machine_next_.resize(n);
+    machine_pos_.resize(n);
+    for (const auto& sequence : machine_order_) {
+        for (size_t k = 0; k < sequence.size(); ++k) {
+            machine_prev_[sequence[k]] = k > 0 ? sequence[k - 1] : NONE;
+            machine_next_[sequence[k]] = k + 1 < sequence.size() ? sequence[k + 1] : NONE;
+            machine_pos_[sequence[k]] = static_cast<std::uint32_t>(k);
+        }
+    }
+
+    mark_.assign(n, 0);
+    build_order();
+    full_update();
+
+    // Ordering by heads (ties in Kahn order) is topological too, and machine
+    // neighbours lie close together in it, so swap() moves few nodes
+    std::stable_sort(order_.begin(), order_.end(),
+                     [this](std::uint32_t a, std::uint32_t b) { return head_[a] < head_[b]; });
+    for (size_t k = 0; k < n; ++k) order_pos_[order_[k]] = static_cast<std::uint32_t>(k);
+}
+
+void DisjunctiveGraph::build_order() {
+    // Kahn: every node has at most two predecessors
+    const size_t n = time_.size();
+    std::vector<std::uint8_t> indegree(n);
+    order_.clear();
+    order_.reserve(n);
+    for (std::uint32_t i = 0; i < n; ++i) {
+        indegree[i] = static_cast<std::uint8_t>((job_prev_[i] != NONE) + (machine_prev_[i] != NONE));
+        if (indegree[i] == 0) order_.push_back(i);
+    }
+    for (size_t k = 0; k < order_.size(); ++k) {
+        const std::uint32_t i = order_[k];
+        for (const std::uint32_t next : {job_next_[i], machine_next_[i]}) {
+            if (next != NONE && --indegree[next] == 0) order_.push_back(next);
+        }
+    }
+    if (order_.size() != n) {
+        throw std::invalid_argument("Machine order of the solution contradicts the job routes (cyclic graph)");
+    }
+    order_pos_.resize(n);
+    for (size_t k = 0; k < n; ++k) order_pos_[order_[k]] = static_cast<std::uint32_t>(k);
+}
+
+// ===== HEADS / TAILS =====
+
+int DisjunctiveGraph::head_from_preds(std::uint32_t i) const {
+    int head = 0;
+    const std::uint32_t jp = job_prev_[i];
+    const std::uint32_t mp = machine_prev_[i];
+    if (jp != NONE) head = head_[jp] + time_[jp] + transport_in_[i];
+    if (mp != NONE) head = std::max(head, head_[mp] + time_[mp]);
+    return head;
+}
+
+int DisjunctiveGraph::tail_from_succs(std::uint32_t i) const {
+    int tail = 0;
+    const std::uint32_t jn = job_next_[i];
+    const std::uint32_t mn = machine_next_[i];
+    if (jn != NONE) tail = transport_in_[jn] + time_[jn] + tail_[jn];
+    if (mn != NONE) tail = std::max(tail, time_[mn] + tail_[mn]);
+    return tail;
+}
+
+void DisjunctiveGraph::full_update() {
+    const size_t n = time_.size();
+    head_.assign(n, 0);
+    tail_.assign(n, 0);
+    for (const std::uint32_t i : order_) head_[i] = head_from_preds(i);
+    for (size_t k = n; k-- > 0;) tail_[order_[k]] = tail_from_succs(order_[k]);
+    update_makespan();
+}
+
+void DisjunctiveGraph::update_makespan() {
+    // The sink of the graph is always the last operation of its job
+    makespan_ = 0;
+    for (size_t j = 0; j + 1 < job_offset_.size(); ++j) {
+        if (job_offset_[j + 1] == job_offset_[j]) continue;
+        const std::uint32_t last = job_offset_[j + 1] - 1;
+        makespan_ = std::max(makespan_, head_[last] + time_[last]);
+    }
+}
+
+// ===== CRITICAL PATH =====
+
+std::vector<std::uint32_t> DisjunctiveGraph::critical_path() const {
+    std::vector<std::uint32_t> path;
+    std::uint32_t current = NONE;
+    for (size_t j = 0; j + 1 < job_offset_.size() && current == NONE; ++j) {
+        if (job_offset_[j + 1] == job_offset_[j]) continue;
+        const std::uint32_t last = job_offset_[j + 1] - 1;
+        if (head_[last] + time_[last] == makespan_) current = last;
+    }
+    // Walk back along tight arcs
+    while (current != NONE) {
+        path.push_back(current);
+        const std::uint32_t mp = machine_prev_[current];
+        const std::uint32_t jp = job_prev_[current];
+        if (mp != NONE && head_[mp] + time_[mp] == head_[current]) {
+            current = mp;
+        } else if (jp != NONE && head_[jp] + time_[jp] + transport_in_[current] == head_[current]) {
+            current = jp;
+        } else {
+            current = NONE;
+        }
+    }
+    std::reverse(path.begin(), path.end());
+    return path;
+}
+
+std::vector<CriticalBlock> DisjunctiveGraph::critical_blocks() const {
+    std::vector<CriticalBlock> blocks;
+    const std::vector<std::uint32_t> path = critical_path();
+    for (size_t k = 0; k < path.size(); ++k) {
+        const std::uint32_t i = path[k];
+        const bool machine_arc = k > 0 && machine_prev_[i] == path[k - 1] &&
+                                 head_[path[k - 1]] + time_[path[k - 1]] == head_[i];
+        if (!machine_arc) blocks.push_back({machine_[i], {}});
+        blocks.back().operations.push_back(i);
+    }
+    return blocks;
+}
+
+std::vector<std::pair<std::uint32_t, std::uint32_t>> DisjunctiveGraph::critical_moves() const {
+    std::vector<std::pair<std::uint32_t, std::uint32_t>> moves;
+    const std::vector<CriticalBlock> blocks = critical_blocks();
+    for (size_t b = 0; b < blocks.size(); ++b) {
+        const auto& ops = blocks[b].operations;
+        if (ops.size() < 2) continue;
+        const std::pair<std::uint32_t, std::uint32_t> front{ops[0], ops[1]};
+        const std::pair<std::uint32_t, std::uint32_t> back{ops[ops.size() - 2], ops.back()};
+        if (b > 0) moves.push_back(front);
+        if (b + 1 < blocks.size() && (b == 0 || back != front)) moves.push_back(back);
+    }
+    return moves;
+}
+
+// ===== MOVES =====
+
+void DisjunctiveGraph::check_adjacent(std::uint32_t u, std::uint32_t v) const {
+    if (u >= time_.size() || v >= time_.size() || machine_next_[u] != v) {
+        throw std::invalid_argument("Operations " + std::to_string(u) + " and " + std::to_string(v) +
+                                    " are not adjacent on a machine");
+    }
+}
+
+int DisjunctiveGraph::swap_estimate(std::uint32_t u, std::uint32_t v) const {
+    check_adjacent(u, v);
+    const std::uint32_t a = machine_prev_[u];
+    const std::uint32_t b = machine_next_[v];
+    const std::uint32_t ju = job_prev_[u], jv = job_prev_[v];
+    const std::uint32_t nu = job_next_[u], nv = job_next_[v];
+
+    // After the swap: a -> v -> u -> b
+    int head_v = a != NONE ? head_[a] + time_[a] : 0;
+    if (jv != NONE) head_v = std::max(head_v, head_[jv] + time_[jv] + transport_in_[v]);
+    int head_u = head_v + time_[v];
+    if (ju != NONE) head_u = std::max(head_u, head_[ju] + time_[ju] + transport_in_[u]);
+
+    int tail_u = b != NONE ? time_[b] + tail_[b] : 0;
+    if (nu != NONE) tail_u = std::max(tail_u, transport_in_[nu] + time_[nu] + tail_[nu]);
+    int tail_v = time_[u] + tail_u;
+    if (nv != NONE) tail_v = std::max(tail_v, transport_in_[nv] + time_[nv] + tail_[nv]);
+
+    return std::max(head_v + time_[v] + tail_v, head_u + time_[u] + tail_u);
+}
+
+void DisjunctiveGraph::relink(std::uint32_t u, std::uint32_t v) {
+    // a -> u -> v -> b  becomes  a -> v -> u -> b
+    const std::uint32_t a = machine_prev_[u];
+    const std::uint32_t b = machine_next_[v];
+    machine_prev_[v] = a;
+    if (a != NONE) machine_next_[a] = v;
+    machine_next_[v] = u;
+    machine_prev_[u] = v;
+    machine_next_[u] = b;
+    if (b != NONE) machine_prev_[b] = u;
+
+    auto& sequence = machine_order_[machine_[u]];
+    std::swap(sequence[machine_pos_[u]], sequence[machine_pos_[v]]);
+    std::swap(machine_pos_[u], machine_pos_[v]);
+}
+
+bool DisjunctiveGraph::swap(std::uint32_t u, std::uint32_t v) {
+    check_adjacent(u, v);
+    const std::uint32_t a = machine_prev_[u];
+    const std::uint32_t b = machine_next_[v];
+    const std::uint32_t lower = order_pos_[u];
+    const std::uint32_t upper = order_pos_[v];
+    relink(u, v);
+
+    // Pearce-Kelly for the new arc v -> u: only nodes reachable from u
+    // (forward_) and leading to v (backward_) within [lower, upper] move
+    forward_.clear();
+    stack_.assign(1, u);
+    mark_[u] = 1;
+    bool cycle = false;
+    while (!stack_.empty() && !cycle) {
+        const std::uint32_t i = stack_.back();
+        stack_.pop_back();
+        forward_.push_back(i);
+        for (const std::uint32_t next : {job_next_[i], machine_next_[i]}) {
+            if (next == NONE || mark_[next] || order_pos_[next] > upper) continue;
+            if (next == v) {
+                cycle = true;
+                break;
+            }
+            mark_[next] = 1;
+            stack_.push_back(next);
+        }
+    }
+    if (cycle) {
+        for (const std::uint32_t i : forward_) mark_[i] = 0;
+        for (const std::uint32_t i : stack_) mark_[i] = 0;
+        relink(v, u);
+        return false;
+    }
+
+    backward_.clear();
+    stack_.assign(1, v);
+    mark_[v] = 1;
+    while (!stack_.empty()) {
+        const std::uint32_t i = stack_.back();
+        stack_.pop_back();
+        backward_.push_back(i);
+        for (const std::uint32_t prev : {job_prev_[i], machine_prev_[i]}) {
+            if (prev == NONE || mark_[prev] || order_pos_[prev] < lower) continue;
+            mark_[prev] = 1;
+            stack_.push_back(prev);
+        }
+    }
+
+    // The freed positions take backward_ first, then forward_ (each in its old order)
+    auto by_position = [this](std::uint32_t x, std::uint32_t y) { return order_pos_[x] < order_pos_[y]; };
+    std::sort(forward_.begin(), forward_.end(), by_position);
+    std::sort(backward_.begin(), backward_.end(), by_position);
+    slots_.clear();
+    for (const std::uint32_t i : backward_) slots_.push_back(order_pos_[i]);
+    for (const std::uint32_t i : forward_) slots_.push_back(order_pos_[i]);
+    std::sort(slots_.begin(), slots_.end());
+    size_t slot = 0;
+    for (const auto* group : {&backward_, &forward_}) {
+        for (const std::uint32_t i : *group) {
+            order_[slots_[slot]] = i;
+            order_pos_[i] = slots_[slot++];
+            mark_[i] = 0;
+        }
+    }
+
+    // Heads: v, u and b have new predecessors; continue only where a head changed
+    size_t pending = 0;
+    auto touch = [this, &pending](std::uint32_t i) {
+        if (i != NONE && !mark_[i]) {
+            mark_[i] = 1;
+            ++pending;
+        }
+    };
+    touch(v);
+    touch(u);
+    touch(b);
+    for (size_t k = lower; pending > 0; ++k) {
+        const std::uint32_t i = order_[k];
+        if (!mark_[i]) continue;
+        mark_[i] = 0;
+        --pending;
+        const int head = head_from_preds(i);
+        if (head != head_[i]) {
+            head_[i] = head;
+            touch(job_next_[i]);
+            touch(machine_next_[i]);
+        }
+    }
+
+    // Tails: a, v and u have new successors
+    touch(a);
+    touch(v);
+    touch(u);
+    for (size_t k = upper + 1; pending > 0 && k-- > 0;) {
+        const std::uint32_t i = order_[k];
+        if (!mark_[i]) continue;
+        mark_[i] = 0;
+        --pending;
+        const int tail = tail_from_succs(i);
+        if (tail != tail_[i]) {
+            tail_[i] = tail;
+            touch(job_prev_[i]);
+            touch(machine_prev_[i]);
+        }
+    }
+
+    update_makespan();
+    return true;
+}
+
+Solution DisjunctiveGraph::to_solution() const {
+    Solution solution;
+    solution.operation_sequence.reserve(order_.size());
+    solution.start_times.reserve(order_.size());
+    for (const std::uint32_t i : order_) {
+        solution.operation_sequence.emplace_back(job_[i], i - job_offset_[job_[i]]);
+        solution.start_times.push_back(head_[i]);
+    }
+    solution.makespan = makespan_;
+    solution.machine_choice = machine_choice_;
+    return solution;
+}
+
+// ===== REPORT =====
+
+BottleneckReport bottleneck_report(const DisjunctiveGraph& graph) {
+    BottleneckReport report;
+    const size_t n = graph.num_operations();
+    report.makespan = graph.makespan();
+    report.machine_load.assign(graph.num_machines(), 0);
+    report.machine_critical.assign(graph.num_machines(), 0);
+    report.machine_path.assign(graph.num_machines(), 0);
+
+    long long total_slack = 0;
+    for (size_t i = 0; i < n; ++i) {
+        report.machine_load[graph.machine(i)] += graph.time(i);
+        const int slack = graph.slack(i);
+        total_slack += slack;
+        if (slack == 0) {
+            ++report.critical_operations;
+            report.machine_critical[graph.machine(i)] += graph.time(i);
+        }
+    }
+    report.mean_slack = n > 0 ? static_cast<double>(total_slack) / static_cast<double>(n) : 0.0;
+
+    const std::vector<CriticalBlock> blocks = graph.critical_blocks();
+    report.blocks = blocks.size();
+    for (size_t b = 0; b < blocks.size(); ++b) {
+        for (const std::uint32_t i : blocks[b].operations) {
+            ++report.path_operations;
+            report.path_processing += graph.time(i);
+            report.machine_path[graph.machine(i)] += graph.time(i);
+        }
+        // Blocks are joined by technological arcs (with transport)
+        if (b > 0) report.path_transport += graph.transport_in(blocks[b].operations.front());
+    }
+    for (size_t m = 1; m < report.machine_path.size(); ++m) {
+        if (report.machine_path[m] > report.machine_path[report.bottleneck_machine]) report.bottleneck_machine = m;
+    }
+    return report;
+}
+
+} // namespace jobshop
@@ -0,0 +1,150 @@
+#include "jobshop/decoder.hpp"
+#include <algorithm>
+#include <array>
+#include <cstdint>
+#include <vector>
+
+namespace jobshop {
+
+namespace {
+
+constexpr size_t LANES = EVAL_LANES;
+
+/**
+ * What the semi-active step needs about one operation under one machine
+ * assignment, in one load
+ */
+struct OpRecord {
+    std::uint32_t machine;
+    std::int32_t time;
+    std::int32_t transport_in;  // from the job's previous machine, 0 for its first operation
+};
+
+/**
+ * Per-thread buffers of the batch evaluator. The scheduling state is
+ * lane-interleaved: entry x * LANES + lane belongs to machine (or job) x
+ * of that lane, so the lanes never touch each other's entries.
+ */
+struct BatchBuffers {
+    RoutingBuffer routing;
+    std::vector<OpRecord> default_records;               // default machines, shared by the lanes
+    std::array<std::vector<OpRecord>, LANES> records;    // lanes with their own machine assignment
+    std::vector<std::int32_t> machine_ready;             // machine * LANES + lane
+    std::vector<std::int32_t> job_ready;                 // job * LANES + lane
+};
+
+void fill_records(const JobShopInstance& instance, const Routing& routing, std::vector<OpRecord>& records) {
+    records.resize(instance.num_operations());
+    for (size_t j = 0; j < instance.num_jobs(); ++j) {
+        const size_t first = instance.job_offset[j];
+        for (size_t index = first; index < instance.job_offset[j + 1]; ++index) {
+            const size_t machine = routing.machine[index];
+            records[index].machine = static_cast<std::uint32_t>(machine);
+            records[index].time = routing.time[index];
+            records[index].transport_in =
+                index > first ? instance.transport_time(routing.machine[index - 1], machine) : 0;
+        }
+    }
+}
+
+/**
+ * Semi-active decode of up to LANES solutions with equal sequence length
+ * (buf.default_records already filled). Unused lanes repeat the last
+ * solution and are not written back.
+ */
+void evaluate_batch(const JobShopInstance& instance, Solution* const* solutions, size_t count,
+                    BatchBuffers& buf) {
+    const size_t n_ops = solutions[0]->operation_sequence.size();
+    const std::uint32_t* job_offset = instance.job_offset.data();
+
+    const std::pair<size_t, size_t>* sequence[LANES];
+    const OpRecord* records[LANES];
+    std::int32_t* start[LANES];
+    for (size_t lane = 0; lane < count; ++lane) {
+        Solution& solution = *solutions[lane];
+        sequence[lane] = solution.operation_sequence.data();
+        solution.start_times.resize(n_ops);
+        start[lane] = solution.start_times.data();
+
+        const Routing routing = resolve_routing(instance, solution.machine_choice, buf.routing);
+        if (routing.machine == instance.op_machine.data()) {
+            records[lane] = buf.default_records.data();
+        } else {
+            fill_records(instance, routing, buf.records[lane]);
+            records[lane] = buf.records[lane].data();
+        }
+    }
+    for (size_t lane = count; lane < LANES; ++lane) {
+        sequence[lane] = sequence[count - 1];
+        records[lane] = records[count - 1];
+        start[lane] = start[count - 1];
+    }
+
+    buf.machine_ready.assign(instance.num_machines * LANES, 0);
+    buf.job_ready.assign(instance.num_jobs() * LANES, 0);
+    std::int32_t* const machine_ready = buf.machine_ready.data();
+    std::int32_t* const job_ready = buf.job_ready.data();
+
+    // One step = operation i of every lane. The lanes are independent
+    // dependency chains, so their loads and max/add overlap
+    std::int32_t makespan[LANES] = {};
+    for (size_t i = 0; i < n_ops; ++i) {
+        for (size_t l = 0; l < LANES; ++l) {
+            const auto [job_id, op_id] = sequence[l][i];
+            const OpRecord& op = records[l][job_offset[job_id] + op_id];
+
+            std::int32_t& machine_free = machine_ready[op.machine * LANES + l];
+            std::int32_t& job_free = job_ready[job_id * LANES + l];
+            const std::int32_t begin = std::max(machine_free, job_free + op.transport_in);
+            const std::int32_t finish = begin + op.time;
+            machine_free = finish;
+            job_free = finish;
+            start[l][i] = begin;
+            makespan[l] = std::max(makespan[l], finish);
+        }
+    }
+
+    for (size_t lane = 0; lane < count; ++lane) solutions[lane]->makespan = makespan[lane];
+}
+
+} // namespace
+
+void evaluate_population(const JobShopInstance& instance, std::vector<Solution>& population,
+                         DecoderKind kind, double delta, std::size_t frozen_prefix, bool batched) {
+    if (kind != DecoderKind::SemiActive) {
+        for (Solution& solution : population) decode_schedule(instance, solution, kind, delta, frozen_prefix);
+        return;
+    }
+    if (!batched) {
+        for (Solution& solution : population) calculate_makespan(instance, solution);
+        return;
+    }
+
+    // Reusable buffers (one set per thread)
+    thread_local BatchBuffers buffers;
+    const size_t n_ops = instance.num_operations();
+
+    fill_records(instance, {instance.op_machine.data(), instance.op_time.data()}, buffers.default_records);
+
+    std::array<Solution*, LANES> lanes{};
+    size_t count = 0;
+    for (Solution& solution : population) {
+        // Incomplete sequences (e.g. from Python) are evaluated one by one
+        if (n_ops == 0 || solution.operation_sequence.size() != n_ops) {
+            calculate_makespan(instance, solution);
+            continue;
+        }
+        lanes[count++] = &solution;
+        if (count == LANES) {
+            evaluate_batch(instance, lanes.data(), count, buffers);
+            count = 0;
+        }
+    }
+    if (count == 1) {
+        calculate_makespan(instance, *lanes[0]);
+    } else if (count > 1) {
+        evaluate_batch(instance, lanes.data(), count, buffers);
+    }
+}
+
+} // namespace jobshop
@@ -0,0 +1,134 @@
+#include "jobshop/instance_stats.hpp"
+#include <algorithm>
+#include <limits>
+
+namespace jobshop {
+
+InstanceStats analyze_instance(const JobShopInstance& instance) {
+    InstanceStats stats;
+    stats.num_jobs = instance.num_jobs();
+    stats.num_machines = instance.num_machines;
+    stats.num_operations = instance.num_operations();
+    stats.machine_load.assign(instance.num_machines, 0);
+    stats.op_tail.assign(instance.num_operations(), 0);
+
+    constexpr long long NONE = std::numeric_limits<long long>::max();
+    std::vector<long long> min_head(instance.num_machines, NONE);
+    std::vector<long long> min_tail(instance.num_machines, NONE);
+    std::vector<long long> fixed_load(instance.num_machines, 0);
+
+    // Shortest time and transport over all alternatives
+    // (for an instance without alternatives: just op_time / transport)
+    auto min_time = [&](size_t i) -> long long {
+        if (!instance.is_flexible()) return instance.op_time[i];
+        return *std::min_element(instance.alt_time.begin() + instance.alt_offset[i],
+                                 instance.alt_time.begin() + instance.alt_offset[i + 1]);
+    };
+    auto min_transport = [&](size_t from, size_t to) -> long long {
+        if (!instance.is_flexible()) return instance.transport_time(instance.op_machine[from], instance.op_machine[to]);
+        long long best = NONE;
+        for (size_t a = instance.alt_offset[from]; a < instance.alt_offset[from + 1]; ++a) {
+            for (size_t b = instance.alt_offset[to]; b < instance.alt_offset[to + 1]; ++b) {
+                best = std::min<long long>(best, instance.transport_time(instance.alt_machine[a], instance.alt_machine[b]));
+            }
+        }
+        return best;
+    };
+
+    long long job_bound = 0;
+    long long total_min_work = 0;
+    for (size_t j = 0; j < instance.num_jobs(); ++j) {
+        const size_t first = instance.job_offset[j];
+        const size_t last = instance.job_offset[j + 1];
+
+        // Length of the job's route (processing + transport)
+        long long route = 0;
+        for (size_t i = first; i < last; ++i) {
+            if (i > first) {
+                route += min_transport(i - 1, i);
+                stats.total_transport += instance.transport_time(instance.op_machine[i - 1], instance.op_machine[i]);
+            }
+            route += min_time(i);
+            total_min_work += min_time(i);
+            stats.total_processing += instance.op_time[i];
+            stats.machine_load[instance.op_machine[i]] += instance.op_time[i];
+            if (instance.num_alternatives(i) > 1) ++stats.flexible_operations;
+        }
+        // Remaining work of the job after each operation (default machines)
+        for (size_t i = last; i-- > first + 1;) {
+            stats.op_tail[i - 1] = stats.op_tail[i] + instance.op_time[i] +
+                                   instance.transport_time(instance.op_machine[i - 1], instance.op_machine[i]);
+        }
+        if (route > job_bound) {
+            job_bound = route;
+            stats.critical_job = j;
+        }
+
+        // Head and tail of each operation: work before and after it in its job
+        long long head = 0;
+        for (size_t i = first; i < last; ++i) {
+            if (i > first) head += min_transport(i - 1, i);
+            const long long time = min_time(i);
+            if (instance.num_alternatives(i) == 1) {
+                const size_t m = instance.op_machine[i];
+                const long long tail = route - head - time;
+                min_head[m] = std::min(min_head[m], head);
+                min_tail[m] = std::min(min_tail[m], tail);
+                fixed_load[m] += time;
+            }
+            head += time;
+        }
+    }
+
+    long long machine_bound = 0;
+    long long max_load = 0;
+    for (size_t m = 0; m < instance.num_machines; ++m) {
+        max_load = std::max(max_load, stats.machine_load[m]);
+        if (min_head[m] == NONE) continue;  // machine without (fixed) operations
+        long long bound = min_head[m] + fixed_load[m] + min_tail[m];
+        if (bound > machine_bound) {
+            machine_bound = bound;
+            stats.bottleneck_machine = m;
+        }
+    }
+    if (instance.num_machines > 0) {
+        const long long machines = static_cast<long long>(instance.num_machines);
+        machine_bound = std::max(machine_bound, (total_min_work + machines - 1) / machines);
+    }
+
+    stats.job_lower_bound = static_cast<int>(job_bound);
+    stats.machine_lower_bound = static_cast<int>(machine_bound);
+    stats.lower_bound = std::max(stats.job_lower_bound, stats.machine_lower_bound);
+
+    if (instance.num_machines > 0 && stats.total_processing > 0) {
+        const double mean_load = static_cast<double>(stats.total_processing) / static_cast<double>(instance.num_machines);
+        stats.load_imbalance = static_cast<double>(max_load) / mean_load;
+        stats.transport_ratio = static_cast<double>(stats.total_transport) / static_cast<double>(stats.total_processing);
+    }
+    return stats;
+}
+
+const InstanceStats& instance_stats(const JobShopInstance& instance) {
+    std::shared_ptr<const InstanceStats> cached = std::atomic_load(&instance.stats_cache);
+    if (cached) return *cached;
+
+    // Concurrent calls may compute the same stats twice; the first stored
+    // result wins, so the returned reference lives as long as the cache
+    auto computed = std::make_shared<const InstanceStats>(analyze_instance(instance));
+    if (std::atomic_compare_exchange_strong(&instance.stats_cache, &cached, computed)) {
+        return *computed;
+    }
+    return *cached;
+}
+
+void invalidate_stats(JobShopInstance& instance) {
+    std::atomic_store(&instance.stats_cache, std::shared_ptr<const InstanceStats>());
+    std::atomic_store(&instance.key_cache, std::shared_ptr<const CacheKey>());
+}
+
+double optimality_gap(int makespan, int lower_bound) {
+    if (lower_bound <= 0) return 0.0;
+    return static_cast<double>(makespan - lower_bound) / static_cast<double>(lower_bound);
+}
+
+} // namespace jobshop
@@ -0,0 +1,190 @@
+#include "jobshop/serialize.hpp"
+#include <string>
+
+namespace jobshop {
+
+namespace {
+
+constexpr char INSTANCE_MAGIC[4] = {'J', 'S', 'P', 'I'};
+constexpr char SOLUTION_MAGIC[4] = {'J', 'S', 'P', 'S'};
+constexpr std::uint32_t FORMAT_VERSION = 2;  // 2: machine alternatives and assignments
+
+void write_header(ByteWriter& w, const char (&magic)[4]) {
+    for (char c : magic) w.u8(static_cast<std::uint8_t>(c));
+    w.u32(FORMAT_VERSION);
+}
+
+std::uint32_t read_header(ByteReader& r, const char (&magic)[4], const char* what) {
+    for (char c : magic) {
+        if (r.u8() != static_cast<std::uint8_t>(c)) {
+            throw std::runtime_error(std::string("Buffer does not contain a serialized ") + what);
+        }
+    }
+    std::uint32_t version = r.u32();
+    if (version < 1 || version > FORMAT_VERSION) {
+        throw std::runtime_error("Unsupported " + std::string(what) + " format version " +
+                                 std::to_string(version));
+    }
+    return version;
+}
+
+} // namespace
+
+// ===== INSTANCE =====
+
+std::size_t serialized_instance_size(const JobShopInstance& instance) {
+    // header (magic, version, n_jobs, n_machines) + counts + operations + transport
+    // + alternatives (total, per-operation counts, machine/time pairs)
+    const std::size_t alternatives = instance.is_flexible()
+        ? instance.num_operations() + 2 * instance.alt_machine.size() : 0;
+    return 16 + 4 * (instance.num_jobs() + 2 * instance.num_operations() +
+                     instance.num_machines * instance.num_machines + 1 + alternatives);
+}
+
+std::vector<std::uint8_t> serialize_instance(const JobShopInstance& instance) {
+    const std::size_t num_machines = instance.num_machines;
+
+    std::vector<std::uint8_t> buffer;
+    buffer.reserve(serialized_instance_size(instance));
+    ByteWriter w(buffer);
+
+    write_header(w, INSTANCE_MAGIC);
+    w.u32(static_cast<std::uint32_t>(instance.num_jobs()));
+    w.u32(static_cast<std::uint32_t>(num_machines));
+    for (std::size_t j = 0; j < instance.num_jobs(); ++j) {
+        w.u32(static_cast<std::uint32_t>(instance.num_ops(j)));
+    }
+    for (std::size_t i = 0; i < instance.num_operations(); ++i) {
+        w.u32(instance.op_machine[i]);
+        w.i32(instance.op_time[i]);
+    }
+    for (std::size_t i = 0; i < num_machines * num_machines; ++i) {
+        w.i32(instance.transport[i]);
+    }
+    w.u32(static_cast<std::uint32_t>(instance.alt_machine.size()));
+    if (instance.is_flexible()) {
+        for (std::size_t i = 0; i < instance.num_operations(); ++i) {
+            w.u32(static_cast<std::uint32_t>(instance.num_alternatives(i)));
+        }
+        for (std::size_t a = 0; a < instance.alt_machine.size(); ++a) {
+            w.u32(instance.alt_machine[a]);
+            w.i32(instance.alt_time[a]);
+        }
+    }
+    return buffer;
+}
+
+JobShopInstance deserialize_instance(const std::uint8_t* data, std::size_t size) {
+    ByteReader r(data, size);
+    const std::uint32_t version = read_header(r, INSTANCE_MAGIC, "instance");
+
+    JobShopInstance instance;
+    const std::size_t num_jobs = r.count(4);
+    instance.num_machines = r.u32();
+    if (instance.num_machines > 0 && instance.num_machines > r.remaining() / (4 * instance.num_machines)) {
+        throw std::runtime_error("Buffer is truncated");
+    }
+
+    instance.job_offset.assign(num_jobs + 1, 0);
+    std::size_t num_ops = 0;
+    for (std::size_t j = 0; j < num_jobs; ++j) {
+        num_ops += r.count(8);
+        if (num_ops > r.remaining() / 8) {
+            throw std::runtime_error("Buffer is truncated");
+        }
+        instance.job_offset[j + 1] = static_cast<std::uint32_t>(num_ops);
+    }
+    instance.op_machine.resize(num_ops);
+    instance.op_time.resize(num_ops);
+    for (std::size_t i = 0; i < num_ops; ++i) {
+        const std::uint32_t machine = r.u32();
+        if (machine >= instance.num_machines) {
+            throw std::runtime_error("Serialized instance has an invalid machine ID");
+        }
+        instance.op_machine[i] = static_cast<std::uint16_t>(machine);
+        instance.op_time[i] = r.i32();
+    }
+    instance.transport.resize(instance.num_machines * instance.num_machines);
+    for (auto& t : instance.transport) t = r.i32();
+
+    const std::size_t num_alternatives = version >= 2 ? r.u32() : 0;
+    if (num_alternatives > 0) {
+        if (num_ops > r.remaining() / 4 || num_alternatives > (r.remaining() - 4 * num_ops) / 8) {
+            throw std::runtime_error("Buffer is truncated");
+        }
+        instance.alt_offset.assign(num_ops + 1, 0);
+        for (std::size_t i = 0; i < num_ops; ++i) {
+            const std::uint32_t count = r.u32();
+            if (count == 0 || count > num_alternatives - instance.alt_offset[i]) {
+                throw std::runtime_error("Serialized instance has invalid machine alternatives");
+            }
+            instance.alt_offset[i + 1] = instance.alt_offset[i] + count;
+        }
+        if (instance.alt_offset.back() != num_alternatives) {
+            throw std::runtime_error("Serialized instance has invalid machine alternatives");
+        }
+        instance.alt_machine.resize(num_alternatives);
+        instance.alt_time.resize(num_alternatives);
+        for (std::size_t a = 0; a < num_alternatives; ++a) {
+            const std::uint32_t machine = r.u32();
+            if (machine >= instance.num_machines) {
+                throw std::runtime_error("Serialized instance has an invalid machine ID");
+            }
+            instance.alt_machine[a] = static_cast<std::uint16_t>(machine);
+            instance.alt_time[a] = r.i32();
+        }
+    }
+
+    if (!r.at_end()) {
+        throw std::runtime_error("Serialized instance has trailing data");
+    }
+    return instance;
+}
+
+// ===== SOLUTION =====
+
+std::vector<std::uint8_t> serialize_solution(const Solution& solution) {
+    const std::size_t n = solution.operation_sequence.size();
+    std::vector<std::uint8_t> buffer;
+    buffer.reserve(24 + 8 * n + 4 * solution.start_times.size() + 2 * solution.machine_choice.size());
+    ByteWriter w(buffer);
+
+    write_header(w, SOLUTION_MAGIC);
+    w.u32(static_cast<std::uint32_t>(n));
+    for (const auto& [job_id, op_id] : solution.operation_sequence) {
+        w.u32(static_cast<std::uint32_t>(job_id));
+        w.u32(static_cast<std::uint32_t>(op_id));
+    }
+    w.u32(static_cast<std::uint32_t>(solution.start_times.size()));
+    for (int t : solution.start_times) w.i32(t);
+    w.i32(solution.makespan);
+    w.u32(static_cast<std::uint32_t>(solution.machine_choice.size()));
+    for (std::uint16_t choice : solution.machine_choice) w.put(choice, 2);
+    return buffer;
+}
+
+Solution deserialize_solution(const std::uint8_t* data, std::size_t size) {
+    ByteReader r(data, size);
+    const std::uint32_t version = read_header(r, SOLUTION_MAGIC, "solution");
+
+    Solution solution;
+    solution.operation_sequence.resize(r.count(8));
+    for (auto& [job_id, op_id] : solution.operation_sequence) {
+        job_id = r.u32();
+        op_id = r.u32();
+    }
+    solution.start_times.resize(r.count(4));
+    for (auto& t : solution.start_times) t = r.i32();
+    solution.makespan = r.i32();
+    if (version >= 2) {
+        solution.machine_choice.resize(r.count(2));
+        for (auto& choice : solution.machine_choice) choice = static_cast<std::uint16_t>(r.get(2));
+    }
+
+    if (!r.at_end()) {
+        throw std::runtime_error("Serialized solution has trailing data");
+    }
+    return solution;
+}
+
+} // namespace jobshop
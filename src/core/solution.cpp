@@ -1,68 +1,375 @@
 #include "jobshop/solution.hpp"
+#include "jobshop/instance_stats.hpp"
+#include <algorithm>
+#include <limits>
+#include <string>
 
 namespace jobshop {
 
-// Funkcja pomocnicza do obliczenia makespanu
-int calculate_makespan(const JobShopInstance& instance, Solution& solution) {
-    size_t n_ops = solution.operation_sequence.size();
-    solution.start_times.assign(n_ops, 0);
+// ===== INSTANCE ARRAYS =====
+
+namespace {
+
+std::uint16_t checked_machine(size_t machine_id) {
+    if (machine_id > std::numeric_limits<std::uint16_t>::max()) {
+        throw std::invalid_argument("Machine id " + std::to_string(machine_id) + " is too large");
+    }
+    return static_cast<std::uint16_t>(machine_id);
+}
+
+} // namespace
+
+void set_jobs(JobShopInstance& instance, const std::vector<Job>& jobs) {
+    std::vector<std::uint32_t> job_offset{0};
+    std::vector<std::uint16_t> op_machine;
+    std::vector<std::int32_t> op_time;
+    job_offset.reserve(jobs.size() + 1);
+
+    bool flexible = false;
+    for (const auto& job : jobs) {
+        for (const auto& op : job.operations) flexible = flexible || !op.alternatives.empty();
+    }
+    std::vector<std::uint32_t> alt_offset;
+    std::vector<std::uint16_t> alt_machine;
+    std::vector<std::int32_t> alt_time;
+    if (flexible) alt_offset.push_back(0);
+
+    for (const auto& job : jobs) {
+        for (const auto& op : job.operations) {
+            if (!flexible) {
+                op_machine.push_back(checked_machine(op.machine_id));
+                op_time.push_back(op.processing_time);
+                continue;
+            }
+
+            // An operation without alternatives = one alternative
+            std::vector<std::pair<size_t, int>> alternatives = op.alternatives;
+            if (alternatives.empty()) alternatives.emplace_back(op.machine_id, op.processing_time);
+            size_t fastest = 0;
+            for (size_t a = 0; a < alternatives.size(); ++a) {
+                alt_machine.push_back(checked_machine(alternatives[a].first));
+                alt_time.push_back(alternatives[a].second);
+                if (alternatives[a].second < alternatives[fastest].second) fastest = a;
+            }
+            if (alternatives.size() > std::numeric_limits<std::uint16_t>::max() ||
+                alt_machine.size() > std::numeric_limits<std::uint32_t>::max()) {
+                throw std::invalid_argument("Instance has too many machine alternatives");
+            }
+            alt_offset.push_back(static_cast<std::uint32_t>(alt_machine.size()));
+            op_machine.push_back(checked_machine(alternatives[fastest].first));
+            op_time.push_back(alternatives[fastest].second);
+        }
+        if (op_machine.size() > std::numeric_limits<std::uint32_t>::max()) {
+            throw std::invalid_argument("Instance has too many operations");
+        }
+        job_offset.push_back(static_cast<std::uint32_t>(op_machine.size()));
+    }
+
+    instance.job_offset = std::move(job_offset);
+    instance.op_machine = std::move(op_machine);
+    instance.op_time = std::move(op_time);
+    instance.alt_offset = std::move(alt_offset);
+    instance.alt_machine = std::move(alt_machine);
+    instance.alt_time = std::move(alt_time);
+}
+
+std::vector<Job> instance_jobs(const JobShopInstance& instance) {
+    std::vector<Job> jobs(instance.num_jobs());
+    for (size_t j = 0; j < jobs.size(); ++j) {
+        jobs[j].job_id = j;
+        jobs[j].operations.reserve(instance.num_ops(j));
+        for (size_t k = 0; k < instance.num_ops(j); ++k) {
+            Operation op{k, instance.machine(j, k), instance.processing_time(j, k), {}};
+            if (instance.is_flexible()) {
+                const size_t i = instance.op_index(j, k);
+                for (size_t a = instance.alt_offset[i]; a < instance.alt_offset[i + 1]; ++a) {
+                    op.alternatives.emplace_back(instance.alt_machine[a], instance.alt_time[a]);
+                }
+            }
+            jobs[j].operations.push_back(std::move(op));
+        }
+    }
+    return jobs;
+}
+
+void set_transport_times(JobShopInstance& instance, const std::vector<std::vector<int>>& transport_times) {
+    const size_t n = transport_times.size();
+    std::vector<std::int32_t> transport;
+    transport.reserve(n * n);
+    for (size_t i = 0; i < n; ++i) {
+        if (transport_times[i].size() != n) {
+            throw std::invalid_argument("Transport matrix row " + std::to_string(i) + " has incorrect size");
+        }
+        transport.insert(transport.end(), transport_times[i].begin(), transport_times[i].end());
+    }
+    instance.num_machines = n;
+    instance.transport = std::move(transport);
+}
+
+std::vector<std::vector<int>> transport_matrix(const JobShopInstance& instance) {
+    const size_t n = instance.num_machines;
+    std::vector<std::vector<int>> matrix(n);
+    for (size_t i = 0; i < n && (i + 1) * n <= instance.transport.size(); ++i) {
+        matrix[i].assign(instance.transport.begin() + static_cast<std::ptrdiff_t>(i * n),
+                         instance.transport.begin() + static_cast<std::ptrdiff_t>((i + 1) * n));
+    }
+    return matrix;
+}
+
+void resize_machines(JobShopInstance& instance, size_t num_machines) {
+    const size_t old_n = instance.num_machines;
+    std::vector<std::int32_t> transport(num_machines * num_machines, 0);
+    for (size_t i = 0; i < std::min(old_n, num_machines); ++i) {
+        for (size_t k = 0; k < std::min(old_n, num_machines); ++k) {
+            if (i * old_n + k < instance.transport.size()) {
+                transport[i * num_machines + k] = instance.transport[i * old_n + k];
+            }
+        }
+    }
+    instance.num_machines = num_machines;
+    instance.transport = std::move(transport);
+}
+
+// ===== EVALUATION =====
 
-    // TODO: do usuniecia
-    // Mapowanie operacji na indeks w solution.operation_sequence
-    std::unordered_map<size_t, std::unordered_map<size_t, size_t>> op_index_map;
+Routing resolve_routing(const JobShopInstance& instance,
+                        const std::vector<std::uint16_t>& machine_choice,
+                        RoutingBuffer& buffer) {
+    if (!instance.is_flexible()) {
+        for (std::uint16_t choice : machine_choice) {
+            if (choice != 0) throw std::invalid_argument("Machine assignment refers to an alternative that does not exist");
+        }
+        return {instance.op_machine.data(), instance.op_time.data()};
+    }
+    if (machine_choice.empty()) {
+        return {instance.op_machine.data(), instance.op_time.data()};
+    }
+
+    const size_t n_ops = instance.num_operations();
+    if (machine_choice.size() != n_ops) {
+        throw std::invalid_argument("Machine assignment does not cover every operation");
+    }
+    buffer.machine.resize(n_ops);
+    buffer.time.resize(n_ops);
     for (size_t i = 0; i < n_ops; ++i) {
-        size_t job_id = solution.operation_sequence[i].first;
-        size_t op_id = solution.operation_sequence[i].second;
-        op_index_map[job_id][op_id] = i;
+        const size_t a = instance.alt_offset[i] + machine_choice[i];
+        if (a >= instance.alt_offset[i + 1]) {
+            throw std::invalid_argument("Machine assignment refers to an alternative that does not exist");
+        }
+        buffer.machine[i] = instance.alt_machine[a];
+        buffer.time[i] = instance.alt_time[a];
     }
+    return {buffer.machine.data(), buffer.time.data()};
+}
+
+std::vector<std::uint16_t> default_machine_choice(const JobShopInstance& instance) {
+    if (!instance.is_flexible()) return {};
+    std::vector<std::uint16_t> choice(instance.num_operations(), 0);
+    for (size_t i = 0; i < choice.size(); ++i) {
+        for (size_t a = instance.alt_offset[i]; a < instance.alt_offset[i + 1]; ++a) {
+            if (instance.alt_machine[a] == instance.op_machine[i] && instance.alt_time[a] == instance.op_time[i]) {
+                choice[i] = static_cast<std::uint16_t>(a - instance.alt_offset[i]);
+                break;
+            }
+        }
+    }
+    return choice;
+}
+
+// ===== EVALUATION =====
+
+// Helper computing the makespan
+int calculate_makespan(const JobShopInstance& instance, Solution& solution) {
+    // Reusable buffers (one set per thread)
+    thread_local RoutingBuffer routing_buffer;
+    thread_local std::vector<int> machine_available;
+    thread_local std::vector<int> job_last_finish;
+
+    const Routing routing = resolve_routing(instance, solution.machine_choice, routing_buffer);
+    const size_t n_ops = solution.operation_sequence.size();
+    solution.start_times.resize(n_ops);
 
     // Śledzenie czasu zakończenia na maszynach
-    std::vector<int> machine_available(instance.num_machines, 0);
+    machine_available.assign(instance.num_machines, 0);
     // Śledzenie czasu zakończenia ostatniej operacji w zadaniu
-    std::vector<int> job_last_finish(instance.jobs.size(), 0);
-    // TODO: do usuniecia
-    // Śledzenie maszyny poprzedniej operacji w zadaniu
-    std::vector<size_t> job_last_machine(instance.jobs.size(), 0);
+    job_last_finish.assign(instance.num_jobs(), 0);
 
+    int max_finish = 0;
     for (size_t i = 0; i < n_ops; ++i) {
-        size_t job_id = solution.operation_sequence[i].first;
-        size_t op_id = solution.operation_sequence[i].second;
-        const Operation& op = instance.jobs[job_id].operations[op_id];
+        const auto [job_id, op_id] = solution.operation_sequence[i];
+        const size_t index = instance.op_index(job_id, op_id);
+        const size_t machine = routing.machine[index];
 
         // Czas transportu z poprzedniej maszyny w zadaniu
         int transport_time = 0;
         if (op_id > 0) {
-            size_t prev_machine = instance.jobs[job_id].operations[op_id - 1].machine_id;
-            size_t curr_machine = op.machine_id;
-            transport_time = instance.transport_times[prev_machine][curr_machine];
+            transport_time = instance.transport[routing.machine[index - 1] * instance.num_machines + machine];
         }
 
         // Najwcześniejszy start operacji
-        int earliest_start = std::max(machine_available[op.machine_id], job_last_finish[job_id] + transport_time);
+        int earliest_start = std::max(machine_available[machine], job_last_finish[job_id] + transport_time);
 
         solution.start_times[i] = earliest_start;
-        int finish_time = earliest_start + op.processing_time;
+        int finish_time = earliest_start + routing.time[index];
 
         // Aktualizuj dostępność maszyny i ostatni czas zakończenia zadania
-        machine_available[op.machine_id] = finish_time;
+        machine_available[machine] = finish_time;
         job_last_finish[job_id] = finish_time;
-        job_last_machine[job_id] = op.machine_id;
+        max_finish = std::max(max_finish, finish_time);
     }
 
     // Makespan to maksymalny czas zakończenia
-    int max_finish = 0;
-    for (size_t i = 0; i < n_ops; ++i) {
-        size_t job_id = solution.operation_sequence[i].first;
-        size_t op_id = solution.operation_sequence[i].second;
-        const Operation& op = instance.jobs[job_id].operations[op_id];
-        int finish_time = solution.start_times[i] + op.processing_time;
-        if (finish_time > max_finish) {
-            max_finish = finish_time;
+    solution.makespan = max_finish;
+    return max_finish;
+}
+
+int makespan_with_cutoff(const JobShopInstance& instance, const Solution& solution, int cutoff,
+                         std::size_t* decoded) {
+    const InstanceStats& stats = instance_stats(instance);
+    if (decoded) *decoded = 0;
+    if (stats.lower_bound >= cutoff) return stats.lower_bound;
+
+    // Machine: end of its last operation and its unscheduled load
+    struct MachineState {
+        int available;
+        int remaining;
+    };
+    thread_local RoutingBuffer routing_buffer;
+    thread_local std::vector<MachineState> machines;
+    thread_local std::vector<int> job_last_finish;
+    thread_local std::vector<int> routed_tail;
+
+    const Routing routing = resolve_routing(instance, solution.machine_choice, routing_buffer);
+    machines.assign(instance.num_machines, MachineState{0, 0});
+    job_last_finish.assign(instance.num_jobs(), 0);
+
+    // Bounds for the default machines come from the instance statistics,
+    // any other machine assignment computes its own
+    const int* tail = stats.op_tail.data();
+    if (routing.machine == instance.op_machine.data()) {
+        for (size_t m = 0; m < instance.num_machines; ++m) {
+            machines[m].remaining = static_cast<int>(stats.machine_load[m]);
+        }
+    } else {
+        routed_tail.assign(instance.num_operations(), 0);
+        for (size_t j = 0; j < instance.num_jobs(); ++j) {
+            const size_t first = instance.job_offset[j];
+            for (size_t i = instance.job_offset[j + 1]; i-- > first;) {
+                machines[routing.machine[i]].remaining += routing.time[i];
+                if (i > first) {
+                    routed_tail[i - 1] = routed_tail[i] + routing.time[i] +
+                                         instance.transport_time(routing.machine[i - 1], routing.machine[i]);
+                }
+            }
         }
+        tail = routed_tail.data();
     }
 
-    solution.makespan = max_finish;
-    return max_finish;
+    MachineState* const machine_state = machines.data();
+    int* const job_ready = job_last_finish.data();
+    const size_t n_ops = solution.operation_sequence.size();
+    // Both bounds only grow by waiting: the rest of the job when the job
+    // waited for the machine, the rest of the machine's load when the
+    // machine idled for the job. Tracked with a select and a running
+    // maximum, compared with cutoff once per block, so the loop stays
+    // almost as lean as calculate_makespan
+    constexpr size_t CHECK_EVERY = 8;
+    int worst = 0;
+    for (size_t block = 0; block < n_ops; block += CHECK_EVERY) {
+        const size_t end = std::min(n_ops, block + CHECK_EVERY);
+        for (size_t i = block; i < end; ++i) {
+            const auto [job_id, op_id] = solution.operation_sequence[i];
+            const size_t index = instance.op_index(job_id, op_id);
+            const size_t machine = routing.machine[index];
+            const int time = routing.time[index];
+
+            int transport_time = 0;
+            if (op_id > 0) {
+                transport_time = instance.transport[routing.machine[index - 1] * instance.num_machines + machine];
+            }
+            MachineState& state = machine_state[machine];
+            const int release = job_ready[job_id] + transport_time;
+            const bool job_waited = state.available > release;
+            const int finish_time = std::max(state.available, release) + time;
+            state.available = finish_time;
+            state.remaining -= time;
+            job_ready[job_id] = finish_time;
+
+            const int job_rest = tail[index];
+            const int machine_rest = state.remaining;
+            worst = std::max(worst, finish_time + (job_waited ? job_rest : machine_rest));
+        }
+        if (worst >= cutoff) {
+            if (decoded) *decoded = end;
+            return worst;
+        }
+    }
+
+    // Everything below the cutoff is scheduled: makespan = end of the last machine
+    if (decoded) *decoded = n_ops;
+    int makespan = 0;
+    for (const MachineState& state : machines) makespan = std::max(makespan, state.available);
+    return makespan;
+}
+
+ScheduleTable schedule_table(const JobShopInstance& instance, const Solution& solution) {
+    const size_t n_ops = solution.operation_sequence.size();
+    for (const auto& [job_id, op_id] : solution.operation_sequence) {
+        if (!instance.has_operation(job_id, op_id)) {
+            throw std::invalid_argument("Solution refers to an operation that is not in the instance");
+        }
+    }
+
+    RoutingBuffer routing_buffer;
+    const Routing routing = resolve_routing(instance, solution.machine_choice, routing_buffer);
+
+    // No start times -> decode a copy
+    const std::vector<int>* start_times = &solution.start_times;
+    Solution decoded;
+    if (solution.start_times.size() != n_ops) {
+        decoded.operation_sequence = solution.operation_sequence;
+        decoded.machine_choice = solution.machine_choice;
+        calculate_makespan(instance, decoded);
+        start_times = &decoded.start_times;
+    }
+
+    ScheduleTable table;
+    table.job.resize(n_ops);
+    table.op.resize(n_ops);
+    table.machine.resize(n_ops);
+    table.start.resize(n_ops);
+    table.duration.resize(n_ops);
+    table.end.resize(n_ops);
+    table.transport_in.resize(n_ops);
+
+    for (size_t i = 0; i < n_ops; ++i) {
+        const auto [job_id, op_id] = solution.operation_sequence[i];
+        const size_t index = instance.op_index(job_id, op_id);
+
+        table.job[i] = static_cast<std::int32_t>(job_id);
+        table.op[i] = static_cast<std::int32_t>(op_id);
+        table.machine[i] = routing.machine[index];
+        table.start[i] = (*start_times)[i];
+        table.duration[i] = routing.time[index];
+        table.end[i] = (*start_times)[i] + routing.time[index];
+        table.transport_in[i] = op_id > 0
+            ? instance.transport_time(routing.machine[index - 1], routing.machine[index])
+            : 0;
+    }
+    return table;
+}
+
+Solution sequential_solution(const JobShopInstance& instance) {
+    Solution solution;
+    solution.operation_sequence.reserve(instance.num_operations());
+
+    for (size_t j = 0; j < instance.num_jobs(); ++j) {
+        for (size_t op = 0; op < instance.num_ops(j); ++op) {
+            solution.operation_sequence.emplace_back(j, op);
+        }
+    }
+    calculate_makespan(instance, solution);
+    return solution;
 }
 
 } // namespace jobshop
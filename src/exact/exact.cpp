@@ -1,13 +1,16 @@
 #include "jobshop/exact.hpp"
 #include "jobshop/solution.hpp"
+#include "jobshop/instance_stats.hpp"
 
-#include <queue>
-#include <unordered_map>
+#include <cstdint>
+#include <cstring>
+#include <type_traits>
 #include <string>
 #include <vector>
 #include <limits>
 #include <algorithm>
 #include <cmath>
+#include <stdexcept>
 
 namespace jobshop {
 
@@ -15,39 +18,131 @@ namespace {
 
 using size_t = std::size_t;
 
-// ===== STATE SERIALIZATION =====
+// ===== STATE HASHING =====
+
+std::uint64_t mix64(std::uint64_t z) {
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
 
 /**
- * Tworzy unikalny klucz stanu.
- * Optymalizacja: Rezerwacja pamięci dla stringa, aby uniknąć częstych alokacji.
+ * Klucze Zobrista stanu (job_next, machine_avail, job_last_finish).
+ *
+ * The key is the XOR of one 64-bit value per component, so scheduling an
+ * operation updates it with three XOR pairs (job position, machine time,
+ * job time) instead of rebuilding it from the whole state. Job positions
+ * have a classic random table; times are unbounded, their values mix a
+ * per-component salt with the time.
  */
-static std::string make_state_key(const std::vector<size_t>& job_next,
-                                  const std::vector<int>& machine_avail,
-                                  const std::vector<int>& job_last_finish) {
-    // Szacujemy rozmiar: liczba elementów * średnio 3 znaki na liczbę + separatory
-    size_t reserve_size = (job_next.size() + machine_avail.size() + job_last_finish.size()) * 4 + 10;
-    std::string s;
-    s.reserve(reserve_size);
-    
-    for (size_t i = 0; i < job_next.size(); ++i) {
-        if (i) s.push_back(',');
-        s += std::to_string(job_next[i]);
+class ZobristKeys {
+public:
+    explicit ZobristKeys(const JobShopInstance& instance) {
+        std::uint64_t seed = 0x6A09E667F3BCC909ULL;
+        auto next = [&seed] { return mix64(seed += 0x9E3779B97F4A7C15ULL); };
+        op_offset_.reserve(instance.num_jobs());
+        for (size_t j = 0; j < instance.num_jobs(); ++j) {
+            op_offset_.push_back(op_keys_.size());
+            for (size_t k = 0; k <= instance.num_ops(j); ++k) op_keys_.push_back(next());
+            job_salt_.push_back(next());
+        }
+        for (size_t m = 0; m < instance.num_machines; ++m) machine_salt_.push_back(next());
     }
-    s.push_back('|');
-    
-    for (size_t i = 0; i < machine_avail.size(); ++i) {
-        if (i) s.push_back(',');
-        s += std::to_string(machine_avail[i]);
+
+    // The job has k scheduled operations
+    std::uint64_t position(size_t job, size_t k) const { return op_keys_[op_offset_[job] + k]; }
+    std::uint64_t machine_time(size_t machine, int t) const { return time_key(machine_salt_[machine], t); }
+    std::uint64_t job_time(size_t job, int t) const { return time_key(job_salt_[job], t); }
+
+    std::uint64_t root() const {
+        std::uint64_t key = 0;
+        for (size_t j = 0; j < job_salt_.size(); ++j) key ^= position(j, 0) ^ job_time(j, 0);
+        for (size_t m = 0; m < machine_salt_.size(); ++m) key ^= machine_time(m, 0);
+        return key;
     }
-    s.push_back('|');
-    
-    for (size_t i = 0; i < job_last_finish.size(); ++i) {
-        if (i) s.push_back(',');
-        s += std::to_string(job_last_finish[i]);
+
+private:
+    static std::uint64_t time_key(std::uint64_t salt, int t) {
+        return mix64(salt + static_cast<std::uint64_t>(static_cast<std::uint32_t>(t)) * 0x9E3779B97F4A7C15ULL);
+    }
+
+    std::vector<std::uint64_t> op_keys_;
+    std::vector<size_t> op_offset_;
+    std::vector<std::uint64_t> job_salt_;
+    std::vector<std::uint64_t> machine_salt_;
+};
+
+// ===== TRANSPOSITION TABLE =====
+
+/**
+ * Fixed-size transposition table.
+ *
+ * Buckets of four 16-byte entries, one cache line each, so a probe
+ * touches one line. A store into a full bucket replaces the entry
+ * deepest in the schedule (most operations scheduled, smallest subtree
+ * below it): states near the root, whose re-expansion costs the most,
+ * stay. The new entry always goes in, so the table follows the search.
+ * Keys are full 64-bit hashes; 0 marks an empty slot.
+ */
+class TranspositionTable {
+public:
+    struct Entry {
+        std::uint64_t key;
+        std::int32_t value;   // A*: g of the state, IDA*: backed-up bound of the subtree
+        std::uint32_t depth;  // number of scheduled operations
+    };
+
+    static constexpr size_t WAYS = 4;
+
+    struct alignas(64) Bucket {
+        Entry entries[WAYS];
+    };
+
+    explicit TranspositionTable(size_t bytes) {
+        size_t buckets = 1;
+        while (buckets * 2 * sizeof(Bucket) <= bytes) buckets *= 2;
+        buckets_.resize(buckets);
+        mask_ = buckets - 1;
+        clear();
+    }
+
+    void clear() {
+        std::memset(static_cast<void*>(buckets_.data()), 0, buckets_.size() * sizeof(Bucket));
     }
-    
-    return s;
-}
+
+    size_t capacity() const { return buckets_.size() * WAYS; }
+    size_t replacements() const { return replacements_; }
+
+    const Entry* find(std::uint64_t key) const {
+        const Bucket& bucket = buckets_[key & mask_];
+        for (const Entry& entry : bucket.entries) {
+            if (entry.key == key) return &entry;
+        }
+        return nullptr;
+    }
+
+    void store(std::uint64_t key, int value, size_t depth) {
+        Bucket& bucket = buckets_[key & mask_];
+        Entry* victim = nullptr;
+        for (Entry& entry : bucket.entries) {
+            if (entry.key == key || entry.key == 0) {
+                entry = Entry{key, value, static_cast<std::uint32_t>(depth)};
+                return;
+            }
+            if (!victim || entry.depth > victim->depth) victim = &entry;
+        }
+        *victim = Entry{key, value, static_cast<std::uint32_t>(depth)};
+        ++replacements_;
+    }
+
+private:
+    std::vector<Bucket> buckets_;
+    size_t mask_ = 0;
+    size_t replacements_ = 0;
+};
+
+static_assert(sizeof(TranspositionTable::Entry) == 16, "four entries per cache line");
+static_assert(sizeof(TranspositionTable::Bucket) == 64, "one bucket per cache line");
 
 // ===== HEURISTIC FUNCTION =====
 
@@ -74,235 +169,515 @@ static int heuristic_lb(const JobShopInstance& /* instance */,
         int cand = job_last_finish[j] + remaining_proc[j];
         if (cand > max_job) max_job = cand;
     }
-    
+
     return std::max(max_machine, max_job);
 }
 
-// ===== NODE INFO STRUCTURE =====
+// ===== SEARCH STATE =====
 
-struct NodeInfo {
-    int g;                                      // koszt dotarcia (aktualny makespan)
-    std::string parent_key;                     // klucz rodzica
-    std::pair<size_t, size_t> scheduled_op;     // (job_id, operation_id) wykonana akcja
-    int start_time;                             // kiedy ta operacja się zaczęła
-};
+/**
+ * State of a partial schedule, changed and undone in place.
+ *
+ * A state's subtree depends only on (job_next, machine_avail,
+ * job_last_finish) - g is max(machine_avail) - so its Zobrist key
+ * identifies it in the transposition table.
+ */
+class ScheduleState {
+public:
+    // Record of one operation, for undo
+    struct Undo {
+        size_t machine;
+        int machine_avail;
+        int job_last_finish;
+        int proc_time;
+        std::uint64_t key;
+    };
+
+    ScheduleState(const JobShopInstance& instance, const ZobristKeys& zobrist)
+        : job_next(instance.num_jobs(), 0),
+          machine_avail(instance.num_machines, 0),
+          job_last_finish(instance.num_jobs(), 0),
+          remain_proc(instance.num_jobs(), 0),
+          instance_(instance), zobrist_(zobrist),
+          job_total_proc_(instance.num_jobs(), 0) {
+        // Precompute total processing time per job
+        for (size_t j = 0; j < instance.num_jobs(); ++j) {
+            for (size_t k = 0; k < instance.num_ops(j); ++k) job_total_proc_[j] += instance.processing_time(j, k);
+        }
+        reset();
+    }
 
-// ===== PRIORITY QUEUE ITEM =====
+    void reset() {
+        std::fill(job_next.begin(), job_next.end(), 0);
+        std::fill(machine_avail.begin(), machine_avail.end(), 0);
+        std::fill(job_last_finish.begin(), job_last_finish.end(), 0);
+        remain_proc = job_total_proc_;
+        key = zobrist_.root();
+        depth = 0;
+    }
 
-struct PQItem {
-    int f;              // f = max(g, h) - szacowany całkowity koszt
-    int g;              // koszt dotychczasowy
-    std::string key;    // stan
-
-    // Kolejka priorytetowa w C++ to Max-Heap (największy element na górze).
-    // Chcemy najmniejsze f, więc odwracamy logikę operatora <.
-    bool operator<(const PQItem& other) const {
-        if (f != other.f) return f > other.f; // Wyższe f ma niższy priorytet
-        // Tie-breaker: Jeśli f jest równe, preferujemy WIĘKSZE g.
-        // Dlaczego? Większe g oznacza, że jesteśmy głębiej w drzewie (bliżej rozwiązania).
-        // To zmienia zachowanie na DFS przy równych kosztach (szybsze znalezienie pierwszego wyniku).
-        return g < other.g; 
+    int heuristic() const {
+        return heuristic_lb(instance_, machine_avail, job_last_finish, job_next, remain_proc);
+    }
+
+    // Earliest start of the job's next operation (machine free, job arrived)
+    int earliest_start(size_t job) const {
+        const size_t op = job_next[job];
+        const size_t index = instance_.op_index(job, op);
+        return std::max(machine_avail[instance_.op_machine[index]],
+                        job_last_finish[job] + instance_.transport_before(job, op));
+    }
+
+    int finish_time(size_t job, int start) const {
+        return start + instance_.op_time[instance_.op_index(job, job_next[job])];
+    }
+
+    Undo apply(size_t job, int finish) {
+        const size_t op = job_next[job];
+        const size_t index = instance_.op_index(job, op);
+        const size_t machine = instance_.op_machine[index];
+        Undo undo{machine, machine_avail[machine], job_last_finish[job], instance_.op_time[index], key};
+        key ^= zobrist_.position(job, op) ^ zobrist_.position(job, op + 1) ^
+               zobrist_.machine_time(machine, machine_avail[machine]) ^ zobrist_.machine_time(machine, finish) ^
+               zobrist_.job_time(job, job_last_finish[job]) ^ zobrist_.job_time(job, finish);
+        machine_avail[machine] = finish;
+        job_last_finish[job] = finish;
+        remain_proc[job] -= undo.proc_time;
+        ++job_next[job];
+        ++depth;
+        return undo;
     }
-};
 
-// ===== AUXILIARY STATE DATA =====
+    void revert(size_t job, const Undo& undo) {
+        --depth;
+        --job_next[job];
+        remain_proc[job] += undo.proc_time;
+        job_last_finish[job] = undo.job_last_finish;
+        machine_avail[undo.machine] = undo.machine_avail;
+        key = undo.key;
+    }
 
-struct Aux {
     std::vector<size_t> job_next;
     std::vector<int> machine_avail;
     std::vector<int> job_last_finish;
     std::vector<int> remain_proc;
+    std::uint64_t key = 0;
+    size_t depth = 0;
+
+private:
+    const JobShopInstance& instance_;
+    const ZobristKeys& zobrist_;
+    std::vector<int> job_total_proc_;
 };
 
-} // namespace
+// Expansions between limit checks (one expansion of a large instance takes tens of µs)
+constexpr size_t POLL_INTERVAL = 256;
 
-// ===== MAIN A* SOLVER =====
+// ===== IDA* =====
 
-Solution solve_exact(const JobShopInstance& instance) {
-    Solution empty;
-    const size_t num_jobs = instance.jobs.size();
-    const size_t num_machines = instance.num_machines;
+/**
+ * Iterative deepening A*: depth-first search below an f-threshold that
+ * grows to the smallest f pruned in the previous iteration. The state
+ * lives in one ScheduleState updated and restored in place, so memory is
+ * the recursion (one frame per scheduled operation) plus the fixed
+ * transposition table, which keeps the backed-up bound of every searched
+ * subtree: states reached again by another order of independent
+ * operations are cut off, later iterations start from better bounds.
+ *
+ * The first schedule found has makespan == threshold, which no earlier
+ * iteration reached, so it is optimal.
+ */
+class IdaSearch {
+public:
+    IdaSearch(const JobShopInstance& instance, const ExactLimits& limits, int upper_bound,
+              ScheduleState& state, TranspositionTable& table, ExactStats& stats)
+        : instance_(instance), limits_(limits), stats_(stats), upper_bound_(upper_bound),
+          total_ops_(instance.num_operations()), state_(state), table_(table),
+          children_((instance.num_operations() + 1) * instance.num_jobs()) {
+        path_.reserve(total_ops_);
+        starts_.reserve(total_ops_);
+    }
 
-    // Szybkie sprawdzenie poprawności instancji
-    size_t total_ops = 0;
-    for (const auto& job : instance.jobs) {
-        total_ops += job.operations.size();
+    /**
+     * @param lower_bound Known lower bound of the optimum (first threshold)
+     */
+    Solution run(bool* complete, int lower_bound = 0) {
+        state_.reset();
+        const int root_f = state_.heuristic();
+        int threshold = std::max(root_f, lower_bound);
+        while (threshold < upper_bound_) {
+            ++stats_.iterations;
+            const int next = search(0, threshold, threshold);
+            stats_.table_replacements = table_.replacements();
+            if (next == FOUND) {
+                Solution solution;
+                solution.operation_sequence = path_;
+                solution.start_times = starts_;
+                solution.makespan = goal_g_;
+                if (complete) *complete = true;
+                return solution;
+            }
+            if (next == ABORTED) return Solution{};
+            threshold = next;
+        }
+        // Every path reaches at least upper_bound
+        if (complete) *complete = true;
+        return Solution{};
     }
-    if (total_ops == 0) return empty;
-
-    // Precompute total processing time per job
-    std::vector<int> job_total_proc(num_jobs, 0);
-    for (size_t j = 0; j < num_jobs; ++j) {
-        int sum = 0;
-        for (const auto& op : instance.jobs[j].operations) {
-            sum += op.processing_time;
+
+private:
+    static constexpr int FOUND = -1;
+    static constexpr int ABORTED = -2;
+
+    struct Child {
+        size_t job;
+        int start;
+        int finish;
+        int g;
+        int f;
+        std::uint64_t key;
+    };
+
+    /**
+     * FOUND (path_ holds the schedule), ABORTED, or the smallest f above
+     * the threshold met in the subtree - a lower bound on every schedule
+     * through this state
+     */
+    int search(int g, int f, int threshold) {
+        const size_t depth = state_.depth;
+        if (depth == total_ops_) {
+            goal_g_ = g;
+            return FOUND;
+        }
+
+        if (++stats_.expanded % POLL_INTERVAL == 0) {
+            if (limits_.should_stop && limits_.should_stop()) return ABORTED;
+            if (limits_.upper_bound) upper_bound_ = std::min(upper_bound_, limits_.upper_bound());
         }
-        job_total_proc[j] = sum;
+        if (limits_.max_states != 0 && stats_.expanded > limits_.max_states) return ABORTED;
+
+        // Successors with their f, sorted: most promising first
+        Child* children = children_.data() + depth * instance_.num_jobs();
+        size_t count = 0;
+        for (size_t j = 0; j < instance_.num_jobs(); ++j) {
+            if (state_.job_next[j] >= instance_.num_ops(j)) continue;
+            const int start = state_.earliest_start(j);
+            const int finish = state_.finish_time(j, start);
+
+            const ScheduleState::Undo undo = state_.apply(j, finish);
+            const int h = state_.heuristic();
+            const std::uint64_t key = state_.key;
+            state_.revert(j, undo);
+
+            const int child_g = std::max(g, finish);
+            // Pathmax: the parent's bound holds for its children too
+            int child_f = std::max({child_g, h, f});
+            const TranspositionTable::Entry* entry = table_.find(key);
+            if (entry && entry->value > child_f) {
+                child_f = entry->value;
+                if (child_f > threshold) ++stats_.table_hits;
+            }
+            ++stats_.generated;
+            children[count++] = Child{j, start, finish, child_g, child_f, key};
+        }
+        // On equal f the larger g (deeper in the schedule), as in the A* queue
+        std::sort(children, children + count, [](const Child& a, const Child& b) {
+            return a.f != b.f ? a.f < b.f : a.g > b.g;
+        });
+
+        int next = std::numeric_limits<int>::max();
+        for (size_t c = 0; c < count; ++c) {
+            const Child child = children[c];
+            if (child.f >= upper_bound_) {
+                next = std::min(next, upper_bound_);
+                continue;
+            }
+            if (child.f > threshold) {
+                next = std::min(next, child.f);
+                continue;
+            }
+
+            const size_t op = state_.job_next[child.job];
+            const ScheduleState::Undo undo = state_.apply(child.job, child.finish);
+            path_.emplace_back(child.job, op);
+            starts_.push_back(child.start);
+            const int result = search(child.g, child.f, threshold);
+            if (result == FOUND || result == ABORTED) return result;
+            path_.pop_back();
+            starts_.pop_back();
+            state_.revert(child.job, undo);
+
+            // Subtree searched up to the threshold: remember its bound
+            table_.store(child.key, result, depth + 1);
+            next = std::min(next, result);
+        }
+        return next;
     }
 
-    // ===== INITIALIZE SEARCH =====
+    const JobShopInstance& instance_;
+    const ExactLimits& limits_;
+    ExactStats& stats_;
+    int upper_bound_;
+    const size_t total_ops_;
+
+    ScheduleState& state_;
+    TranspositionTable& table_;
+    std::vector<Child> children_;  // successor buffer, num_jobs per level
+
+    std::vector<std::pair<size_t, size_t>> path_;
+    std::vector<int> starts_;
+    int goal_g_ = 0;
+};
+
+// ===== A* NODES =====
+
+/**
+ * A* node: the last scheduled operation and the parent's index. The state of
+ * a node is rebuilt by replaying its path from the root when it is
+ * expanded, so a generated state costs sizeof(SearchNode) +
+ * sizeof(OpenItem) instead of copies of all state vectors.
+ */
+struct SearchNode {
+    std::uint32_t parent;
+    std::uint32_t job;
+    int start;
+    int finish;
+};
+
+constexpr std::uint32_t NO_PARENT = std::numeric_limits<std::uint32_t>::max();
+
+// ===== PRIORITY QUEUE ITEM =====
 
-    std::vector<size_t> init_job_next(num_jobs, 0);
-    std::vector<int> init_machine_avail(num_machines, 0);
-    std::vector<int> init_job_last_finish(num_jobs, 0);
-    std::vector<int> init_remain_proc(num_jobs, 0);
-    
-    for (size_t j = 0; j < num_jobs; ++j) {
-        init_remain_proc[j] = job_total_proc[j];
+struct OpenItem {
+    int f;              // f = max(g, h) - estimated total cost
+    int g;              // cost so far
+    std::uint32_t node; // index in the node array
+
+    // The C++ heap (std::push_heap) is a max-heap (largest element on top).
+    // We want the smallest f, so operator< is inverted.
+    bool operator<(const OpenItem& other) const {
+        if (f != other.f) return f > other.f; // Higher f has lower priority
+        // Tie-breaker: on equal f prefer the LARGER g. A larger g is deeper in
+        // the tree (closer to a solution), so equal costs are searched depth
+        // first and the first complete schedule is found sooner.
+        return g < other.g;
     }
+};
 
-    std::string init_key = make_state_key(init_job_next, init_machine_avail, init_job_last_finish);
+/**
+ * Path from the root to a node (node indices, root excluded)
+ */
+void node_path(const std::vector<SearchNode>& nodes, std::uint32_t node, std::vector<std::uint32_t>& path) {
+    path.clear();
+    for (; nodes[node].parent != NO_PARENT; node = nodes[node].parent) path.push_back(node);
+    std::reverse(path.begin(), path.end());
+}
+
+// ===== A* =====
+
+Solution astar_search(const JobShopInstance& instance, const ExactLimits& limits, int upper_bound,
+                      bool* complete, ExactStats& stats) {
+    Solution empty;
+    const size_t num_jobs = instance.num_jobs();
+    const size_t total_ops = instance.num_operations();
+    size_t expansions = 0;
+    stats.iterations = 1;
 
-    // Mapy odwiedzonych stanów
-    std::unordered_map<std::string, NodeInfo> visited;
-    std::unordered_map<std::string, Aux> aux_map;
-    
-    // Rezerwacja pamięci
-    visited.reserve(100000);
-    aux_map.reserve(100000);
+    // ===== INITIALIZE SEARCH =====
 
-    std::priority_queue<PQItem> pq;
+    const ZobristKeys zobrist(instance);
+    ScheduleState state(instance, zobrist);
+    TranspositionTable table(limits.table_mb << 20);
+    stats.table_slots = table.capacity();
+
+    // Nodes and the queue (a heap on a vector) are the only memory that grows with the search
+    const size_t node_budget = limits.node_mb << 20;
+    std::vector<SearchNode> nodes;
+    std::vector<OpenItem> open;
+    std::vector<std::uint32_t> path;
+    path.reserve(total_ops);
+
+    // Room for the successors of one expansion. Growing a vector copies it
+    // (old and new array at once), so it grows only when both fit the budget
+    auto reserve_children = [&](auto& items, size_t other_bytes) {
+        using Item = typename std::decay_t<decltype(items)>::value_type;
+        if (items.size() + num_jobs <= items.capacity()) return true;
+        const size_t next = std::max({items.capacity() * 2, items.size() + num_jobs, size_t{1024}});
+        if ((items.capacity() + next) * sizeof(Item) + other_bytes > node_budget) return false;
+        items.reserve(next);
+        return true;
+    };
 
     // Stan początkowy
-    int init_g = 0;
-    int init_h = heuristic_lb(instance, init_machine_avail, init_job_last_finish,
-                              init_job_next, init_remain_proc);
-    
     // NAPRAWA #1: f to szacowany całkowity czas, a nie suma.
     // Ponieważ h szacuje "całkowity czas zakończenia", f = max(g, h).
-    int init_f = std::max(init_g, init_h);
-
-    pq.push(PQItem{init_f, init_g, init_key});
-    visited[init_key] = NodeInfo{init_g, std::string(), 
-                                 std::pair<size_t, size_t>{size_t(-1), size_t(-1)}, 0};
-    aux_map[init_key] = Aux{init_job_next, init_machine_avail, init_job_last_finish, init_remain_proc};
+    nodes.push_back(SearchNode{NO_PARENT, 0, 0, 0});
+    table.store(state.key, 0, 0);
+    open.push_back(OpenItem{state.heuristic(), 0, 0});
 
     // ===== A* MAIN LOOP =====
 
-    while (!pq.empty()) {
-        PQItem current = pq.top();
-        pq.pop();
+    while (!open.empty()) {
+        std::pop_heap(open.begin(), open.end());
+        OpenItem current = open.back();
+        open.pop_back();
 
-        // Lazy deletion / Pruning
-        auto vit = visited.find(current.key);
-        // Jeśli znaleźliśmy wcześniej lepszą ścieżkę do tego samego stanu, pomijamy obecną
-        if (vit != visited.end() && vit->second.g < current.g) {
-            continue;
+        stats.stored_states = nodes.size();
+        stats.table_replacements = table.replacements();
+        if (++expansions % POLL_INTERVAL == 0) {
+            if (limits.should_stop && limits.should_stop()) return empty;
+            if (limits.upper_bound) upper_bound = std::min(upper_bound, limits.upper_bound());
+        }
+        if (limits.max_states != 0 && nodes.size() > limits.max_states) return empty;
+
+        // The state cannot improve on the best known solution (f is a lower bound)
+        if (current.f >= upper_bound) continue;
+
+        // Node budget spent: continue with IDA* from the smallest f in the queue (a
+        // lower bound on the optimum) - more re-expansions instead of running out of memory
+        if (!reserve_children(nodes, open.capacity() * sizeof(OpenItem)) ||
+            !reserve_children(open, nodes.capacity() * sizeof(SearchNode)) ||
+            nodes.size() + num_jobs >= NO_PARENT) {
+            const int lower_bound = current.f;
+            std::vector<SearchNode>().swap(nodes);
+            std::vector<OpenItem>().swap(open);
+            table.clear();
+            stats.switched_to_ida = true;
+            return IdaSearch(instance, limits, upper_bound, state, table, stats).run(complete, lower_bound);
         }
 
-        const Aux& curr_aux = aux_map.at(current.key);
-        const auto& job_next = curr_aux.job_next;
-        const auto& machine_avail = curr_aux.machine_avail;
-        const auto& job_last_finish = curr_aux.job_last_finish;
-        const auto& remain_proc = curr_aux.remain_proc;
+        // Rebuild the node's state from its path
+        node_path(nodes, current.node, path);
+        state.reset();
+        for (std::uint32_t step : path) state.apply(nodes[step].job, nodes[step].finish);
 
         // Sprawdzenie warunku końca (wszystkie operacje wykonane)
-        bool is_goal = true;
-        for (size_t j = 0; j < num_jobs; ++j) {
-            if (job_next[j] < instance.jobs[j].operations.size()) {
-                is_goal = false;
-                break;
-            }
-        }
-
-        if (is_goal) {
+        if (state.depth == total_ops) {
             // Rekonstrukcja rozwiązania
-            std::vector<std::pair<size_t, size_t>> seq_rev;
-            std::vector<int> starts_rev;
-            
-            std::string cur_key = current.key;
-            while (true) {
-                auto it = visited.find(cur_key);
-                if (it == visited.end()) break;
-                
-                const NodeInfo& info = it->second;
-                if (info.parent_key.empty()) break; // Root
-                
-                seq_rev.push_back(info.scheduled_op);
-                starts_rev.push_back(info.start_time);
-                cur_key = info.parent_key;
-            }
-
-            std::reverse(seq_rev.begin(), seq_rev.end());
-            std::reverse(starts_rev.begin(), starts_rev.end());
-
             Solution solution;
-            solution.operation_sequence = std::move(seq_rev);
-            solution.start_times = std::move(starts_rev);
+            solution.operation_sequence.reserve(total_ops);
+            solution.start_times.reserve(total_ops);
+            std::vector<size_t> op_counter(num_jobs, 0);
+            for (std::uint32_t step : path) {
+                const size_t job = nodes[step].job;
+                solution.operation_sequence.emplace_back(job, op_counter[job]++);
+                solution.start_times.push_back(nodes[step].start);
+            }
             solution.makespan = current.g;
+            if (complete) *complete = true;
             return solution;
         }
 
         // Generowanie następników
+        ++stats.expanded;
         for (size_t j = 0; j < num_jobs; ++j) {
-            size_t op_idx = job_next[j];
-            
             // Jeśli zadanie zakończone, pomiń
-            if (op_idx >= instance.jobs[j].operations.size()) continue;
+            if (state.job_next[j] >= instance.num_ops(j)) continue;
 
-            const Operation& op = instance.jobs[j].operations[op_idx];
-            size_t machine_id = op.machine_id;
-            int proc_time = op.processing_time;
+            const int earliest_start = state.earliest_start(j);
+            const int finish_time = state.finish_time(j, earliest_start);
 
-            // Czas transportu
-            int transport_time = 0;
-            if (op_idx > 0) {
-                size_t prev_machine = instance.jobs[j].operations[op_idx - 1].machine_id;
-                transport_time = instance.transport_times[prev_machine][machine_id];
-            }
-
-            // Najwcześniejszy możliwy start
-            int earliest_start = std::max(machine_avail[machine_id],
-                                          job_last_finish[j] + transport_time);
-            int finish_time = earliest_start + proc_time;
-            
             // Nowy koszt g (makespan)
-            int new_g = std::max(current.g, finish_time);
-
-            // Tworzenie stanu następnika
-            std::vector<size_t> next_job_next = job_next;
-            next_job_next[j]++;
-            
-            std::vector<int> next_machine_avail = machine_avail;
-            next_machine_avail[machine_id] = finish_time;
-            
-            std::vector<int> next_job_last_finish = job_last_finish;
-            next_job_last_finish[j] = finish_time;
-            
-            std::vector<int> next_remain_proc = remain_proc;
-            next_remain_proc[j] -= proc_time;
-
-            std::string next_key = make_state_key(next_job_next, next_machine_avail, next_job_last_finish);
-
-            // Pruning: Jeśli odwiedziliśmy ten stan z lepszym lub równym g, nie dodajemy
-            auto known_it = visited.find(next_key);
-            if (known_it != visited.end() && known_it->second.g <= new_g) {
+            const int new_g = std::max(current.g, finish_time);
+
+            // Successor state, key updated incrementally
+            const ScheduleState::Undo undo = state.apply(j, finish_time);
+            const std::uint64_t next_key = state.key;
+
+            // Pruning: state already generated (the same state has the same g). An
+            // entry evicted from the table only means the state is expanded again.
+            if (table.find(next_key)) {
+                state.revert(j, undo);
+                ++stats.table_hits;
                 continue;
             }
 
             // Heurystyka i f
-            int h = heuristic_lb(instance, next_machine_avail, next_job_last_finish,
-                                 next_job_next, next_remain_proc);
-            
+            ++stats.generated;
+            const int h = state.heuristic();
+            state.revert(j, undo);
+
             // NAPRAWA #2: Poprawne obliczenie f.
             // f = max(g, h), ponieważ h jest dolnym oszacowaniem CAŁOŚCI.
-            int f = std::max(new_g, h);
+            const int f = std::max(new_g, h);
+            if (f >= upper_bound) continue;
 
             // Zapisz i dodaj do kolejki
-            visited[next_key] = NodeInfo{new_g, current.key,
-                                         std::pair<size_t, size_t>{j, op_idx},
-                                         earliest_start};
-                                         
-            aux_map[next_key] = Aux{std::move(next_job_next),
-                                    std::move(next_machine_avail),
-                                    std::move(next_job_last_finish),
-                                    std::move(next_remain_proc)};
-
-            pq.push(PQItem{f, new_g, next_key});
+            table.store(next_key, new_g, state.depth + 1);
+            nodes.push_back(SearchNode{current.node, static_cast<std::uint32_t>(j), earliest_start, finish_time});
+            open.push_back(OpenItem{f, new_g, static_cast<std::uint32_t>(nodes.size() - 1)});
+            std::push_heap(open.begin(), open.end());
         }
     }
 
+    // Search space exhausted: nothing beats upper_bound
+    stats.stored_states = nodes.size();
+    if (complete) *complete = true;
     return empty;
 }
 
-} // namespace jobshop
\ No newline at end of file
+Solution ida_search(const JobShopInstance& instance, const ExactLimits& limits, int upper_bound,
+                    bool* complete, ExactStats& stats) {
+    const ZobristKeys zobrist(instance);
+    ScheduleState state(instance, zobrist);
+    TranspositionTable table(limits.table_mb << 20);
+    stats.table_slots = table.capacity();
+    return IdaSearch(instance, limits, upper_bound, state, table, stats).run(complete);
+}
+
+} // namespace
+
+const char* exact_search_name(ExactSearch search) {
+    switch (search) {
+        case ExactSearch::AStar: return "astar";
+        case ExactSearch::IDAStar: return "ida";
+    }
+    return "astar";
+}
+
+ExactSearch parse_exact_search(const std::string& name) {
+    for (ExactSearch search : {ExactSearch::AStar, ExactSearch::IDAStar}) {
+        if (name == exact_search_name(search)) return search;
+    }
+    throw std::invalid_argument("Unknown exact search '" + name + "' (expected astar or ida)");
+}
+
+// ===== MAIN EXACT SOLVER =====
+
+Solution solve_exact(const JobShopInstance& instance) {
+    return solve_exact(instance, ExactLimits{});
+}
+
+Solution solve_exact(const JobShopInstance& instance, const ExactLimits& limits, bool* complete,
+                     ExactStats* stats) {
+    if (complete) *complete = false;
+    ExactStats local;
+    ExactStats& counters = stats ? *stats : local;
+    counters = ExactStats{};
+
+    // The state space does not cover machine choice
+    if (instance.is_flexible()) {
+        throw std::invalid_argument("Exact solver does not support flexible instances (machine alternatives)");
+    }
+
+    // Quick sanity check of the instance
+    if (instance.num_operations() == 0) {
+        if (complete) *complete = true;
+        return Solution{};
+    }
+
+    const int upper_bound = limits.upper_bound ? limits.upper_bound() : std::numeric_limits<int>::max();
+
+    // The known solution already reaches the instance's lower bound - nothing better exists
+    if (upper_bound <= instance_stats(instance).lower_bound) {
+        if (complete) *complete = true;
+        return Solution{};
+    }
+
+    if (limits.search == ExactSearch::IDAStar) {
+        return ida_search(instance, limits, upper_bound, complete, counters);
+    }
+    return astar_search(instance, limits, upper_bound, complete, counters);
+}
+
+} // namespace jobshop
@@ -0,0 +1,323 @@
+#include "jobshop/checkpoint.hpp"
+#include "jobshop/serialize.hpp"
+#include <algorithm>
+#include <filesystem>
+#include <fstream>
+#include <iostream>
+#include <iterator>
+#include <stdexcept>
+#include <string>
+
+namespace jobshop {
+
+namespace {
+
+constexpr char SNAPSHOT_MAGIC[4] = {'J', 'S', 'G', 'A'};
+// 2: frozen prefix, decoder, operators, stop_at_lower_bound and machine
+// assignment. Version 1 snapshots still load with the behaviour of the run
+// that wrote them (semi-active decoder, OX + swap, all generations)
+constexpr std::uint32_t SNAPSHOT_VERSION = 2;
+
+std::uint8_t gene_width(std::size_t num_jobs) {
+    if (num_jobs <= 0x100) return 1;
+    if (num_jobs <= 0x10000) return 2;
+    return 4;
+}
+
+std::size_t count_operations(const JobShopInstance& instance) {
+    return instance.num_operations();
+}
+
+void write_genome(ByteWriter& w, const Solution& sol, std::uint8_t width) {
+    for (const auto& p : sol.operation_sequence) {
+        w.put(p.first, width);
+    }
+}
+
+/**
+ * Bytes per machine choice: 0 = instance without alternatives
+ */
+std::uint8_t choice_width(const JobShopInstance& instance) {
+    if (!instance.is_flexible()) return 0;
+    std::size_t most = 1;
+    for (std::size_t i = 0; i < instance.num_operations(); ++i) most = std::max(most, instance.num_alternatives(i));
+    return most <= 0x100 ? 1 : 2;
+}
+
+void write_choice(ByteWriter& w, const JobShopInstance& instance, const Solution& sol, std::uint8_t width) {
+    if (width == 0) return;
+    const std::vector<std::uint16_t> defaults =
+        sol.machine_choice.empty() ? default_machine_choice(instance) : std::vector<std::uint16_t>();
+    for (std::uint16_t choice : sol.machine_choice.empty() ? defaults : sol.machine_choice) {
+        w.put(choice, width);
+    }
+}
+
+void read_choice(ByteReader& r, const JobShopInstance& instance, Solution& sol, std::uint8_t width) {
+    if (width == 0) return;
+    sol.machine_choice.resize(instance.num_operations());
+    for (std::size_t i = 0; i < sol.machine_choice.size(); ++i) {
+        std::size_t choice = static_cast<std::size_t>(r.get(width));
+        if (choice >= instance.num_alternatives(i)) {
+            throw std::runtime_error("Snapshot contains an invalid machine assignment");
+        }
+        sol.machine_choice[i] = static_cast<std::uint16_t>(choice);
+    }
+}
+
+/**
+ * Read genome (job IDs) and rebuild (job_id, operation_id) pairs
+ */
+Solution read_genome(ByteReader& r, const JobShopInstance& instance,
+                     std::size_t num_ops, std::uint8_t width) {
+    Solution sol;
+    sol.operation_sequence.reserve(num_ops);
+    std::vector<std::size_t> next_op(instance.num_jobs(), 0);
+    for (std::size_t i = 0; i < num_ops; ++i) {
+        std::size_t job_id = static_cast<std::size_t>(r.get(width));
+        if (job_id >= instance.num_jobs() || next_op[job_id] >= instance.num_ops(job_id)) {
+            throw std::runtime_error("Snapshot contains an invalid genome");
+        }
+        sol.operation_sequence.emplace_back(job_id, next_op[job_id]++);
+    }
+    return sol;
+}
+
+} // namespace
+
+// ===== ENCODING =====
+
+std::vector<std::uint8_t> encode_snapshot(const JobShopInstance& instance,
+                                          const GeneticParams& params,
+                                          const GeneticState& state) {
+    const std::size_t num_jobs = instance.num_jobs();
+    const std::size_t num_ops = count_operations(instance);
+    const std::uint8_t width = gene_width(num_jobs);
+
+    std::vector<std::uint8_t> buffer;
+    buffer.reserve(128 + (state.population.size() + 1) * (4 + num_ops * width));
+    ByteWriter w(buffer);
+
+    for (char c : SNAPSHOT_MAGIC) w.u8(static_cast<std::uint8_t>(c));
+    w.u32(SNAPSHOT_VERSION);
+
+    // Parameters
+    w.u64(params.population_size);
+    w.u64(params.generations);
+    w.u64(params.tournament_size);
+    w.f64(params.mutation_prob);
+    w.u32(params.seed);
+    w.u64(params.frozen_prefix);
+    w.u64(params.checkpoint_interval);
+    w.u8(static_cast<std::uint8_t>(params.decoder));
+    w.f64(params.decoder_delta);
+    w.u8(static_cast<std::uint8_t>(params.crossover));
+    w.u8(static_cast<std::uint8_t>(params.mutation));
+    w.u8(params.stop_at_lower_bound ? 1 : 0);
+
+    // Instance shape (sanity check on resume)
+    w.u32(static_cast<std::uint32_t>(num_jobs));
+    w.u32(static_cast<std::uint32_t>(instance.num_machines));
+    w.u32(static_cast<std::uint32_t>(num_ops));
+
+    // Progress
+    w.u64(state.generation);
+    for (std::uint64_t word : state.rng.state()) w.u64(word);
+
+    // Population with cached fitness
+    const std::uint8_t assignment_width = choice_width(instance);
+    w.u8(width);
+    w.u8(assignment_width);
+    w.u32(static_cast<std::uint32_t>(state.population.size()));
+    for (const auto& individual : state.population) {
+        w.i32(individual.makespan);
+        write_genome(w, individual, width);
+        write_choice(w, instance, individual, assignment_width);
+    }
+
+    // Best solution
+    w.i32(state.best.makespan);
+    write_genome(w, state.best, width);
+    write_choice(w, instance, state.best, assignment_width);
+
+    return buffer;
+}
+
+// ===== DECODING =====
+
+GeneticSnapshot decode_snapshot(const JobShopInstance& instance,
+                                const std::vector<std::uint8_t>& buffer) {
+    ByteReader r(buffer);
+
+    for (char c : SNAPSHOT_MAGIC) {
+        if (r.u8() != static_cast<std::uint8_t>(c)) {
+            throw std::runtime_error("Not a genetic algorithm snapshot");
+        }
+    }
+    std::uint32_t version = r.u32();
+    if (version < 1 || version > SNAPSHOT_VERSION) {
+        throw std::runtime_error("Unsupported snapshot version " + std::to_string(version));
+    }
+    const bool legacy = version == 1;
+
+    GeneticSnapshot snap;
+    snap.params.population_size = static_cast<std::size_t>(r.u64());
+    snap.params.generations = static_cast<std::size_t>(r.u64());
+    snap.params.tournament_size = static_cast<std::size_t>(r.u64());
+    snap.params.mutation_prob = r.f64();
+    snap.params.seed = r.u32();
+    if (!legacy) snap.params.frozen_prefix = static_cast<std::size_t>(r.u64());
+    snap.params.checkpoint_interval = static_cast<std::size_t>(r.u64());
+    if (legacy) {
+        snap.params.stop_at_lower_bound = false;
+    } else {
+        std::uint8_t decoder = r.u8();
+        if (decoder > static_cast<std::uint8_t>(DecoderKind::Hybrid)) {
+            throw std::runtime_error("Snapshot has an unknown decoder");
+        }
+        snap.params.decoder = static_cast<DecoderKind>(decoder);
+        snap.params.decoder_delta = r.f64();
+        std::uint8_t crossover = r.u8();
+        std::uint8_t mutation = r.u8();
+        if (crossover > static_cast<std::uint8_t>(CrossoverKind::JOX) ||
+            mutation > static_cast<std::uint8_t>(MutationKind::Inversion)) {
+            throw std::runtime_error("Snapshot has an unknown crossover or mutation operator");
+        }
+        snap.params.crossover = static_cast<CrossoverKind>(crossover);
+        snap.params.mutation = static_cast<MutationKind>(mutation);
+        std::uint8_t stop = r.u8();
+        if (stop > 1) {
+            throw std::runtime_error("Snapshot has an invalid stop_at_lower_bound flag");
+        }
+        snap.params.stop_at_lower_bound = stop == 1;
+    }
+
+    const std::size_t num_jobs = r.u32();
+    const std::size_t num_machines = r.u32();
+    const std::size_t num_ops = r.u32();
+    if (num_jobs != instance.num_jobs() || num_machines != instance.num_machines ||
+        num_ops != count_operations(instance)) {
+        throw std::runtime_error("Snapshot was created for a different instance");
+    }
+
+    snap.state.generation = static_cast<std::size_t>(r.u64());
+    Rng::State rng_state;
+    for (auto& word : rng_state) word = r.u64();
+    snap.state.rng.set_state(rng_state);
+
+    const std::uint8_t width = r.u8();
+    if (width != gene_width(num_jobs)) {
+        throw std::runtime_error("Snapshot has invalid gene width");
+    }
+    const std::uint8_t assignment_width = legacy ? 0 : r.u8();
+    if (assignment_width != choice_width(instance)) {
+        throw std::runtime_error("Snapshot was created for a different instance");
+    }
+
+    const std::size_t pop_size = r.u32();
+    snap.state.population.reserve(pop_size);
+    for (std::size_t i = 0; i < pop_size; ++i) {
+        int fitness = r.i32();
+        Solution individual = read_genome(r, instance, num_ops, width);
+        read_choice(r, instance, individual, assignment_width);
+        individual.makespan = fitness;
+        snap.state.population.push_back(std::move(individual));
+    }
+
+    r.i32(); // stored best makespan, recomputed below together with start times
+    snap.state.best = read_genome(r, instance, num_ops, width);
+    read_choice(r, instance, snap.state.best, assignment_width);
+    decode_schedule(instance, snap.state.best, snap.params.decoder, snap.params.decoder_delta,
+                    snap.params.frozen_prefix);
+
+    if (!r.at_end()) {
+        throw std::runtime_error("Snapshot has trailing data");
+    }
+    return snap;
+}
+
+// ===== FILES =====
+
+GeneticSnapshot load_snapshot(const JobShopInstance& instance, const std::string& path) {
+    std::ifstream file(path, std::ios::binary);
+    if (!file.is_open()) {
+        throw std::runtime_error("Cannot open snapshot: " + path);
+    }
+    std::vector<std::uint8_t> buffer((std::istreambuf_iterator<char>(file)),
+                                     std::istreambuf_iterator<char>());
+    try {
+        return decode_snapshot(instance, buffer);
+    } catch (const std::exception& e) {
+        throw std::runtime_error("Error loading snapshot '" + path + "': " + e.what());
+    }
+}
+
+void write_snapshot_file(const std::string& path, const std::vector<std::uint8_t>& buffer) {
+    const std::string tmp_path = path + ".tmp";
+    {
+        std::ofstream file(tmp_path, std::ios::binary | std::ios::trunc);
+        if (!file.is_open()) {
+            throw std::runtime_error("Cannot write snapshot: " + tmp_path);
+        }
+        file.write(reinterpret_cast<const char*>(buffer.data()),
+                   static_cast<std::streamsize>(buffer.size()));
+        if (!file) {
+            throw std::runtime_error("Failed writing snapshot: " + tmp_path);
+        }
+    }
+    // Rename is atomic, so an interrupted write never corrupts the previous snapshot
+    std::filesystem::rename(tmp_path, path);
+}
+
+// ===== BACKGROUND WRITER =====
+
+CheckpointWriter::CheckpointWriter(std::string path)
+    : path_(std::move(path)), worker_(&CheckpointWriter::worker_loop, this) {}
+
+CheckpointWriter::~CheckpointWriter() {
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        stop_ = true;
+    }
+    cv_.notify_all();
+    worker_.join();
+}
+
+void CheckpointWriter::submit(std::vector<std::uint8_t> buffer) {
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        pending_ = std::move(buffer);
+        has_pending_ = true;
+    }
+    cv_.notify_all();
+}
+
+void CheckpointWriter::flush() {
+    std::unique_lock<std::mutex> lock(mutex_);
+    cv_.wait(lock, [this] { return !has_pending_ && !writing_; });
+}
+
+void CheckpointWriter::worker_loop() {
+    std::unique_lock<std::mutex> lock(mutex_);
+    while (true) {
+        cv_.wait(lock, [this] { return has_pending_ || stop_; });
+        if (!has_pending_) break; // stop requested and nothing left to write
+
+        std::vector<std::uint8_t> buffer = std::move(pending_);
+        has_pending_ = false;
+        writing_ = true;
+        lock.unlock();
+
+        try {
+            write_snapshot_file(path_, buffer);
+        } catch (const std::exception& e) {
+            std::cerr << "Checkpoint error: " << e.what() << std::endl;
+        }
+
+        lock.lock();
+        writing_ = false;
+        cv_.notify_all();
+    }
+}
+
+} // namespace jobshop
@@ -1,13 +1,16 @@
 #include "jobshop/genetic.hpp"
+#include "jobshop/checkpoint.hpp"
+#include "jobshop/instance_stats.hpp"
 #include <vector>
 #include <algorithm>
-#include <random>
+#include <memory>
+#include <stdexcept>
 #include <unordered_map>
 #include <unordered_set>
 
 namespace jobshop {
 
-namespace {
+// ===== GENOME ENCODING =====
 
 /**
  * Helper: Converts a Solution (list of pairs) into a Genome (list of Job IDs).
@@ -43,14 +46,14 @@ Solution genes_to_solution(const std::vector<size_t>& genes) {
     return sol;
 }
 
+namespace {
+
 /**
- * Helper: safely convert time_t to unsigned int
+ * Replace the sequence of a solution, keeping its machine assignment
  */
-static unsigned int get_seed(unsigned int seed) {
-    if (seed > 0) {
-        return seed;
-    }
-    return static_cast<unsigned int>(std::time(nullptr) & 0xFFFFFFFF);
+void assign_genes(Solution& solution, const std::vector<size_t>& genes) {
+    solution.operation_sequence = genes_to_solution(genes).operation_sequence;
+    solution.start_times.clear();
 }
 
 } // namespace
@@ -58,21 +61,25 @@ static unsigned int get_seed(unsigned int seed) {
 // ===== RANDOM SOLUTION GENERATION =====
 
 Solution generate_random_solution(const JobShopInstance& instance, unsigned int seed) {
-    std::mt19937 rng(get_seed(seed));
-    
+    Rng rng(resolve_seed(seed));
+    return generate_random_solution(instance, rng);
+}
+
+Solution generate_random_solution(const JobShopInstance& instance, Rng& rng) {
     // Create a genome consisting of Job IDs repeated N times (where N is num operations)
     std::vector<size_t> genes;
-    for (const auto& job : instance.jobs) {
-        for (size_t i = 0; i < job.operations.size(); ++i) {
-            genes.push_back(job.job_id);
-        }
+    genes.reserve(instance.num_operations());
+    for (size_t j = 0; j < instance.num_jobs(); ++j) {
+        genes.insert(genes.end(), instance.num_ops(j), j);
     }
     
     // Shuffle the Job IDs
-    std::shuffle(genes.begin(), genes.end(), rng);
+    shuffle(genes.begin(), genes.end(), rng);
     
     // Decode into a valid solution (assigns Op IDs in correct order 0, 1, 2...)
-    return genes_to_solution(genes);
+    Solution solution = genes_to_solution(genes);
+    solution.machine_choice = random_machine_choice(instance, rng);
+    return solution;
 }
 
 // ===== POPULATION GENERATION =====
@@ -82,12 +89,20 @@ std::vector<Solution> generate_population(
     size_t population_size,
     unsigned int seed) {
     
-    std::mt19937 rng(get_seed(seed));
+    Rng rng(resolve_seed(seed));
+    return generate_population(instance, population_size, rng);
+}
+
+std::vector<Solution> generate_population(
+    const JobShopInstance& instance,
+    size_t population_size,
+    Rng& rng) {
+    
     std::vector<Solution> population;
     population.reserve(population_size);
     
     for (size_t i = 0; i < population_size; ++i) {
-        population.push_back(generate_random_solution(instance, rng()));
+        population.push_back(generate_random_solution(instance, rng));
     }
     
     return population;
@@ -101,18 +116,27 @@ Solution tournament_selection(
     size_t tournament_size,
     unsigned int seed) {
     
-    std::mt19937 rng(get_seed(seed));
-    std::uniform_int_distribution<size_t> dist(0, population.size() - 1);
+    Rng rng(resolve_seed(seed));
+    return tournament_selection(population, instance, tournament_size, rng);
+}
+
+Solution tournament_selection(
+    const std::vector<Solution>& population,
+    const JobShopInstance& instance,
+    size_t tournament_size,
+    Rng& rng) {
+    
+    const size_t n = population.size();
     
     // Select first random individual
-    Solution best = population[dist(rng)];
+    Solution best = population[rng.below(n)];
     int best_makespan = calculate_makespan(instance, best);
     
     for (size_t i = 1; i < tournament_size; ++i) {
         // FIX: Create a COPY of the contender.
         // calculate_makespan takes Solution& (non-const) because it fills start_times.
         // We cannot pass a const reference from the population vector directly.
-        Solution contender = population[dist(rng)];
+        Solution contender = population[rng.below(n)];
         int contender_makespan = calculate_makespan(instance, contender);
         
         if (contender_makespan < best_makespan) {
@@ -132,21 +156,34 @@ Solution order_crossover(
     const Solution& parent2,
     unsigned int seed) {
     
-    std::mt19937 rng(get_seed(seed));
+    Rng rng(resolve_seed(seed));
+    return order_crossover(parent1, parent2, rng);
+}
+
+Solution order_crossover(
+    const Solution& parent1,
+    const Solution& parent2,
+    Rng& rng,
+    size_t frozen_prefix) {
     
     // 1. Extract Genomes (Job IDs only)
     std::vector<size_t> p1_genes = solution_to_genes(parent1);
     std::vector<size_t> p2_genes = solution_to_genes(parent2);
     size_t n = p1_genes.size();
     
-    if (n == 0) return Solution();
+    if (frozen_prefix >= n) return genes_to_solution(p1_genes);
     
+    // Frozen positions are inherited unchanged, OX works on [b, n)
+    const size_t b = frozen_prefix;
+    const size_t m = n - b;
     std::vector<size_t> child_genes(n);
+    std::copy(p1_genes.begin(), p1_genes.begin() + static_cast<std::ptrdiff_t>(b), child_genes.begin());
+    
+    auto next = [b, n](size_t idx) { return idx + 1 == n ? b : idx + 1; };
     
     // 2. Perform Order Crossover (OX) on Job IDs
-    std::uniform_int_distribution<size_t> dist(0, n - 1);
-    size_t start = dist(rng);
-    size_t end = dist(rng);
+    size_t start = b + rng.below(m);
+    size_t end = b + rng.below(m);
     
     if (start > end) std::swap(start, end);
     
@@ -154,7 +191,7 @@ Solution order_crossover(
     std::unordered_map<size_t, int> jobs_needed;
     
     // Initialize with total counts from parent 1 (to know how many of each job we need total)
-    for (size_t job : p1_genes) jobs_needed[job]++;
+    for (size_t i = b; i < n; ++i) jobs_needed[p1_genes[i]]++;
     
     // Copy segment from Parent 1 to Child
     for (size_t i = start; i <= end; ++i) {
@@ -163,8 +200,8 @@ Solution order_crossover(
     }
     
     // Fill remaining positions from Parent 2
-    size_t current_p2_idx = (end + 1) % n;
-    size_t current_child_idx = (end + 1) % n;
+    size_t current_p2_idx = next(end);
+    size_t current_child_idx = next(end);
     
     while (current_child_idx != start) {
         size_t job_candidate = p2_genes[current_p2_idx];
@@ -173,87 +210,408 @@ Solution order_crossover(
         if (jobs_needed[job_candidate] > 0) {
             child_genes[current_child_idx] = job_candidate;
             jobs_needed[job_candidate]--;
-            current_child_idx = (current_child_idx + 1) % n;
+            current_child_idx = next(current_child_idx);
         }
         
-        current_p2_idx = (current_p2_idx + 1) % n;
+        current_p2_idx = next(current_p2_idx);
     }
     
     // 3. Decode back to valid Solution (Pairs)
     return genes_to_solution(child_genes);
 }
 
+Solution job_order_crossover(
+    const Solution& parent1,
+    const Solution& parent2,
+    unsigned int seed) {
+
+    Rng rng(resolve_seed(seed));
+    return job_order_crossover(parent1, parent2, rng);
+}
+
+Solution job_order_crossover(
+    const Solution& parent1,
+    const Solution& parent2,
+    Rng& rng,
+    size_t frozen_prefix) {
+
+    std::vector<size_t> p1_genes = solution_to_genes(parent1);
+    std::vector<size_t> p2_genes = solution_to_genes(parent2);
+    const size_t n = p1_genes.size();
+
+    if (frozen_prefix >= n) return genes_to_solution(p1_genes);
+
+    // 1. Random subset of jobs (each with probability 1/2)
+    size_t num_jobs = 0;
+    for (size_t job : p1_genes) num_jobs = std::max(num_jobs, job + 1);
+    std::vector<char> keep(num_jobs, 0);
+    for (size_t j = 0; j < num_jobs; ++j) keep[j] = rng.below(2) == 0;
+
+    // 2. Kept jobs (and the frozen prefix) stay where they are in parent 1,
+    //    the free positions take the other jobs in parent 2 order
+    std::vector<size_t> child_genes(p1_genes);
+    size_t p2_idx = frozen_prefix;
+    for (size_t i = frozen_prefix; i < n; ++i) {
+        if (keep[p1_genes[i]]) continue;
+        while (keep[p2_genes[p2_idx]]) ++p2_idx;
+        child_genes[i] = p2_genes[p2_idx++];
+    }
+
+    return genes_to_solution(child_genes);
+}
+
 // ===== MUTATION =====
 
 void mutate_swap(Solution& solution, unsigned int seed) {
-    std::mt19937 rng(get_seed(seed));
-    
+    Rng rng(resolve_seed(seed));
+    mutate_swap(solution, rng);
+}
+
+void mutate_swap(Solution& solution, Rng& rng, size_t frozen_prefix) {
     // 1. Convert to genes
     std::vector<size_t> genes = solution_to_genes(solution);
     size_t n = genes.size();
     
-    if (n < 2) return;
+    if (n < frozen_prefix + 2) return;
     
-    // 2. Perform Swap
-    std::uniform_int_distribution<size_t> dist(0, n - 1);
-    size_t i = dist(rng);
-    size_t j = dist(rng);
-    while (i == j) j = dist(rng);
+    // 2. Perform Swap (never touches the frozen prefix)
+    const size_t m = n - frozen_prefix;
+    size_t i = frozen_prefix + rng.below(m);
+    size_t j = frozen_prefix + rng.below(m);
+    while (i == j) j = frozen_prefix + rng.below(m);
     
     std::swap(genes[i], genes[j]);
     
     // 3. Reconstruct solution to fix Operation IDs
-    solution = genes_to_solution(genes);
+    assign_genes(solution, genes);
 }
 
-// ===== MAIN GENETIC ALGORITHM =====
+void mutate_insert(Solution& solution, unsigned int seed) {
+    Rng rng(resolve_seed(seed));
+    mutate_insert(solution, rng);
+}
 
-Solution run_genetic(
+void mutate_insert(Solution& solution, Rng& rng, size_t frozen_prefix) {
+    std::vector<size_t> genes = solution_to_genes(solution);
+    size_t n = genes.size();
+
+    if (n < frozen_prefix + 2) return;
+
+    const size_t m = n - frozen_prefix;
+    size_t from = frozen_prefix + rng.below(m);
+    size_t to = frozen_prefix + rng.below(m);
+    while (from == to) to = frozen_prefix + rng.below(m);
+
+    // Moving one gene = rotating the range between the two positions
+    auto first = genes.begin();
+    if (from < to) {
+        std::rotate(first + static_cast<std::ptrdiff_t>(from), first + static_cast<std::ptrdiff_t>(from + 1),
+                    first + static_cast<std::ptrdiff_t>(to + 1));
+    } else {
+        std::rotate(first + static_cast<std::ptrdiff_t>(to), first + static_cast<std::ptrdiff_t>(from),
+                    first + static_cast<std::ptrdiff_t>(from + 1));
+    }
+
+    assign_genes(solution, genes);
+}
+
+void mutate_inversion(Solution& solution, unsigned int seed) {
+    Rng rng(resolve_seed(seed));
+    mutate_inversion(solution, rng);
+}
+
+void mutate_inversion(Solution& solution, Rng& rng, size_t frozen_prefix) {
+    std::vector<size_t> genes = solution_to_genes(solution);
+    size_t n = genes.size();
+
+    if (n < frozen_prefix + 2) return;
+
+    const size_t m = n - frozen_prefix;
+    size_t i = frozen_prefix + rng.below(m);
+    size_t j = frozen_prefix + rng.below(m);
+    while (i == j) j = frozen_prefix + rng.below(m);
+    if (i > j) std::swap(i, j);
+
+    std::reverse(genes.begin() + static_cast<std::ptrdiff_t>(i), genes.begin() + static_cast<std::ptrdiff_t>(j + 1));
+
+    assign_genes(solution, genes);
+}
+
+// ===== MACHINE ASSIGNMENT =====
+
+std::vector<std::uint16_t> random_machine_choice(const JobShopInstance& instance, Rng& rng) {
+    std::vector<std::uint16_t> choice = default_machine_choice(instance);
+    for (size_t i = 0; i < choice.size(); ++i) {
+        const size_t alternatives = instance.num_alternatives(i);
+        if (alternatives > 1 && rng.below(2) == 0) {
+            choice[i] = static_cast<std::uint16_t>(rng.below(alternatives));
+        }
+    }
+    return choice;
+}
+
+std::vector<std::uint16_t> assignment_crossover(
     const JobShopInstance& instance,
-    size_t population_size,
-    size_t generations,
-    size_t tournament_size,
-    double mutation_prob,
-    unsigned int seed) {
-    
-    std::mt19937 rng(get_seed(seed));
-    
-    auto population = generate_population(instance, population_size, rng());
-    
-    Solution best_overall = population[0];
-    int best_makespan = calculate_makespan(instance, best_overall);
-    
-    for (size_t gen = 0; gen < generations; ++gen) {
-        std::vector<Solution> new_population;
-        new_population.reserve(population_size);
+    const Solution& parent1,
+    const Solution& parent2,
+    Rng& rng,
+    size_t frozen_prefix) {
+
+    if (!instance.is_flexible()) return {};
+    const std::vector<std::uint16_t> defaults =
+        parent1.machine_choice.empty() || parent2.machine_choice.empty()
+            ? default_machine_choice(instance) : std::vector<std::uint16_t>();
+    const auto& choice1 = parent1.machine_choice.empty() ? defaults : parent1.machine_choice;
+    const auto& choice2 = parent2.machine_choice.empty() ? defaults : parent2.machine_choice;
+
+    std::vector<std::uint16_t> child(choice1);
+    for (size_t i = 0; i < child.size(); ++i) {
+        if (instance.num_alternatives(i) > 1 && rng.below(2) == 0) child[i] = choice2[i];
+    }
+    // Frozen operations keep parent 1's machine
+    const size_t frozen = std::min(frozen_prefix, parent1.operation_sequence.size());
+    for (size_t p = 0; p < frozen; ++p) {
+        const auto [job_id, op_id] = parent1.operation_sequence[p];
+        const size_t index = instance.op_index(job_id, op_id);
+        child[index] = choice1[index];
+    }
+    return child;
+}
+
+void mutate_assignment(const JobShopInstance& instance, Solution& solution, Rng& rng, size_t frozen_prefix) {
+    if (!instance.is_flexible()) return;
+    const size_t n = solution.operation_sequence.size();
+    if (n <= frozen_prefix) return;
+    if (solution.machine_choice.empty()) solution.machine_choice = default_machine_choice(instance);
+
+    // Random position outside the frozen prefix; operations without
+    // alternatives are skipped (a bounded number of attempts, so instances
+    // with few flexible operations cannot loop)
+    for (size_t attempt = 0; attempt < n; ++attempt) {
+        const auto [job_id, op_id] = solution.operation_sequence[frozen_prefix + rng.below(n - frozen_prefix)];
+        const size_t index = instance.op_index(job_id, op_id);
+        const size_t alternatives = instance.num_alternatives(index);
+        if (alternatives < 2) continue;
+
+        size_t next = rng.below(alternatives - 1);
+        if (next >= solution.machine_choice[index]) ++next;  // other than the current one
+        solution.machine_choice[index] = static_cast<std::uint16_t>(next);
+        solution.start_times.clear();
+        return;
+    }
+}
+
+// ===== OPERATOR NAMES =====
+
+const char* crossover_name(CrossoverKind kind) {
+    switch (kind) {
+        case CrossoverKind::OX: return "ox";
+        case CrossoverKind::JOX: return "jox";
+    }
+    return "unknown";
+}
+
+const char* mutation_name(MutationKind kind) {
+    switch (kind) {
+        case MutationKind::Swap: return "swap";
+        case MutationKind::Insert: return "insert";
+        case MutationKind::Inversion: return "inversion";
+    }
+    return "unknown";
+}
+
+CrossoverKind parse_crossover(const std::string& name) {
+    for (CrossoverKind kind : {CrossoverKind::OX, CrossoverKind::JOX}) {
+        if (name == crossover_name(kind)) return kind;
+    }
+    throw std::invalid_argument("Unknown crossover '" + name + "' (expected ox or jox)");
+}
+
+MutationKind parse_mutation(const std::string& name) {
+    for (MutationKind kind : {MutationKind::Swap, MutationKind::Insert, MutationKind::Inversion}) {
+        if (name == mutation_name(kind)) return kind;
+    }
+    throw std::invalid_argument("Unknown mutation '" + name + "' (expected swap, insert or inversion)");
+}
+
+// ===== MAIN GENETIC ALGORITHM =====
+
+namespace {
+
+/**
+ * Offspring of two parents with the crossover chosen for the run
+ */
+Solution crossover(const Solution& parent1, const Solution& parent2, Rng& rng, const GeneticParams& params) {
+    if (params.crossover == CrossoverKind::JOX) {
+        return job_order_crossover(parent1, parent2, rng, params.frozen_prefix);
+    }
+    return order_crossover(parent1, parent2, rng, params.frozen_prefix);
+}
+
+/**
+ * Mutation chosen for the run
+ */
+void mutate(Solution& solution, Rng& rng, const GeneticParams& params) {
+    switch (params.mutation) {
+        case MutationKind::Swap: mutate_swap(solution, rng, params.frozen_prefix); break;
+        case MutationKind::Insert: mutate_insert(solution, rng, params.frozen_prefix); break;
+        case MutationKind::Inversion: mutate_inversion(solution, rng, params.frozen_prefix); break;
+    }
+}
+
+/**
+ * Fitness of a whole population with the decoder chosen for the run
+ */
+void evaluate(const JobShopInstance& instance, std::vector<Solution>& population, const GeneticParams& params) {
+    evaluate_population(instance, population, params.decoder, params.decoder_delta, params.frozen_prefix);
+}
+
+/**
+ * Tournament on cached fitness (Solution::makespan), returns index.
+ * Draws the same random numbers as tournament_selection.
+ */
+size_t tournament_index(const std::vector<Solution>& population, size_t tournament_size, Rng& rng) {
+    const size_t n = population.size();
+    size_t best = rng.below(n);
+    for (size_t i = 1; i < tournament_size; ++i) {
+        size_t contender = rng.below(n);
+        if (population[contender].makespan < population[best].makespan) {
+            best = contender;
+        }
+    }
+    return best;
+}
+
+/**
+ * Random initial population with evaluated fitness
+ */
+GeneticState initial_state(const JobShopInstance& instance, const GeneticParams& params) {
+    if (params.population_size == 0) {
+        throw std::invalid_argument("Population size must be positive");
+    }
+
+    GeneticState state;
+    state.rng.reseed(resolve_seed(params.seed));
+    state.population = generate_population(instance, params.population_size, state.rng);
+
+    evaluate(instance, state.population, params);
+    size_t best_idx = 0;
+    for (size_t i = 0; i < state.population.size(); ++i) {
+        if (state.population[i].makespan < state.population[best_idx].makespan) {
+            best_idx = i;
+        }
+    }
+    state.best = state.population[best_idx];
+    return state;
+}
+
+} // namespace
+
+Solution make_offspring(const JobShopInstance& instance, const Solution& parent1, const Solution& parent2,
+                        Rng& rng, const GeneticParams& params) {
+    Solution child = crossover(parent1, parent2, rng, params);
+
+    if (rng.uniform01() < params.mutation_prob) {
+        mutate(child, rng, params);
+    }
+
+    // Second level: machine assignment (flexible instances only)
+    if (instance.is_flexible()) {
+        child.machine_choice = assignment_crossover(instance, parent1, parent2, rng, params.frozen_prefix);
+        if (rng.uniform01() < params.mutation_prob) {
+            mutate_assignment(instance, child, rng, params.frozen_prefix);
+        }
+    }
+    return child;
+}
+
+void evolve_genetic(const JobShopInstance& instance, const GeneticParams& params, GeneticState& state) {
+    std::unique_ptr<CheckpointWriter> writer;
+    if (!params.checkpoint_path.empty()) {
+        writer = std::make_unique<CheckpointWriter>(params.checkpoint_path);
+    }
+    const size_t interval = std::max<size_t>(params.checkpoint_interval, 1);
+    const int lower_bound = instance_stats(instance).lower_bound;
+
+    Rng& rng = state.rng;
+    std::vector<Solution> new_population;
+
+    while (state.generation < params.generations) {
+        const int best_before = state.best.makespan;
+        new_population.clear();
+        new_population.reserve(params.population_size);
         
         // Elitism: keep the best found so far? (Optional, usually good practice)
-        // new_population.push_back(best_overall); 
+        // new_population.push_back(state.best); 
         
-        while (new_population.size() < population_size) {
-            Solution parent1 = tournament_selection(population, instance, tournament_size, rng());
-            Solution parent2 = tournament_selection(population, instance, tournament_size, rng());
-            
-            Solution child = order_crossover(parent1, parent2, rng());
-            
-            std::uniform_real_distribution<double> prob_dist(0.0, 1.0);
-            if (prob_dist(rng) < mutation_prob) {
-                mutate_swap(child, rng());
-            }
-            
-            int child_makespan = calculate_makespan(instance, child);
-            if (child_makespan < best_makespan) {
-                best_makespan = child_makespan;
-                best_overall = child;
+        while (new_population.size() < params.population_size) {
+            const Solution& parent1 = state.population[tournament_index(state.population, params.tournament_size, rng)];
+            const Solution& parent2 = state.population[tournament_index(state.population, params.tournament_size, rng)];
+            new_population.push_back(make_offspring(instance, parent1, parent2, rng, params));
+        }
+
+        // Evaluated exactly once, the makespan stays cached in the child
+        evaluate(instance, new_population, params);
+        for (const Solution& child : new_population) {
+            if (child.makespan < state.best.makespan) {
+                state.best = child;
             }
-            
-            new_population.push_back(std::move(child));
         }
         
-        population = std::move(new_population);
+        std::swap(state.population, new_population);
+        ++state.generation;
+
+        if (params.on_progress) {
+            GenerationStats stats;
+            stats.generation = state.generation;
+            stats.best_makespan = state.best.makespan;
+            double total = 0.0;
+            for (const auto& individual : state.population) total += individual.makespan;
+            stats.mean_makespan = total / static_cast<double>(state.population.size());
+            stats.improved = state.best.makespan < best_before;
+            stats.lower_bound = lower_bound;
+            params.on_progress(stats, state.best);
+        }
+
+        const bool stop = (params.stop_at_lower_bound && state.best.makespan <= lower_bound) ||
+                          (params.should_stop && params.should_stop());
+
+        // Encoding is a cheap sequential pass; file I/O runs on the writer thread
+        if (writer && (stop || state.generation % interval == 0 || state.generation == params.generations)) {
+            writer->submit(encode_snapshot(instance, params, state));
+        }
+        if (stop) break;
     }
+}
+
+Solution run_genetic(
+    const JobShopInstance& instance,
+    size_t population_size,
+    size_t generations,
+    size_t tournament_size,
+    double mutation_prob,
+    unsigned int seed) {
     
-    return best_overall;
+    GeneticParams params;
+    params.population_size = population_size;
+    params.generations = generations;
+    params.tournament_size = tournament_size;
+    params.mutation_prob = mutation_prob;
+    params.seed = seed;
+    return run_genetic(instance, params);
+}
+
+Solution run_genetic(const JobShopInstance& instance, const GeneticParams& params) {
+    GeneticState state = initial_state(instance, params);
+    evolve_genetic(instance, params, state);
+    return state.best;
+}
+
+Solution resume_genetic(const JobShopInstance& instance, const std::string& snapshot_path) {
+    GeneticSnapshot snapshot = load_snapshot(instance, snapshot_path);
+    snapshot.params.checkpoint_path = snapshot_path;
+    evolve_genetic(instance, snapshot.params, snapshot.state);
+    return snapshot.state.best;
 }
 
-} // namespace jobshop
\ No newline at end of file
+} // namespace jobshop
@@ -0,0 +1,277 @@
+#include "jobshop/nsga2.hpp"
+#include "jobshop/instance_stats.hpp"
+#include <algorithm>
+#include <limits>
+#include <numeric>
+#include <stdexcept>
+#include <utility>
+
+namespace jobshop {
+
+// ===== OBJECTIVES =====
+
+const char* objective_name(std::size_t objective) {
+    switch (objective) {
+        case 0: return "makespan";
+        case 1: return "transport";
+        case 2: return "idle";
+    }
+    return "unknown";
+}
+
+Objectives evaluate_objectives(const JobShopInstance& instance, Solution& solution,
+                               DecoderKind decoder, double delta) {
+    // Reusable buffers (one set per thread)
+    thread_local RoutingBuffer routing_buffer;
+    thread_local std::vector<int> machine_first;
+    thread_local std::vector<int> machine_last;
+    thread_local std::vector<int> machine_load;
+    thread_local std::vector<int> job_last_finish;
+
+    const bool decoded = decoder != DecoderKind::SemiActive;
+    if (decoded) decode_schedule(instance, solution, decoder, delta);
+
+    const Routing routing = resolve_routing(instance, solution.machine_choice, routing_buffer);
+    const size_t n_ops = solution.operation_sequence.size();
+    solution.start_times.resize(n_ops);
+    machine_first.assign(instance.num_machines, std::numeric_limits<int>::max());
+    machine_last.assign(instance.num_machines, 0);
+    machine_load.assign(instance.num_machines, 0);
+    job_last_finish.assign(instance.num_jobs(), 0);
+
+    int transport = 0;
+    for (size_t i = 0; i < n_ops; ++i) {
+        const auto [job_id, op_id] = solution.operation_sequence[i];
+        const size_t index = instance.op_index(job_id, op_id);
+        const size_t machine = routing.machine[index];
+        const int transport_time = op_id > 0
+            ? instance.transport[routing.machine[index - 1] * instance.num_machines + machine]
+            : 0;
+
+        // Semi-active like calculate_makespan; other decoders have set the starts
+        int start = solution.start_times[i];
+        if (!decoded) {
+            start = std::max(machine_last[machine], job_last_finish[job_id] + transport_time);
+            solution.start_times[i] = start;
+        }
+        const int finish = start + routing.time[index];
+
+        machine_first[machine] = std::min(machine_first[machine], start);
+        machine_last[machine] = std::max(machine_last[machine], finish);
+        machine_load[machine] += routing.time[index];
+        job_last_finish[job_id] = finish;
+        transport += transport_time;
+    }
+
+    int makespan = 0;
+    int idle = 0;
+    for (size_t m = 0; m < instance.num_machines; ++m) {
+        makespan = std::max(makespan, machine_last[m]);
+        if (machine_load[m] > 0) idle += machine_last[m] - machine_first[m] - machine_load[m];
+    }
+    solution.makespan = makespan;
+    return {makespan, transport, idle};
+}
+
+bool dominates(const Objectives& a, const Objectives& b) {
+    bool better = false;
+    for (size_t k = 0; k < NUM_OBJECTIVES; ++k) {
+        if (a[k] > b[k]) return false;
+        better = better || a[k] < b[k];
+    }
+    return better;
+}
+
+// ===== NON-DOMINATED SORTING =====
+
+std::vector<std::vector<std::size_t>> non_dominated_sort(const std::vector<Objectives>& points) {
+    std::vector<std::size_t> order(points.size());
+    std::iota(order.begin(), order.end(), 0);
+    std::sort(order.begin(), order.end(), [&points](size_t a, size_t b) {
+        return points[a] != points[b] ? points[a] < points[b] : a < b;
+    });
+
+    // Front members in insertion order; the newest are lexicographically
+    // closest, so they dominate most often - checked from the back
+    std::vector<std::vector<std::size_t>> fronts;
+    auto dominated_by = [&](const std::vector<std::size_t>& front, size_t point) {
+        for (auto it = front.rbegin(); it != front.rend(); ++it) {
+            if (dominates(points[*it], points[point])) return true;
+        }
+        return false;
+    };
+    for (const size_t point : order) {
+        size_t low = 0;
+        size_t high = fronts.size();
+        while (low < high) {
+            const size_t mid = low + (high - low) / 2;
+            if (dominated_by(fronts[mid], point)) low = mid + 1;
+            else high = mid;
+        }
+        if (low == fronts.size()) fronts.emplace_back();
+        fronts[low].push_back(point);
+    }
+    return fronts;
+}
+
+std::vector<double> crowding_distance(const std::vector<Objectives>& points,
+                                      const std::vector<std::size_t>& front) {
+    const size_t n = front.size();
+    std::vector<double> distance(n, 0.0);
+    if (n <= 2) {
+        std::fill(distance.begin(), distance.end(), std::numeric_limits<double>::infinity());
+        return distance;
+    }
+    std::vector<size_t> order(n);
+    for (size_t k = 0; k < NUM_OBJECTIVES; ++k) {
+        std::iota(order.begin(), order.end(), 0);
+        std::sort(order.begin(), order.end(), [&](size_t a, size_t b) {
+            return points[front[a]][k] < points[front[b]][k];
+        });
+        const int low = points[front[order.front()]][k];
+        const int high = points[front[order.back()]][k];
+        distance[order.front()] = distance[order.back()] = std::numeric_limits<double>::infinity();
+        if (high == low) continue;  // e.g. constant transport - the objective adds nothing
+        const double range = static_cast<double>(high - low);
+        for (size_t i = 1; i + 1 < n; ++i) {
+            distance[order[i]] += (points[front[order[i + 1]]][k] - points[front[order[i - 1]]][k]) / range;
+        }
+    }
+    return distance;
+}
+
+// ===== NSGA-II =====
+
+namespace {
+
+/**
+ * Population with its objectives, front index and crowding distance
+ */
+struct Population {
+    std::vector<Solution> solutions;
+    std::vector<Objectives> objectives;
+    std::vector<std::size_t> rank;
+    std::vector<double> crowding;
+};
+
+/**
+ * Crowded-comparison tournament among the ranked members (the children
+ * appended during a generation are not ranked yet), returns index
+ */
+size_t crowded_tournament(const Population& population, size_t tournament_size, Rng& rng) {
+    const size_t n = population.rank.size();
+    size_t best = rng.below(n);
+    for (size_t i = 1; i < tournament_size; ++i) {
+        const size_t contender = rng.below(n);
+        if (population.rank[contender] < population.rank[best] ||
+            (population.rank[contender] == population.rank[best] &&
+             population.crowding[contender] > population.crowding[best])) {
+            best = contender;
+        }
+    }
+    return best;
+}
+
+/**
+ * Keep the best `size` of population (whole fronts, the last one cut by
+ * crowding distance); ranks and distances are those of the merged set
+ */
+void select_survivors(Population& population, size_t size) {
+    const auto fronts = non_dominated_sort(population.objectives);
+    Population next;
+    next.solutions.reserve(size);
+    auto take = [&](size_t i, size_t rank, double crowding) {
+        next.solutions.push_back(std::move(population.solutions[i]));
+        next.objectives.push_back(population.objectives[i]);
+        next.rank.push_back(rank);
+        next.crowding.push_back(crowding);
+    };
+    for (size_t r = 0; r < fronts.size() && next.solutions.size() < size; ++r) {
+        const auto& front = fronts[r];
+        const std::vector<double> distance = crowding_distance(population.objectives, front);
+        std::vector<size_t> members(front.size());
+        std::iota(members.begin(), members.end(), 0);
+        const size_t room = size - next.solutions.size();
+        if (front.size() > room) {
+            std::partial_sort(members.begin(), members.begin() + static_cast<std::ptrdiff_t>(room), members.end(),
+                              [&distance](size_t a, size_t b) { return distance[a] > distance[b]; });
+            members.resize(room);
+        }
+        for (const size_t m : members) take(front[m], r, distance[m]);
+    }
+    population = std::move(next);
+}
+
+} // namespace
+
+ParetoFront run_nsga2(const JobShopInstance& instance, const GeneticParams& params) {
+    if (params.population_size == 0) {
+        throw std::invalid_argument("Population size must be positive");
+    }
+    const size_t size = params.population_size;
+    const int lower_bound = instance_stats(instance).lower_bound;
+    Rng rng(resolve_seed(params.seed));
+
+    Population population;
+    population.solutions = generate_population(instance, size, rng);
+    for (auto& solution : population.solutions) {
+        population.objectives.push_back(evaluate_objectives(instance, solution, params.decoder, params.decoder_delta));
+    }
+    select_survivors(population, size);
+
+    Solution best = *std::min_element(population.solutions.begin(), population.solutions.end(),
+                                      [](const Solution& a, const Solution& b) { return a.makespan < b.makespan; });
+
+    size_t generation = 0;
+    while (generation < params.generations) {
+        const int best_before = best.makespan;
+
+        // Children are appended after the parents: selection picks from the union
+        population.solutions.reserve(2 * size);
+        for (size_t i = 0; i < size; ++i) {
+            const Solution& parent1 = population.solutions[crowded_tournament(population, params.tournament_size, rng)];
+            const Solution& parent2 = population.solutions[crowded_tournament(population, params.tournament_size, rng)];
+            Solution child = make_offspring(instance, parent1, parent2, rng, params);
+            population.objectives.push_back(evaluate_objectives(instance, child, params.decoder, params.decoder_delta));
+            if (child.makespan < best.makespan) best = child;
+            population.solutions.push_back(std::move(child));
+        }
+        select_survivors(population, size);
+        ++generation;
+
+        if (params.on_progress) {
+            GenerationStats stats;
+            stats.generation = generation;
+            stats.best_makespan = best.makespan;
+            double total = 0.0;
+            for (const auto& objectives : population.objectives) total += objectives[0];
+            stats.mean_makespan = total / static_cast<double>(size);
+            stats.improved = best.makespan < best_before;
+            stats.lower_bound = lower_bound;
+            params.on_progress(stats, best);
+        }
+        if (params.should_stop && params.should_stop()) break;
+    }
+
+    // First front, one solution per objective vector
+    std::vector<size_t> first;
+    for (size_t i = 0; i < population.solutions.size(); ++i) {
+        if (population.rank[i] == 0) first.push_back(i);
+    }
+    std::sort(first.begin(), first.end(), [&population](size_t a, size_t b) {
+        return population.objectives[a] < population.objectives[b];
+    });
+    first.erase(std::unique(first.begin(), first.end(), [&population](size_t a, size_t b) {
+        return population.objectives[a] == population.objectives[b];
+    }), first.end());
+
+    ParetoFront front;
+    front.generations = generation;
+    for (const size_t i : first) {
+        front.solutions.push_back(std::move(population.solutions[i]));
+        front.objectives.push_back(population.objectives[i]);
+    }
+    return front;
+}
+
+} // namespace jobshop
@@ -0,0 +1,123 @@
+#include "jobshop/genetic.hpp"
+#include <fstream>
+#include <sstream>
+#include <stdexcept>
+
+namespace jobshop {
+
+namespace {
+
+std::string trim(const std::string& str) {
+    size_t first = str.find_first_not_of(" \t\r\n");
+    if (first == std::string::npos) return "";
+    size_t last = str.find_last_not_of(" \t\r\n");
+    return str.substr(first, last - first + 1);
+}
+
+/**
+ * Whole-string numeric parse (std::stoul alone accepts "12abc")
+ */
+template <typename Parse>
+auto parse_number(const std::string& key, const std::string& value, Parse parse) {
+    size_t used = 0;
+    try {
+        auto result = parse(value, &used);
+        if (used == value.size()) return result;
+    } catch (const std::exception&) {
+    }
+    throw std::invalid_argument("Profile: invalid value '" + value + "' for " + key);
+}
+
+size_t parse_count(const std::string& key, const std::string& value) {
+    if (!value.empty() && value[0] == '-') {
+        throw std::invalid_argument("Profile: " + key + " must not be negative");
+    }
+    return static_cast<size_t>(parse_number(key, value, [](const std::string& v, size_t* used) {
+        return std::stoull(v, used);
+    }));
+}
+
+double parse_probability(const std::string& key, const std::string& value) {
+    double result = parse_number(key, value, [](const std::string& v, size_t* used) {
+        return std::stod(v, used);
+    });
+    if (result < 0.0 || result > 1.0) {
+        throw std::invalid_argument("Profile: " + key + " must be between 0.0 and 1.0");
+    }
+    return result;
+}
+
+} // namespace
+
+GeneticParams load_genetic_profile(const std::string& path, const GeneticParams& defaults) {
+    std::ifstream in(path);
+    if (!in) {
+        throw std::runtime_error("Cannot open profile: " + path);
+    }
+
+    GeneticParams params = defaults;
+    std::string line;
+    size_t line_number = 0;
+    while (std::getline(in, line)) {
+        ++line_number;
+        line = trim(line.substr(0, line.find('#')));
+        if (line.empty()) continue;
+
+        size_t eq = line.find('=');
+        if (eq == std::string::npos) {
+            throw std::invalid_argument("Profile line " + std::to_string(line_number) + ": expected key = value");
+        }
+        const std::string key = trim(line.substr(0, eq));
+        const std::string value = trim(line.substr(eq + 1));
+
+        if (key == "population_size") {
+            params.population_size = parse_count(key, value);
+        } else if (key == "generations") {
+            params.generations = parse_count(key, value);
+        } else if (key == "tournament_size") {
+            params.tournament_size = parse_count(key, value);
+        } else if (key == "mutation_prob") {
+            params.mutation_prob = parse_probability(key, value);
+        } else if (key == "crossover") {
+            params.crossover = parse_crossover(value);
+        } else if (key == "mutation") {
+            params.mutation = parse_mutation(value);
+        } else if (key == "decoder") {
+            params.decoder = parse_decoder(value);
+        } else if (key == "decoder_delta") {
+            params.decoder_delta = parse_probability(key, value);
+        } else {
+            throw std::invalid_argument("Profile line " + std::to_string(line_number) + ": unknown key '" + key + "'");
+        }
+    }
+
+    if (params.population_size == 0 || params.tournament_size == 0) {
+        throw std::invalid_argument("Profile: population_size and tournament_size must be positive");
+    }
+    return params;
+}
+
+void save_genetic_profile(const std::string& path, const GeneticParams& params, const std::string& comment) {
+    std::ofstream out(path);
+    if (!out) {
+        throw std::runtime_error("Cannot write profile: " + path);
+    }
+
+    std::istringstream comment_lines(comment);
+    std::string line;
+    while (std::getline(comment_lines, line)) out << "# " << line << "\n";
+
+    out << "population_size = " << params.population_size << "\n"
+        << "generations = " << params.generations << "\n"
+        << "tournament_size = " << params.tournament_size << "\n"
+        << "mutation_prob = " << params.mutation_prob << "\n"
+        << "crossover = " << crossover_name(params.crossover) << "\n"
+        << "mutation = " << mutation_name(params.mutation) << "\n"
+        << "decoder = " << decoder_name(params.decoder) << "\n"
+        << "decoder_delta = " << params.decoder_delta << "\n";
+    if (!out) {
+        throw std::runtime_error("Cannot write profile: " + path);
+    }
+}
+
+} // namespace jobshop
@@ -0,0 +1,168 @@
+#include "jobshop/genetic.hpp"
+#include <stdexcept>
+#include <string>
+
+namespace jobshop {
+
+namespace {
+
+/**
+ * Count frozen operations per job, checking that they are route prefixes
+ */
+std::vector<size_t> frozen_counts(const JobShopInstance& instance,
+                                  const std::vector<std::pair<size_t, size_t>>& frozen) {
+    std::vector<size_t> counts(instance.num_jobs(), 0);
+    for (const auto& [job_id, op_id] : frozen) {
+        if (!instance.has_operation(job_id, op_id)) {
+            throw std::invalid_argument("Frozen operation (" + std::to_string(job_id) + ", " +
+                                        std::to_string(op_id) + ") does not exist in the instance");
+        }
+        if (op_id != counts[job_id]) {
+            throw std::invalid_argument("Frozen operations of job " + std::to_string(job_id) +
+                                        " must be 0, 1, ..., k-1 in route order");
+        }
+        counts[job_id]++;
+    }
+    return counts;
+}
+
+/**
+ * Machine assignment of a previous solution mapped onto the edited
+ * instance. The previous solution lists every operation of its instance
+ * once, so counting its jobs gives the old route lengths (and offsets).
+ * Operations that are new or whose alternative no longer exists get the
+ * default machine.
+ */
+std::vector<std::uint16_t> carry_over_assignment(const JobShopInstance& instance, const Solution& previous) {
+    std::vector<std::uint16_t> choice = default_machine_choice(instance);
+    if (choice.empty() || previous.machine_choice.size() != previous.operation_sequence.size()) return choice;
+
+    std::vector<size_t> old_count;
+    for (const auto& op : previous.operation_sequence) {
+        if (op.first >= old_count.size()) old_count.resize(op.first + 1, 0);
+        old_count[op.first]++;
+    }
+    size_t old_offset = 0;
+    for (size_t j = 0; j < old_count.size(); ++j) {
+        if (j < instance.num_jobs()) {
+            for (size_t k = 0; k < std::min(old_count[j], instance.num_ops(j)); ++k) {
+                const size_t index = instance.op_index(j, k);
+                const std::uint16_t old_choice = previous.machine_choice[old_offset + k];
+                if (old_choice < instance.num_alternatives(index)) choice[index] = old_choice;
+            }
+        }
+        old_offset += old_count[j];
+    }
+    return choice;
+}
+
+} // namespace
+
+// ===== REPAIR =====
+
+Solution repair_solution(
+    const JobShopInstance& instance,
+    const Solution& previous,
+    const std::vector<std::pair<size_t, size_t>>& frozen,
+    Rng& rng) {
+    
+    const size_t num_jobs = instance.num_jobs();
+    const std::vector<size_t> frozen_per_job = frozen_counts(instance, frozen);
+    std::vector<size_t> placed = frozen_per_job;
+    
+    const size_t total_ops = instance.num_operations();
+    
+    // 1. Frozen prefix, in the given order
+    std::vector<size_t> genes;
+    genes.reserve(total_ops);
+    for (const auto& op : frozen) genes.push_back(op.first);
+    const size_t prefix = genes.size();
+    
+    // 2. Previous plan: k-th occurrence of a job is its k-th operation
+    std::vector<size_t> seen(num_jobs, 0);
+    for (const auto& op : previous.operation_sequence) {
+        size_t job_id = op.first;
+        if (job_id >= num_jobs) continue;                 // job was removed
+        size_t k = seen[job_id]++;
+        if (k < frozen_per_job[job_id]) continue;         // already in the frozen prefix
+        if (placed[job_id] >= instance.num_ops(job_id)) continue; // route got shorter
+        genes.push_back(job_id);
+        placed[job_id]++;
+    }
+    
+    // 3. New operations at random positions after the frozen prefix
+    for (size_t j = 0; j < num_jobs; ++j) {
+        for (size_t k = placed[j]; k < instance.num_ops(j); ++k) {
+            size_t pos = prefix + rng.below(genes.size() - prefix + 1);
+            genes.insert(genes.begin() + static_cast<std::ptrdiff_t>(pos), j);
+        }
+    }
+    
+    Solution repaired = genes_to_solution(genes);
+    repaired.machine_choice = carry_over_assignment(instance, previous);
+    return repaired;
+}
+
+// ===== WARM-START RE-OPTIMIZATION =====
+
+Solution reoptimize_genetic(
+    const JobShopInstance& instance,
+    const std::vector<Solution>& previous,
+    const std::vector<std::pair<size_t, size_t>>& frozen,
+    const GeneticParams& params) {
+    
+    if (params.population_size == 0) {
+        throw std::invalid_argument("Population size must be positive");
+    }
+    
+    GeneticParams run_params = params;
+    run_params.frozen_prefix = frozen.size();
+    
+    GeneticState state;
+    state.rng.reseed(resolve_seed(params.seed));
+    Rng& rng = state.rng;
+    
+    const size_t pop_size = params.population_size;
+    auto& population = state.population;
+    population.reserve(pop_size);
+    
+    // 1. Repaired previous solutions (at most half of the population)
+    const size_t seed_limit = std::max<size_t>(pop_size / 2, 1);
+    for (const auto& sol : previous) {
+        if (population.size() >= seed_limit) break;
+        population.push_back(repair_solution(instance, sol, frozen, rng));
+    }
+    const size_t num_seeds = population.size();
+    
+    // 2. Mutated copies of the seeds (up to three quarters)
+    const size_t mutant_limit = num_seeds > 0 ? (pop_size * 3) / 4 : 0;
+    for (size_t i = 0; population.size() < mutant_limit; ++i) {
+        Solution mutant = population[i % num_seeds];
+        size_t swaps = 1 + rng.below(3);
+        for (size_t s = 0; s < swaps; ++s) mutate_swap(mutant, rng, run_params.frozen_prefix);
+        population.push_back(std::move(mutant));
+    }
+    
+    // 3. Random suffixes for diversity
+    Solution base = repair_solution(instance, Solution(), frozen, rng);
+    if (num_seeds > 0) base.machine_choice = population[0].machine_choice;  // frozen operations keep their machines
+    while (population.size() < pop_size) {
+        std::vector<size_t> genes = solution_to_genes(base);
+        shuffle(genes.begin() + static_cast<std::ptrdiff_t>(run_params.frozen_prefix), genes.end(), rng);
+        population.push_back(genes_to_solution(genes));
+        population.back().machine_choice = base.machine_choice;
+    }
+    
+    evaluate_population(instance, population, run_params.decoder, run_params.decoder_delta,
+                        run_params.frozen_prefix);
+    size_t best_idx = 0;
+    for (size_t i = 0; i < population.size(); ++i) {
+        if (population[i].makespan < population[best_idx].makespan) best_idx = i;
+    }
+    state.best = population[best_idx];
+    
+    evolve_genetic(instance, run_params, state);
+    return state.best;
+}
+
+} // namespace jobshop
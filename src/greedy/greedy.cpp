@@ -2,70 +2,84 @@
 #include <limits>
 #include <vector>
 #include <tuple>
+#include <algorithm>
+#include <stdexcept>
 
 namespace jobshop {
 
 Solution greedy_schedule(const JobShopInstance& instance) {
     Solution solution;
-    size_t num_jobs = instance.jobs.size();
+    size_t num_jobs = instance.num_jobs();
     size_t num_machines = instance.num_machines;
 
     // Liczba wszystkich operacji
-    size_t total_ops = 0;
-    for (const auto& job : instance.jobs) total_ops += job.operations.size();
+    size_t total_ops = instance.num_operations();
 
     // Indeksy następnej operacji dla każdego zadania
     std::vector<size_t> next_op(num_jobs, 0);
 
     // Czas, kiedy maszyna będzie wolna
     std::vector<int> machine_available(num_machines, 0);
-    // Czas zakończenia ostatniej operacji w zadaniu
+    // Finish time of the job's last operation and its machine
     std::vector<int> job_finish_time(num_jobs, 0);
+    std::vector<size_t> job_machine(num_jobs, 0);
+    // Flexible instance: the chosen alternative of every operation
+    solution.machine_choice.assign(instance.is_flexible() ? total_ops : 0, 0);
 
     while (solution.operation_sequence.size() < total_ops) {
         int best_start_time = std::numeric_limits<int>::max();
         size_t best_job = -1;
         size_t best_machine = -1;
         int best_proc_time = std::numeric_limits<int>::max();
+        size_t best_alternative = 0;
 
         // Szukamy operacji, która może wystartować najwcześniej
         for (size_t j = 0; j < num_jobs; ++j) {
             size_t op_idx = next_op[j];
-            if (op_idx >= instance.jobs[j].operations.size()) continue;
-
-            const Operation& op = instance.jobs[j].operations[op_idx];
-
-            // Transport z poprzedniej maszyny (jeśli nie pierwsza operacja)
-            int transport_time = 0;
-            if (op_idx > 0) {
-                size_t prev_mach = instance.jobs[j].operations[op_idx - 1].machine_id;
-                size_t curr_mach = op.machine_id;
-                transport_time = instance.transport_times[prev_mach][curr_mach];
-            }
-
-            // Najwcześniejszy możliwy start
-            int start_time = std::max(machine_available[op.machine_id],
-                                      job_finish_time[j] + transport_time);
-
-            // Wybór zachłanny: najwcześniejszy start, a przy remisie – najkrótszy czas
-            if (start_time < best_start_time ||
-                (start_time == best_start_time && op.processing_time < best_proc_time)) {
-                best_start_time = start_time;
-                best_job = j;
-                best_machine = op.machine_id;
-                best_proc_time = op.processing_time;
+            if (op_idx >= instance.num_ops(j)) continue;
+
+            const size_t index = instance.op_index(j, op_idx);
+            const size_t prev_machine = op_idx > 0 ? job_machine[j] : 0;
+
+            // Every alternative of the operation (one without alternatives)
+            const size_t alternatives = instance.num_alternatives(index);
+            for (size_t a = 0; a < alternatives; ++a) {
+                const size_t machine = instance.is_flexible()
+                    ? instance.alt_machine[instance.alt_offset[index] + a] : instance.op_machine[index];
+                const int proc_time = instance.is_flexible()
+                    ? instance.alt_time[instance.alt_offset[index] + a] : instance.op_time[index];
+
+                // Transport from the previous machine (unless it is the first operation)
+                int transport_time = op_idx > 0 ? instance.transport_time(prev_machine, machine) : 0;
+
+                // Earliest possible start
+                int start_time = std::max(machine_available[machine],
+                                          job_finish_time[j] + transport_time);
+
+                // Greedy choice: earliest start, on a tie the shortest time
+                if (start_time < best_start_time ||
+                    (start_time == best_start_time && proc_time < best_proc_time)) {
+                    best_start_time = start_time;
+                    best_job = j;
+                    best_machine = machine;
+                    best_proc_time = proc_time;
+                    best_alternative = a;
+                }
             }
         }
 
         // Dodajemy wybraną operację do sekwencji
         size_t op_id = next_op[best_job];
-        const Operation& op = instance.jobs[best_job].operations[op_id];
         solution.operation_sequence.emplace_back(best_job, op_id);
         solution.start_times.push_back(best_start_time);
 
-        int finish_time = best_start_time + op.processing_time;
+        int finish_time = best_start_time + best_proc_time;
         machine_available[best_machine] = finish_time;
         job_finish_time[best_job] = finish_time;
+        job_machine[best_job] = best_machine;
+        if (instance.is_flexible()) {
+            solution.machine_choice[instance.op_index(best_job, op_id)] = static_cast<std::uint16_t>(best_alternative);
+        }
 
         next_op[best_job]++; // Przechodzimy do kolejnej operacji w zadaniu
     }
@@ -75,5 +89,109 @@ Solution greedy_schedule(const JobShopInstance& instance) {
     return solution;
 }
 
-} // namespace jobshop
+// ===== DISPATCH RULES =====
+
+const char* dispatch_rule_name(DispatchRule rule) {
+    switch (rule) {
+        case DispatchRule::SPT: return "spt";
+        case DispatchRule::LPT: return "lpt";
+        case DispatchRule::MWKR: return "mwkr";
+        case DispatchRule::LWKR: return "lwkr";
+        case DispatchRule::MOPNR: return "mopnr";
+        case DispatchRule::FIFO: return "fifo";
+    }
+    return "unknown";
+}
+
+DispatchRule parse_dispatch_rule(const std::string& name) {
+    for (DispatchRule rule : {DispatchRule::SPT, DispatchRule::LPT, DispatchRule::MWKR,
+                              DispatchRule::LWKR, DispatchRule::MOPNR, DispatchRule::FIFO}) {
+        if (name == dispatch_rule_name(rule)) return rule;
+    }
+    throw std::invalid_argument("Unknown dispatch rule '" + name +
+                                "' (expected spt, lpt, mwkr, lwkr, mopnr or fifo)");
+}
+
+Solution dispatch_schedule(const JobShopInstance& instance, DispatchRule rule) {
+    Solution solution;
+    const size_t num_jobs = instance.num_jobs();
+    const size_t total_ops = instance.num_operations();
+    solution.operation_sequence.reserve(total_ops);
+    solution.start_times.reserve(total_ops);
+
+    std::vector<size_t> next_op(num_jobs, 0);
+    std::vector<int> machine_available(instance.num_machines, 0);
+    std::vector<int> job_finish_time(num_jobs, 0);
+    // Remaining work of the job (sum of its unscheduled operation times)
+    std::vector<int> work_remaining(num_jobs, 0);
+    for (size_t j = 0; j < num_jobs; ++j) {
+        for (size_t k = 0; k < instance.num_ops(j); ++k) work_remaining[j] += instance.processing_time(j, k);
+    }
 
+    std::vector<int> est(num_jobs, 0);
+    auto earliest_start = [&](size_t j) {
+        const size_t op_idx = next_op[j];
+        return std::max(machine_available[instance.machine(j, op_idx)],
+                        job_finish_time[j] + instance.transport_before(j, op_idx));
+    };
+
+    // Larger value = higher priority
+    auto priority = [&](size_t j) -> long long {
+        const int processing_time = instance.processing_time(j, next_op[j]);
+        switch (rule) {
+            case DispatchRule::SPT: return -processing_time;
+            case DispatchRule::LPT: return processing_time;
+            case DispatchRule::MWKR: return work_remaining[j];
+            case DispatchRule::LWKR: return -work_remaining[j];
+            case DispatchRule::MOPNR:
+                return static_cast<long long>(instance.num_ops(j) - next_op[j]);
+            case DispatchRule::FIFO: return -job_finish_time[j];
+        }
+        return 0;
+    };
+
+    while (solution.operation_sequence.size() < total_ops) {
+        // Earliest possible start t* and its machine
+        int earliest = std::numeric_limits<int>::max();
+        size_t machine = 0;
+        for (size_t j = 0; j < num_jobs; ++j) {
+            if (next_op[j] >= instance.num_ops(j)) continue;
+            est[j] = earliest_start(j);
+            if (est[j] < earliest) {
+                earliest = est[j];
+                machine = instance.machine(j, next_op[j]);
+            }
+        }
+
+        // Conflict set: operations on this machine that can start at t*
+        size_t chosen = num_jobs;
+        long long chosen_priority = 0;
+        for (size_t j = 0; j < num_jobs; ++j) {
+            if (next_op[j] >= instance.num_ops(j) ||
+                instance.machine(j, next_op[j]) != machine || est[j] != earliest) {
+                continue;
+            }
+            long long p = priority(j);
+            if (chosen == num_jobs || p > chosen_priority) {
+                chosen = j;
+                chosen_priority = p;
+            }
+        }
+
+        const size_t op_id = next_op[chosen];
+        const int processing_time = instance.processing_time(chosen, op_id);
+        const int finish_time = est[chosen] + processing_time;
+        solution.operation_sequence.emplace_back(chosen, op_id);
+        solution.start_times.push_back(est[chosen]);
+        solution.makespan = std::max(solution.makespan, finish_time);
+
+        machine_available[machine] = finish_time;
+        job_finish_time[chosen] = finish_time;
+        work_remaining[chosen] -= processing_time;
+        next_op[chosen]++;
+    }
+
+    return solution;
+}
+
+} // namespace jobshop
@@ -1,7 +1,9 @@
 #include "jobshop/file_io.hpp"
+#include "jobshop/instance_stats.hpp"
 #include <algorithm>
 #include <cctype>
 #include <iostream>
+#include <limits>
 
 namespace jobshop {
 
@@ -36,6 +38,35 @@ static std::vector<std::string> split_by_delimiter(const std::string& line, char
     return result;
 }
 
+/**
+ * Parse "a" or "a/b/c" (alternatives of a flexible operation)
+ */
+template <typename T, typename Parse>
+static std::vector<T> parse_alternatives(const std::string& token, Parse parse) {
+    std::vector<T> values;
+    std::stringstream ss(token);
+    std::string item;
+    while (std::getline(ss, item, '/')) {
+        values.push_back(parse(trim(item)));
+    }
+    if (values.empty()) {
+        throw std::runtime_error("Empty value");
+    }
+    return values;
+}
+
+/**
+ * Machine listed more than once among the alternatives of one operation,
+ * or -1 (DATA_FORMAT.md: each machine at most once)
+ */
+template <typename It>
+static long duplicate_machine(It first, It last) {
+    for (It a = first; a != last; ++a) {
+        if (std::find(first, a, *a) != a) return static_cast<long>(*a);
+    }
+    return -1;
+}
+
 /**
  * Check if line is comment or empty
  */
@@ -88,14 +119,19 @@ JobShopInstance parse_txt_format(std::ifstream& file) {
         throw std::runtime_error("Error: n_jobs and n_machines must be positive");
     }
 
+    if (n_machines > std::numeric_limits<std::uint16_t>::max()) {
+        throw std::runtime_error("Error: too many machines");
+    }
+
     JobShopInstance instance;
     instance.num_machines = n_machines;
-    instance.jobs.resize(n_jobs);
+    std::vector<Job> jobs(n_jobs);
 
     // ===== MACHINE SEQUENCES =====
+    // Route length = number of entries; "a/b/c" = operation may run on a, b or c
+    std::vector<std::vector<std::vector<size_t>>> routes(n_jobs);
     for (size_t j = 0; j < n_jobs; ++j) {
-        instance.jobs[j].job_id = j;
-        instance.jobs[j].operations.resize(n_machines);
+        jobs[j].job_id = j;
 
         // Skip comments and empty lines
         while (std::getline(file, line)) {
@@ -104,25 +140,31 @@ JobShopInstance parse_txt_format(std::ifstream& file) {
         }
 
         auto machines = split_by_delimiter(line, ' ');
-        if (machines.size() < n_machines) {
+        if (machines.empty()) {
             throw std::runtime_error("Line " + std::to_string(line_num) +
-                ": Job " + std::to_string(j) + " - not enough machine IDs");
+                ": Job " + std::to_string(j) + " - empty route");
         }
 
-        for (size_t op = 0; op < n_machines; ++op) {
+        for (size_t op = 0; op < machines.size(); ++op) {
             try {
-                size_t machine_id = std::stoul(machines[op]);
-                if (machine_id >= n_machines) {
-                    throw std::runtime_error("Invalid machine ID");
-                }
-                instance.jobs[j].operations[op].machine_id = machine_id;
-                instance.jobs[j].operations[op].job_id = j; // TODO: do usuniecia
-                instance.jobs[j].operations[op].operation_id = op;
+                routes[j].push_back(parse_alternatives<size_t>(machines[op], [n_machines](const std::string& v) {
+                    size_t machine_id = std::stoul(v);
+                    if (machine_id >= n_machines) {
+                        throw std::runtime_error("Invalid machine ID");
+                    }
+                    return machine_id;
+                }));
             } catch (const std::exception&) {
                 throw std::runtime_error("Line " + std::to_string(line_num) +
                     ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
                     " - invalid machine ID");
             }
+            const long duplicate = duplicate_machine(routes[j].back().begin(), routes[j].back().end());
+            if (duplicate >= 0) {
+                throw std::runtime_error("Line " + std::to_string(line_num) +
+                    ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
+                    " - machine " + std::to_string(duplicate) + " listed twice among the alternatives");
+            }
         }
     }
 
@@ -134,28 +176,50 @@ JobShopInstance parse_txt_format(std::ifstream& file) {
         }
 
         auto times = split_by_delimiter(line, ' ');
-        if (times.size() < n_machines) {
+        if (times.size() < routes[j].size()) {
             throw std::runtime_error("Line " + std::to_string(line_num) +
                 ": Job " + std::to_string(j) + " - not enough processing times");
         }
+        if (times.size() > routes[j].size()) {
+            throw std::runtime_error("Line " + std::to_string(line_num) +
+                ": Job " + std::to_string(j) + " - " + std::to_string(times.size()) +
+                " processing times for a route of " + std::to_string(routes[j].size()) + " operations");
+        }
 
-        for (size_t op = 0; op < n_machines; ++op) {
+        for (size_t op = 0; op < routes[j].size(); ++op) {
+            std::vector<int> proc_times;
             try {
-                int proc_time = std::stoi(times[op]);
-                if (proc_time <= 0) {
-                    throw std::runtime_error("Processing time must be positive");
-                }
-                instance.jobs[j].operations[op].processing_time = proc_time;
+                proc_times = parse_alternatives<int>(times[op], [](const std::string& v) {
+                    int proc_time = std::stoi(v);
+                    if (proc_time <= 0) {
+                        throw std::runtime_error("Processing time must be positive");
+                    }
+                    return proc_time;
+                });
             } catch (const std::exception&) {
                 throw std::runtime_error("Line " + std::to_string(line_num) +
                     ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
                     " - invalid processing time");
             }
+            if (proc_times.size() != routes[j][op].size()) {
+                throw std::runtime_error("Line " + std::to_string(line_num) +
+                    ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
+                    " - expected one processing time per machine alternative");
+            }
+
+            Operation operation{op, routes[j][op][0], proc_times[0], {}};
+            if (proc_times.size() > 1) {
+                for (size_t a = 0; a < proc_times.size(); ++a) {
+                    operation.alternatives.emplace_back(routes[j][op][a], proc_times[a]);
+                }
+            }
+            jobs[j].operations.push_back(std::move(operation));
         }
     }
+    set_jobs(instance, jobs);
 
     // ===== TRANSPORT TIMES MATRIX =====
-    instance.transport_times.resize(n_machines, std::vector<int>(n_machines, 0));
+    instance.transport.assign(n_machines * n_machines, 0);
     for (size_t i = 0; i < n_machines; ++i) {
         while (std::getline(file, line)) {
             line_num++;
@@ -174,7 +238,7 @@ JobShopInstance parse_txt_format(std::ifstream& file) {
                 if (transport_time < 0) {
                     throw std::runtime_error("Transport time cannot be negative");
                 }
-                instance.transport_times[i][k] = transport_time;
+                instance.transport[i * n_machines + k] = transport_time;
             } catch (const std::exception&) {
                 throw std::runtime_error("Line " + std::to_string(line_num) +
                     ": Transport time from M" + std::to_string(i) + " to M" +
@@ -218,38 +282,51 @@ JobShopInstance parse_csv_format(std::ifstream& file) {
         throw std::runtime_error("Error: n_jobs and n_machines must be positive");
     }
 
+    if (n_machines > std::numeric_limits<std::uint16_t>::max()) {
+        throw std::runtime_error("Error: too many machines");
+    }
+
     JobShopInstance instance;
     instance.num_machines = n_machines;
-    instance.jobs.resize(n_jobs);
+    std::vector<Job> jobs(n_jobs);
 
     // ===== MACHINE SEQUENCES =====
+    // Route length = number of entries; "a/b/c" = operation may run on a, b or c
+    std::vector<std::vector<std::vector<size_t>>> routes(n_jobs);
     for (size_t j = 0; j < n_jobs; ++j) {
-        instance.jobs[j].job_id = j;
-        instance.jobs[j].operations.resize(n_machines);
+        jobs[j].job_id = j;
 
+        // Skip comments and empty lines
         while (std::getline(file, line)) {
             line_num++;
             if (!is_comment_line(line)) break;
         }
 
         auto machines = split_by_delimiter(line, ',');
-        if (machines.size() < n_machines) {
+        if (machines.empty()) {
             throw std::runtime_error("CSV Line " + std::to_string(line_num) +
-                ": Not enough machine IDs for job " + std::to_string(j));
+                ": Job " + std::to_string(j) + " - empty route");
         }
 
-        for (size_t op = 0; op < n_machines; ++op) {
+        for (size_t op = 0; op < machines.size(); ++op) {
             try {
-                size_t machine_id = std::stoul(machines[op]);
-                if (machine_id >= n_machines) {
-                    throw std::runtime_error("Invalid machine ID");
-                }
-                instance.jobs[j].operations[op].machine_id = machine_id;
-                instance.jobs[j].operations[op].job_id = j;
-                instance.jobs[j].operations[op].operation_id = op;
+                routes[j].push_back(parse_alternatives<size_t>(machines[op], [n_machines](const std::string& v) {
+                    size_t machine_id = std::stoul(v);
+                    if (machine_id >= n_machines) {
+                        throw std::runtime_error("Invalid machine ID");
+                    }
+                    return machine_id;
+                }));
             } catch (const std::exception&) {
                 throw std::runtime_error("CSV Line " + std::to_string(line_num) +
-                    ": Invalid machine ID for job " + std::to_string(j));
+                    ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
+                    " - invalid machine ID");
+            }
+            const long duplicate = duplicate_machine(routes[j].back().begin(), routes[j].back().end());
+            if (duplicate >= 0) {
+                throw std::runtime_error("CSV Line " + std::to_string(line_num) +
+                    ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
+                    " - machine " + std::to_string(duplicate) + " listed twice among the alternatives");
             }
         }
     }
@@ -262,27 +339,50 @@ JobShopInstance parse_csv_format(std::ifstream& file) {
         }
 
         auto times = split_by_delimiter(line, ',');
-        if (times.size() < n_machines) {
+        if (times.size() < routes[j].size()) {
+            throw std::runtime_error("CSV Line " + std::to_string(line_num) +
+                ": Job " + std::to_string(j) + " - not enough processing times");
+        }
+        if (times.size() > routes[j].size()) {
             throw std::runtime_error("CSV Line " + std::to_string(line_num) +
-                ": Not enough processing times for job " + std::to_string(j));
+                ": Job " + std::to_string(j) + " - " + std::to_string(times.size()) +
+                " processing times for a route of " + std::to_string(routes[j].size()) + " operations");
         }
 
-        for (size_t op = 0; op < n_machines; ++op) {
+        for (size_t op = 0; op < routes[j].size(); ++op) {
+            std::vector<int> proc_times;
             try {
-                int proc_time = std::stoi(times[op]);
-                if (proc_time <= 0) {
-                    throw std::runtime_error("Processing time must be positive");
-                }
-                instance.jobs[j].operations[op].processing_time = proc_time;
+                proc_times = parse_alternatives<int>(times[op], [](const std::string& v) {
+                    int proc_time = std::stoi(v);
+                    if (proc_time <= 0) {
+                        throw std::runtime_error("Processing time must be positive");
+                    }
+                    return proc_time;
+                });
             } catch (const std::exception&) {
                 throw std::runtime_error("CSV Line " + std::to_string(line_num) +
-                    ": Invalid processing time for job " + std::to_string(j));
+                    ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
+                    " - invalid processing time");
             }
+            if (proc_times.size() != routes[j][op].size()) {
+                throw std::runtime_error("CSV Line " + std::to_string(line_num) +
+                    ": Job " + std::to_string(j) + " Op " + std::to_string(op) +
+                    " - expected one processing time per machine alternative");
+            }
+
+            Operation operation{op, routes[j][op][0], proc_times[0], {}};
+            if (proc_times.size() > 1) {
+                for (size_t a = 0; a < proc_times.size(); ++a) {
+                    operation.alternatives.emplace_back(routes[j][op][a], proc_times[a]);
+                }
+            }
+            jobs[j].operations.push_back(std::move(operation));
         }
     }
+    set_jobs(instance, jobs);
 
     // ===== TRANSPORT TIMES MATRIX =====
-    instance.transport_times.resize(n_machines, std::vector<int>(n_machines, 0));
+    instance.transport.assign(n_machines * n_machines, 0);
     for (size_t i = 0; i < n_machines; ++i) {
         while (std::getline(file, line)) {
             line_num++;
@@ -301,7 +401,7 @@ JobShopInstance parse_csv_format(std::ifstream& file) {
                 if (transport_time < 0) {
                     throw std::runtime_error("Transport time cannot be negative");
                 }
-                instance.transport_times[i][k] = transport_time;
+                instance.transport[i * n_machines + k] = transport_time;
             } catch (const std::exception&) {
                 throw std::runtime_error("CSV Line " + std::to_string(line_num) +
                     ": Invalid transport time");
@@ -315,19 +415,44 @@ JobShopInstance parse_csv_format(std::ifstream& file) {
 // ===== VALIDATION =====
 
 void validate_instance(const JobShopInstance& instance) {
-    if (instance.jobs.empty()) {
+    if (instance.num_jobs() == 0) {
         throw std::runtime_error("Instance has no jobs");
     }
     if (instance.num_machines == 0) {
         throw std::runtime_error("Instance has no machines");
     }
-    if (instance.transport_times.size() != instance.num_machines) {
+    if (instance.transport.size() != instance.num_machines * instance.num_machines) {
         throw std::runtime_error("Transport matrix size mismatch");
     }
-    for (size_t i = 0; i < instance.transport_times.size(); ++i) {
-        if (instance.transport_times[i].size() != instance.num_machines) {
-            throw std::runtime_error("Transport matrix row " + std::to_string(i) + 
-                " has incorrect size");
+    if (instance.job_offset.back() != instance.num_operations() ||
+        instance.op_time.size() != instance.num_operations()) {
+        throw std::runtime_error("Operation arrays size mismatch");
+    }
+    for (std::uint16_t machine : instance.op_machine) {
+        if (machine >= instance.num_machines) {
+            throw std::runtime_error("Operation uses machine " + std::to_string(machine) +
+                " which is not in the instance");
+        }
+    }
+    if (instance.is_flexible()) {
+        if (instance.alt_offset.size() != instance.num_operations() + 1 ||
+            instance.alt_offset.back() != instance.alt_machine.size() ||
+            instance.alt_time.size() != instance.alt_machine.size()) {
+            throw std::runtime_error("Machine alternative arrays size mismatch");
+        }
+        for (std::uint16_t machine : instance.alt_machine) {
+            if (machine >= instance.num_machines) {
+                throw std::runtime_error("Operation alternative uses machine " + std::to_string(machine) +
+                    " which is not in the instance");
+            }
+        }
+        for (size_t i = 0; i < instance.num_operations(); ++i) {
+            const auto first = instance.alt_machine.begin() + instance.alt_offset[i];
+            const auto last = instance.alt_machine.begin() + instance.alt_offset[i + 1];
+            if (duplicate_machine(first, last) >= 0) {
+                throw std::runtime_error("Operation " + std::to_string(i) +
+                    " lists a machine twice among its alternatives");
+            }
         }
     }
 }
@@ -361,6 +486,7 @@ JobShopInstance load_instance_from_file(const std::string& filename) {
         }
 
         validate_instance(instance);
+        instance_stats(instance);  // linear, computed once on load
         return instance;
 
     } catch (const std::exception& e) {
@@ -0,0 +1,384 @@
+#include "jobshop/result_cache.hpp"
+#include "jobshop/checkpoint.hpp"
+#include "jobshop/exact.hpp"
+#include "jobshop/greedy.hpp"
+#include "jobshop/serialize.hpp"
+#include <algorithm>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <iterator>
+#include <sstream>
+#include <stdexcept>
+#include <system_error>
+#include <unordered_set>
+
+namespace fs = std::filesystem;
+
+namespace jobshop {
+
+namespace {
+
+constexpr const char* ENTRY_EXTENSION = ".jss";
+
+// ===== HASH =====
+
+constexpr std::uint64_t PRIME_1 = 0x9E3779B185EBCA87ull;
+constexpr std::uint64_t PRIME_2 = 0xC2B2AE3D27D4EB4Full;
+
+std::uint64_t rotl(std::uint64_t x, int r) { return (x << r) | (x >> (64 - r)); }
+
+// Finalizer of MurmurHash3: every input bit affects every output bit
+std::uint64_t fmix(std::uint64_t h) {
+    h ^= h >> 33;
+    h *= 0xFF51AFD7ED558CCDull;
+    h ^= h >> 33;
+    h *= 0xC4CEB9FE1A85EC53ull;
+    h ^= h >> 33;
+    return h;
+}
+
+/**
+ * Two independent 64-bit lanes over 8-byte words (not cryptographic;
+ * keys only have to tell different requests apart)
+ */
+class Hasher {
+public:
+    void bytes(const std::uint8_t* data, std::size_t size) {
+        length_ += size;
+        for (; size >= 8; data += 8, size -= 8) {
+            std::uint64_t word;
+            std::memcpy(&word, data, 8);
+            mix(word);
+        }
+        if (size > 0) {
+            std::uint64_t word = 0;
+            std::memcpy(&word, data, size);
+            mix(word ^ (static_cast<std::uint64_t>(size) << 56));
+        }
+    }
+
+    void text(const std::string& s) {
+        bytes(reinterpret_cast<const std::uint8_t*>(s.data()), s.size());
+        mix(0xFFull);  // separator, "ab"+"c" != "a"+"bc"
+    }
+
+    CacheKey finish() const {
+        return {fmix(a_ ^ length_), fmix(b_ ^ rotl(length_, 32))};
+    }
+
+private:
+    void mix(std::uint64_t word) {
+        a_ = rotl(a_ ^ (word * PRIME_2), 31) * PRIME_1;
+        b_ = rotl(b_ ^ (word * PRIME_1), 27) * PRIME_2 + 0x165667B19E3779F9ull;
+    }
+
+    std::uint64_t a_ = 0x27D4EB2F165667C5ull;
+    std::uint64_t b_ = 0x85EBCA77C2B2AE63ull;
+    std::uint64_t length_ = 0;
+};
+
+std::vector<std::uint8_t> read_file(const fs::path& path) {
+    std::ifstream file(path, std::ios::binary);
+    if (!file) throw std::runtime_error("Cannot open cache entry: " + path.string());
+    return std::vector<std::uint8_t>(std::istreambuf_iterator<char>(file), {});
+}
+
+/**
+ * Cached solution is usable for instance (same operations, assignment in range)
+ */
+bool fits(const JobShopInstance& instance, const Solution& solution) {
+    if (solution.operation_sequence.size() != instance.num_operations()) return false;
+    if (!solution.machine_choice.empty() && solution.machine_choice.size() != instance.num_operations()) {
+        return false;
+    }
+    return true;
+}
+
+} // namespace
+
+std::string CacheKey::hex() const {
+    static const char digits[] = "0123456789abcdef";
+    std::string out(32, '0');
+    for (int i = 0; i < 16; ++i) {
+        out[static_cast<size_t>(15 - i)] = digits[(hi >> (4 * i)) & 0xF];
+        out[static_cast<size_t>(31 - i)] = digits[(lo >> (4 * i)) & 0xF];
+    }
+    return out;
+}
+
+CacheKey instance_key(const JobShopInstance& instance) {
+    std::shared_ptr<const CacheKey> cached = std::atomic_load(&instance.key_cache);
+    if (cached) return *cached;
+
+    const std::vector<std::uint8_t> bytes = serialize_instance(instance);
+    Hasher h;
+    h.bytes(bytes.data(), bytes.size());
+    auto computed = std::make_shared<const CacheKey>(h.finish());
+    std::atomic_compare_exchange_strong(&instance.key_cache, &cached, computed);
+    return *computed;
+}
+
+CacheKey request_key(const CacheKey& instance, const std::string& algorithm, const std::string& params) {
+    Hasher h;
+    h.text(instance.hex());
+    h.text(algorithm);
+    h.text(params);
+    return h.finish();
+}
+
+std::string genetic_params_key(const GeneticParams& params) {
+    std::ostringstream out;
+    out.precision(17);
+    out << "pop=" << params.population_size
+        << ";gen=" << params.generations
+        << ";tour=" << params.tournament_size
+        << ";mut=" << params.mutation_prob
+        << ";seed=" << params.seed
+        << ";crossover=" << crossover_name(params.crossover)
+        << ";mutation=" << mutation_name(params.mutation)
+        << ";decoder=" << decoder_name(params.decoder);
+    if (params.decoder == DecoderKind::Hybrid) out << ";delta=" << params.decoder_delta;
+    out << ";frozen=" << params.frozen_prefix
+        << ";stop_at_lb=" << (params.stop_at_lower_bound ? 1 : 0);
+    return out.str();
+}
+
+// ===== RESULT CACHE =====
+
+ResultCache::ResultCache(std::string directory, size_t memory_entries, std::uint64_t disk_limit)
+    : directory_(std::move(directory)), memory_entries_(memory_entries), disk_limit_(disk_limit) {
+    if (!directory_.empty()) fs::create_directories(directory_);
+}
+
+std::string ResultCache::entry_path(const CacheKey& instance, const CacheKey& request) const {
+    return (fs::path(directory_) / instance.hex() / (request.hex() + ENTRY_EXTENSION)).string();
+}
+
+void ResultCache::remember(const CacheKey& instance, const CacheKey& request, const Solution& solution) {
+    if (memory_entries_ == 0) return;
+    auto found = index_.find(request);
+    if (found != index_.end()) {
+        found->second->solution = solution;
+        lru_.splice(lru_.begin(), lru_, found->second);
+        return;
+    }
+    lru_.push_front({instance, request, solution});
+    index_[request] = lru_.begin();
+    if (lru_.size() > memory_entries_) {
+        index_.erase(lru_.back().request);
+        lru_.pop_back();
+    }
+}
+
+std::optional<Solution> ResultCache::lookup(const CacheKey& instance, const CacheKey& request) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = index_.find(request);
+    if (found != index_.end()) {
+        lru_.splice(lru_.begin(), lru_, found->second);
+        ++stats_.memory_hits;
+        return found->second->solution;
+    }
+
+    if (!directory_.empty()) {
+        const fs::path path = entry_path(instance, request);
+        std::error_code ec;
+        if (fs::exists(path, ec)) {
+            try {
+                const std::vector<std::uint8_t> bytes = read_file(path);
+                Solution solution = deserialize_solution(bytes.data(), bytes.size());
+                fs::last_write_time(path, fs::file_time_type::clock::now(), ec);  // LRU on disk
+                remember(instance, request, solution);
+                ++stats_.disk_hits;
+                return solution;
+            } catch (const std::exception&) {
+                fs::remove(path, ec);  // a corrupt entry = no entry
+            }
+        }
+    }
+
+    ++stats_.misses;
+    return std::nullopt;
+}
+
+void ResultCache::store(const CacheKey& instance, const CacheKey& request, const Solution& solution) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    remember(instance, request, solution);
+    ++stats_.stores;
+    stats_.memory_entries = lru_.size();
+    if (directory_.empty()) return;
+    try {
+        write_entry(instance, request, solution);
+        evict_disk();
+    } catch (const std::exception&) {
+        // The disk is only the second level: the result stays in memory
+    }
+}
+
+void ResultCache::write_entry(const CacheKey& instance, const CacheKey& request, const Solution& solution) {
+    fs::create_directories(fs::path(directory_) / instance.hex());
+    write_snapshot_file(entry_path(instance, request), serialize_solution(solution));
+}
+
+void ResultCache::evict_disk() {
+    struct File {
+        fs::path path;
+        fs::file_time_type used;
+        std::uint64_t size;
+    };
+
+    // Rescanned on every store: other processes may share the directory
+    std::vector<File> files;
+    std::uint64_t total = 0;
+    std::error_code ec;
+    for (const auto& item : fs::recursive_directory_iterator(directory_, ec)) {
+        if (!item.is_regular_file(ec) || item.path().extension() != ENTRY_EXTENSION) continue;
+        File file{item.path(), item.last_write_time(ec), item.file_size(ec)};
+        if (ec) continue;
+        total += file.size;
+        files.push_back(std::move(file));
+    }
+
+    if (total > disk_limit_) {
+        std::sort(files.begin(), files.end(), [](const File& a, const File& b) { return a.used < b.used; });
+        for (const File& file : files) {
+            if (total <= disk_limit_) break;
+            if (fs::remove(file.path, ec)) {
+                total -= file.size;
+                ++stats_.evictions;
+                fs::remove(file.path.parent_path(), ec);  // only succeeds once the instance directory is empty
+            }
+        }
+    }
+    stats_.disk_bytes = total;
+}
+
+std::vector<Solution> ResultCache::seeds(const CacheKey& instance, size_t count) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::vector<Solution> found;
+    std::unordered_set<CacheKey, CacheKeyHash> requests;
+
+    for (const Entry& entry : lru_) {
+        if (entry.instance == instance && requests.insert(entry.request).second) {
+            found.push_back(entry.solution);
+        }
+    }
+
+    if (!directory_.empty()) {
+        std::error_code ec;
+        for (const auto& item : fs::directory_iterator(fs::path(directory_) / instance.hex(), ec)) {
+            if (item.path().extension() != ENTRY_EXTENSION) continue;
+            CacheKey request;
+            const std::string stem = item.path().stem().string();
+            if (stem.size() != 32) continue;
+            try {
+                request.hi = std::stoull(stem.substr(0, 16), nullptr, 16);
+                request.lo = std::stoull(stem.substr(16), nullptr, 16);
+                if (!requests.insert(request).second) continue;
+                const std::vector<std::uint8_t> bytes = read_file(item.path());
+                found.push_back(deserialize_solution(bytes.data(), bytes.size()));
+            } catch (const std::exception&) {
+                continue;
+            }
+        }
+    }
+
+    // Same schedule from different requests counts once
+    std::stable_sort(found.begin(), found.end(),
+                     [](const Solution& a, const Solution& b) { return a.makespan < b.makespan; });
+    std::vector<Solution> best;
+    for (Solution& solution : found) {
+        if (best.size() >= count) break;
+        bool duplicate = std::any_of(best.begin(), best.end(), [&](const Solution& other) {
+            return other.operation_sequence == solution.operation_sequence &&
+                   other.machine_choice == solution.machine_choice;
+        });
+        if (!duplicate) best.push_back(std::move(solution));
+    }
+    return best;
+}
+
+void ResultCache::clear() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    lru_.clear();
+    index_.clear();
+    stats_.memory_entries = 0;
+    if (directory_.empty()) return;
+    std::error_code ec;
+    for (const auto& item : fs::directory_iterator(directory_, ec)) {
+        if (item.is_directory(ec)) fs::remove_all(item.path(), ec);
+    }
+    stats_.disk_bytes = 0;
+}
+
+CacheStats ResultCache::stats() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    CacheStats out = stats_;
+    out.memory_entries = lru_.size();
+    return out;
+}
+
+// ===== SOLVE =====
+
+Solution solve_cached(ResultCache& cache, const JobShopInstance& instance, const std::string& algorithm,
+                      const GeneticParams& params, bool warm_start, CacheOutcome* outcome) {
+    std::string params_key;
+    if (algorithm == "genetic") {
+        params_key = genetic_params_key(params);
+    } else if (algorithm == "exact") {
+        if (instance.is_flexible()) {
+            throw std::invalid_argument("The exact solver only handles fixed routes");
+        }
+    } else if (algorithm != "greedy") {
+        throw std::invalid_argument("Unknown algorithm '" + algorithm + "' (expected greedy, exact or genetic)");
+    }
+
+    const CacheKey instance_hash = instance_key(instance);
+    CacheOutcome result;
+    result.request = request_key(instance_hash, algorithm, params_key);
+
+    // The result depends on the cache contents, so a warm-started GA has its own key
+    const CacheKey warm_request = request_key(instance_hash, algorithm, params_key + ";warm");
+    // seed 0 = a new random run on every call: never answered from the cache,
+    // its result is still stored as a warm seed for later runs
+    const bool random_run = algorithm == "genetic" && params.seed == 0;
+    for (const CacheKey& request : {result.request, warm_request}) {
+        if (random_run) break;
+        if (request == warm_request && !(warm_start && algorithm == "genetic")) break;
+        std::optional<Solution> cached = cache.lookup(instance_hash, request);
+        if (cached && fits(instance, *cached)) {
+            result.hit = true;
+            result.request = request;
+            if (outcome) *outcome = result;
+            return *cached;
+        }
+    }
+
+    Solution solution;
+    if (algorithm == "greedy") {
+        solution = greedy_schedule(instance);
+    } else if (algorithm == "exact") {
+        solution = solve_exact(instance);
+    } else {
+        std::vector<Solution> seeds;
+        if (warm_start) {
+            seeds = cache.seeds(instance_hash, std::max<size_t>(params.population_size / 2, 1));
+            seeds.erase(std::remove_if(seeds.begin(), seeds.end(),
+                                       [&](const Solution& s) { return !fits(instance, s); }),
+                        seeds.end());
+        }
+        if (seeds.empty()) {
+            solution = run_genetic(instance, params);
+        } else {
+            result.warm_seeds = seeds.size();
+            result.request = warm_request;
+            solution = reoptimize_genetic(instance, seeds, {}, params);
+        }
+    }
+
+    if (!solution.operation_sequence.empty()) cache.store(instance_hash, result.request, solution);
+    if (outcome) *outcome = result;
+    return solution;
+}
+
+} // namespace jobshop
@@ -6,11 +6,20 @@
 #include <algorithm>
 #include <stdexcept>
 #include <filesystem>
+#include <iomanip>
+#include <thread>
+#include <optional>
 #include "jobshop/solution.hpp"
 #include "jobshop/genetic.hpp"
+#include "jobshop/decoder.hpp"
 #include "jobshop/greedy.hpp"
 #include "jobshop/exact.hpp"
+#include "jobshop/portfolio.hpp"
+#include "jobshop/instance_stats.hpp"
+#include "jobshop/disjunctive_graph.hpp"
 #include "jobshop/file_io.hpp"
+#include "jobshop/result_cache.hpp"
+#include "jobshop/server.hpp"
 
 using namespace jobshop;
 
@@ -26,6 +35,8 @@ void print_help(const char* program_name) {
     
     std::cout << "USAGE:\n";
     std::cout << "  " << program_basename << " <instance_file> [algorithm] [options]\n";
+    std::cout << "  " << program_basename << " --daemon [daemon options]\n";
+    std::cout << "  " << program_basename << " --client <instance_file> [algorithm] [options]\n";
     std::cout << "\n";
     
     std::cout << "ARGUMENTS:\n";
@@ -35,6 +46,8 @@ void print_help(const char* program_name) {
     std::cout << "                       - greedy    Greedy heuristic\n";
     std::cout << "                       - exact     Exact solver (A*)\n";
     std::cout << "                       - genetic   Genetic algorithm\n";
+    std::cout << "                       - portfolio Greedy, dispatch rules, exact and several GA\n";
+    std::cout << "                                   runs in parallel under one deadline\n";
     std::cout << "\n";
     
     std::cout << "OPTIONS:\n";
@@ -42,8 +55,49 @@ void print_help(const char* program_name) {
     std::cout << "  -gen N             Number of generations (default: 100)\n";
     std::cout << "  -tour N            Tournament size (default: 3)\n";
     std::cout << "  -mut F             Mutation probability 0.0-1.0 (default: 0.2)\n";
+    std::cout << "  -crossover NAME    Crossover operator: ox, jox (default: ox)\n";
+    std::cout << "  -mutation NAME     Mutation operator: swap, insert, inversion (default: swap)\n";
+    std::cout << "  -decoder NAME      Schedule decoder: semi-active, active, non-delay, hybrid\n";
+    std::cout << "                     (default: semi-active)\n";
+    std::cout << "  -delta F           Delay parameter of the hybrid decoder 0.0-1.0 (default: 0.5)\n";
+    std::cout << "  -profile FILE      Load GA parameters from a profile (e.g. written by\n";
+    std::cout << "                     python -m jobshop.tune); other options override it\n";
+    std::cout << "  -checkpoint FILE   Write a snapshot of the run to FILE\n";
+    std::cout << "  -every N           Generations between snapshots (default: 10)\n";
+    std::cout << "  --resume FILE      Continue an interrupted run from snapshot FILE\n";
+    std::cout << "  -time F            Portfolio wall-clock budget in seconds (default: 10)\n";
+    std::cout << "  -threads N         Portfolio worker threads (default: all cores)\n";
+    std::cout << "  -ga N              GA members of the portfolio (default: threads - 2, min 1)\n";
+    std::cout << "  -cache DIR         Reuse greedy, exact and genetic results stored in DIR;\n";
+    std::cout << "                     a repeated request is answered without solving\n";
+    std::cout << "  -cache-mb N        Size limit of the cache directory in MB (default: 64)\n";
+    std::cout << "  -warm              Seed the GA with cached solutions of the same instance\n";
+    std::cout << "                     when its exact parameters are not cached yet\n";
+    std::cout << "  -search NAME       Exact search: astar (default) or ida (iterative deepening,\n";
+    std::cout << "                     memory linear in depth plus a fixed transposition table)\n";
+    std::cout << "  -table-mb N        Exact: transposition table size in MB (default: 16)\n";
+    std::cout << "  -node-mb N         Exact A*: node memory in MB; when full the search goes\n";
+    std::cout << "                     on as IDA* instead of running out of memory (default: 1024)\n";
+    std::cout << "  -critical          Print the critical path and the bottleneck machines of\n";
+    std::cout << "                     every schedule\n";
     std::cout << "\n";
-    std::cout << "  Note: Options only apply to genetic algorithm\n";
+    std::cout << "  Note: Other options only apply to genetic algorithm and portfolio\n";
+    std::cout << "\n";
+
+    std::cout << "DAEMON / CLIENT:\n";
+    std::cout << "  --daemon           Keep loaded instances in memory and solve requests\n";
+    std::cout << "                     (one JSON object per line) on a worker pool\n";
+    std::cout << "  --client           Send one solve request to a running daemon; the\n";
+    std::cout << "                     GA/portfolio options above are forwarded\n";
+    std::cout << "  -socket PATH       Unix socket (default: <temp dir>/jobshop_optimizer.sock)\n";
+    std::cout << "  -port N            Localhost TCP port instead of the Unix socket\n";
+    std::cout << "  -host ADDR         TCP address (default: 127.0.0.1)\n";
+    std::cout << "  -threads N         Daemon: solver workers (default: all cores)\n";
+    std::cout << "  -cache DIR         Daemon: reuse results stored in DIR (see above)\n";
+    std::cout << "  -quiet             Daemon: no log line per request\n";
+    std::cout << "  -seed N            Client: GA seed (default: 42, as without the daemon)\n";
+    std::cout << "  -json              Client: print the raw JSON response\n";
+    std::cout << "  -stats, -shutdown  Client: daemon statistics / stop the daemon\n";
     std::cout << "\n";
     
     std::cout << "EXAMPLES:\n";
@@ -59,6 +113,28 @@ void print_help(const char* program_name) {
     std::cout << "    " << program_basename << " data/instances/jsp_06x06.csv genetic -pop 200 -gen 300\n";
     std::cout << "    " << program_basename << " data/instances/jsp_06x06.csv genetic -pop 50 -gen 100 -tour 5 -mut 0.1\n";
     std::cout << "\n";
+    std::cout << "  Active decoder (fills idle machine gaps):\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt genetic -decoder active\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt genetic -decoder hybrid -delta 0.3\n";
+    std::cout << "\n";
+    std::cout << "  Tuned parameters:\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt genetic -profile profiles/large.profile\n";
+    std::cout << "\n";
+    std::cout << "  Portfolio with a 30 s budget on 8 threads:\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt portfolio -time 30 -threads 8\n";
+    std::cout << "\n";
+    std::cout << "  Checkpoint and resume a long run:\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt genetic -gen 5000 -checkpoint run.snap\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt genetic --resume run.snap\n";
+    std::cout << "\n";
+    std::cout << "  Daemon and client:\n";
+    std::cout << "    " << program_basename << " --daemon -threads 4 &\n";
+    std::cout << "    " << program_basename << " --client data/instances/large.txt greedy\n";
+    std::cout << "    " << program_basename << " --client -shutdown\n";
+    std::cout << "\n";
+    std::cout << "  Cached results, later runs start from the best cached schedules:\n";
+    std::cout << "    " << program_basename << " data/instances/large.txt genetic -cache .jobshop-cache -warm\n";
+    std::cout << "\n";
     
     std::cout << "HELP:\n";
     std::cout << "  -h, --help, help   Show this help message\n";
@@ -68,24 +144,81 @@ void print_help(const char* program_name) {
     std::cout << "\n";
 }
 
+void print_instance_stats(const InstanceStats& stats) {
+    std::cout << "Lower bound: " << stats.lower_bound << " (jobs " << stats.job_lower_bound
+              << ", machines " << stats.machine_lower_bound << ")" << std::endl;
+    std::cout << "  Bottleneck machine: " << stats.bottleneck_machine
+              << ", critical job: " << stats.critical_job << std::endl;
+    if (stats.flexible_operations > 0) {
+        std::cout << "  Flexible operations: " << stats.flexible_operations << std::endl;
+    }
+    std::cout << "  Load imbalance: " << std::fixed << std::setprecision(2) << stats.load_imbalance
+              << ", transport/processing: " << stats.transport_ratio << std::defaultfloat << "\n" << std::endl;
+}
+
+void print_gap(int makespan, int lower_bound) {
+    if (makespan <= lower_bound) {
+        std::cout << "Gap: 0% (matches the lower bound - optimal)" << std::endl;
+    } else {
+        std::cout << "Gap: " << std::fixed << std::setprecision(2)
+                  << 100.0 * optimality_gap(makespan, lower_bound) << "% to lower bound "
+                  << lower_bound << std::defaultfloat << std::endl;
+    }
+}
+
+/**
+ * Critical path (machine blocks) and per-machine load of a schedule
+ */
+void print_critical_report(const JobShopInstance& instance, const Solution& solution) {
+    if (solution.operation_sequence.size() != instance.num_operations()) return;
+    const DisjunctiveGraph graph(instance, solution);
+    const BottleneckReport report = bottleneck_report(graph);
+
+    std::cout << "Critical path: " << report.path_operations << " operations in " << report.blocks
+              << " blocks, processing " << report.path_processing << " + transport "
+              << report.path_transport << " = " << report.makespan << std::endl;
+    std::cout << " ";
+    for (const auto& block : graph.critical_blocks()) {
+        std::cout << " M" << block.machine << "[";
+        for (size_t k = 0; k < block.operations.size(); ++k) {
+            std::cout << (k > 0 ? " " : "") << "J" << graph.job(block.operations[k]);
+        }
+        std::cout << "]";
+    }
+    std::cout << std::endl;
+    std::cout << "Critical operations: " << report.critical_operations << " of " << graph.num_operations()
+              << ", mean slack " << std::fixed << std::setprecision(1) << report.mean_slack
+              << std::defaultfloat << std::endl;
+    std::cout << "Bottleneck machine: " << report.bottleneck_machine << std::endl;
+    std::cout << "  Machine      Load  Critical   On path   Busy" << std::endl;
+    for (size_t m = 0; m < graph.num_machines(); ++m) {
+        const double busy = report.makespan > 0
+            ? 100.0 * static_cast<double>(report.machine_load[m]) / report.makespan : 0.0;
+        std::cout << "  " << std::setw(7) << m << std::setw(10) << report.machine_load[m]
+                  << std::setw(10) << report.machine_critical[m] << std::setw(10) << report.machine_path[m]
+                  << std::setw(6) << std::fixed << std::setprecision(1) << busy << "%"
+                  << std::defaultfloat << std::endl;
+    }
+}
+
 void print_schedule(const JobShopInstance& instance, const Solution& solution, 
-                    const std::string& algorithm_name) {
+                    const std::string& algorithm_name, bool critical = false) {
     std::cout << "\n=== Schedule for " << algorithm_name << " ===" << std::endl;
     
     // Create a 2D array to track job operations
     std::vector<std::vector<int>> schedule(instance.num_machines);
+    RoutingBuffer routing_buffer;
+    const Routing routing = resolve_routing(instance, solution.machine_choice, routing_buffer);
     
     // Build schedule from solution
     for (size_t op = 0; op < solution.operation_sequence.size(); ++op) {
         auto [job_id, operation_idx] = solution.operation_sequence[op];
         
-        if (job_id >= instance.jobs.size() || 
-            operation_idx >= instance.jobs[job_id].operations.size()) {
+        if (!instance.has_operation(job_id, operation_idx)) {
             continue;
         }
         
-        const auto& operation = instance.jobs[job_id].operations[operation_idx];
-        schedule[operation.machine_id].push_back(static_cast<int>(job_id));
+        schedule[routing.machine[instance.op_index(job_id, operation_idx)]].push_back(static_cast<int>(job_id));
     }
     
     // Print schedule
@@ -98,10 +231,159 @@ void print_schedule(const JobShopInstance& instance, const Solution& solution,
     }
     
     std::cout << "Makespan: " << solution.makespan << std::endl;
+    if (critical) print_critical_report(instance, solution);
     std::cout << std::endl;
 }
 
 
+/**
+ * -socket / -port / -host at argv[i]; advances i past the value
+ */
+bool parse_endpoint_option(const std::string& arg, int& i, int argc, char* argv[], Endpoint& endpoint) {
+    if (i + 1 >= argc) return false;
+    if (arg == "-socket") {
+        endpoint.socket_path = argv[++i];
+    } else if (arg == "-port") {
+        endpoint.port = std::stoi(argv[++i]);
+        if (endpoint.port <= 0 || endpoint.port > 65535) throw std::out_of_range("Port must be 1-65535");
+        endpoint.socket_path.clear();
+    } else if (arg == "-host") {
+        endpoint.host = argv[++i];
+    } else {
+        return false;
+    }
+    return true;
+}
+
+std::string lowercase(std::string s) {
+    std::transform(s.begin(), s.end(), s.begin(), [](unsigned char c) { return std::tolower(c); });
+    return s;
+}
+
+int run_daemon_command(int argc, char* argv[]) {
+    ServerOptions options;
+    options.endpoint = default_endpoint();
+    try {
+        for (int i = 2; i < argc; ++i) {
+            const std::string arg = lowercase(argv[i]);
+            if (parse_endpoint_option(arg, i, argc, argv, options.endpoint)) continue;
+            if (arg == "-threads" && i + 1 < argc) {
+                options.threads = static_cast<size_t>(std::stoul(argv[++i]));
+            } else if (arg == "-cache" && i + 1 < argc) {
+                options.cache_dir = argv[++i];
+            } else if (arg == "-cache-mb" && i + 1 < argc) {
+                options.cache_limit = std::stoull(argv[++i]) << 20;
+            } else if (arg == "-quiet") {
+                options.log = false;
+            } else {
+                throw std::invalid_argument("Unknown daemon option '" + std::string(argv[i]) + "'");
+            }
+        }
+        std::cout << "Solver daemon listening on " << options.endpoint.describe() << std::endl;
+        run_server(options);
+        std::cout << "Solver daemon stopped" << std::endl;
+    } catch (const std::exception& e) {
+        std::cerr << "Error: " << e.what() << std::endl;
+        return 1;
+    }
+    return 0;
+}
+
+int run_client_command(int argc, char* argv[]) {
+    // CLI options forwarded as "params" of the solve request
+    static const std::pair<const char*, const char*> forwarded[] = {
+        {"-pop", "population_size"}, {"-gen", "generations"}, {"-tour", "tournament_size"},
+        {"-mut", "mutation_prob"}, {"-crossover", "crossover"}, {"-mutation", "mutation"},
+        {"-decoder", "decoder"}, {"-delta", "decoder_delta"}, {"-seed", "seed"},
+        {"-time", "time_limit"}, {"-threads", "threads"}, {"-ga", "genetic_members"},
+        {"-search", "search"}, {"-table-mb", "table_mb"}, {"-node-mb", "node_mb"},
+    };
+
+    Endpoint endpoint = default_endpoint();
+    std::vector<std::string> positional;
+    Json request = Json::object();
+    Json params = Json::object();
+    bool raw_json = false;
+    try {
+        for (int i = 2; i < argc; ++i) {
+            const std::string arg = lowercase(argv[i]);
+            if (parse_endpoint_option(arg, i, argc, argv, endpoint)) continue;
+            auto option = std::find_if(std::begin(forwarded), std::end(forwarded),
+                                       [&arg](const auto& entry) { return arg == entry.first; });
+            if (option != std::end(forwarded) && i + 1 < argc) {
+                const std::string value = argv[++i];
+                char* end = nullptr;
+                const double number = std::strtod(value.c_str(), &end);
+                params.set(option->second, *end == '\0' && !value.empty() ? Json(number) : Json(value));
+            } else if (arg == "-id" && i + 1 < argc) {
+                request.set("id", argv[++i]);
+            } else if (arg == "-json") {
+                raw_json = true;
+            } else if (arg == "-stats" || arg == "-shutdown" || arg == "-list") {
+                request.set("cmd", arg.substr(1));
+            } else if (!arg.empty() && arg[0] == '-') {
+                throw std::invalid_argument("Unknown client option '" + std::string(argv[i]) + "'");
+            } else {
+                positional.push_back(argv[i]);
+            }
+        }
+
+        if (!request.find("cmd")) {
+            if (positional.empty() && !request.find("id")) {
+                throw std::invalid_argument("Client needs an instance file (or -id of a loaded instance)");
+            }
+            const std::string algorithm = positional.size() > 1 ? lowercase(positional[1]) : "greedy";
+            request.set("cmd", "solve");
+            if (!positional.empty()) {
+                // The daemon may run in another working directory
+                request.set("path", std::filesystem::absolute(positional[0]).string());
+            }
+            request.set("algorithm", algorithm);
+            if ((algorithm == "genetic" || algorithm == "portfolio") && !params.find("seed")) {
+                params.set("seed", 42);
+            }
+            request.set("params", std::move(params));
+            request.set("schedule", raw_json);
+        }
+    } catch (const std::exception& e) {
+        std::cerr << "Error parsing arguments: " << e.what() << std::endl;
+        return 1;
+    }
+
+    try {
+        const auto start = std::chrono::steady_clock::now();
+        ServerConnection connection(endpoint);
+        const Json response = connection.request(request);
+        const double round_trip = std::chrono::duration<double, std::milli>(
+            std::chrono::steady_clock::now() - start).count();
+
+        if (raw_json) {
+            std::cout << response.dump() << std::endl;
+        } else if (!response.find("ok") || !response.find("ok")->as_bool()) {
+            const Json* error = response.find("error");
+            std::cerr << "Error: " << (error ? error->as_string() : response.dump()) << std::endl;
+        } else if (const Json* makespan = response.find("makespan")) {
+            std::cout << "Makespan: " << makespan->as_number() << std::endl;
+            print_gap(static_cast<int>(makespan->as_number()),
+                      static_cast<int>(response.find("lower_bound")->as_number()));
+            std::cout << "Solve time: " << std::fixed << std::setprecision(3)
+                      << response.find("solve_ms")->as_number() << " ms (queued "
+                      << response.find("queue_ms")->as_number() << " ms, round trip "
+                      << round_trip << " ms)" << std::defaultfloat << std::endl;
+            if (response.find("cached")->as_bool()) std::cout << "Cache: hit" << std::endl;
+        } else {
+            for (const auto& [key, value] : response.members()) {
+                if (key != "ok") std::cout << key << ": " << value.dump() << std::endl;
+            }
+        }
+        const Json* ok = response.find("ok");
+        return ok && ok->as_bool() ? 0 : 1;
+    } catch (const std::exception& e) {
+        std::cerr << "Error: " << e.what() << std::endl;
+        return 1;
+    }
+}
+
 int main(int argc, char* argv[]) {
     // Check for help flag FIRST
     if (argc < 2) {
@@ -117,6 +399,8 @@ int main(int argc, char* argv[]) {
         print_help(argv[0]);
         return 0;
     }
+    if (first_arg == "--daemon") return run_daemon_command(argc, argv);
+    if (first_arg == "--client") return run_client_command(argc, argv);
     
     std::cout << "Job Shop Scheduling Optimizer\n" << std::endl;
     
@@ -129,6 +413,28 @@ int main(int argc, char* argv[]) {
     size_t generations = 100;
     size_t tournament_size = 3;
     double mutation_prob = 0.2;
+    DecoderKind decoder = DecoderKind::SemiActive;
+    double decoder_delta = 0.5;
+    CrossoverKind crossover = CrossoverKind::OX;
+    MutationKind mutation = MutationKind::Swap;
+    std::string checkpoint_path;
+    size_t checkpoint_interval = 10;
+    std::string resume_path;
+
+    // Portfolio parameters
+    double time_limit = 10.0;
+    size_t threads = 0;
+    size_t ga_members = 0;
+
+    // Result cache
+    std::string cache_dir;
+    std::uint64_t cache_mb = 64;
+    bool warm_start = false;
+    bool show_critical = false;
+
+    // Exact solver
+    ExactSearch exact_search = ExactSearch::AStar;
+    ExactLimits exact_memory;
     
     if (argc > 2) {
         algorithm = argv[2];
@@ -136,6 +442,28 @@ int main(int argc, char* argv[]) {
                       [](unsigned char c) { return std::tolower(c); });
     }
     
+    // A profile replaces the defaults, so it is loaded before the other options
+    for (int i = 3; i + 1 < argc; ++i) {
+        std::string arg = argv[i];
+        std::transform(arg.begin(), arg.end(), arg.begin(),
+                      [](unsigned char c) { return std::tolower(c); });
+        if (arg != "-profile") continue;
+        try {
+            GeneticParams profile = load_genetic_profile(argv[i + 1]);
+            pop_size = profile.population_size;
+            generations = profile.generations;
+            tournament_size = profile.tournament_size;
+            mutation_prob = profile.mutation_prob;
+            crossover = profile.crossover;
+            mutation = profile.mutation;
+            decoder = profile.decoder;
+            decoder_delta = profile.decoder_delta;
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return 1;
+        }
+    }
+
     // Parse GA parameters
     for (int i = 3; i < argc; ++i) {
         std::string arg = argv[i];
@@ -154,6 +482,54 @@ int main(int argc, char* argv[]) {
                 if (mutation_prob < 0.0 || mutation_prob > 1.0) {
                     throw std::out_of_range("Mutation probability must be between 0.0 and 1.0");
                 }
+            } else if (arg == "-crossover" && i + 1 < argc) {
+                crossover = parse_crossover(argv[++i]);
+            } else if (arg == "-mutation" && i + 1 < argc) {
+                mutation = parse_mutation(argv[++i]);
+            } else if (arg == "-profile" && i + 1 < argc) {
+                ++i;  // loaded above
+            } else if (arg == "-decoder" && i + 1 < argc) {
+                decoder = parse_decoder(argv[++i]);
+            } else if (arg == "-delta" && i + 1 < argc) {
+                decoder_delta = std::stod(argv[++i]);
+                if (decoder_delta < 0.0 || decoder_delta > 1.0) {
+                    throw std::out_of_range("Decoder delta must be between 0.0 and 1.0");
+                }
+            } else if (arg == "-checkpoint" && i + 1 < argc) {
+                checkpoint_path = argv[++i];
+            } else if (arg == "-every" && i + 1 < argc) {
+                checkpoint_interval = static_cast<size_t>(std::stoul(argv[++i]));
+                if (checkpoint_interval == 0) {
+                    throw std::out_of_range("Checkpoint interval must be positive");
+                }
+            } else if (arg == "--resume" && i + 1 < argc) {
+                resume_path = argv[++i];
+            } else if (arg == "-time" && i + 1 < argc) {
+                time_limit = std::stod(argv[++i]);
+                if (!(time_limit > 0.0)) {
+                    throw std::out_of_range("Time limit must be positive");
+                }
+            } else if (arg == "-threads" && i + 1 < argc) {
+                threads = static_cast<size_t>(std::stoul(argv[++i]));
+            } else if (arg == "-ga" && i + 1 < argc) {
+                ga_members = static_cast<size_t>(std::stoul(argv[++i]));
+                if (ga_members == 0) {
+                    throw std::out_of_range("Portfolio needs at least one GA member");
+                }
+            } else if (arg == "-cache" && i + 1 < argc) {
+                cache_dir = argv[++i];
+            } else if (arg == "-cache-mb" && i + 1 < argc) {
+                cache_mb = std::stoull(argv[++i]);
+            } else if (arg == "-warm") {
+                warm_start = true;
+            } else if (arg == "-critical") {
+                show_critical = true;
+            } else if (arg == "-search" && i + 1 < argc) {
+                exact_search = parse_exact_search(lowercase(argv[++i]));
+            } else if (arg == "-table-mb" && i + 1 < argc) {
+                exact_memory.table_mb = static_cast<size_t>(std::stoul(argv[++i]));
+            } else if (arg == "-node-mb" && i + 1 < argc) {
+                exact_memory.node_mb = static_cast<size_t>(std::stoul(argv[++i]));
             }
         } catch (const std::exception& e) {
             std::cerr << "Error parsing arguments: " << e.what() << std::endl;
@@ -162,7 +538,8 @@ int main(int argc, char* argv[]) {
     }
     
     // Validate algorithm
-    if (algorithm != "all" && algorithm != "greedy" && algorithm != "exact" && algorithm != "genetic") {
+    if (algorithm != "all" && algorithm != "greedy" && algorithm != "exact" && algorithm != "genetic" &&
+        algorithm != "portfolio") {
         std::cerr << "Error: Unknown algorithm '" << algorithm << "'" << std::endl;
         std::cerr << "Use -h for help" << std::endl;
         return 1;
@@ -173,19 +550,38 @@ int main(int argc, char* argv[]) {
     try {
         std::cout << "Loading instance from: " << filename << std::endl;
         instance = load_instance_from_file(filename);
-        std::cout << "OK - Loaded " << instance.jobs.size() << " jobs, " 
+        std::cout << "OK - Loaded " << instance.num_jobs() << " jobs, " 
                   << instance.num_machines << " machines\n" << std::endl;
+        print_instance_stats(instance_stats(instance));
     } catch (const std::exception& e) {
         std::cerr << "Error: " << e.what() << std::endl;
         return 1;
     }
     
+    const int lower_bound = instance_stats(instance).lower_bound;
+
+    std::optional<ResultCache> cache;
+    if (!cache_dir.empty()) {
+        try {
+            cache.emplace(cache_dir, 64, cache_mb << 20);
+        } catch (const std::exception& e) {
+            std::cerr << "Error: cannot open cache " << cache_dir << ": " << e.what() << std::endl;
+            return 1;
+        }
+    }
+    auto print_cache_hit = [](const CacheOutcome& outcome) {
+        std::cout << "Cache: hit (" << outcome.request.hex() << ")" << std::endl;
+    };
+
     // ===== GREEDY =====
     if (algorithm == "all" || algorithm == "greedy") {
         std::cout << "--- Greedy Algorithm ---" << std::endl;
         auto start = std::chrono::high_resolution_clock::now();
-        Solution sol_greedy = greedy_schedule(instance);
+        CacheOutcome outcome;
+        Solution sol_greedy = cache ? solve_cached(*cache, instance, "greedy", {}, false, &outcome)
+                                    : greedy_schedule(instance);
         auto end = std::chrono::high_resolution_clock::now();
+        if (outcome.hit) print_cache_hit(outcome);
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end - start);
         
         if (sol_greedy.makespan == 0) {
@@ -194,21 +590,52 @@ int main(int argc, char* argv[]) {
         
         std::cout << "Makespan: " << sol_greedy.makespan << std::endl;
         std::cout << "Time: " << duration.count() << " ms" << std::endl;
-        print_schedule(instance, sol_greedy, "Greedy");
+        print_gap(sol_greedy.makespan, lower_bound);
+        print_schedule(instance, sol_greedy, "Greedy", show_critical);
     }
 
     // ===== EXACT =====
     if (algorithm == "all" || algorithm == "exact") {
-        std::cout << "--- Exact Algorithm (A*) ---" << std::endl;
+        const std::string exact_label = exact_search == ExactSearch::IDAStar ? "IDA*" : "A*";
+        std::cout << "--- Exact Algorithm (" << exact_label << ") ---" << std::endl;
         
+        // Greedy is an upper bound: if it matches the lower bound it is optimal
+        // already, otherwise the search only looks for strictly better schedules
+        Solution incumbent = greedy_schedule(instance);
         bool run_exact = false;
-        
-        // Check heuristics for "safe" size (approx 4 jobs, 3 machines is very safe)
-        if (instance.jobs.size() <= 4 && instance.num_machines <= 3) {
+
+        // The bounded search below finds the same optimum as solve_exact,
+        // so both share the "exact" cache entry
+        const CacheKey exact_instance = cache ? instance_key(instance) : CacheKey{};
+        CacheOutcome exact_outcome;
+        exact_outcome.request = request_key(exact_instance, "exact");
+        std::optional<Solution> cached_exact;
+        if (cache && !instance.is_flexible()) cached_exact = cache->lookup(exact_instance, exact_outcome.request);
+
+        if (instance.is_flexible()) {
+            std::cout << "Instance has machine alternatives - the exact solver only handles fixed routes, skipped." << std::endl;
+        } else if (cached_exact) {
+            print_cache_hit(exact_outcome);
+            std::cout << "Makespan: " << cached_exact->makespan << std::endl;
+            print_gap(cached_exact->makespan, lower_bound);
+            print_schedule(instance, *cached_exact, "Exact (" + exact_label + ")", show_critical);
+        } else if (incumbent.makespan <= lower_bound) {
+            std::cout << "Greedy schedule matches the lower bound - it is optimal, search skipped." << std::endl;
+            std::cout << "Makespan: " << incumbent.makespan << std::endl;
+            print_gap(incumbent.makespan, lower_bound);
+            print_schedule(instance, incumbent, "Exact (" + exact_label + ")", show_critical);
+        } else if (instance.num_operations() <= 12) {
+            // "Safe" size by operation count (e.g. 4 jobs x 3 machines), the
+            // same threshold the GUI warns above; routes may differ in length
             run_exact = true;
         } else {
-            std::cout << "Warning: Instance size (" << instance.jobs.size() << "x" << instance.num_machines 
-                      << ") is large for the exact solver (Exponential Complexity).\n";
+            std::cout << "Warning: Instance size (" << instance.num_jobs() << "x" << instance.num_machines
+                      << ", " << instance.num_operations()
+                      << " operations) is large for the exact solver (Exponential Complexity).\n";
+            std::cout << "Greedy makespan " << incumbent.makespan << ", lower bound " << lower_bound
+                      << " (gap " << std::fixed << std::setprecision(2)
+                      << 100.0 * optimality_gap(incumbent.makespan, lower_bound) << "%)."
+                      << std::defaultfloat << "\n";
             std::cout << "This might take a very long time or consume all memory.\n";
             std::cout << "Do you want to proceed? (y/N): ";
             
@@ -225,33 +652,98 @@ int main(int argc, char* argv[]) {
         if (run_exact) {
             std::cout << "Running Exact Solver..." << std::endl;
             auto start = std::chrono::high_resolution_clock::now();
-            Solution sol_exact = solve_exact(instance);
+            ExactLimits limits;
+            const int bound = incumbent.makespan + 1;  // the greedy schedule itself stays reachable
+            limits.upper_bound = [bound] { return bound; };
+            limits.search = exact_search;
+            limits.table_mb = exact_memory.table_mb;
+            limits.node_mb = exact_memory.node_mb;
+            ExactStats exact_stats;
+            Solution sol_exact = solve_exact(instance, limits, nullptr, &exact_stats);
             auto end = std::chrono::high_resolution_clock::now();
             auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end - start);
             
             if (sol_exact.makespan == 0) {
                 sol_exact.makespan = calculate_makespan(instance, sol_exact);
             }
+            if (cache) cache->store(exact_instance, exact_outcome.request, sol_exact);
             
             std::cout << "Makespan: " << sol_exact.makespan << std::endl;
             std::cout << "Time: " << duration.count() << " ms" << std::endl;
-            print_schedule(instance, sol_exact, "Exact (A*)");
+            std::cout << "Expanded: " << exact_stats.expanded << " states";
+            if (exact_search == ExactSearch::AStar) std::cout << ", " << exact_stats.stored_states << " stored";
+            if (exact_stats.iterations > 1) std::cout << " in " << exact_stats.iterations << " iterations";
+            std::cout << std::endl;
+            std::cout << "Transposition table: " << exact_stats.table_slots << " slots, "
+                      << exact_stats.table_hits << " cutoffs, " << exact_stats.table_replacements
+                      << " replacements" << std::endl;
+            if (exact_stats.switched_to_ida) {
+                std::cout << "Node memory (-node-mb " << limits.node_mb << ") ran out, finished with IDA*" << std::endl;
+            }
+            print_gap(sol_exact.makespan, lower_bound);
+            print_schedule(instance, sol_exact, "Exact (" + exact_label + ")", show_critical);
         }
     }
 
     // ===== GENETIC =====
     if (algorithm == "all" || algorithm == "genetic") {
         std::cout << "--- Genetic Algorithm ---" << std::endl;
-        std::cout << "Parameters:" << std::endl;
-        std::cout << "  Population:  " << pop_size << std::endl;
-        std::cout << "  Generations: " << generations << std::endl;
-        std::cout << "  Tournament:  " << tournament_size << std::endl;
-        std::cout << "  Mutation:    " << mutation_prob << std::endl;
+        
+        GeneticParams params;
+        params.population_size = pop_size;
+        params.generations = generations;
+        params.tournament_size = tournament_size;
+        params.mutation_prob = mutation_prob;
+        params.crossover = crossover;
+        params.mutation = mutation;
+        params.seed = 42;
+        params.decoder = decoder;
+        params.decoder_delta = decoder_delta;
+        params.checkpoint_path = checkpoint_path;
+        params.checkpoint_interval = checkpoint_interval;
+        size_t completed = 0;
+        params.on_progress = [&completed](const GenerationStats& stats, const Solution&) {
+            completed = stats.generation;
+        };
+        
+        if (resume_path.empty()) {
+            std::cout << "Parameters:" << std::endl;
+            std::cout << "  Population:  " << pop_size << std::endl;
+            std::cout << "  Generations: " << generations << std::endl;
+            std::cout << "  Tournament:  " << tournament_size << std::endl;
+            std::cout << "  Mutation:    " << mutation_prob << std::endl;
+            std::cout << "  Operators:   " << crossover_name(crossover) << " + " << mutation_name(mutation) << std::endl;
+            std::cout << "  Decoder:     " << decoder_name(decoder);
+            if (decoder == DecoderKind::Hybrid) std::cout << " (delta " << decoder_delta << ")";
+            std::cout << std::endl;
+            if (!checkpoint_path.empty()) {
+                std::cout << "  Checkpoint:  " << checkpoint_path << " (every " 
+                          << checkpoint_interval << " generations)" << std::endl;
+            }
+        } else {
+            std::cout << "Resuming from: " << resume_path << std::endl;
+        }
         
         auto start = std::chrono::high_resolution_clock::now();
-        Solution sol_genetic = run_genetic(instance, pop_size, generations, 
-                                           tournament_size, mutation_prob, 42);
+        Solution sol_genetic;
+        CacheOutcome outcome;
+        try {
+            if (!resume_path.empty()) {
+                sol_genetic = resume_genetic(instance, resume_path);
+            } else if (cache) {
+                sol_genetic = solve_cached(*cache, instance, "genetic", params, warm_start, &outcome);
+            } else {
+                sol_genetic = run_genetic(instance, params);
+            }
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return 1;
+        }
         auto end = std::chrono::high_resolution_clock::now();
+        if (outcome.hit) print_cache_hit(outcome);
+        if (outcome.warm_seeds > 0) {
+            std::cout << "Warm start from " << outcome.warm_seeds << " cached solution(s)" << std::endl;
+        }
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end - start);
         
         if (sol_genetic.makespan == 0) {
@@ -260,7 +752,74 @@ int main(int argc, char* argv[]) {
         
         std::cout << "Makespan: " << sol_genetic.makespan << std::endl;
         std::cout << "Time: " << duration.count() << " ms" << std::endl;
-        print_schedule(instance, sol_genetic, "Genetic");
+        print_gap(sol_genetic.makespan, lower_bound);
+        if (resume_path.empty() && !outcome.hit) {
+            if (completed < generations) {
+                std::cout << "Stopped after " << completed << " generations (lower bound reached)" << std::endl;
+            }
+            // Initial population + one child per individual and generation
+            const double evaluations = static_cast<double>(pop_size) * static_cast<double>(completed + 1);
+            const double seconds = std::max(std::chrono::duration<double>(end - start).count(), 1e-9);
+            std::cout << "Evaluations: " << static_cast<size_t>(evaluations) << " ("
+                      << static_cast<size_t>(evaluations / seconds) << "/s)" << std::endl;
+        }
+        print_schedule(instance, sol_genetic, "Genetic", show_critical);
+    }
+
+    // ===== PORTFOLIO =====
+    if (algorithm == "portfolio") {
+        std::cout << "--- Portfolio ---" << std::endl;
+
+        if (threads == 0) threads = std::max<unsigned int>(std::thread::hardware_concurrency(), 1);
+        if (ga_members == 0) ga_members = threads > 3 ? threads - 2 : 1;
+
+        GeneticParams base;
+        base.population_size = pop_size;
+        base.tournament_size = tournament_size;
+        base.mutation_prob = mutation_prob;
+        base.crossover = crossover;
+        base.mutation = mutation;
+        base.decoder_delta = decoder_delta;
+        base.seed = 42;
+
+        PortfolioParams params;
+        params.time_limit = time_limit;
+        params.threads = threads;
+        params.genetic = default_genetic_members(ga_members, base);
+
+        std::cout << "Parameters:" << std::endl;
+        std::cout << "  Time limit:  " << time_limit << " s" << std::endl;
+        std::cout << "  Threads:     " << threads << std::endl;
+        std::cout << "  GA members:  " << ga_members << " (population " << pop_size << ")" << std::endl;
+
+        PortfolioResult result;
+        try {
+            result = run_portfolio(instance, params);
+        } catch (const std::exception& e) {
+            std::cerr << "Error: " << e.what() << std::endl;
+            return 1;
+        }
+
+        std::cout << "\n" << std::left << std::setw(30) << "Member" << std::right
+                  << std::setw(10) << "Makespan" << std::setw(10) << "At [s]"
+                  << std::setw(8) << "Impr." << std::setw(10) << "Ran [s]" << "  Status" << std::endl;
+        for (const auto& member : result.members) {
+            std::cout << std::left << std::setw(30) << member.name << std::right << std::setw(10);
+            if (member.best_makespan > 0) std::cout << member.best_makespan;
+            else std::cout << "-";
+            std::cout << std::setw(10) << std::fixed << std::setprecision(3) << member.time_to_best
+                      << std::setw(8) << member.improvements
+                      << std::setw(10) << member.runtime << std::defaultfloat
+                      << "  " << (member.finished ? "finished" : member.runtime > 0.0 ? "stopped" : "not started")
+                      << std::endl;
+        }
+
+        std::cout << "\nMakespan: " << result.best.makespan << " (" << result.best_member << ")";
+        if (result.proven_optimal) std::cout << " - proven optimal";
+        std::cout << std::endl;
+        std::cout << "Time: " << static_cast<long long>(result.elapsed * 1000.0) << " ms" << std::endl;
+        print_gap(result.best.makespan, result.lower_bound);
+        print_schedule(instance, result.best, "Portfolio", show_critical);
     }
     
     return 0;
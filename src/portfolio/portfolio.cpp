@@ -0,0 +1,216 @@
+#include "jobshop/portfolio.hpp"
+#include "jobshop/exact.hpp"
+#include "jobshop/instance_stats.hpp"
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <exception>
+#include <functional>
+#include <iterator>
+#include <limits>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
+
+namespace jobshop {
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+double seconds_since(Clock::time_point start) {
+    return std::chrono::duration<double>(Clock::now() - start).count();
+}
+
+/**
+ * Best solution shared by all members.
+ * bound() is a lock-free read, so members can poll it in hot loops.
+ */
+class Incumbent {
+public:
+    int bound() const { return bound_.load(std::memory_order_relaxed); }
+
+    /**
+     * Keep solution if it is strictly better; returns true if it was kept
+     */
+    bool offer(const Solution& solution, size_t member) {
+        if (solution.makespan >= bound()) return false;
+        std::lock_guard<std::mutex> lock(mutex_);
+        if (solution.makespan >= bound_.load(std::memory_order_relaxed)) return false;
+        best_ = solution;
+        member_ = member;
+        bound_.store(solution.makespan, std::memory_order_relaxed);
+        return true;
+    }
+
+    Solution best() const {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return best_;
+    }
+
+    size_t member() const {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return member_;
+    }
+
+private:
+    std::atomic<int> bound_{std::numeric_limits<int>::max()};
+    mutable std::mutex mutex_;
+    Solution best_;
+    size_t member_ = 0;
+};
+
+struct Member {
+    std::string name;
+    std::function<bool(size_t index)> run;  // true = ended on its own
+};
+
+} // namespace
+
+std::vector<GeneticParams> default_genetic_members(size_t count, const GeneticParams& base) {
+    static const DecoderKind decoders[] = {
+        DecoderKind::SemiActive, DecoderKind::Active, DecoderKind::NonDelay, DecoderKind::Hybrid,
+    };
+
+    std::vector<GeneticParams> members;
+    members.reserve(count);
+    for (size_t i = 0; i < count; ++i) {
+        GeneticParams member = base;
+        member.decoder = decoders[i % std::size(decoders)];
+        // seed 0 = random for every member
+        member.seed = base.seed == 0 ? 0 : base.seed + static_cast<unsigned int>(i);
+        member.generations = std::numeric_limits<size_t>::max();
+        members.push_back(std::move(member));
+    }
+    return members;
+}
+
+PortfolioResult run_portfolio(const JobShopInstance& instance, const PortfolioParams& params) {
+    if (!(params.time_limit > 0.0)) {
+        throw std::invalid_argument("Portfolio time limit must be positive");
+    }
+
+    const Clock::time_point start = Clock::now();
+    const Clock::time_point deadline = start + std::chrono::duration_cast<Clock::duration>(
+        std::chrono::duration<double>(params.time_limit));
+
+    const int lower_bound = instance_stats(instance).lower_bound;
+    const int target = params.target_makespan > 0 ? params.target_makespan : lower_bound;
+
+    Incumbent incumbent;
+    std::atomic<bool> stop{false};
+    std::atomic<bool> proven_optimal{false};
+    auto should_stop = [&] {
+        return stop.load(std::memory_order_relaxed) || Clock::now() >= deadline;
+    };
+
+    std::vector<Member> members;
+    std::vector<MemberReport> reports;
+
+    // Every member result goes through here: per-member statistics first,
+    // then the shared incumbent
+    auto report = [&](size_t index, const Solution& solution) {
+        if (solution.operation_sequence.empty()) return;
+        MemberReport& r = reports[index];
+        if (r.best_makespan != 0 && solution.makespan >= r.best_makespan) return;
+        r.best_makespan = solution.makespan;
+        r.time_to_best = seconds_since(start);
+        if (incumbent.offer(solution, index)) {
+            ++r.improvements;
+            if (solution.makespan <= target) stop.store(true, std::memory_order_relaxed);
+        }
+    };
+
+    // ===== MEMBERS (fast heuristics first) =====
+
+    if (params.greedy) {
+        members.push_back({"greedy", [&](size_t index) {
+            report(index, greedy_schedule(instance));
+            return true;
+        }});
+    }
+    for (DispatchRule rule : params.dispatch_rules) {
+        members.push_back({std::string("dispatch ") + dispatch_rule_name(rule), [&, rule](size_t index) {
+            report(index, dispatch_schedule(instance, rule));
+            return true;
+        }});
+    }
+    if (params.exact_max_states > 0 && !instance.is_flexible()) {
+        members.push_back({"exact", [&](size_t index) {
+            ExactLimits limits;
+            limits.upper_bound = [&incumbent] { return incumbent.bound(); };
+            limits.should_stop = should_stop;
+            limits.max_states = params.exact_max_states;
+            bool complete = false;
+            report(index, solve_exact(instance, limits, &complete));
+            if (complete) {
+                // Nothing better than the incumbent exists
+                proven_optimal.store(true);
+                stop.store(true);
+            }
+            return complete;
+        }});
+    }
+    for (size_t i = 0; i < params.genetic.size(); ++i) {
+        const GeneticParams& ga = params.genetic[i];
+        std::string name = std::string("genetic ") + decoder_name(ga.decoder);
+        if (ga.seed != 0) name += " seed " + std::to_string(ga.seed);
+        members.push_back({std::move(name), [&, i](size_t index) {
+            GeneticParams member = params.genetic[i];
+            ProgressCallback user_progress = member.on_progress;
+            std::function<bool()> user_stop = member.should_stop;
+            member.on_progress = [&, index, user_progress](const GenerationStats& stats, const Solution& best) {
+                if (user_progress) user_progress(stats, best);
+                if (stats.generation == 1 || stats.improved) report(index, best);
+            };
+            member.should_stop = [&, user_stop] { return should_stop() || (user_stop && user_stop()); };
+            report(index, run_genetic(instance, member));
+            return !should_stop();
+        }});
+    }
+
+    reports.resize(members.size());
+    for (size_t i = 0; i < members.size(); ++i) reports[i].name = members[i].name;
+
+    // ===== WORKERS =====
+
+    size_t threads = params.threads != 0 ? params.threads
+                                         : std::max<size_t>(std::thread::hardware_concurrency(), 1);
+    threads = std::min(threads, members.size());
+
+    std::atomic<size_t> next{0};
+    std::exception_ptr error;
+    std::mutex error_mutex;
+    auto worker = [&] {
+        for (size_t index = next++; index < members.size(); index = next++) {
+            if (should_stop()) continue;  // the remaining members do not start
+            const Clock::time_point member_start = Clock::now();
+            try {
+                reports[index].finished = members[index].run(index);
+            } catch (...) {
+                std::lock_guard<std::mutex> lock(error_mutex);
+                if (!error) error = std::current_exception();
+                stop.store(true);
+            }
+            reports[index].runtime = seconds_since(member_start);
+        }
+    };
+
+    std::vector<std::thread> pool;
+    pool.reserve(threads);
+    for (size_t t = 0; t < threads; ++t) pool.emplace_back(worker);
+    for (auto& thread : pool) thread.join();
+    if (error) std::rethrow_exception(error);
+
+    PortfolioResult result;
+    result.best = incumbent.best();
+    if (!result.best.operation_sequence.empty()) result.best_member = members[incumbent.member()].name;
+    result.lower_bound = lower_bound;
+    result.proven_optimal = proven_optimal.load() ||
+                            (!result.best.operation_sequence.empty() && result.best.makespan <= lower_bound);
+    result.elapsed = seconds_since(start);
+    result.members = std::move(reports);
+    return result;
+}
+
+} // namespace jobshop
@@ -0,0 +1,332 @@
+#include "jobshop/json.hpp"
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <stdexcept>
+
+namespace jobshop {
+
+namespace {
+
+const char* type_name(Json::Type type) {
+    switch (type) {
+        case Json::Type::Null: return "null";
+        case Json::Type::Bool: return "bool";
+        case Json::Type::Number: return "number";
+        case Json::Type::String: return "string";
+        case Json::Type::Array: return "array";
+        case Json::Type::Object: return "object";
+    }
+    return "unknown";
+}
+
+void expect(const Json& value, Json::Type type) {
+    if (value.type() != type) {
+        throw std::invalid_argument(std::string("JSON value is ") + type_name(value.type()) +
+                                    ", expected " + type_name(type));
+    }
+}
+
+void dump_string(const std::string& s, std::string& out) {
+    out.push_back('"');
+    for (char c : s) {
+        switch (c) {
+            case '"': out += "\\\""; break;
+            case '\\': out += "\\\\"; break;
+            case '\n': out += "\\n"; break;
+            case '\r': out += "\\r"; break;
+            case '\t': out += "\\t"; break;
+            default:
+                if (static_cast<unsigned char>(c) < 0x20) {
+                    char escaped[8];
+                    std::snprintf(escaped, sizeof(escaped), "\\u%04x", static_cast<unsigned>(c));
+                    out += escaped;
+                } else {
+                    out.push_back(c);
+                }
+        }
+    }
+    out.push_back('"');
+}
+
+/**
+ * Recursive descent over the whole text
+ */
+class Parser {
+public:
+    explicit Parser(const std::string& text) : text_(text) {}
+
+    Json document() {
+        Json value = parse_value(0);
+        skip_space();
+        if (pos_ != text_.size()) fail("trailing characters");
+        return value;
+    }
+
+private:
+    static constexpr int MAX_DEPTH = 64;
+
+    [[noreturn]] void fail(const std::string& what) const {
+        throw std::invalid_argument("Invalid JSON at offset " + std::to_string(pos_) + ": " + what);
+    }
+
+    void skip_space() {
+        while (pos_ < text_.size() && (text_[pos_] == ' ' || text_[pos_] == '\t' ||
+                                       text_[pos_] == '\n' || text_[pos_] == '\r')) {
+            ++pos_;
+        }
+    }
+
+    bool consume(char c) {
+        skip_space();
+        if (pos_ < text_.size() && text_[pos_] == c) {
+            ++pos_;
+            return true;
+        }
+        return false;
+    }
+
+    void literal(const char* word) {
+        for (const char* c = word; *c; ++c, ++pos_) {
+            if (pos_ >= text_.size() || text_[pos_] != *c) fail(std::string("expected ") + word);
+        }
+    }
+
+    Json parse_value(int depth) {
+        if (depth > MAX_DEPTH) fail("nesting too deep");
+        skip_space();
+        if (pos_ >= text_.size()) fail("unexpected end");
+        switch (text_[pos_]) {
+            case '{': return parse_object(depth);
+            case '[': return parse_array(depth);
+            case '"': return Json(parse_string());
+            case 't': literal("true"); return Json(true);
+            case 'f': literal("false"); return Json(false);
+            case 'n': literal("null"); return Json();
+            default: return Json(parse_number());
+        }
+    }
+
+    Json parse_object(int depth) {
+        ++pos_;
+        Json object = Json::object();
+        if (consume('}')) return object;
+        do {
+            skip_space();
+            if (pos_ >= text_.size() || text_[pos_] != '"') fail("expected member name");
+            std::string key = parse_string();
+            if (!consume(':')) fail("expected ':'");
+            object.set(key, parse_value(depth + 1));
+        } while (consume(','));
+        if (!consume('}')) fail("expected ',' or '}'");
+        return object;
+    }
+
+    Json parse_array(int depth) {
+        ++pos_;
+        Json array = Json::array();
+        if (consume(']')) return array;
+        do {
+            array.push_back(parse_value(depth + 1));
+        } while (consume(','));
+        if (!consume(']')) fail("expected ',' or ']'");
+        return array;
+    }
+
+    std::string parse_string() {
+        ++pos_;  // '"'
+        std::string out;
+        while (pos_ < text_.size() && text_[pos_] != '"') {
+            char c = text_[pos_++];
+            if (c != '\\') {
+                out.push_back(c);
+                continue;
+            }
+            if (pos_ >= text_.size()) break;
+            char e = text_[pos_++];
+            switch (e) {
+                case '"': case '\\': case '/': out.push_back(e); break;
+                case 'b': out.push_back('\b'); break;
+                case 'f': out.push_back('\f'); break;
+                case 'n': out.push_back('\n'); break;
+                case 'r': out.push_back('\r'); break;
+                case 't': out.push_back('\t'); break;
+                case 'u': out += parse_unicode(); break;
+                default: fail("invalid escape");
+            }
+        }
+        if (pos_ >= text_.size()) fail("unterminated string");
+        ++pos_;
+        return out;
+    }
+
+    unsigned hex4() {
+        if (pos_ + 4 > text_.size()) fail("truncated \\u escape");
+        unsigned value = 0;
+        for (int i = 0; i < 4; ++i) {
+            char c = text_[pos_++];
+            value <<= 4;
+            if (c >= '0' && c <= '9') value |= static_cast<unsigned>(c - '0');
+            else if (c >= 'a' && c <= 'f') value |= static_cast<unsigned>(c - 'a' + 10);
+            else if (c >= 'A' && c <= 'F') value |= static_cast<unsigned>(c - 'A' + 10);
+            else fail("invalid \\u escape");
+        }
+        return value;
+    }
+
+    // \uXXXX (with surrogate pairs) as UTF-8
+    std::string parse_unicode() {
+        unsigned code = hex4();
+        if (code >= 0xD800 && code < 0xDC00 && pos_ + 6 <= text_.size() &&
+            text_[pos_] == '\\' && text_[pos_ + 1] == 'u') {
+            pos_ += 2;
+            unsigned low = hex4();
+            code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00);
+        }
+        std::string out;
+        if (code < 0x80) {
+            out.push_back(static_cast<char>(code));
+        } else if (code < 0x800) {
+            out.push_back(static_cast<char>(0xC0 | (code >> 6)));
+            out.push_back(static_cast<char>(0x80 | (code & 0x3F)));
+        } else if (code < 0x10000) {
+            out.push_back(static_cast<char>(0xE0 | (code >> 12)));
+            out.push_back(static_cast<char>(0x80 | ((code >> 6) & 0x3F)));
+            out.push_back(static_cast<char>(0x80 | (code & 0x3F)));
+        } else {
+            out.push_back(static_cast<char>(0xF0 | (code >> 18)));
+            out.push_back(static_cast<char>(0x80 | ((code >> 12) & 0x3F)));
+            out.push_back(static_cast<char>(0x80 | ((code >> 6) & 0x3F)));
+            out.push_back(static_cast<char>(0x80 | (code & 0x3F)));
+        }
+        return out;
+    }
+
+    double parse_number() {
+        const char* begin = text_.c_str() + pos_;
+        char* end = nullptr;
+        double value = std::strtod(begin, &end);
+        if (end == begin) fail("unexpected character");
+        pos_ += static_cast<std::size_t>(end - begin);
+        return value;
+    }
+
+    const std::string& text_;
+    std::size_t pos_ = 0;
+};
+
+} // namespace
+
+Json Json::array() {
+    Json value;
+    value.type_ = Type::Array;
+    return value;
+}
+
+Json Json::object() {
+    Json value;
+    value.type_ = Type::Object;
+    return value;
+}
+
+bool Json::as_bool() const {
+    expect(*this, Type::Bool);
+    return bool_;
+}
+
+double Json::as_number() const {
+    expect(*this, Type::Number);
+    return number_;
+}
+
+const std::string& Json::as_string() const {
+    expect(*this, Type::String);
+    return string_;
+}
+
+const std::vector<Json>& Json::items() const {
+    expect(*this, Type::Array);
+    return items_;
+}
+
+const std::vector<std::pair<std::string, Json>>& Json::members() const {
+    expect(*this, Type::Object);
+    return members_;
+}
+
+const Json* Json::find(const std::string& key) const {
+    if (type_ != Type::Object) return nullptr;
+    for (const auto& [name, value] : members_) {
+        if (name == key) return &value;
+    }
+    return nullptr;
+}
+
+Json& Json::set(const std::string& key, Json value) {
+    expect(*this, Type::Object);
+    for (auto& [name, existing] : members_) {
+        if (name == key) return existing = std::move(value);
+    }
+    members_.emplace_back(key, std::move(value));
+    return members_.back().second;
+}
+
+Json& Json::push_back(Json value) {
+    expect(*this, Type::Array);
+    items_.push_back(std::move(value));
+    return items_.back();
+}
+
+std::string Json::dump() const {
+    std::string out;
+    dump(out);
+    return out;
+}
+
+void Json::dump(std::string& out) const {
+    switch (type_) {
+        case Type::Null: out += "null"; break;
+        case Type::Bool: out += bool_ ? "true" : "false"; break;
+        case Type::Number: {
+            if (!std::isfinite(number_)) {
+                out += "null";
+            } else if (number_ == std::floor(number_) && std::fabs(number_) < 9e15) {
+                out += std::to_string(static_cast<long long>(number_));
+            } else {
+                // Shortest text that reads back as the same number
+                char buffer[32];
+                std::snprintf(buffer, sizeof(buffer), "%.15g", number_);
+                if (std::strtod(buffer, nullptr) != number_) {
+                    std::snprintf(buffer, sizeof(buffer), "%.17g", number_);
+                }
+                out += buffer;
+            }
+            break;
+        }
+        case Type::String: dump_string(string_, out); break;
+        case Type::Array:
+            out.push_back('[');
+            for (std::size_t i = 0; i < items_.size(); ++i) {
+                if (i > 0) out.push_back(',');
+                items_[i].dump(out);
+            }
+            out.push_back(']');
+            break;
+        case Type::Object:
+            out.push_back('{');
+            for (std::size_t i = 0; i < members_.size(); ++i) {
+                if (i > 0) out.push_back(',');
+                dump_string(members_[i].first, out);
+                out.push_back(':');
+                members_[i].second.dump(out);
+            }
+            out.push_back('}');
+            break;
+    }
+}
+
+Json Json::parse(const std::string& text) {
+    return Parser(text).document();
+}
+
+} // namespace jobshop
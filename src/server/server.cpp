@@ -0,0 +1,694 @@
+#include "jobshop/server.hpp"
+#include "jobshop/exact.hpp"
+#include "jobshop/file_io.hpp"
+#include "jobshop/genetic.hpp"
+#include "jobshop/greedy.hpp"
+#include "jobshop/instance_stats.hpp"
+#include "jobshop/portfolio.hpp"
+#include "jobshop/result_cache.hpp"
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <filesystem>
+#include <functional>
+#include <future>
+#include <iostream>
+#include <list>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <queue>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+#ifndef _WIN32
+#include <arpa/inet.h>
+#include <cerrno>
+#include <csignal>
+#include <cstring>
+#include <netinet/in.h>
+#include <netinet/tcp.h>
+#include <poll.h>
+#include <sys/socket.h>
+#include <sys/un.h>
+#include <unistd.h>
+#endif
+
+namespace fs = std::filesystem;
+
+namespace jobshop {
+
+std::string Endpoint::describe() const {
+    if (!socket_path.empty()) return "unix:" + socket_path;
+    return host + ":" + std::to_string(port);
+}
+
+Endpoint default_endpoint() {
+    Endpoint endpoint;
+    std::error_code ec;
+    fs::path dir = fs::temp_directory_path(ec);
+    if (ec) dir = ".";
+    endpoint.socket_path = (dir / "jobshop_optimizer.sock").string();
+    return endpoint;
+}
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+double ms_since(Clock::time_point start) {
+    return std::chrono::duration<double, std::milli>(Clock::now() - start).count();
+}
+
+// ===== WORKER POOL =====
+
+/**
+ * Fixed set of solver threads fed from one FIFO queue
+ */
+class WorkerPool {
+public:
+    explicit WorkerPool(size_t threads) {
+        threads = std::max<size_t>(threads, 1);
+        for (size_t i = 0; i < threads; ++i) workers_.emplace_back([this] { loop(); });
+    }
+
+    ~WorkerPool() {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stop_ = true;
+        }
+        ready_.notify_all();
+        for (auto& worker : workers_) worker.join();
+    }
+
+    template <typename F>
+    auto submit(F task) -> std::future<decltype(task())> {
+        auto packaged = std::make_shared<std::packaged_task<decltype(task())()>>(std::move(task));
+        auto future = packaged->get_future();
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            queue_.push([packaged] { (*packaged)(); });
+        }
+        ready_.notify_one();
+        return future;
+    }
+
+    size_t size() const { return workers_.size(); }
+
+private:
+    void loop() {
+        for (;;) {
+            std::function<void()> task;
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                ready_.wait(lock, [this] { return stop_ || !queue_.empty(); });
+                if (queue_.empty()) return;  // stop_ and nothing left to do
+                task = std::move(queue_.front());
+                queue_.pop();
+            }
+            task();
+        }
+    }
+
+    std::vector<std::thread> workers_;
+    std::queue<std::function<void()>> queue_;
+    std::mutex mutex_;
+    std::condition_variable ready_;
+    bool stop_ = false;
+};
+
+// ===== REQUEST PARAMETERS =====
+
+const Json* member(const Json& object, const char* key) {
+    return object.find(key);
+}
+
+std::string string_param(const Json& object, const char* key, const std::string& fallback = "") {
+    const Json* value = member(object, key);
+    return value && !value->is_null() ? value->as_string() : fallback;
+}
+
+double number_param(const Json& object, const char* key, double fallback) {
+    const Json* value = member(object, key);
+    return value && !value->is_null() ? value->as_number() : fallback;
+}
+
+size_t count_param(const Json& object, const char* key, size_t fallback) {
+    const double value = number_param(object, key, static_cast<double>(fallback));
+    if (value < 0.0) throw std::invalid_argument(std::string("'") + key + "' must not be negative");
+    return static_cast<size_t>(value);
+}
+
+bool bool_param(const Json& object, const char* key, bool fallback) {
+    const Json* value = member(object, key);
+    return value && !value->is_null() ? value->as_bool() : fallback;
+}
+
+/**
+ * Reject "params" keys the algorithm does not read, so a typo (or an
+ * option of another algorithm) does not silently run with the defaults
+ */
+void check_params(const Json& params, const std::string& algorithm) {
+    static const std::vector<std::string> genetic = {
+        "population_size", "generations", "tournament_size", "mutation_prob", "seed",
+        "crossover", "mutation", "decoder", "decoder_delta", "time_limit",
+    };
+    static const std::map<std::string, std::vector<std::string>> known = {
+        {"greedy", {"time_limit"}},
+        {"exact", {"time_limit", "max_states", "search", "table_mb", "node_mb"}},
+        {"genetic", genetic},
+        {"portfolio", [] {
+            std::vector<std::string> keys = genetic;
+            keys.insert(keys.end(), {"threads", "genetic_members"});
+            return keys;
+        }()},
+    };
+    const auto entry = known.find(algorithm);
+    if (entry == known.end()) {
+        throw std::invalid_argument("Unknown algorithm '" + algorithm +
+                                    "' (expected greedy, exact, genetic or portfolio)");
+    }
+    for (const auto& [key, value] : params.members()) {
+        if (std::find(entry->second.begin(), entry->second.end(), key) == entry->second.end()) {
+            throw std::invalid_argument("Unknown parameter '" + key + "' for " + algorithm);
+        }
+    }
+}
+
+/**
+ * GeneticParams from the "params" object (keys checked by check_params)
+ */
+GeneticParams genetic_params(const Json& params) {
+    GeneticParams ga;
+    ga.population_size = count_param(params, "population_size", ga.population_size);
+    ga.generations = count_param(params, "generations", ga.generations);
+    ga.tournament_size = count_param(params, "tournament_size", ga.tournament_size);
+    ga.mutation_prob = number_param(params, "mutation_prob", ga.mutation_prob);
+    ga.seed = static_cast<unsigned int>(count_param(params, "seed", ga.seed));
+    if (const Json* v = member(params, "crossover")) ga.crossover = parse_crossover(v->as_string());
+    if (const Json* v = member(params, "mutation")) ga.mutation = parse_mutation(v->as_string());
+    if (const Json* v = member(params, "decoder")) ga.decoder = parse_decoder(v->as_string());
+    ga.decoder_delta = number_param(params, "decoder_delta", ga.decoder_delta);
+    return ga;
+}
+
+Json schedule_json(const Solution& solution) {
+    Json sequence = Json::array();
+    for (const auto& [job_id, op_id] : solution.operation_sequence) {
+        Json pair = Json::array();
+        pair.push_back(job_id);
+        pair.push_back(op_id);
+        sequence.push_back(std::move(pair));
+    }
+    Json starts = Json::array();
+    for (int t : solution.start_times) starts.push_back(t);
+
+    Json schedule = Json::object();
+    schedule.set("sequence", std::move(sequence));
+    schedule.set("start_times", std::move(starts));
+    if (!solution.machine_choice.empty()) {
+        Json choice = Json::array();
+        for (std::uint16_t c : solution.machine_choice) choice.push_back(static_cast<int>(c));
+        schedule.set("machine_choice", std::move(choice));
+    }
+    return schedule;
+}
+
+Json error_response(const std::string& message) {
+    Json response = Json::object();
+    response.set("ok", false);
+    response.set("error", message);
+    return response;
+}
+
+// ===== DAEMON =====
+
+/**
+ * Resident instances and request handling, independent of the transport
+ */
+class SolverDaemon {
+public:
+    explicit SolverDaemon(const ServerOptions& options)
+        : options_(options),
+          pool_(options.threads != 0 ? options.threads
+                                     : std::max<size_t>(std::thread::hardware_concurrency(), 1)),
+          started_(Clock::now()) {
+        if (!options.cache_dir.empty()) cache_.emplace(options.cache_dir, 256, options.cache_limit);
+    }
+
+    bool stopping() const { return stopping_.load(); }
+
+    /**
+     * One request line in, one response line out (never throws)
+     */
+    std::string handle_line(const std::string& line) {
+        const Clock::time_point start = Clock::now();
+        ++requests_;
+        Json response;
+        std::string cmd;
+        try {
+            Json request = Json::parse(line);
+            if (!request.is_object()) throw std::invalid_argument("Request must be a JSON object");
+            cmd = string_param(request, "cmd");
+            response = dispatch(cmd, request);
+        } catch (const std::exception& e) {
+            ++errors_;
+            response = error_response(e.what());
+        }
+        if (options_.log) {
+            std::lock_guard<std::mutex> lock(log_mutex_);
+            std::cout << "[daemon] " << (cmd.empty() ? "?" : cmd);
+            if (const Json* id = response.find("id")) std::cout << " " << id->as_string();
+            if (const Json* makespan = response.find("makespan")) std::cout << " makespan " << makespan->as_number();
+            if (const Json* error = response.find("error")) std::cout << " error: " << error->as_string();
+            std::cout << " (" << ms_since(start) << " ms)" << std::endl;
+        }
+        return response.dump();
+    }
+
+private:
+    struct Resident {
+        std::shared_ptr<const JobShopInstance> instance;
+        std::string path;
+        fs::file_time_type modified;
+    };
+
+    Json dispatch(const std::string& cmd, const Json& request) {
+        if (cmd == "solve") return solve(request);
+        if (cmd == "load") return load(request);
+        if (cmd == "unload") return unload(request);
+        if (cmd == "list") return list();
+        if (cmd == "stats") return stats();
+        if (cmd == "ping") return ok();
+        if (cmd == "shutdown") {
+            stopping_.store(true);
+            return ok();
+        }
+        throw std::invalid_argument("Unknown cmd '" + cmd + "' (expected load, solve, unload, list, stats, ping or shutdown)");
+    }
+
+    static Json ok() {
+        Json response = Json::object();
+        response.set("ok", true);
+        return response;
+    }
+
+    static Json describe(const std::string& id, const Resident& resident) {
+        const InstanceStats& stats = instance_stats(*resident.instance);
+        Json info = Json::object();
+        info.set("id", id);
+        info.set("path", resident.path);
+        info.set("jobs", resident.instance->num_jobs());
+        info.set("machines", resident.instance->num_machines);
+        info.set("operations", resident.instance->num_operations());
+        info.set("lower_bound", stats.lower_bound);
+        info.set("flexible", resident.instance->is_flexible());
+        return info;
+    }
+
+    /**
+     * Parse path and make it resident under id (replacing an older one)
+     */
+    Resident load_file(const std::string& id, const std::string& path) {
+        Resident resident;
+        resident.path = path;
+        std::error_code ec;
+        resident.modified = fs::last_write_time(path, ec);
+        resident.instance = std::make_shared<const JobShopInstance>(load_instance_from_file(path));
+        ++loads_;
+        std::lock_guard<std::mutex> lock(mutex_);
+        resident_[id] = resident;
+        return resident;
+    }
+
+    /**
+     * Instance of a request: by "id", or by "path" (loaded on first use,
+     * reloaded when the file changed since)
+     */
+    std::pair<std::string, Resident> resolve(const Json& request) {
+        const std::string path = string_param(request, "path");
+        const std::string id = string_param(request, "id", path);
+        if (id.empty()) throw std::invalid_argument("Request needs 'id' or 'path'");
+
+        std::optional<Resident> found;
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            auto it = resident_.find(id);
+            if (it != resident_.end()) found = it->second;
+        }
+        if (found && path.empty()) return {id, *found};
+        if (found && path == found->path) {
+            std::error_code ec;
+            if (fs::last_write_time(path, ec) == found->modified && !ec) return {id, *found};
+        }
+        if (path.empty()) throw std::invalid_argument("No instance loaded under id '" + id + "'");
+        return {id, load_file(id, path)};
+    }
+
+    Json load(const Json& request) {
+        const std::string path = string_param(request, "path");
+        if (path.empty()) throw std::invalid_argument("load needs 'path'");
+        const std::string id = string_param(request, "id", path);
+        Json response = describe(id, load_file(id, path));
+        response.set("ok", true);
+        return response;
+    }
+
+    Json unload(const Json& request) {
+        const std::string id = string_param(request, "id");
+        std::lock_guard<std::mutex> lock(mutex_);
+        if (resident_.erase(id) == 0) throw std::invalid_argument("No instance loaded under id '" + id + "'");
+        return ok();
+    }
+
+    Json list() {
+        Json instances = Json::array();
+        std::lock_guard<std::mutex> lock(mutex_);
+        for (const auto& [id, resident] : resident_) instances.push_back(describe(id, resident));
+        Json response = ok();
+        response.set("instances", std::move(instances));
+        return response;
+    }
+
+    Json stats() {
+        Json response = ok();
+        response.set("uptime_s", ms_since(started_) / 1000.0);
+        response.set("requests", requests_.load());
+        response.set("solves", solves_.load());
+        response.set("errors", errors_.load());
+        response.set("loads", loads_.load());
+        response.set("workers", pool_.size());
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            response.set("resident", resident_.size());
+        }
+        if (cache_) {
+            const CacheStats cache = cache_->stats();
+            response.set("cache_hits", cache.memory_hits + cache.disk_hits);
+            response.set("cache_misses", cache.misses);
+        }
+        return response;
+    }
+
+    Json solve(const Json& request) {
+        auto [id, resident] = resolve(request);
+        const std::string algorithm = string_param(request, "algorithm", "greedy");
+        const Json params = member(request, "params") ? *member(request, "params") : Json::object();
+        if (!params.is_object()) throw std::invalid_argument("'params' must be an object");
+        const bool with_schedule = bool_param(request, "schedule", true);
+
+        const Clock::time_point queued = Clock::now();
+        auto future = pool_.submit([this, instance = resident.instance, algorithm, params, queued] {
+            const double queue_ms = ms_since(queued);
+            const Clock::time_point start = Clock::now();
+            bool cached = false;
+            Solution solution = run(*instance, algorithm, params, cached);
+            return std::make_tuple(std::move(solution), queue_ms, ms_since(start), cached);
+        });
+        auto [solution, queue_ms, solve_ms, cached] = future.get();
+        ++solves_;
+
+        const int lower_bound = instance_stats(*resident.instance).lower_bound;
+        Json response = ok();
+        response.set("id", id);
+        response.set("algorithm", algorithm);
+        response.set("makespan", solution.makespan);
+        response.set("lower_bound", lower_bound);
+        response.set("gap", optimality_gap(solution.makespan, lower_bound));
+        response.set("queue_ms", queue_ms);
+        response.set("solve_ms", solve_ms);
+        response.set("cached", cached);
+        if (with_schedule) response.set("schedule", schedule_json(solution));
+        return response;
+    }
+
+    /**
+     * Runs on a pool worker
+     */
+    Solution run(const JobShopInstance& instance, const std::string& algorithm, const Json& params,
+                 bool& cached) {
+        check_params(params, algorithm);
+        GeneticParams ga = genetic_params(params);
+        const double time_limit = number_param(params, "time_limit", 0.0);
+        const Clock::time_point deadline = Clock::now() + std::chrono::duration_cast<Clock::duration>(
+            std::chrono::duration<double>(time_limit));
+        auto past_deadline = [deadline] { return Clock::now() >= deadline; };
+
+        if (algorithm == "portfolio") {
+            PortfolioParams portfolio;
+            if (time_limit > 0.0) portfolio.time_limit = time_limit;
+            portfolio.threads = count_param(params, "threads", 1);
+            portfolio.genetic = default_genetic_members(count_param(params, "genetic_members", 1), ga);
+            return run_portfolio(instance, portfolio).best;
+        }
+
+        // Limited runs depend on timing, they bypass the cache; so does IDA*
+        // (a cache miss would otherwise run the memory-hungry A*)
+        const size_t max_states = count_param(params, "max_states", 0);
+        const ExactSearch search = parse_exact_search(string_param(params, "search", "astar"));
+        if (cache_ && time_limit <= 0.0 && max_states == 0 &&
+            (algorithm != "exact" || search == ExactSearch::AStar)) {
+            CacheOutcome outcome;
+            Solution solution = solve_cached(*cache_, instance, algorithm, ga, false, &outcome);
+            cached = outcome.hit;
+            return solution;
+        }
+
+        if (algorithm == "greedy") return greedy_schedule(instance);
+        if (algorithm == "exact") {
+            if (instance.is_flexible()) throw std::invalid_argument("The exact solver only handles fixed routes");
+            ExactLimits limits;
+            limits.max_states = max_states;
+            limits.search = search;
+            limits.table_mb = count_param(params, "table_mb", limits.table_mb);
+            limits.node_mb = count_param(params, "node_mb", limits.node_mb);
+            if (time_limit > 0.0) limits.should_stop = past_deadline;
+            Solution solution = solve_exact(instance, limits);
+            if (solution.operation_sequence.empty()) throw std::runtime_error("Exact search stopped before finding a schedule");
+            return solution;
+        }
+        if (time_limit > 0.0) ga.should_stop = past_deadline;
+        return run_genetic(instance, ga);
+    }
+
+    ServerOptions options_;
+    WorkerPool pool_;
+    std::optional<ResultCache> cache_;
+    const Clock::time_point started_;
+
+    std::mutex mutex_;
+    std::map<std::string, Resident> resident_;
+    std::mutex log_mutex_;
+
+    std::atomic<bool> stopping_{false};
+    std::atomic<size_t> requests_{0};
+    std::atomic<size_t> solves_{0};
+    std::atomic<size_t> errors_{0};
+    std::atomic<size_t> loads_{0};
+};
+
+constexpr size_t MAX_LINE = 64u << 20;  // largest request (bytes)
+constexpr int POLL_MS = 200;            // how often threads check for shutdown
+
+#ifndef _WIN32
+
+// ===== SOCKETS (POSIX) =====
+
+[[noreturn]] void socket_error(const std::string& what) {
+    throw std::runtime_error(what + ": " + std::strerror(errno));
+}
+
+void send_all(int fd, const std::string& data) {
+    size_t sent = 0;
+    while (sent < data.size()) {
+        ssize_t n = ::send(fd, data.data() + sent, data.size() - sent, 0);
+        if (n < 0) {
+            if (errno == EINTR) continue;
+            socket_error("send");
+        }
+        sent += static_cast<size_t>(n);
+    }
+}
+
+int open_socket(const Endpoint& endpoint, bool listening) {
+    int fd = -1;
+    if (!endpoint.socket_path.empty()) {
+        sockaddr_un address{};
+        address.sun_family = AF_UNIX;
+        if (endpoint.socket_path.size() >= sizeof(address.sun_path)) {
+            throw std::invalid_argument("Socket path is too long: " + endpoint.socket_path);
+        }
+        std::strncpy(address.sun_path, endpoint.socket_path.c_str(), sizeof(address.sun_path) - 1);
+        fd = ::socket(AF_UNIX, SOCK_STREAM, 0);
+        if (fd < 0) socket_error("socket");
+        const sockaddr* raw = reinterpret_cast<const sockaddr*>(&address);
+        if (listening) {
+            // Left over by a killed daemon: remove it if nobody listens on it
+            int probe = ::socket(AF_UNIX, SOCK_STREAM, 0);
+            if (probe >= 0 && ::connect(probe, raw, sizeof(address)) == 0) {
+                ::close(probe);
+                ::close(fd);
+                throw std::runtime_error("A daemon is already listening on " + endpoint.describe());
+            }
+            if (probe >= 0) ::close(probe);
+            ::unlink(endpoint.socket_path.c_str());
+            if (::bind(fd, raw, sizeof(address)) < 0) socket_error("bind " + endpoint.describe());
+        } else if (::connect(fd, raw, sizeof(address)) < 0) {
+            ::close(fd);
+            socket_error("connect " + endpoint.describe());
+        }
+    } else {
+        sockaddr_in address{};
+        address.sin_family = AF_INET;
+        address.sin_port = htons(static_cast<std::uint16_t>(endpoint.port));
+        if (::inet_pton(AF_INET, endpoint.host.c_str(), &address.sin_addr) != 1) {
+            throw std::invalid_argument("Invalid IPv4 address: " + endpoint.host);
+        }
+        fd = ::socket(AF_INET, SOCK_STREAM, 0);
+        if (fd < 0) socket_error("socket");
+        int one = 1;
+        ::setsockopt(fd, IPPROTO_TCP, TCP_NODELAY, &one, sizeof(one));  // short replies without Nagle
+        const sockaddr* raw = reinterpret_cast<const sockaddr*>(&address);
+        if (listening) {
+            ::setsockopt(fd, SOL_SOCKET, SO_REUSEADDR, &one, sizeof(one));
+            if (::bind(fd, raw, sizeof(address)) < 0) socket_error("bind " + endpoint.describe());
+        } else if (::connect(fd, raw, sizeof(address)) < 0) {
+            ::close(fd);
+            socket_error("connect " + endpoint.describe());
+        }
+    }
+    if (listening && ::listen(fd, 64) < 0) socket_error("listen");
+    return fd;
+}
+
+/**
+ * Wait until fd is readable; false on timeout
+ */
+bool readable(int fd, int timeout_ms) {
+    pollfd p{fd, POLLIN, 0};
+    int r = ::poll(&p, 1, timeout_ms);
+    if (r < 0 && errno != EINTR) socket_error("poll");
+    return r > 0;
+}
+
+void serve_connection(int fd, SolverDaemon& daemon) {
+    std::string buffer;
+    char chunk[1 << 16];
+    try {
+        while (!daemon.stopping()) {
+            if (!readable(fd, POLL_MS)) continue;
+            ssize_t n = ::recv(fd, chunk, sizeof(chunk), 0);
+            if (n < 0 && errno == EINTR) continue;
+            if (n <= 0) break;
+            buffer.append(chunk, static_cast<size_t>(n));
+
+            size_t begin = 0;
+            for (size_t end; (end = buffer.find('\n', begin)) != std::string::npos; begin = end + 1) {
+                if (end == begin) continue;
+                send_all(fd, daemon.handle_line(buffer.substr(begin, end - begin)) + "\n");
+            }
+            buffer.erase(0, begin);
+            if (buffer.size() > MAX_LINE) {
+                send_all(fd, error_response("Request line too long").dump() + "\n");
+                break;
+            }
+        }
+    } catch (const std::exception&) {
+        // The client went away during the reply
+    }
+    ::close(fd);
+}
+
+struct Connection {
+    std::thread thread;
+    std::shared_ptr<std::atomic<bool>> done;
+};
+
+#endif
+
+} // namespace
+
+#ifndef _WIN32
+
+void run_server(const ServerOptions& options) {
+    std::signal(SIGPIPE, SIG_IGN);  // a dropped connection = send error, not process exit
+    SolverDaemon daemon(options);
+    const int listener = open_socket(options.endpoint, true);
+
+    std::list<Connection> connections;
+    while (!daemon.stopping()) {
+        // Finished connections are released as we go
+        for (auto it = connections.begin(); it != connections.end();) {
+            if (it->done->load()) {
+                it->thread.join();
+                it = connections.erase(it);
+            } else {
+                ++it;
+            }
+        }
+        if (!readable(listener, POLL_MS)) continue;
+        int fd = ::accept(listener, nullptr, nullptr);
+        if (fd < 0) continue;
+        if (options.endpoint.socket_path.empty()) {
+            int one = 1;
+            ::setsockopt(fd, IPPROTO_TCP, TCP_NODELAY, &one, sizeof(one));
+        }
+        auto done = std::make_shared<std::atomic<bool>>(false);
+        connections.push_back({std::thread([fd, &daemon, done] {
+            serve_connection(fd, daemon);
+            done->store(true);
+        }), done});
+    }
+
+    ::close(listener);
+    for (auto& connection : connections) connection.thread.join();
+    if (!options.endpoint.socket_path.empty()) ::unlink(options.endpoint.socket_path.c_str());
+}
+
+ServerConnection::ServerConnection(const Endpoint& endpoint) {
+    std::signal(SIGPIPE, SIG_IGN);
+    fd_ = open_socket(endpoint, false);
+}
+
+ServerConnection::~ServerConnection() {
+    if (fd_ >= 0) ::close(fd_);
+}
+
+Json ServerConnection::request(const Json& request) {
+    send_all(fd_, request.dump() + "\n");
+    char chunk[1 << 16];
+    size_t end;
+    while ((end = buffer_.find('\n')) == std::string::npos) {
+        ssize_t n = ::recv(fd_, chunk, sizeof(chunk), 0);
+        if (n < 0 && errno == EINTR) continue;
+        if (n < 0) socket_error("recv");
+        if (n == 0) throw std::runtime_error("Daemon closed the connection");
+        buffer_.append(chunk, static_cast<size_t>(n));
+    }
+    Json response = Json::parse(buffer_.substr(0, end));
+    buffer_.erase(0, end + 1);
+    return response;
+}
+
+#else
+
+void run_server(const ServerOptions&) {
+    throw std::runtime_error("The solver daemon needs POSIX sockets (Linux, macOS, WSL)");
+}
+
+ServerConnection::ServerConnection(const Endpoint&) {
+    throw std::runtime_error("The solver daemon needs POSIX sockets (Linux, macOS, WSL)");
+}
+
+ServerConnection::~ServerConnection() = default;
+
+Json ServerConnection::request(const Json&) {
+    return Json();
+}
+
+#endif
+
+} // namespace jobshop